@@ -14,4 +14,13 @@ target_include_directories(usermod_uzigbee INTERFACE
     ${MICROPY_PORT_DIR}/managed_components/espressif__esp-zboss-lib/include
 )
 
+# Event ring depth: CONFIG_UZIGBEE_EVENT_QUEUE_LEN from sdkconfig wins, otherwise
+# -DUZIGBEE_EVENT_QUEUE_LEN=<n> or the UZIGBEE_EVENT_QUEUE_LEN environment variable.
+if(NOT DEFINED UZIGBEE_EVENT_QUEUE_LEN AND DEFINED ENV{UZIGBEE_EVENT_QUEUE_LEN})
+    set(UZIGBEE_EVENT_QUEUE_LEN $ENV{UZIGBEE_EVENT_QUEUE_LEN})
+endif()
+if(DEFINED UZIGBEE_EVENT_QUEUE_LEN)
+    target_compile_definitions(usermod_uzigbee INTERFACE UZB_EVENT_QUEUE_LEN=${UZIGBEE_EVENT_QUEUE_LEN})
+endif()
+
 target_link_libraries(usermod INTERFACE usermod_uzigbee)
@@ -30,6 +30,16 @@
 
 MP_REGISTER_ROOT_POINTER(mp_obj_t uzigbee_signal_callback);
 MP_REGISTER_ROOT_POINTER(mp_obj_t uzigbee_attr_callback);
+MP_REGISTER_ROOT_POINTER(mp_obj_t uzigbee_desc_callback);
+MP_REGISTER_ROOT_POINTER(mp_obj_t uzigbee_attr_batch_callback);
+MP_REGISTER_ROOT_POINTER(mp_obj_t uzigbee_read_attr_callback);
+MP_REGISTER_ROOT_POINTER(mp_obj_t uzigbee_group_resp_callback);
+
+// Attribute events handed to the batch callback per Python call (bounded C stack array).
+#define UZIGBEE_ATTR_BATCH_MAX (16)
+#define UZIGBEE_ATTR_BATCH_DEFAULT (8)
+
+static size_t s_attr_batch_max = UZIGBEE_ATTR_BATCH_DEFAULT;
 
 static mp_obj_t uzigbee_dispatch_events(mp_obj_t unused);
 static MP_DEFINE_CONST_FUN_OBJ_1(uzigbee_dispatch_events_obj, uzigbee_dispatch_events);
@@ -50,6 +60,38 @@ static mp_obj_t uzigbee_get_attr_callback(void) {
     return cb;
 }
 
+static mp_obj_t uzigbee_get_attr_batch_callback(void) {
+    mp_obj_t cb = MP_STATE_PORT(uzigbee_attr_batch_callback);
+    if (cb == MP_OBJ_NULL) {
+        return mp_const_none;
+    }
+    return cb;
+}
+
+static mp_obj_t uzigbee_get_desc_callback(void) {
+    mp_obj_t cb = MP_STATE_PORT(uzigbee_desc_callback);
+    if (cb == MP_OBJ_NULL) {
+        return mp_const_none;
+    }
+    return cb;
+}
+
+static mp_obj_t uzigbee_get_read_attr_callback(void) {
+    mp_obj_t cb = MP_STATE_PORT(uzigbee_read_attr_callback);
+    if (cb == MP_OBJ_NULL) {
+        return mp_const_none;
+    }
+    return cb;
+}
+
+static mp_obj_t uzigbee_get_group_resp_callback(void) {
+    mp_obj_t cb = MP_STATE_PORT(uzigbee_group_resp_callback);
+    if (cb == MP_OBJ_NULL) {
+        return mp_const_none;
+    }
+    return cb;
+}
+
 static bool uzigbee_is_type_error_exception(mp_obj_t exc) {
     if (!mp_obj_is_exception_instance(exc)) {
         return false;
@@ -953,6 +995,63 @@ static mp_obj_t uzigbee_send_on_off_cmd(size_t n_args, const mp_obj_t *pos_args,
 }
 static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_send_on_off_cmd_obj, 0, uzigbee_send_on_off_cmd);
 
+static mp_obj_t uzigbee_send_read_attr_cmd(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_src_endpoint, ARG_dst_short_addr, ARG_dst_endpoint, ARG_cluster_id, ARG_attr_ids };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_src_endpoint, MP_ARG_INT, {.u_int = 1} },
+        { MP_QSTR_dst_short_addr, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_dst_endpoint, MP_ARG_INT, {.u_int = 1} },
+        { MP_QSTR_cluster_id, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_attr_ids, MP_ARG_REQUIRED | MP_ARG_OBJ, {.u_obj = mp_const_none} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_int_t src_endpoint = args[ARG_src_endpoint].u_int;
+    mp_int_t dst_short_addr = args[ARG_dst_short_addr].u_int;
+    mp_int_t dst_endpoint = args[ARG_dst_endpoint].u_int;
+    mp_int_t cluster_id = args[ARG_cluster_id].u_int;
+    if (src_endpoint <= 0 || src_endpoint >= 0xF0 || dst_endpoint <= 0 || dst_endpoint >= 0xF0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid endpoint"));
+    }
+    if (dst_short_addr < 0 || dst_short_addr > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid dst_short_addr"));
+    }
+    if (cluster_id < 0 || cluster_id > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid cluster_id"));
+    }
+
+    size_t attr_len = 0;
+    mp_obj_t *attr_items = NULL;
+    mp_obj_get_array(args[ARG_attr_ids].u_obj, &attr_len, &attr_items);
+    if (attr_len == 0 || attr_len > UZB_READ_ATTR_MAX) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid attr_ids length"));
+    }
+    uint16_t attr_ids[UZB_READ_ATTR_MAX];
+    for (size_t i = 0; i < attr_len; ++i) {
+        mp_int_t attr_id = mp_obj_get_int(attr_items[i]);
+        if (attr_id < 0 || attr_id > 0xFFFF) {
+            mp_raise_ValueError(MP_ERROR_TEXT("invalid attr_id"));
+        }
+        attr_ids[i] = (uint16_t)attr_id;
+    }
+
+    uint8_t tsn = 0;
+    esp_err_t err = uzb_core_send_read_attr_cmd(
+        (uint8_t)src_endpoint,
+        (uint16_t)dst_short_addr,
+        (uint8_t)dst_endpoint,
+        (uint16_t)cluster_id,
+        attr_ids,
+        (uint8_t)attr_len,
+        &tsn);
+    if (err != ESP_OK) {
+        mp_raise_OSError(err);
+    }
+    return mp_obj_new_int_from_uint(tsn);
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_send_read_attr_cmd_obj, 0, uzigbee_send_read_attr_cmd);
+
 static mp_obj_t uzigbee_send_level_cmd(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
     enum { ARG_src_endpoint, ARG_dst_short_addr, ARG_dst_endpoint, ARG_level, ARG_transition_ds, ARG_with_onoff };
     static const mp_arg_t allowed_args[] = {
@@ -1089,6 +1188,164 @@ static mp_obj_t uzigbee_send_color_move_to_color_temperature_cmd(size_t n_args,
 }
 static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_send_color_move_to_color_temperature_cmd_obj, 0, uzigbee_send_color_move_to_color_temperature_cmd);
 
+static mp_obj_t uzigbee_groupcast_on_off_cmd(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_src_endpoint, ARG_group_id, ARG_cmd_id };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_src_endpoint, MP_ARG_INT, {.u_int = 1} },
+        { MP_QSTR_group_id, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_cmd_id, MP_ARG_INT, {.u_int = ESP_ZB_ZCL_CMD_ON_OFF_TOGGLE_ID} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_int_t src_endpoint = args[ARG_src_endpoint].u_int;
+    mp_int_t group_id = args[ARG_group_id].u_int;
+    mp_int_t cmd_id = args[ARG_cmd_id].u_int;
+    if (src_endpoint <= 0 || src_endpoint >= 0xF0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid endpoint"));
+    }
+    if (group_id < 0 || group_id > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid group_id"));
+    }
+    if (cmd_id != ESP_ZB_ZCL_CMD_ON_OFF_OFF_ID &&
+        cmd_id != ESP_ZB_ZCL_CMD_ON_OFF_ON_ID &&
+        cmd_id != ESP_ZB_ZCL_CMD_ON_OFF_TOGGLE_ID) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid cmd_id"));
+    }
+
+    esp_err_t err = uzb_core_groupcast_on_off_cmd((uint8_t)src_endpoint, (uint16_t)group_id, (uint8_t)cmd_id);
+    if (err != ESP_OK) {
+        mp_raise_OSError(err);
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_groupcast_on_off_cmd_obj, 0, uzigbee_groupcast_on_off_cmd);
+
+static mp_obj_t uzigbee_groupcast_level_cmd(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_src_endpoint, ARG_group_id, ARG_level, ARG_transition_ds, ARG_with_onoff };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_src_endpoint, MP_ARG_INT, {.u_int = 1} },
+        { MP_QSTR_group_id, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_level, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_transition_ds, MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_with_onoff, MP_ARG_BOOL, {.u_bool = true} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_int_t src_endpoint = args[ARG_src_endpoint].u_int;
+    mp_int_t group_id = args[ARG_group_id].u_int;
+    mp_int_t level = args[ARG_level].u_int;
+    mp_int_t transition_ds = args[ARG_transition_ds].u_int;
+    if (src_endpoint <= 0 || src_endpoint >= 0xF0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid endpoint"));
+    }
+    if (group_id < 0 || group_id > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid group_id"));
+    }
+    if (level < 0 || level > 254) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid level"));
+    }
+    if (transition_ds < 0 || transition_ds > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid transition_ds"));
+    }
+
+    esp_err_t err = uzb_core_groupcast_level_cmd(
+        (uint8_t)src_endpoint,
+        (uint16_t)group_id,
+        (uint8_t)level,
+        (uint16_t)transition_ds,
+        args[ARG_with_onoff].u_bool);
+    if (err != ESP_OK) {
+        mp_raise_OSError(err);
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_groupcast_level_cmd_obj, 0, uzigbee_groupcast_level_cmd);
+
+static mp_obj_t uzigbee_groupcast_color_move_to_color_cmd(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_src_endpoint, ARG_group_id, ARG_color_x, ARG_color_y, ARG_transition_ds };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_src_endpoint, MP_ARG_INT, {.u_int = 1} },
+        { MP_QSTR_group_id, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_color_x, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_color_y, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_transition_ds, MP_ARG_INT, {.u_int = 0} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_int_t src_endpoint = args[ARG_src_endpoint].u_int;
+    mp_int_t group_id = args[ARG_group_id].u_int;
+    mp_int_t color_x = args[ARG_color_x].u_int;
+    mp_int_t color_y = args[ARG_color_y].u_int;
+    mp_int_t transition_ds = args[ARG_transition_ds].u_int;
+    if (src_endpoint <= 0 || src_endpoint >= 0xF0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid endpoint"));
+    }
+    if (group_id < 0 || group_id > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid group_id"));
+    }
+    if (color_x < 0 || color_x > 0xFFFF || color_y < 0 || color_y > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid color xy"));
+    }
+    if (transition_ds < 0 || transition_ds > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid transition_ds"));
+    }
+
+    esp_err_t err = uzb_core_groupcast_color_move_to_color_cmd(
+        (uint8_t)src_endpoint,
+        (uint16_t)group_id,
+        (uint16_t)color_x,
+        (uint16_t)color_y,
+        (uint16_t)transition_ds);
+    if (err != ESP_OK) {
+        mp_raise_OSError(err);
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_groupcast_color_move_to_color_cmd_obj, 0, uzigbee_groupcast_color_move_to_color_cmd);
+
+static mp_obj_t uzigbee_groupcast_color_move_to_color_temperature_cmd(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_src_endpoint, ARG_group_id, ARG_color_temperature, ARG_transition_ds };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_src_endpoint, MP_ARG_INT, {.u_int = 1} },
+        { MP_QSTR_group_id, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_color_temperature, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_transition_ds, MP_ARG_INT, {.u_int = 0} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_int_t src_endpoint = args[ARG_src_endpoint].u_int;
+    mp_int_t group_id = args[ARG_group_id].u_int;
+    mp_int_t color_temperature = args[ARG_color_temperature].u_int;
+    mp_int_t transition_ds = args[ARG_transition_ds].u_int;
+    if (src_endpoint <= 0 || src_endpoint >= 0xF0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid endpoint"));
+    }
+    if (group_id < 0 || group_id > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid group_id"));
+    }
+    if (color_temperature < 0 || color_temperature > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid color_temperature"));
+    }
+    if (transition_ds < 0 || transition_ds > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid transition_ds"));
+    }
+
+    esp_err_t err = uzb_core_groupcast_color_move_to_color_temperature_cmd(
+        (uint8_t)src_endpoint,
+        (uint16_t)group_id,
+        (uint16_t)color_temperature,
+        (uint16_t)transition_ds);
+    if (err != ESP_OK) {
+        mp_raise_OSError(err);
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_groupcast_color_move_to_color_temperature_cmd_obj, 0, uzigbee_groupcast_color_move_to_color_temperature_cmd);
+
 static mp_obj_t uzigbee_send_lock_cmd(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
     enum { ARG_src_endpoint, ARG_dst_short_addr, ARG_dst_endpoint, ARG_lock };
     static const mp_arg_t allowed_args[] = {
@@ -1752,12 +2009,13 @@ static mp_obj_t uzigbee_get_active_endpoints_snapshot(void) {
         ep_objs[i] = mp_obj_new_int_from_uint(snapshot.endpoints[i]);
     }
 
-    mp_obj_t out[3] = {
+    mp_obj_t out[4] = {
         mp_obj_new_int_from_uint(snapshot.status),
         mp_obj_new_int_from_uint(snapshot.count),
         mp_obj_new_tuple(snapshot.count, ep_objs),
+        mp_obj_new_int_from_uint(snapshot.addr),
     };
-    return mp_obj_new_tuple(3, out);
+    return mp_obj_new_tuple(4, out);
 }
 static MP_DEFINE_CONST_FUN_OBJ_0(uzigbee_get_active_endpoints_snapshot_obj, uzigbee_get_active_endpoints_snapshot);
 
@@ -1845,49 +2103,82 @@ static mp_obj_t uzigbee_request_simple_descriptor(size_t n_args, const mp_obj_t
 }
 static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_request_simple_descriptor_obj, 0, uzigbee_request_simple_descriptor);
 
-static mp_obj_t uzigbee_get_simple_descriptor_snapshot(void) {
-    uzb_simple_desc_snapshot_t snapshot = {0};
-    esp_err_t err = uzb_core_get_simple_descriptor_snapshot(&snapshot);
-    if (err == ESP_ERR_NOT_FOUND) {
-        return mp_const_none;
-    }
-    if (err != ESP_OK) {
-        mp_raise_OSError(err);
-    }
-    if (!snapshot.valid) {
-        return mp_const_none;
-    }
-
+static mp_obj_t uzigbee_simple_desc_snapshot_to_obj(const uzb_simple_desc_snapshot_t *snapshot) {
     mp_obj_t desc_obj = mp_const_none;
-    if (snapshot.has_desc) {
+    if (snapshot->has_desc) {
         mp_obj_t in_clusters[UZB_SIMPLE_DESC_MAX_CLUSTERS];
         mp_obj_t out_clusters[UZB_SIMPLE_DESC_MAX_CLUSTERS];
-        for (size_t i = 0; i < snapshot.input_count; ++i) {
-            in_clusters[i] = mp_obj_new_int_from_uint(snapshot.input_clusters[i]);
+        for (size_t i = 0; i < snapshot->input_count; ++i) {
+            in_clusters[i] = mp_obj_new_int_from_uint(snapshot->input_clusters[i]);
         }
-        for (size_t i = 0; i < snapshot.output_count; ++i) {
-            out_clusters[i] = mp_obj_new_int_from_uint(snapshot.output_clusters[i]);
+        for (size_t i = 0; i < snapshot->output_count; ++i) {
+            out_clusters[i] = mp_obj_new_int_from_uint(snapshot->output_clusters[i]);
         }
         mp_obj_t desc[6] = {
-            mp_obj_new_int_from_uint(snapshot.endpoint),
-            mp_obj_new_int_from_uint(snapshot.profile_id),
-            mp_obj_new_int_from_uint(snapshot.device_id),
-            mp_obj_new_int_from_uint(snapshot.device_version),
-            mp_obj_new_tuple(snapshot.input_count, in_clusters),
-            mp_obj_new_tuple(snapshot.output_count, out_clusters),
+            mp_obj_new_int_from_uint(snapshot->endpoint),
+            mp_obj_new_int_from_uint(snapshot->profile_id),
+            mp_obj_new_int_from_uint(snapshot->device_id),
+            mp_obj_new_int_from_uint(snapshot->device_version),
+            mp_obj_new_tuple(snapshot->input_count, in_clusters),
+            mp_obj_new_tuple(snapshot->output_count, out_clusters),
         };
         desc_obj = mp_obj_new_tuple(6, desc);
     }
 
     mp_obj_t out[3] = {
-        mp_obj_new_int_from_uint(snapshot.status),
-        mp_obj_new_int_from_uint(snapshot.addr),
+        mp_obj_new_int_from_uint(snapshot->status),
+        mp_obj_new_int_from_uint(snapshot->addr),
         desc_obj,
     };
     return mp_obj_new_tuple(3, out);
 }
+
+static mp_obj_t uzigbee_get_simple_descriptor_snapshot(void) {
+    uzb_simple_desc_snapshot_t snapshot = {0};
+    esp_err_t err = uzb_core_get_simple_descriptor_snapshot(&snapshot);
+    if (err == ESP_ERR_NOT_FOUND) {
+        return mp_const_none;
+    }
+    if (err != ESP_OK) {
+        mp_raise_OSError(err);
+    }
+    if (!snapshot.valid) {
+        return mp_const_none;
+    }
+    return uzigbee_simple_desc_snapshot_to_obj(&snapshot);
+}
 static MP_DEFINE_CONST_FUN_OBJ_0(uzigbee_get_simple_descriptor_snapshot_obj, uzigbee_get_simple_descriptor_snapshot);
 
+static mp_obj_t uzigbee_get_simple_descriptor_snapshot_for(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_dst_short_addr, ARG_endpoint };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_dst_short_addr, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 0} },
+        { MP_QSTR_endpoint, MP_ARG_REQUIRED | MP_ARG_INT, {.u_int = 1} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_int_t dst_short_addr = args[ARG_dst_short_addr].u_int;
+    mp_int_t endpoint = args[ARG_endpoint].u_int;
+    if (dst_short_addr < 0 || dst_short_addr > 0xFFFE) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid dst_short_addr"));
+    }
+    if (endpoint <= 0 || endpoint >= 0xF0) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid endpoint"));
+    }
+
+    uzb_simple_desc_snapshot_t snapshot = {0};
+    esp_err_t err = uzb_core_get_simple_descriptor_snapshot_for((uint16_t)dst_short_addr, (uint8_t)endpoint, &snapshot);
+    if (err == ESP_ERR_NOT_FOUND) {
+        return mp_const_none;
+    }
+    if (err != ESP_OK) {
+        mp_raise_OSError(err);
+    }
+    return uzigbee_simple_desc_snapshot_to_obj(&snapshot);
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_get_simple_descriptor_snapshot_for_obj, 0, uzigbee_get_simple_descriptor_snapshot_for);
+
 static mp_obj_t uzigbee_request_power_descriptor(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
     enum { ARG_dst_short_addr };
     static const mp_arg_t allowed_args[] = {
@@ -2288,6 +2579,23 @@ static mp_obj_t uzigbee_get_ieee_addr(void) {
 }
 static MP_DEFINE_CONST_FUN_OBJ_0(uzigbee_get_ieee_addr_obj, uzigbee_get_ieee_addr);
 
+static mp_obj_t uzigbee_get_ieee_addr_by_short(mp_obj_t short_addr_obj) {
+    mp_int_t short_addr = mp_obj_get_int(short_addr_obj);
+    if (short_addr < 0 || short_addr > 0xFFFF) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid short_addr"));
+    }
+    uint8_t ieee_addr[8] = {0};
+    esp_err_t err = uzb_core_get_ieee_addr_by_short((uint16_t)short_addr, ieee_addr);
+    if (err == ESP_ERR_NOT_FOUND) {
+        return mp_const_none;
+    }
+    if (err != ESP_OK) {
+        mp_raise_OSError(err);
+    }
+    return mp_obj_new_bytes(ieee_addr, 8);
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(uzigbee_get_ieee_addr_by_short_obj, uzigbee_get_ieee_addr_by_short);
+
 static mp_obj_t uzigbee_get_network_runtime(void) {
     uzb_network_runtime_t runtime = {0};
     esp_err_t err = uzb_core_get_network_runtime(&runtime);
@@ -2365,19 +2673,71 @@ static mp_obj_t uzigbee_on_attribute(mp_obj_t callback_in) {
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(uzigbee_on_attribute_obj, uzigbee_on_attribute);
 
+static mp_obj_t uzigbee_set_descriptor_callback(mp_obj_t callback_in) {
+    if (callback_in != mp_const_none && !mp_obj_is_callable(callback_in)) {
+        mp_raise_ValueError(MP_ERROR_TEXT("callback must be callable or None"));
+    }
+    MP_STATE_PORT(uzigbee_desc_callback) = callback_in;
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(uzigbee_set_descriptor_callback_obj, uzigbee_set_descriptor_callback);
+
+static mp_obj_t uzigbee_set_read_attr_callback(mp_obj_t callback_in) {
+    if (callback_in != mp_const_none && !mp_obj_is_callable(callback_in)) {
+        mp_raise_ValueError(MP_ERROR_TEXT("callback must be callable or None"));
+    }
+    MP_STATE_PORT(uzigbee_read_attr_callback) = callback_in;
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(uzigbee_set_read_attr_callback_obj, uzigbee_set_read_attr_callback);
+
+static mp_obj_t uzigbee_set_group_response_callback(mp_obj_t callback_in) {
+    if (callback_in != mp_const_none && !mp_obj_is_callable(callback_in)) {
+        mp_raise_ValueError(MP_ERROR_TEXT("callback must be callable or None"));
+    }
+    MP_STATE_PORT(uzigbee_group_resp_callback) = callback_in;
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_1(uzigbee_set_group_response_callback_obj, uzigbee_set_group_response_callback);
+
+static mp_obj_t uzigbee_set_attribute_batch_callback(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_callback, ARG_max_batch };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_callback, MP_ARG_REQUIRED | MP_ARG_OBJ, {.u_obj = mp_const_none} },
+        { MP_QSTR_max_batch, MP_ARG_INT, {.u_int = UZIGBEE_ATTR_BATCH_DEFAULT} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+
+    mp_obj_t callback_in = args[ARG_callback].u_obj;
+    mp_int_t max_batch = args[ARG_max_batch].u_int;
+    if (callback_in != mp_const_none && !mp_obj_is_callable(callback_in)) {
+        mp_raise_ValueError(MP_ERROR_TEXT("callback must be callable or None"));
+    }
+    if (max_batch < 1 || max_batch > UZIGBEE_ATTR_BATCH_MAX) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid max_batch"));
+    }
+    s_attr_batch_max = (size_t)max_batch;
+    MP_STATE_PORT(uzigbee_attr_batch_callback) = callback_in;
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_KW(uzigbee_set_attribute_batch_callback_obj, 1, uzigbee_set_attribute_batch_callback);
+
 static mp_obj_t uzigbee_get_event_stats(void) {
     uzb_event_stats_t stats;
     uzb_core_get_event_stats(&stats);
 
-    mp_obj_t out[6] = {
+    mp_obj_t out[8] = {
         mp_obj_new_int_from_uint(stats.enqueued),
         mp_obj_new_int_from_uint(stats.dropped_queue_full),
         mp_obj_new_int_from_uint(stats.dropped_schedule_fail),
         mp_obj_new_int_from_uint(stats.dispatched),
         mp_obj_new_int_from_uint(stats.max_depth),
         mp_obj_new_int_from_uint(stats.depth),
+        mp_obj_new_int_from_uint(stats.coalesced),
+        mp_obj_new_int_from_uint(stats.capacity),
     };
-    return mp_obj_new_tuple(6, out);
+    return mp_obj_new_tuple(8, out);
 }
 static MP_DEFINE_CONST_FUN_OBJ_0(uzigbee_get_event_stats_obj, uzigbee_get_event_stats);
 
@@ -2392,13 +2752,56 @@ static mp_obj_t uzigbee_get_heap_stats(void) {
 }
 static MP_DEFINE_CONST_FUN_OBJ_0(uzigbee_get_heap_stats_obj, uzigbee_get_heap_stats);
 
+static void uzigbee_flush_attr_batch(mp_obj_t batch_cb, mp_obj_t *items, size_t *len) {
+    if (*len == 0) {
+        return;
+    }
+    mp_obj_t batch = mp_obj_new_list(*len, items);
+    *len = 0;
+    mp_obj_t callback_exc = mp_const_none;
+    if (!uzigbee_call_callback(batch_cb, 1, &batch, &callback_exc)) {
+        mp_obj_print_exception(&mp_plat_print, callback_exc);
+    }
+}
+
 static mp_obj_t uzigbee_dispatch_events(mp_obj_t unused) {
     (void)unused;
 
     uzb_event_t event;
     mp_obj_t signal_cb = uzigbee_get_signal_callback();
     mp_obj_t attr_cb = uzigbee_get_attr_callback();
+    mp_obj_t attr_batch_cb = uzigbee_get_attr_batch_callback();
+    mp_obj_t desc_cb = uzigbee_get_desc_callback();
+    mp_obj_t read_cb = uzigbee_get_read_attr_callback();
+    mp_obj_t group_cb = uzigbee_get_group_resp_callback();
+    mp_obj_t batch_items[UZIGBEE_ATTR_BATCH_MAX];
+    size_t batch_len = 0;
+    size_t batch_max = s_attr_batch_max;
     while (uzb_core_pop_event(&event)) {
+        if (event.type == UZB_EVENT_TYPE_ATTR_SET && attr_batch_cb != mp_const_none) {
+            mp_obj_t record[7] = {
+                event.data.attr_set.has_source
+                    ? mp_obj_new_int_from_uint(event.data.attr_set.source_short_addr)
+                    : mp_const_none,
+                mp_obj_new_int_from_uint(event.data.attr_set.endpoint),
+                mp_obj_new_int_from_uint(event.data.attr_set.cluster_id),
+                mp_obj_new_int_from_uint(event.data.attr_set.attr_id),
+                uzigbee_attr_value_to_obj(&event.data.attr_set.value),
+                mp_obj_new_int_from_uint(event.data.attr_set.value.zcl_type),
+                mp_obj_new_int(event.data.attr_set.status),
+            };
+            batch_items[batch_len++] = mp_obj_new_tuple(7, record);
+            if (batch_len >= batch_max) {
+                uzigbee_flush_attr_batch(attr_batch_cb, batch_items, &batch_len);
+            }
+            // A per-event callback registered alongside the batch one still sees every event.
+            if (attr_cb == mp_const_none) {
+                continue;
+            }
+        } else if (batch_len > 0) {
+            // Keep attribute batches ordered relative to signals/descriptor events.
+            uzigbee_flush_attr_batch(attr_batch_cb, batch_items, &batch_len);
+        }
         if (event.type == UZB_EVENT_TYPE_APP_SIGNAL) {
             if (signal_cb == mp_const_none) {
                 continue;
@@ -2465,8 +2868,64 @@ static mp_obj_t uzigbee_dispatch_events(mp_obj_t unused) {
             if (!uzigbee_call_callback(attr_cb, 6, legacy_args, &callback_exc)) {
                 mp_obj_print_exception(&mp_plat_print, callback_exc);
             }
+        } else if (event.type == UZB_EVENT_TYPE_DESC_RESPONSE) {
+            if (desc_cb == mp_const_none) {
+                continue;
+            }
+
+            mp_obj_t args[4] = {
+                mp_obj_new_int_from_uint(event.data.desc_response.kind),
+                mp_obj_new_int_from_uint(event.data.desc_response.status),
+                mp_obj_new_int_from_uint(event.data.desc_response.addr),
+                mp_obj_new_int_from_uint(event.data.desc_response.endpoint),
+            };
+            mp_obj_t callback_exc = mp_const_none;
+            if (!uzigbee_call_callback(desc_cb, 4, args, &callback_exc)) {
+                mp_obj_print_exception(&mp_plat_print, callback_exc);
+            }
+        } else if (event.type == UZB_EVENT_TYPE_READ_ATTR_RESP) {
+            if (read_cb == mp_const_none) {
+                continue;
+            }
+
+            const uzb_read_attr_resp_event_t *resp = &event.data.read_attr_resp;
+            mp_obj_t args[9] = {
+                mp_obj_new_int_from_uint(resp->tsn),
+                mp_obj_new_int_from_uint(resp->source_short_addr),
+                mp_obj_new_int_from_uint(resp->source_endpoint),
+                mp_obj_new_int_from_uint(resp->cluster_id),
+                mp_obj_new_int_from_uint(resp->attr_id),
+                resp->status == 0 ? uzigbee_attr_value_to_obj(&resp->value) : mp_const_none,
+                mp_obj_new_int_from_uint(resp->value.zcl_type),
+                mp_obj_new_int_from_uint(resp->status),
+                mp_obj_new_bool(resp->last),
+            };
+            mp_obj_t callback_exc = mp_const_none;
+            if (!uzigbee_call_callback(read_cb, 9, args, &callback_exc)) {
+                mp_obj_print_exception(&mp_plat_print, callback_exc);
+            }
+        } else if (event.type == UZB_EVENT_TYPE_GROUP_RESP) {
+            if (group_cb == mp_const_none) {
+                continue;
+            }
+
+            const uzb_group_resp_event_t *resp = &event.data.group_resp;
+            mp_obj_t args[5] = {
+                mp_obj_new_int_from_uint(resp->cmd_id),
+                mp_obj_new_int_from_uint(resp->status),
+                mp_obj_new_int_from_uint(resp->source_short_addr),
+                mp_obj_new_int_from_uint(resp->source_endpoint),
+                mp_obj_new_int_from_uint(resp->group_id),
+            };
+            mp_obj_t callback_exc = mp_const_none;
+            if (!uzigbee_call_callback(group_cb, 5, args, &callback_exc)) {
+                mp_obj_print_exception(&mp_plat_print, callback_exc);
+            }
         }
     }
+    if (batch_len > 0) {
+        uzigbee_flush_attr_batch(attr_batch_cb, batch_items, &batch_len);
+    }
 
     uzb_core_dispatch_complete();
     return mp_const_none;
@@ -2503,10 +2962,15 @@ static const mp_rom_map_elem_t uzigbee_module_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_get_attribute), MP_ROM_PTR(&uzigbee_get_attribute_obj) },
     { MP_ROM_QSTR(MP_QSTR_set_attribute), MP_ROM_PTR(&uzigbee_set_attribute_obj) },
     { MP_ROM_QSTR(MP_QSTR_configure_reporting), MP_ROM_PTR(&uzigbee_configure_reporting_obj) },
+    { MP_ROM_QSTR(MP_QSTR_send_read_attr_cmd), MP_ROM_PTR(&uzigbee_send_read_attr_cmd_obj) },
     { MP_ROM_QSTR(MP_QSTR_send_on_off_cmd), MP_ROM_PTR(&uzigbee_send_on_off_cmd_obj) },
     { MP_ROM_QSTR(MP_QSTR_send_level_cmd), MP_ROM_PTR(&uzigbee_send_level_cmd_obj) },
     { MP_ROM_QSTR(MP_QSTR_send_color_move_to_color_cmd), MP_ROM_PTR(&uzigbee_send_color_move_to_color_cmd_obj) },
     { MP_ROM_QSTR(MP_QSTR_send_color_move_to_color_temperature_cmd), MP_ROM_PTR(&uzigbee_send_color_move_to_color_temperature_cmd_obj) },
+    { MP_ROM_QSTR(MP_QSTR_groupcast_on_off_cmd), MP_ROM_PTR(&uzigbee_groupcast_on_off_cmd_obj) },
+    { MP_ROM_QSTR(MP_QSTR_groupcast_level_cmd), MP_ROM_PTR(&uzigbee_groupcast_level_cmd_obj) },
+    { MP_ROM_QSTR(MP_QSTR_groupcast_color_move_to_color_cmd), MP_ROM_PTR(&uzigbee_groupcast_color_move_to_color_cmd_obj) },
+    { MP_ROM_QSTR(MP_QSTR_groupcast_color_move_to_color_temperature_cmd), MP_ROM_PTR(&uzigbee_groupcast_color_move_to_color_temperature_cmd_obj) },
     { MP_ROM_QSTR(MP_QSTR_send_lock_cmd), MP_ROM_PTR(&uzigbee_send_lock_cmd_obj) },
     { MP_ROM_QSTR(MP_QSTR_send_group_add_cmd), MP_ROM_PTR(&uzigbee_send_group_add_cmd_obj) },
     { MP_ROM_QSTR(MP_QSTR_send_group_remove_cmd), MP_ROM_PTR(&uzigbee_send_group_remove_cmd_obj) },
@@ -2530,6 +2994,11 @@ static const mp_rom_map_elem_t uzigbee_module_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_get_node_descriptor_snapshot), MP_ROM_PTR(&uzigbee_get_node_descriptor_snapshot_obj) },
     { MP_ROM_QSTR(MP_QSTR_request_simple_descriptor), MP_ROM_PTR(&uzigbee_request_simple_descriptor_obj) },
     { MP_ROM_QSTR(MP_QSTR_get_simple_descriptor_snapshot), MP_ROM_PTR(&uzigbee_get_simple_descriptor_snapshot_obj) },
+    { MP_ROM_QSTR(MP_QSTR_get_simple_descriptor_snapshot_for), MP_ROM_PTR(&uzigbee_get_simple_descriptor_snapshot_for_obj) },
+    { MP_ROM_QSTR(MP_QSTR_set_descriptor_callback), MP_ROM_PTR(&uzigbee_set_descriptor_callback_obj) },
+    { MP_ROM_QSTR(MP_QSTR_set_read_attr_callback), MP_ROM_PTR(&uzigbee_set_read_attr_callback_obj) },
+    { MP_ROM_QSTR(MP_QSTR_set_group_response_callback), MP_ROM_PTR(&uzigbee_set_group_response_callback_obj) },
+    { MP_ROM_QSTR(MP_QSTR_set_attribute_batch_callback), MP_ROM_PTR(&uzigbee_set_attribute_batch_callback_obj) },
     { MP_ROM_QSTR(MP_QSTR_request_power_descriptor), MP_ROM_PTR(&uzigbee_request_power_descriptor_obj) },
     { MP_ROM_QSTR(MP_QSTR_get_power_descriptor_snapshot), MP_ROM_PTR(&uzigbee_get_power_descriptor_snapshot_obj) },
     { MP_ROM_QSTR(MP_QSTR_set_install_code_policy), MP_ROM_PTR(&uzigbee_set_install_code_policy_obj) },
@@ -2555,6 +3024,7 @@ static const mp_rom_map_elem_t uzigbee_module_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_get_short_addr), MP_ROM_PTR(&uzigbee_get_short_addr_obj) },
     { MP_ROM_QSTR(MP_QSTR_get_last_joined_short_addr), MP_ROM_PTR(&uzigbee_get_last_joined_short_addr_obj) },
     { MP_ROM_QSTR(MP_QSTR_get_ieee_addr), MP_ROM_PTR(&uzigbee_get_ieee_addr_obj) },
+    { MP_ROM_QSTR(MP_QSTR_get_ieee_addr_by_short), MP_ROM_PTR(&uzigbee_get_ieee_addr_by_short_obj) },
     { MP_ROM_QSTR(MP_QSTR_get_network_runtime), MP_ROM_PTR(&uzigbee_get_network_runtime_obj) },
     { MP_ROM_QSTR(MP_QSTR_on_signal), MP_ROM_PTR(&uzigbee_on_signal_obj) },
     { MP_ROM_QSTR(MP_QSTR_set_signal_callback), MP_ROM_PTR(&uzigbee_set_signal_callback_obj) },
@@ -2562,6 +3032,13 @@ static const mp_rom_map_elem_t uzigbee_module_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_set_attribute_callback), MP_ROM_PTR(&uzigbee_set_attribute_callback_obj) },
     { MP_ROM_QSTR(MP_QSTR_get_event_stats), MP_ROM_PTR(&uzigbee_get_event_stats_obj) },
     { MP_ROM_QSTR(MP_QSTR_get_heap_stats), MP_ROM_PTR(&uzigbee_get_heap_stats_obj) },
+    { MP_ROM_QSTR(MP_QSTR_DESC_KIND_ACTIVE_EP), MP_ROM_INT(UZB_DESC_KIND_ACTIVE_EP) },
+    { MP_ROM_QSTR(MP_QSTR_DESC_KIND_NODE), MP_ROM_INT(UZB_DESC_KIND_NODE) },
+    { MP_ROM_QSTR(MP_QSTR_DESC_KIND_SIMPLE), MP_ROM_INT(UZB_DESC_KIND_SIMPLE) },
+    { MP_ROM_QSTR(MP_QSTR_DESC_KIND_POWER), MP_ROM_INT(UZB_DESC_KIND_POWER) },
+    { MP_ROM_QSTR(MP_QSTR_SIMPLE_DESC_SLOTS), MP_ROM_INT(UZB_SIMPLE_DESC_SLOTS) },
+    { MP_ROM_QSTR(MP_QSTR_ATTR_BATCH_MAX), MP_ROM_INT(UZIGBEE_ATTR_BATCH_MAX) },
+    { MP_ROM_QSTR(MP_QSTR_READ_ATTR_MAX), MP_ROM_INT(UZB_READ_ATTR_MAX) },
     { MP_ROM_QSTR(MP_QSTR_CLUSTER_ROLE_SERVER), MP_ROM_INT(ESP_ZB_ZCL_CLUSTER_SERVER_ROLE) },
     { MP_ROM_QSTR(MP_QSTR_CLUSTER_ROLE_CLIENT), MP_ROM_INT(ESP_ZB_ZCL_CLUSTER_CLIENT_ROLE) },
     { MP_ROM_QSTR(MP_QSTR_CLUSTER_ID_BASIC), MP_ROM_INT(ESP_ZB_ZCL_CLUSTER_ID_BASIC) },
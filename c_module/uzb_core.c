@@ -94,16 +94,35 @@ static uint16_t s_window_current_position_tilt = ESP_ZB_ZCL_WINDOW_COVERING_CURR
 static uint8_t s_window_current_position_lift_percentage = ESP_ZB_ZCL_WINDOW_COVERING_CURRENT_POSITION_LIFT_PERCENTAGE_DEFAULT_VALUE;
 static uint8_t s_window_current_position_tilt_percentage = ESP_ZB_ZCL_WINDOW_COVERING_CURRENT_POSITION_TILT_PERCENTAGE_DEFAULT_VALUE;
 
+// Event ring depth: sdkconfig CONFIG_UZIGBEE_EVENT_QUEUE_LEN, then -DUZB_EVENT_QUEUE_LEN, then 16.
+#if defined(CONFIG_UZIGBEE_EVENT_QUEUE_LEN)
+#define UZB_EVENT_QUEUE_LEN (CONFIG_UZIGBEE_EVENT_QUEUE_LEN)
+#elif !defined(UZB_EVENT_QUEUE_LEN)
 #define UZB_EVENT_QUEUE_LEN (16)
+#endif
+
+#if (UZB_EVENT_QUEUE_LEN) < 4 || (UZB_EVENT_QUEUE_LEN) > 1024
+#error "UZB_EVENT_QUEUE_LEN must be in 4..1024"
+#endif
+
+// ATTR_SET coalescing only looks at the newest entries so the scan under
+// s_event_lock stays short regardless of the ring depth.
+#ifndef UZB_EVENT_COALESCE_SCAN
+#define UZB_EVENT_COALESCE_SCAN (8)
+#endif
+
+#if (UZB_EVENT_COALESCE_SCAN) < 1
+#error "UZB_EVENT_COALESCE_SCAN must be at least 1"
+#endif
 
 static uzb_dispatch_request_cb_t s_dispatch_request_cb = NULL;
 static bool s_dispatch_pending = false;
 
 static uzb_event_t s_event_queue[UZB_EVENT_QUEUE_LEN];
-static uint8_t s_event_head = 0;
-static uint8_t s_event_tail = 0;
-static uint8_t s_event_depth = 0;
-static uzb_event_stats_t s_event_stats = {0};
+static uint16_t s_event_head = 0;
+static uint16_t s_event_tail = 0;
+static uint16_t s_event_depth = 0;
+static uzb_event_stats_t s_event_stats = {.capacity = UZB_EVENT_QUEUE_LEN};
 static portMUX_TYPE s_event_lock = portMUX_INITIALIZER_UNLOCKED;
 static bool s_last_joined_valid = false;
 static uint16_t s_last_joined_short_addr = 0;
@@ -117,6 +136,10 @@ static portMUX_TYPE s_active_ep_lock = portMUX_INITIALIZER_UNLOCKED;
 static uzb_node_desc_snapshot_t s_node_desc_snapshot = {0};
 static portMUX_TYPE s_node_desc_lock = portMUX_INITIALIZER_UNLOCKED;
 static uzb_simple_desc_snapshot_t s_simple_desc_snapshot = {0};
+static uzb_simple_desc_snapshot_t s_simple_desc_slots[UZB_SIMPLE_DESC_SLOTS] = {0};
+static uint8_t s_simple_desc_slot_endpoint[UZB_SIMPLE_DESC_SLOTS] = {0};
+static uint8_t s_simple_desc_slot_pending[UZB_SIMPLE_DESC_SLOTS] = {0};
+static uint8_t s_simple_desc_slot_next = 0;
 static portMUX_TYPE s_simple_desc_lock = portMUX_INITIALIZER_UNLOCKED;
 static uzb_power_desc_snapshot_t s_power_desc_snapshot = {0};
 static portMUX_TYPE s_power_desc_lock = portMUX_INITIALIZER_UNLOCKED;
@@ -621,6 +644,34 @@ static void uzb_request_dispatch_if_needed(void) {
     }
 }
 
+static inline bool uzb_attr_set_same_key(const uzb_attr_set_event_t *a, const uzb_attr_set_event_t *b) {
+    return a->has_source == b->has_source &&
+        (!a->has_source || (a->source_short_addr == b->source_short_addr && a->source_endpoint == b->source_endpoint)) &&
+        a->endpoint == b->endpoint &&
+        a->cluster_id == b->cluster_id &&
+        a->attr_id == b->attr_id;
+}
+
+// Caller holds s_event_lock. A pending ATTR_SET for the same attribute among the
+// newest UZB_EVENT_COALESCE_SCAN entries keeps its queue slot and takes the newer
+// value, so bursts never displace fresh state.
+static bool uzb_coalesce_attr_set_locked(const uzb_attr_set_event_t *attr_set) {
+    uint16_t scan = s_event_depth;
+    if (scan > UZB_EVENT_COALESCE_SCAN) {
+        scan = UZB_EVENT_COALESCE_SCAN;
+    }
+    uint16_t index = s_event_head;
+    for (uint16_t i = 0; i < scan; ++i) {
+        index = (uint16_t)((index + UZB_EVENT_QUEUE_LEN - 1) % UZB_EVENT_QUEUE_LEN);
+        uzb_event_t *pending = &s_event_queue[index];
+        if (pending->type == UZB_EVENT_TYPE_ATTR_SET && uzb_attr_set_same_key(&pending->data.attr_set, attr_set)) {
+            pending->data.attr_set = *attr_set;
+            return true;
+        }
+    }
+    return false;
+}
+
 static void uzb_enqueue_event(const uzb_event_t *event) {
     if (event == NULL) {
         return;
@@ -629,11 +680,13 @@ static void uzb_enqueue_event(const uzb_event_t *event) {
     bool queued = false;
 
     uzb_event_lock();
-    if (s_event_depth >= UZB_EVENT_QUEUE_LEN) {
+    if (event->type == UZB_EVENT_TYPE_ATTR_SET && uzb_coalesce_attr_set_locked(&event->data.attr_set)) {
+        s_event_stats.coalesced += 1;
+    } else if (s_event_depth >= UZB_EVENT_QUEUE_LEN) {
         s_event_stats.dropped_queue_full += 1;
     } else {
         s_event_queue[s_event_head] = *event;
-        s_event_head = (uint8_t)((s_event_head + 1) % UZB_EVENT_QUEUE_LEN);
+        s_event_head = (uint16_t)((s_event_head + 1) % UZB_EVENT_QUEUE_LEN);
         s_event_depth += 1;
         s_event_stats.enqueued += 1;
         s_event_stats.depth = s_event_depth;
@@ -715,6 +768,94 @@ static void uzb_enqueue_report_attr_event(const esp_zb_zcl_report_attr_message_t
     uzb_enqueue_event(&event);
 }
 
+static void uzb_enqueue_read_attr_resp_event(const esp_zb_zcl_cmd_read_attr_resp_message_t *message) {
+    if (message == NULL) {
+        return;
+    }
+
+    uzb_event_t event = {0};
+    event.type = UZB_EVENT_TYPE_READ_ATTR_RESP;
+    event.data.read_attr_resp.tsn = message->info.header.tsn;
+    event.data.read_attr_resp.source_short_addr = 0xFFFF;
+    if (message->info.src_address.addr_type == ESP_ZB_ZCL_ADDR_TYPE_SHORT) {
+        event.data.read_attr_resp.source_short_addr = message->info.src_address.u.short_addr;
+    }
+    event.data.read_attr_resp.source_endpoint = message->info.src_endpoint;
+    event.data.read_attr_resp.cluster_id = message->info.cluster;
+
+    const esp_zb_zcl_read_attr_resp_variable_t *variable = message->variables;
+    if (message->info.status != ESP_ZB_ZCL_STATUS_SUCCESS || variable == NULL) {
+        // Whole-frame failure: one terminal record so the waiter does not time out.
+        event.data.read_attr_resp.last = 1;
+        event.data.read_attr_resp.attr_id = 0xFFFF;
+        event.data.read_attr_resp.status = (uint8_t)(message->info.status != ESP_ZB_ZCL_STATUS_SUCCESS
+            ? message->info.status
+            : ESP_ZB_ZCL_STATUS_FAIL);
+        uzb_enqueue_event(&event);
+        return;
+    }
+
+    while (variable != NULL) {
+        uzb_event_t record = event;
+        record.data.read_attr_resp.attr_id = variable->attribute.id;
+        record.data.read_attr_resp.status = (uint8_t)variable->status;
+        record.data.read_attr_resp.last = variable->next == NULL ? 1 : 0;
+        if (variable->status == ESP_ZB_ZCL_STATUS_SUCCESS &&
+            uzb_decode_attr_data(variable->attribute.data.type, variable->attribute.data.value, &record.data.read_attr_resp.value) != ESP_OK) {
+            record.data.read_attr_resp.status = ESP_ZB_ZCL_STATUS_INVALID_TYPE;
+            record.data.read_attr_resp.value.zcl_type = variable->attribute.data.type;
+        }
+        uzb_enqueue_event(&record);
+        variable = variable->next;
+    }
+}
+
+static void uzb_enqueue_group_resp_event(const esp_zb_zcl_groups_operate_group_resp_message_t *message) {
+    if (message == NULL) {
+        return;
+    }
+
+    uzb_event_t event = {0};
+    event.type = UZB_EVENT_TYPE_GROUP_RESP;
+    event.data.group_resp.cmd_id = message->info.command.id;
+    event.data.group_resp.status = (uint8_t)message->info.status;
+    event.data.group_resp.source_endpoint = message->info.src_endpoint;
+    event.data.group_resp.source_short_addr = 0xFFFF;
+    if (message->info.src_address.addr_type == ESP_ZB_ZCL_ADDR_TYPE_SHORT) {
+        event.data.group_resp.source_short_addr = message->info.src_address.u.short_addr;
+    }
+    event.data.group_resp.group_id = message->group_id;
+    uzb_enqueue_event(&event);
+}
+
+static void uzb_enqueue_desc_response_event(uint8_t kind, uint8_t status, uint16_t addr, uint8_t endpoint) {
+    uzb_event_t event = {0};
+    event.type = UZB_EVENT_TYPE_DESC_RESPONSE;
+    event.data.desc_response.kind = kind;
+    event.data.desc_response.status = status;
+    event.data.desc_response.addr = addr;
+    event.data.desc_response.endpoint = endpoint;
+    uzb_enqueue_event(&event);
+}
+
+// Caller must hold the simple descriptor lock. Returns UZB_SIMPLE_DESC_SLOTS when every slot
+// still waits for a response: reusing one would file that late answer under the new request.
+static uint8_t uzb_simple_desc_slot_acquire(uint16_t addr, uint8_t endpoint) {
+    for (uint8_t i = 0; i < UZB_SIMPLE_DESC_SLOTS; ++i) {
+        if (s_simple_desc_slot_endpoint[i] == endpoint && s_simple_desc_slots[i].addr == addr) {
+            return i;
+        }
+    }
+    for (uint8_t n = 0; n < UZB_SIMPLE_DESC_SLOTS; ++n) {
+        uint8_t slot = (uint8_t)((s_simple_desc_slot_next + n) % UZB_SIMPLE_DESC_SLOTS);
+        if (s_simple_desc_slot_pending[slot] == 0) {
+            s_simple_desc_slot_next = (uint8_t)((slot + 1) % UZB_SIMPLE_DESC_SLOTS);
+            return slot;
+        }
+    }
+    return UZB_SIMPLE_DESC_SLOTS;
+}
+
 static inline void uzb_update_last_joined_short_addr(uint16_t short_addr) {
     if (short_addr == 0 || short_addr == 0xFFFF) {
         return;
@@ -784,12 +925,13 @@ static void uzb_binding_table_response_cb(const esp_zb_zdo_binding_table_info_t
 }
 
 static void uzb_active_ep_response_cb(esp_zb_zdp_status_t zdo_status, uint8_t ep_count, uint8_t *ep_id_list, void *user_ctx) {
-    (void)user_ctx;
+    uint16_t req_addr = (uint16_t)(uintptr_t)user_ctx;
 
     uzb_active_ep_lock();
     memset(&s_active_ep_snapshot, 0, sizeof(s_active_ep_snapshot));
     s_active_ep_snapshot.valid = 1;
     s_active_ep_snapshot.status = (uint8_t)zdo_status;
+    s_active_ep_snapshot.addr = req_addr;
     uint8_t count = ep_count;
     if (count > UZB_ACTIVE_EP_MAX_ENDPOINTS) {
         count = UZB_ACTIVE_EP_MAX_ENDPOINTS;
@@ -801,10 +943,12 @@ static void uzb_active_ep_response_cb(esp_zb_zdp_status_t zdo_status, uint8_t ep
     uzb_active_ep_unlock();
 
     ESP_LOGI(TAG,
-             "active_ep rsp status=0x%02x count=%u stored=%u",
+             "active_ep rsp status=0x%02x addr=0x%04x count=%u stored=%u",
              (unsigned int)zdo_status,
+             (unsigned int)req_addr,
              (unsigned int)ep_count,
              (unsigned int)count);
+    uzb_enqueue_desc_response_event(UZB_DESC_KIND_ACTIVE_EP, (uint8_t)zdo_status, req_addr, 0);
 }
 
 static void uzb_node_desc_response_cb(esp_zb_zdp_status_t zdo_status, uint16_t addr, esp_zb_af_node_desc_t *node_desc, void *user_ctx) {
@@ -833,10 +977,14 @@ static void uzb_node_desc_response_cb(esp_zb_zdp_status_t zdo_status, uint16_t a
              (unsigned int)zdo_status,
              (unsigned int)addr,
              (unsigned int)(node_desc != NULL ? 1 : 0));
+    uzb_enqueue_desc_response_event(UZB_DESC_KIND_NODE, (uint8_t)zdo_status, addr, 0);
 }
 
 static void uzb_simple_desc_response_cb(esp_zb_zdp_status_t zdo_status, esp_zb_af_simple_desc_1_1_t *simple_desc, void *user_ctx) {
-    (void)user_ctx;
+    // user_ctx carries slot index + 1, zero means no slot was reserved.
+    uintptr_t slot_ref = (uintptr_t)user_ctx;
+    uint16_t slot_addr = 0xFFFF;
+    uint8_t slot_endpoint = 0;
 
     uzb_simple_desc_lock();
     uint16_t req_addr = s_simple_desc_snapshot.addr;
@@ -872,12 +1020,25 @@ static void uzb_simple_desc_response_cb(esp_zb_zdp_status_t zdo_status, esp_zb_a
             }
         }
     }
+    if (slot_ref > 0 && slot_ref <= UZB_SIMPLE_DESC_SLOTS) {
+        uint8_t slot = (uint8_t)(slot_ref - 1);
+        slot_addr = s_simple_desc_slots[slot].addr;
+        slot_endpoint = s_simple_desc_slot_endpoint[slot];
+        s_simple_desc_slots[slot] = s_simple_desc_snapshot;
+        s_simple_desc_slots[slot].addr = slot_addr;
+        if (s_simple_desc_slot_pending[slot] > 0) {
+            s_simple_desc_slot_pending[slot]--;
+        }
+    }
     uzb_simple_desc_unlock();
 
     ESP_LOGI(TAG,
              "simple_desc rsp status=0x%02x has_desc=%u",
              (unsigned int)zdo_status,
              (unsigned int)(simple_desc != NULL ? 1 : 0));
+    if (slot_endpoint != 0) {
+        uzb_enqueue_desc_response_event(UZB_DESC_KIND_SIMPLE, (uint8_t)zdo_status, slot_addr, slot_endpoint);
+    }
 }
 
 static void uzb_power_desc_response_cb(esp_zb_zdo_power_desc_rsp_t *power_desc, void *user_ctx) {
@@ -902,6 +1063,7 @@ static void uzb_power_desc_response_cb(esp_zb_zdo_power_desc_rsp_t *power_desc,
              "power_desc rsp status=0x%02x addr=0x%04x",
              (unsigned int)power_desc->status,
              (unsigned int)power_desc->nwk_addr_of_interest);
+    uzb_enqueue_desc_response_event(UZB_DESC_KIND_POWER, (uint8_t)power_desc->status, power_desc->nwk_addr_of_interest, 0);
 }
 
 static esp_err_t uzb_action_handler(esp_zb_core_action_callback_id_t callback_id, const void *message) {
@@ -909,6 +1071,10 @@ static esp_err_t uzb_action_handler(esp_zb_core_action_callback_id_t callback_id
         uzb_enqueue_attr_set_event((const esp_zb_zcl_set_attr_value_message_t *)message);
     } else if (callback_id == ESP_ZB_CORE_REPORT_ATTR_CB_ID) {
         uzb_enqueue_report_attr_event((const esp_zb_zcl_report_attr_message_t *)message);
+    } else if (callback_id == ESP_ZB_CORE_CMD_READ_ATTR_RESP_CB_ID) {
+        uzb_enqueue_read_attr_resp_event((const esp_zb_zcl_cmd_read_attr_resp_message_t *)message);
+    } else if (callback_id == ESP_ZB_CORE_CMD_OPERATE_GROUP_RESP_CB_ID) {
+        uzb_enqueue_group_resp_event((const esp_zb_zcl_groups_operate_group_resp_message_t *)message);
     }
     return ESP_OK;
 }
@@ -2351,6 +2517,7 @@ esp_err_t uzb_core_start(bool form_network) {
     uzb_node_desc_unlock();
     uzb_simple_desc_lock();
     memset(&s_simple_desc_snapshot, 0, sizeof(s_simple_desc_snapshot));
+    memset(s_simple_desc_slot_pending, 0, sizeof(s_simple_desc_slot_pending));
     uzb_simple_desc_unlock();
     uzb_power_desc_lock();
     memset(&s_power_desc_snapshot, 0, sizeof(s_power_desc_snapshot));
@@ -2750,6 +2917,44 @@ esp_err_t uzb_core_configure_reporting(uint8_t src_endpoint, uint16_t dst_short_
     return ESP_OK;
 }
 
+esp_err_t uzb_core_send_read_attr_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint,
+                                      uint16_t cluster_id, const uint16_t *attr_ids, uint8_t attr_count, uint8_t *out_tsn) {
+    if (!s_started || !s_device_registered) {
+        return ESP_ERR_INVALID_STATE;
+    }
+    if (!uzb_valid_endpoint_id(src_endpoint) || !uzb_valid_endpoint_id(dst_endpoint)) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (attr_ids == NULL || attr_count == 0 || attr_count > UZB_READ_ATTR_MAX) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (!esp_zb_lock_acquire(pdMS_TO_TICKS(5000))) {
+        ESP_LOGE(TAG, "lock acquire failed during send_read_attr_cmd");
+        return ESP_ERR_TIMEOUT;
+    }
+
+    // The SDK copies attr_field into the outgoing frame before returning.
+    uint16_t attr_field[UZB_READ_ATTR_MAX];
+    memcpy(attr_field, attr_ids, (size_t)attr_count * sizeof(uint16_t));
+
+    esp_zb_zcl_read_attr_cmd_t cmd_req = {0};
+    cmd_req.zcl_basic_cmd.src_endpoint = src_endpoint;
+    cmd_req.zcl_basic_cmd.dst_endpoint = dst_endpoint;
+    cmd_req.zcl_basic_cmd.dst_addr_u.addr_short = dst_short_addr;
+    cmd_req.address_mode = ESP_ZB_APS_ADDR_MODE_16_ENDP_PRESENT;
+    cmd_req.clusterID = cluster_id;
+    cmd_req.direction = ESP_ZB_ZCL_CMD_DIRECTION_TO_SRV;
+    cmd_req.attr_number = attr_count;
+    cmd_req.attr_field = attr_field;
+    uint8_t tsn = esp_zb_zcl_read_attr_cmd_req(&cmd_req);
+    esp_zb_lock_release();
+
+    if (out_tsn != NULL) {
+        *out_tsn = tsn;
+    }
+    return ESP_OK;
+}
+
 esp_err_t uzb_core_send_on_off_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint, uint8_t cmd_id) {
     if (!s_started || !s_device_registered) {
         return ESP_ERR_INVALID_STATE;
@@ -2873,6 +3078,124 @@ esp_err_t uzb_core_send_color_move_to_color_temperature_cmd(
     return ESP_OK;
 }
 
+/* Groupcast variants: one APS frame addressed to a group, no destination endpoint. */
+esp_err_t uzb_core_groupcast_on_off_cmd(uint8_t src_endpoint, uint16_t group_id, uint8_t cmd_id) {
+    if (!s_started || !s_device_registered) {
+        return ESP_ERR_INVALID_STATE;
+    }
+    if (!uzb_valid_endpoint_id(src_endpoint)) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (cmd_id != ESP_ZB_ZCL_CMD_ON_OFF_OFF_ID &&
+        cmd_id != ESP_ZB_ZCL_CMD_ON_OFF_ON_ID &&
+        cmd_id != ESP_ZB_ZCL_CMD_ON_OFF_TOGGLE_ID) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (!esp_zb_lock_acquire(pdMS_TO_TICKS(5000))) {
+        ESP_LOGE(TAG, "lock acquire failed during groupcast_on_off_cmd");
+        return ESP_ERR_TIMEOUT;
+    }
+
+    esp_zb_zcl_on_off_cmd_t cmd_req = {0};
+    cmd_req.zcl_basic_cmd.src_endpoint = src_endpoint;
+    cmd_req.zcl_basic_cmd.dst_addr_u.addr_short = group_id;
+    cmd_req.address_mode = ESP_ZB_APS_ADDR_MODE_16_GROUP_ENDP_NOT_PRESENT;
+    cmd_req.on_off_cmd_id = cmd_id;
+    (void)esp_zb_zcl_on_off_cmd_req(&cmd_req);
+    esp_zb_lock_release();
+    return ESP_OK;
+}
+
+esp_err_t uzb_core_groupcast_level_cmd(uint8_t src_endpoint, uint16_t group_id, uint8_t level, uint16_t transition_time_ds, bool with_onoff) {
+    if (!s_started || !s_device_registered) {
+        return ESP_ERR_INVALID_STATE;
+    }
+    if (!uzb_valid_endpoint_id(src_endpoint)) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (level > 254) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (!esp_zb_lock_acquire(pdMS_TO_TICKS(5000))) {
+        ESP_LOGE(TAG, "lock acquire failed during groupcast_level_cmd");
+        return ESP_ERR_TIMEOUT;
+    }
+
+    esp_zb_zcl_move_to_level_cmd_t cmd_req = {0};
+    cmd_req.zcl_basic_cmd.src_endpoint = src_endpoint;
+    cmd_req.zcl_basic_cmd.dst_addr_u.addr_short = group_id;
+    cmd_req.address_mode = ESP_ZB_APS_ADDR_MODE_16_GROUP_ENDP_NOT_PRESENT;
+    cmd_req.level = level;
+    cmd_req.transition_time = transition_time_ds;
+    if (with_onoff) {
+        (void)esp_zb_zcl_level_move_to_level_with_onoff_cmd_req(&cmd_req);
+    } else {
+        (void)esp_zb_zcl_level_move_to_level_cmd_req(&cmd_req);
+    }
+    esp_zb_lock_release();
+    return ESP_OK;
+}
+
+esp_err_t uzb_core_groupcast_color_move_to_color_cmd(
+    uint8_t src_endpoint,
+    uint16_t group_id,
+    uint16_t color_x,
+    uint16_t color_y,
+    uint16_t transition_time_ds
+) {
+    if (!s_started || !s_device_registered) {
+        return ESP_ERR_INVALID_STATE;
+    }
+    if (!uzb_valid_endpoint_id(src_endpoint)) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (!esp_zb_lock_acquire(pdMS_TO_TICKS(5000))) {
+        ESP_LOGE(TAG, "lock acquire failed during groupcast_color_move_to_color_cmd");
+        return ESP_ERR_TIMEOUT;
+    }
+
+    esp_zb_zcl_color_move_to_color_cmd_t cmd_req = {0};
+    cmd_req.zcl_basic_cmd.src_endpoint = src_endpoint;
+    cmd_req.zcl_basic_cmd.dst_addr_u.addr_short = group_id;
+    cmd_req.address_mode = ESP_ZB_APS_ADDR_MODE_16_GROUP_ENDP_NOT_PRESENT;
+    cmd_req.color_x = color_x;
+    cmd_req.color_y = color_y;
+    cmd_req.transition_time = transition_time_ds;
+    (void)esp_zb_zcl_color_move_to_color_cmd_req(&cmd_req);
+
+    esp_zb_lock_release();
+    return ESP_OK;
+}
+
+esp_err_t uzb_core_groupcast_color_move_to_color_temperature_cmd(
+    uint8_t src_endpoint,
+    uint16_t group_id,
+    uint16_t color_temperature,
+    uint16_t transition_time_ds
+) {
+    if (!s_started || !s_device_registered) {
+        return ESP_ERR_INVALID_STATE;
+    }
+    if (!uzb_valid_endpoint_id(src_endpoint)) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (!esp_zb_lock_acquire(pdMS_TO_TICKS(5000))) {
+        ESP_LOGE(TAG, "lock acquire failed during groupcast_color_move_to_color_temperature_cmd");
+        return ESP_ERR_TIMEOUT;
+    }
+
+    esp_zb_zcl_color_move_to_color_temperature_cmd_t cmd_req = {0};
+    cmd_req.zcl_basic_cmd.src_endpoint = src_endpoint;
+    cmd_req.zcl_basic_cmd.dst_addr_u.addr_short = group_id;
+    cmd_req.address_mode = ESP_ZB_APS_ADDR_MODE_16_GROUP_ENDP_NOT_PRESENT;
+    cmd_req.color_temperature = color_temperature;
+    cmd_req.transition_time = transition_time_ds;
+    (void)esp_zb_zcl_color_move_to_color_temperature_cmd_req(&cmd_req);
+
+    esp_zb_lock_release();
+    return ESP_OK;
+}
+
 esp_err_t uzb_core_send_lock_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint, bool lock) {
     if (!s_started || !s_device_registered) {
         return ESP_ERR_INVALID_STATE;
@@ -3483,7 +3806,7 @@ esp_err_t uzb_core_request_active_endpoints(uint16_t dst_short_addr) {
 
     esp_zb_zdo_active_ep_req_param_t req = {0};
     req.addr_of_interest = dst_short_addr;
-    esp_zb_zdo_active_ep_req(&req, uzb_active_ep_response_cb, NULL);
+    esp_zb_zdo_active_ep_req(&req, uzb_active_ep_response_cb, (void *)(uintptr_t)dst_short_addr);
 
     esp_zb_lock_release();
     return ESP_OK;
@@ -3562,14 +3885,24 @@ esp_err_t uzb_core_request_simple_descriptor(uint16_t dst_short_addr, uint8_t en
     }
 
     uzb_simple_desc_lock();
+    uint8_t slot = uzb_simple_desc_slot_acquire(dst_short_addr, endpoint);
+    if (slot >= UZB_SIMPLE_DESC_SLOTS) {
+        uzb_simple_desc_unlock();
+        esp_zb_lock_release();
+        return ESP_ERR_NO_MEM;
+    }
     memset(&s_simple_desc_snapshot, 0, sizeof(s_simple_desc_snapshot));
     s_simple_desc_snapshot.addr = dst_short_addr;
+    memset(&s_simple_desc_slots[slot], 0, sizeof(s_simple_desc_slots[slot]));
+    s_simple_desc_slots[slot].addr = dst_short_addr;
+    s_simple_desc_slot_endpoint[slot] = endpoint;
+    s_simple_desc_slot_pending[slot]++;
     uzb_simple_desc_unlock();
 
     esp_zb_zdo_simple_desc_req_param_t req = {0};
     req.addr_of_interest = dst_short_addr;
     req.endpoint = endpoint;
-    esp_zb_zdo_simple_desc_req(&req, uzb_simple_desc_response_cb, NULL);
+    esp_zb_zdo_simple_desc_req(&req, uzb_simple_desc_response_cb, (void *)(uintptr_t)(slot + 1));
 
     esp_zb_lock_release();
     return ESP_OK;
@@ -3593,6 +3926,30 @@ esp_err_t uzb_core_get_simple_descriptor_snapshot(uzb_simple_desc_snapshot_t *ou
     return ESP_OK;
 }
 
+esp_err_t uzb_core_get_simple_descriptor_snapshot_for(uint16_t dst_short_addr, uint8_t endpoint, uzb_simple_desc_snapshot_t *out_snapshot) {
+    if (out_snapshot == NULL) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (!s_started) {
+        return ESP_ERR_INVALID_STATE;
+    }
+
+    esp_err_t err = ESP_ERR_NOT_FOUND;
+    uzb_simple_desc_lock();
+    for (uint8_t i = 0; i < UZB_SIMPLE_DESC_SLOTS; ++i) {
+        if (s_simple_desc_slot_endpoint[i] != endpoint || s_simple_desc_slots[i].addr != dst_short_addr) {
+            continue;
+        }
+        if (s_simple_desc_slots[i].valid) {
+            *out_snapshot = s_simple_desc_slots[i];
+            err = ESP_OK;
+        }
+        break;
+    }
+    uzb_simple_desc_unlock();
+    return err;
+}
+
 esp_err_t uzb_core_request_power_descriptor(uint16_t dst_short_addr) {
     if (!s_started) {
         return ESP_ERR_INVALID_STATE;
@@ -3710,6 +4067,28 @@ esp_err_t uzb_core_get_ieee_addr(uint8_t out_ieee_addr[8]) {
     return ESP_OK;
 }
 
+esp_err_t uzb_core_get_ieee_addr_by_short(uint16_t short_addr, uint8_t out_ieee_addr[8]) {
+    if (out_ieee_addr == NULL) {
+        return ESP_ERR_INVALID_ARG;
+    }
+    if (!s_started) {
+        return ESP_ERR_INVALID_STATE;
+    }
+    if (!esp_zb_lock_acquire(pdMS_TO_TICKS(5000))) {
+        ESP_LOGE(TAG, "lock acquire failed during get_ieee_addr_by_short");
+        return ESP_ERR_TIMEOUT;
+    }
+    esp_zb_ieee_addr_t long_addr = {0};
+    // Resolved from the stack address table, filled by device announce/update.
+    esp_err_t err = esp_zb_ieee_address_by_short(short_addr, long_addr);
+    esp_zb_lock_release();
+    if (err != ESP_OK) {
+        return ESP_ERR_NOT_FOUND;
+    }
+    memcpy(out_ieee_addr, long_addr, 8);
+    return ESP_OK;
+}
+
 bool uzb_core_is_started(void) {
     return s_started;
 }
@@ -3730,7 +4109,7 @@ bool uzb_core_pop_event(uzb_event_t *out_event) {
     uzb_event_lock();
     if (s_event_depth > 0) {
         *out_event = s_event_queue[s_event_tail];
-        s_event_tail = (uint8_t)((s_event_tail + 1) % UZB_EVENT_QUEUE_LEN);
+        s_event_tail = (uint16_t)((s_event_tail + 1) % UZB_EVENT_QUEUE_LEN);
         s_event_depth -= 1;
         s_event_stats.depth = s_event_depth;
         s_event_stats.dispatched += 1;
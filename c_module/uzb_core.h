@@ -48,12 +48,18 @@ typedef struct {
     uint32_t dispatched;
     uint32_t max_depth;
     uint32_t depth;
+    uint32_t coalesced;
+    uint32_t capacity;
 } uzb_event_stats_t;
 
 // Keep snapshot bounded to protect RAM usage on ESP32-C6.
 #define UZB_BIND_TABLE_MAX_RECORDS (8)
 #define UZB_ACTIVE_EP_MAX_ENDPOINTS (16)
 #define UZB_SIMPLE_DESC_MAX_CLUSTERS (16)
+// Simple descriptor responses kept per (addr, endpoint) so requests can be pipelined.
+#define UZB_SIMPLE_DESC_SLOTS (8)
+// Attribute IDs packed into one ZCL Read Attributes frame.
+#define UZB_READ_ATTR_MAX (16)
 
 typedef struct {
     uint8_t src_ieee_addr[8];
@@ -81,6 +87,8 @@ typedef struct {
 typedef struct {
     uint8_t valid;
     uint8_t status;
+    // Short address the request was sent to, so concurrent interviews can reject a foreign answer.
+    uint16_t addr;
     uint8_t count;
     uint8_t endpoints[UZB_ACTIVE_EP_MAX_ENDPOINTS];
 } uzb_active_ep_snapshot_t;
@@ -138,8 +146,25 @@ typedef struct {
 typedef enum {
     UZB_EVENT_TYPE_APP_SIGNAL = 1,
     UZB_EVENT_TYPE_ATTR_SET = 2,
+    UZB_EVENT_TYPE_DESC_RESPONSE = 3,
+    UZB_EVENT_TYPE_READ_ATTR_RESP = 4,
+    UZB_EVENT_TYPE_GROUP_RESP = 5,
 } uzb_event_type_t;
 
+typedef enum {
+    UZB_DESC_KIND_ACTIVE_EP = 1,
+    UZB_DESC_KIND_NODE = 2,
+    UZB_DESC_KIND_SIMPLE = 3,
+    UZB_DESC_KIND_POWER = 4,
+} uzb_desc_kind_t;
+
+typedef struct {
+    uint8_t kind;
+    uint8_t status;
+    uint16_t addr;
+    uint8_t endpoint;
+} uzb_desc_response_event_t;
+
 typedef struct {
     uint8_t has_source;
     uint16_t source_short_addr;
@@ -151,11 +176,35 @@ typedef struct {
     uzb_attr_value_t value;
 } uzb_attr_set_event_t;
 
+// One record of a Read Attributes response; ``last`` marks the final record of the frame.
+typedef struct {
+    uint8_t tsn;
+    uint8_t last;
+    uint8_t status;
+    uint8_t source_endpoint;
+    uint16_t source_short_addr;
+    uint16_t cluster_id;
+    uint16_t attr_id;
+    uzb_attr_value_t value;
+} uzb_read_attr_resp_event_t;
+
+// Groups cluster Add/Remove Group response; ``cmd_id`` is the response command id.
+typedef struct {
+    uint8_t cmd_id;
+    uint8_t status;
+    uint8_t source_endpoint;
+    uint16_t source_short_addr;
+    uint16_t group_id;
+} uzb_group_resp_event_t;
+
 typedef struct {
     uint8_t type;
     union {
         uzb_app_signal_event_t app_signal;
         uzb_attr_set_event_t attr_set;
+        uzb_desc_response_event_t desc_response;
+        uzb_read_attr_resp_event_t read_attr_resp;
+        uzb_group_resp_event_t group_resp;
     } data;
 } uzb_event_t;
 
@@ -201,6 +250,8 @@ esp_err_t uzb_core_configure_reporting(uint8_t src_endpoint, uint16_t dst_short_
                                        uint16_t cluster_id, uint16_t attr_id, uint8_t attr_type,
                                        uint16_t min_interval, uint16_t max_interval,
                                        bool has_reportable_change, int32_t reportable_change);
+esp_err_t uzb_core_send_read_attr_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint,
+                                      uint16_t cluster_id, const uint16_t *attr_ids, uint8_t attr_count, uint8_t *out_tsn);
 esp_err_t uzb_core_send_on_off_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint, uint8_t cmd_id);
 esp_err_t uzb_core_send_level_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint, uint8_t level, uint16_t transition_time_ds, bool with_onoff);
 esp_err_t uzb_core_send_color_move_to_color_cmd(
@@ -219,6 +270,21 @@ esp_err_t uzb_core_send_color_move_to_color_temperature_cmd(
     uint16_t transition_time_ds
 );
 esp_err_t uzb_core_send_lock_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint, bool lock);
+esp_err_t uzb_core_groupcast_on_off_cmd(uint8_t src_endpoint, uint16_t group_id, uint8_t cmd_id);
+esp_err_t uzb_core_groupcast_level_cmd(uint8_t src_endpoint, uint16_t group_id, uint8_t level, uint16_t transition_time_ds, bool with_onoff);
+esp_err_t uzb_core_groupcast_color_move_to_color_cmd(
+    uint8_t src_endpoint,
+    uint16_t group_id,
+    uint16_t color_x,
+    uint16_t color_y,
+    uint16_t transition_time_ds
+);
+esp_err_t uzb_core_groupcast_color_move_to_color_temperature_cmd(
+    uint8_t src_endpoint,
+    uint16_t group_id,
+    uint16_t color_temperature,
+    uint16_t transition_time_ds
+);
 esp_err_t uzb_core_send_group_add_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint, uint16_t group_id);
 esp_err_t uzb_core_send_group_remove_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint, uint16_t group_id);
 esp_err_t uzb_core_send_group_remove_all_cmd(uint8_t src_endpoint, uint16_t dst_short_addr, uint8_t dst_endpoint);
@@ -264,11 +330,13 @@ esp_err_t uzb_core_request_node_descriptor(uint16_t dst_short_addr);
 esp_err_t uzb_core_get_node_descriptor_snapshot(uzb_node_desc_snapshot_t *out_snapshot);
 esp_err_t uzb_core_request_simple_descriptor(uint16_t dst_short_addr, uint8_t endpoint);
 esp_err_t uzb_core_get_simple_descriptor_snapshot(uzb_simple_desc_snapshot_t *out_snapshot);
+esp_err_t uzb_core_get_simple_descriptor_snapshot_for(uint16_t dst_short_addr, uint8_t endpoint, uzb_simple_desc_snapshot_t *out_snapshot);
 esp_err_t uzb_core_request_power_descriptor(uint16_t dst_short_addr);
 esp_err_t uzb_core_get_power_descriptor_snapshot(uzb_power_desc_snapshot_t *out_snapshot);
 esp_err_t uzb_core_get_network_runtime(uzb_network_runtime_t *out_runtime);
 esp_err_t uzb_core_get_short_addr(uint16_t *out_short_addr);
 esp_err_t uzb_core_get_ieee_addr(uint8_t out_ieee_addr[8]);
+esp_err_t uzb_core_get_ieee_addr_by_short(uint16_t short_addr, uint8_t out_ieee_addr[8]);
 bool uzb_core_is_started(void);
 void uzb_core_set_dispatch_request_cb(uzb_dispatch_request_cb_t cb);
 bool uzb_core_pop_event(uzb_event_t *out_event);
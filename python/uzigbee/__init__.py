@@ -14,6 +14,9 @@ ROLE_END_DEVICE = const(2)
 
 from .core import (
     ZigbeeStack,
+    DescriptorDiscovery,
+    AttributeRead,
+    READ_ATTR_MAX,
     Endpoint,
     Cluster,
     Attribute,
@@ -147,6 +150,7 @@ from .core import (
 from . import zcl
 from . import z2m
 from . import groups
+from .groups import GroupManager
 from . import scenes
 from . import reporting
 from . import commissioning
@@ -154,6 +158,24 @@ from . import security
 from . import custom
 from . import ota
 from .ota import OtaManager
+from . import eventqueue
+from .eventqueue import EventQueue
+from . import scheduler
+from .scheduler import (
+    LANE_ATTRIBUTE,
+    LANE_AUTOMATION,
+    LANE_CONTROL,
+    LANE_DISCOVERY,
+    LANE_PERSISTENCE,
+    LaneScheduler,
+)
+from . import transmit
+from .transmit import (
+    TX_PRIORITY_HIGH,
+    TX_PRIORITY_LOW,
+    TX_PRIORITY_NORMAL,
+    TransmitScheduler,
+)
 from . import greenpower
 from .greenpower import GreenPowerManager
 from . import touchlink
@@ -163,9 +185,11 @@ from .ncp import NcpRcpManager
 from . import network
 from . import node
 from . import gateway
+from . import aio
 from .network import Coordinator, DeviceRegistry, DiscoveredDevice, DeviceIdentity
 from .node import Router, EndDevice
-from .gateway import Gateway
+from .gateway import FrameStream, Gateway
+from .aio import AsyncCoordinator
 from .commissioning import NetworkProfile
 from .devices import (
     ClimateSensor,
@@ -190,6 +214,9 @@ from .devices import (
 
 __all__ = [
     "ZigbeeStack",
+    "DescriptorDiscovery",
+    "AttributeRead",
+    "READ_ATTR_MAX",
     "Endpoint",
     "Cluster",
     "Attribute",
@@ -325,6 +352,7 @@ __all__ = [
     "zcl",
     "z2m",
     "groups",
+    "GroupManager",
     "scenes",
     "reporting",
     "commissioning",
@@ -332,6 +360,20 @@ __all__ = [
     "custom",
     "ota",
     "OtaManager",
+    "eventqueue",
+    "EventQueue",
+    "scheduler",
+    "LaneScheduler",
+    "LANE_CONTROL",
+    "LANE_ATTRIBUTE",
+    "LANE_DISCOVERY",
+    "LANE_AUTOMATION",
+    "LANE_PERSISTENCE",
+    "transmit",
+    "TransmitScheduler",
+    "TX_PRIORITY_HIGH",
+    "TX_PRIORITY_NORMAL",
+    "TX_PRIORITY_LOW",
     "greenpower",
     "GreenPowerManager",
     "touchlink",
@@ -341,6 +383,7 @@ __all__ = [
     "network",
     "node",
     "gateway",
+    "aio",
     "Coordinator",
     "DeviceRegistry",
     "DiscoveredDevice",
@@ -349,6 +392,8 @@ __all__ = [
     "Router",
     "EndDevice",
     "Gateway",
+    "FrameStream",
+    "AsyncCoordinator",
     "Light",
     "DimmableLight",
     "ColorLight",
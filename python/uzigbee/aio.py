@@ -0,0 +1,312 @@
+"""asyncio/uasyncio facade over Coordinator.
+
+Awaitable discovery and device waits, an async stream of attribute/device
+events and a background task that drives the discovery queue. The asyncio
+module is imported on first use, so ``import uzigbee`` stays cheap on target.
+"""
+
+try:
+    import time as _time
+except ImportError:
+    _time = None
+
+from .eventqueue import EventQueue, QUEUE_DROP_OLDEST
+from .network import Coordinator
+
+_asyncio = None
+
+
+def _lib():
+    global _asyncio
+    if _asyncio is None:
+        try:
+            import uasyncio as mod  # type: ignore
+        except ImportError:
+            import asyncio as mod
+        _asyncio = mod
+    return _asyncio
+
+
+def _ticks_ms():
+    if _time is None:
+        return 0
+    if hasattr(_time, "ticks_ms"):
+        return int(_time.ticks_ms())
+    return int(_time.time() * 1000)
+
+
+def _ticks_diff(a, b):
+    if _time is not None and hasattr(_time, "ticks_diff"):
+        return int(_time.ticks_diff(int(a), int(b)))
+    return int(a) - int(b)
+
+
+async def _sleep_ms(ms):
+    lib = _lib()
+    if hasattr(lib, "sleep_ms"):
+        await lib.sleep_ms(int(ms))
+    else:
+        await lib.sleep(int(ms) / 1000.0)
+
+
+async def _wait_event(event, timeout_ms):
+    if timeout_ms is None:
+        await event.wait()
+        return True
+    lib = _lib()
+    try:
+        if hasattr(lib, "wait_for_ms"):
+            await lib.wait_for_ms(event.wait(), int(timeout_ms))
+        else:
+            await lib.wait_for(event.wait(), int(timeout_ms) / 1000.0)
+    except lib.TimeoutError:
+        return False
+    return True
+
+
+class AsyncCoordinator:
+    """Non-blocking Coordinator front-end for uasyncio (target) and asyncio (host).
+
+    Unknown attributes are delegated to the wrapped ``coordinator``. Events are
+    dicts ``{"event", "ts_ms", "payload"}`` like ``Gateway`` and are read with
+    ``await next_event()`` or ``async for event in facade``.
+    """
+
+    __slots__ = (
+        "coordinator",
+        "poll_ms",
+        "process_batch",
+        "_events",
+        "_wake",
+        "_task",
+        "_running",
+        "_closed",
+        "_ticks",
+    )
+
+    def __init__(
+        self,
+        coordinator=None,
+        poll_ms=50,
+        process_batch=4,
+        event_queue_max=64,
+        event_queue_policy=QUEUE_DROP_OLDEST,
+    ):
+        self.coordinator = coordinator if coordinator is not None else Coordinator(auto_discovery=True)
+        self.poll_ms = max(1, int(poll_ms))
+        self.process_batch = max(1, int(process_batch))
+        self._events = EventQueue(event_queue_max, event_queue_policy)
+        self._wake = None
+        self._task = None
+        self._running = False
+        self._closed = False
+        self._ticks = 0
+
+    def __getattr__(self, name):
+        return getattr(self.coordinator, name)
+
+    def _event(self):
+        if self._wake is None:
+            self._wake = _lib().Event()
+        return self._wake
+
+    def _emit(self, event, payload):
+        self._events.push({"event": str(event), "ts_ms": int(_ticks_ms()), "payload": payload})
+        self._event().set()
+
+    def _on_attribute(self, *event):
+        if len(event) >= 7:
+            source_short_addr, endpoint, cluster_id, attr_id, value, attr_type, status = event[:7]
+        else:
+            endpoint, cluster_id, attr_id, value, status = event[:5]
+            source_short_addr = None
+            attr_type = None
+        self._emit(
+            "attribute",
+            {
+                "source_short_addr": source_short_addr,
+                "endpoint": int(endpoint),
+                "cluster_id": int(cluster_id),
+                "attr_id": int(attr_id),
+                "value": value,
+                "attr_type": attr_type,
+                "status": int(status),
+            },
+        )
+
+    def _on_device_added(self, device):
+        self._emit("device_added", {"short_addr": int(device.short_addr), "device": device})
+
+    def _on_device_updated(self, device):
+        self._emit("device_updated", {"short_addr": int(device.short_addr), "device": device})
+
+    def attach(self):
+        """Route coordinator callbacks into the event stream (``start()`` does this)."""
+        self.coordinator.on_attribute(self._on_attribute)
+        self.coordinator.on_device_added(self._on_device_added)
+        self.coordinator.on_device_updated(self._on_device_updated)
+        return self
+
+    async def start(self, form_network=True, interval_ms=None):
+        self.attach()
+        self.coordinator.start(form_network=bool(form_network))
+        self.start_task(interval_ms=interval_ms)
+        return self
+
+    def start_task(self, interval_ms=None):
+        """Spawn ``run()`` on the running loop; no-op when already running."""
+        if self._task is None:
+            self._closed = False
+            self._running = True
+            self._task = _lib().create_task(self.run(interval_ms=interval_ms))
+        return self._task
+
+    async def run(self, interval_ms=None):
+        """Drive queued commands, discovery and autosave (``run_once()`` when cooperative) until ``stop()``."""
+        interval_ms = self.poll_ms if interval_ms is None else max(1, int(interval_ms))
+        self._running = True
+        try:
+            while self._running:
+                self._pump()
+                self._ticks += 1
+                await _sleep_ms(interval_ms)
+        finally:
+            self._running = False
+
+    def _pump(self):
+        coordinator = self.coordinator
+        if coordinator.cooperative:
+            return coordinator.run_once()
+        return coordinator.process_pending_discovery(max_items=self.process_batch)
+
+    def stop(self):
+        self._running = False
+        self._closed = True
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+        self._event().set()
+        return task
+
+    async def _wait_handle(self, handle):
+        while not handle.poll():
+            await _sleep_ms(self.poll_ms)
+        return handle.result()
+
+    async def discover_device(self, short_addr, strict=None):
+        """Interview ``short_addr`` without blocking the loop; returns the registered device."""
+        coordinator = self.coordinator
+        stack = coordinator.stack
+        short_addr = int(short_addr) & 0xFFFF
+        if not hasattr(stack, "start_node_discovery"):
+            # Firmware without split descriptor requests only has the blocking interview.
+            return coordinator.discover_device(short_addr, strict=strict)
+        # Same steps as Coordinator.discover_device; each request is awaited instead of blocking.
+        plan = coordinator._discovery_plan(short_addr, strict=strict)
+        result = None
+        error = None
+        while True:
+            try:
+                step = plan.send(result) if error is None else plan.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                handle = stack.start_node_discovery(
+                    short_addr,
+                    endpoint_ids=step[0],
+                    include_power_desc=step[1],
+                    timeout_ms=coordinator.discover_timeout_ms,
+                    poll_ms=coordinator.discover_poll_ms,
+                    strict=step[2],
+                )
+                result = await self._wait_handle(handle)
+                error = None
+            except Exception as exc:
+                result = None
+                error = exc
+
+    async def wait_for_device(
+        self,
+        feature=None,
+        features=None,
+        manufacturer_code=None,
+        profile_id=None,
+        device_id=None,
+        ieee_addr=None,
+        online=None,
+        timeout_ms=60000,
+        poll_ms=None,
+        permit_join_s=None,
+        auto_discover=True,
+        default=None,
+    ):
+        """Awaitable ``Coordinator.wait_for_device``; the discovery queue is driven while waiting."""
+        coordinator = self.coordinator
+        poll_ms = self.poll_ms if poll_ms is None else max(1, int(poll_ms))
+        timeout_ms = int(timeout_ms)
+        if permit_join_s is not None:
+            coordinator.permit_join(int(permit_join_s), auto_discover=auto_discover)
+        started_ms = _ticks_ms()
+        drive = False
+        while True:
+            if drive:
+                # Without the background task the wait itself pumps the queue.
+                self._pump()
+            device = coordinator.select_device(
+                feature=feature,
+                features=features,
+                manufacturer_code=manufacturer_code,
+                profile_id=profile_id,
+                device_id=device_id,
+                ieee_addr=ieee_addr,
+                online=online,
+                default=None,
+            )
+            if device is not None:
+                return device
+            if not drive and not self._running:
+                drive = True
+                continue
+            if timeout_ms <= 0 or _ticks_diff(_ticks_ms(), started_ms) >= timeout_ms:
+                return default
+            await _sleep_ms(poll_ms)
+
+    def poll_event(self, default=None):
+        return self._events.pop(default)
+
+    async def next_event(self, timeout_ms=None):
+        """Next queued event; None on timeout or after ``stop()``."""
+        started_ms = _ticks_ms()
+        wake = self._event()
+        while True:
+            # Clear before popping so an event pushed in between still wakes the wait.
+            wake.clear()
+            item = self._events.pop()
+            if item is not None:
+                return item
+            if self._closed:
+                return None
+            remaining = None
+            if timeout_ms is not None:
+                remaining = int(timeout_ms) - _ticks_diff(_ticks_ms(), started_ms)
+                if remaining <= 0:
+                    return None
+            if not await _wait_event(wake, remaining):
+                return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.next_event()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+    def stats(self):
+        return {
+            "running": bool(self._running),
+            "ticks": int(self._ticks),
+            "event_queue": self._events.stats(),
+        }
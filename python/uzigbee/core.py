@@ -167,6 +167,19 @@ ATTR_ACCESS_REPORTING = _uzb_const("ATTR_ACCESS_REPORTING", 0x04)
 ATTR_ACCESS_SCENE = _uzb_const("ATTR_ACCESS_SCENE", 0x10)
 CMD_DIRECTION_TO_SERVER = _uzb_const("CMD_DIRECTION_TO_SERVER", 0x00)
 CMD_DIRECTION_TO_CLIENT = _uzb_const("CMD_DIRECTION_TO_CLIENT", 0x01)
+DESC_KIND_ACTIVE_EP = _uzb_const("DESC_KIND_ACTIVE_EP", 1)
+DESC_KIND_NODE = _uzb_const("DESC_KIND_NODE", 2)
+DESC_KIND_SIMPLE = _uzb_const("DESC_KIND_SIMPLE", 3)
+DESC_KIND_POWER = _uzb_const("DESC_KIND_POWER", 4)
+SIMPLE_DESC_SLOTS = _uzb_const("SIMPLE_DESC_SLOTS", 8)
+ATTR_BATCH_MAX = _uzb_const("ATTR_BATCH_MAX", 16)
+ATTR_BATCH_DEFAULT = const(8)
+READ_ATTR_MAX = _uzb_const("READ_ATTR_MAX", 16)
+_DESC_EVENT_WAIT_MS = const(5)
+# esp_err_t the firmware returns when every simple descriptor slot still awaits a response.
+_ESP_ERR_NO_MEM = const(0x101)
+# attr_id of the single record firmware emits when a whole Read Attributes frame failed.
+_READ_ATTR_FRAME = const(0xFFFF)
 
 SIGNAL_NAMES = {
     SIGNAL_DEFAULT_START: "default_start",
@@ -243,6 +256,22 @@ def _sleep_ms(ms):
     _time.sleep(ms / 1000.0)
 
 
+def attr_event_record(event):
+    """Normalize a 5/6/7-field attribute event into the batch record layout.
+
+    Record: ``(source_short_addr|None, endpoint, cluster_id, attr_id, value, attr_type|None, status)``.
+    """
+    if len(event) == 5:
+        endpoint, cluster_id, attr_id, value, status = event
+        return (None, endpoint, cluster_id, attr_id, value, None, status)
+    if len(event) == 6:
+        endpoint, cluster_id, attr_id, value, attr_type, status = event
+        return (None, endpoint, cluster_id, attr_id, value, attr_type, status)
+    if len(event) >= 7:
+        return tuple(event[:7])
+    return None
+
+
 def _coerce_ieee_addr(value):
     try:
         out = bytes(value)
@@ -263,6 +292,437 @@ def _coerce_key16(value):
     return out
 
 
+class DescriptorDiscovery:
+    """Non-blocking descriptor interview handle, see ZigbeeStack.start_node_discovery()."""
+
+    __slots__ = (
+        "_stack",
+        "short_addr",
+        "evented",
+        "_include_green_power",
+        "_timeout_ms",
+        "_poll_ms",
+        "_strict",
+        "_result",
+        "_queue",
+        "_inflight",
+        "_ready",
+        "_simple_by_ep",
+        "_endpoints_known",
+        "_last_sweep_ms",
+        "_error",
+        "_done",
+        "started_ms",
+        "finished_ms",
+    )
+
+    def __init__(
+        self,
+        stack,
+        dst_short_addr,
+        endpoint_ids=None,
+        include_power_desc=True,
+        include_green_power=False,
+        timeout_ms=5000,
+        poll_ms=200,
+        strict=True,
+        evented=True,
+    ):
+        self._stack = stack
+        self.short_addr = int(dst_short_addr)
+        self.evented = bool(evented)
+        self._include_green_power = bool(include_green_power)
+        self._timeout_ms = int(timeout_ms)
+        self._poll_ms = max(0, int(poll_ms))
+        self._strict = bool(strict)
+        self._result = {
+            "short_addr": self.short_addr,
+            "endpoint_ids": [],
+            "active_endpoints": None,
+            "node_descriptor": None,
+            "simple_descriptors": [],
+            "power_descriptor": None,
+            "errors": [],
+        }
+        # Queue order mirrors the sequential interview; (DESC_KIND_SIMPLE, None) expands once endpoints are known.
+        self._queue = []
+        if endpoint_ids is None:
+            self._queue.append((DESC_KIND_ACTIVE_EP, 0))
+            self._endpoints_known = False
+        else:
+            self._set_endpoints([int(endpoint_id) for endpoint_id in endpoint_ids])
+        self._queue.append((DESC_KIND_NODE, 0))
+        self._queue.append((DESC_KIND_SIMPLE, None))
+        if include_power_desc:
+            self._queue.append((DESC_KIND_POWER, 0))
+        self._inflight = {}
+        self._ready = {}
+        self._simple_by_ep = {}
+        self._error = None
+        self._done = False
+        self.started_ms = _ticks_ms()
+        self._last_sweep_ms = self.started_ms
+        self.finished_ms = None
+
+    def _set_endpoints(self, endpoint_ids):
+        if not self._include_green_power:
+            endpoint_ids = [endpoint_id for endpoint_id in endpoint_ids if int(endpoint_id) != 242]
+        self._result["endpoint_ids"] = [int(endpoint_id) for endpoint_id in endpoint_ids]
+        self._endpoints_known = True
+
+    def _request(self, key):
+        kind, endpoint = key
+        if kind == DESC_KIND_ACTIVE_EP:
+            self._stack.request_active_endpoints(self.short_addr)
+        elif kind == DESC_KIND_NODE:
+            self._stack.request_node_descriptor(self.short_addr)
+        elif kind == DESC_KIND_SIMPLE:
+            self._stack.request_simple_descriptor(self.short_addr, endpoint)
+        else:
+            self._stack.request_power_descriptor(self.short_addr)
+
+    def _fetch(self, key):
+        kind, endpoint = key
+        stack = self._stack
+        if kind == DESC_KIND_ACTIVE_EP:
+            snapshot = stack.get_active_endpoints_snapshot()
+            if snapshot is None or int(snapshot.get("addr", self.short_addr)) != self.short_addr:
+                return None
+            return snapshot
+        if kind == DESC_KIND_SIMPLE:
+            if self.evented:
+                snapshot = stack.get_simple_descriptor_snapshot_for(self.short_addr, endpoint)
+            else:
+                snapshot = stack.get_simple_descriptor_snapshot()
+            if snapshot is None or int(snapshot.get("addr", -1)) != self.short_addr:
+                return None
+            desc = snapshot.get("simple_desc")
+            if desc is not None and int(desc.get("endpoint", -1)) != int(endpoint):
+                return None
+            return snapshot
+        if kind == DESC_KIND_NODE:
+            snapshot = stack.get_node_descriptor_snapshot()
+        else:
+            snapshot = stack.get_power_descriptor_snapshot()
+        if snapshot is None or int(snapshot.get("addr", -1)) != self.short_addr:
+            return None
+        return snapshot
+
+    def _on_descriptor_event(self, kind, status, addr, endpoint):
+        if self._done or int(addr) != self.short_addr:
+            return
+        key = (int(kind), int(endpoint) if int(kind) == DESC_KIND_SIMPLE else 0)
+        if key not in self._inflight:
+            return
+        # Shared firmware slots can be overwritten by another interview; re-ask instead of waiting for timeout.
+        snapshot = self._fetch(key)
+        if snapshot is None:
+            if not self._send(key):
+                self._retire(key)
+                self._queue.insert(0, key)
+            return
+        self._ready[key] = snapshot
+
+    def _complete(self, key, snapshot):
+        kind, endpoint = key
+        if kind == DESC_KIND_ACTIVE_EP:
+            self._result["active_endpoints"] = snapshot
+            self._set_endpoints(snapshot.get("endpoints", []))
+        elif kind == DESC_KIND_NODE:
+            self._result["node_descriptor"] = snapshot
+        elif kind == DESC_KIND_SIMPLE:
+            self._simple_by_ep[int(endpoint)] = snapshot
+        else:
+            self._result["power_descriptor"] = snapshot
+
+    def _fail(self, key):
+        kind, endpoint = key
+        if kind == DESC_KIND_ACTIVE_EP:
+            message = "timeout waiting for active_endpoints snapshot"
+            self._set_endpoints([])
+        elif kind == DESC_KIND_NODE:
+            message = "timeout waiting for node_descriptor snapshot"
+        elif kind == DESC_KIND_SIMPLE:
+            message = "timeout waiting for simple_descriptor snapshot for endpoint {}".format(int(endpoint))
+        else:
+            message = "timeout waiting for power_descriptor snapshot"
+        if self._strict:
+            self._error = message
+            self._finish()
+            return
+        self._result["errors"].append(message)
+
+    def _send(self, key):
+        try:
+            self._request(key)
+        except OSError as exc:
+            # Every firmware slot still awaits a (possibly timed-out) response; retry on a later pump.
+            if key[0] == DESC_KIND_SIMPLE and exc.args and int(exc.args[0]) == _ESP_ERR_NO_MEM:
+                return False
+            raise
+        return True
+
+    def _retire(self, key):
+        del self._inflight[key]
+        if key[0] == DESC_KIND_SIMPLE:
+            self._stack._simple_desc_inflight -= 1
+
+    def _pump(self, now_ms):
+        stack = self._stack
+        index = 0
+        while index < len(self._queue) and (self.evented or not self._inflight):
+            key = self._queue[index]
+            if key[0] == DESC_KIND_SIMPLE:
+                if key[1] is None:
+                    if self._endpoints_known:
+                        self._queue[index:index + 1] = [(DESC_KIND_SIMPLE, endpoint_id) for endpoint_id in self._result["endpoint_ids"]]
+                        continue
+                    if not self.evented:
+                        break
+                    index += 1
+                    continue
+                # Firmware slots are shared by every interview, so the budget lives on the stack.
+                if stack._simple_desc_inflight >= SIMPLE_DESC_SLOTS:
+                    if not self.evented:
+                        break
+                    index += 1
+                    continue
+                stack._simple_desc_inflight += 1
+            del self._queue[index]
+            self._inflight[key] = _ticks_add(now_ms, self._timeout_ms if self._timeout_ms > 0 else 0)
+            if not self._send(key):
+                self._retire(key)
+                self._queue.insert(index, key)
+                if not self.evented:
+                    break
+                index += 1
+
+    def _finish(self):
+        self._done = True
+        self._queue = []
+        for key in tuple(self._inflight):
+            self._retire(key)
+        self._ready = {}
+        self.finished_ms = _ticks_ms()
+        self._result["simple_descriptors"] = [
+            {"endpoint": endpoint_id, "snapshot": self._simple_by_ep[endpoint_id]}
+            for endpoint_id in self._result["endpoint_ids"]
+            if endpoint_id in self._simple_by_ep
+        ]
+        self._stack._release_descriptor_job(self)
+
+    def start(self):
+        if self.evented:
+            self._stack._attach_descriptor_job(self)
+        self._pump(self.started_ms)
+        return self
+
+    def poll(self):
+        if self._done:
+            return True
+        now_ms = _ticks_ms()
+        sweep = not self.evented or self._timeout_ms <= 0
+        if not sweep and self._poll_ms > 0 and _ticks_diff(now_ms, self._last_sweep_ms) >= self._poll_ms:
+            # Safety net for completion events lost to a full firmware queue.
+            sweep = True
+            self._last_sweep_ms = now_ms
+        for key in tuple(self._inflight):
+            snapshot = self._ready.pop(key, None)
+            if snapshot is None and sweep:
+                snapshot = self._fetch(key)
+            if snapshot is not None:
+                self._retire(key)
+                self._complete(key, snapshot)
+                continue
+            if self._timeout_ms <= 0 or _ticks_diff(self._inflight[key], now_ms) <= 0:
+                self._retire(key)
+                self._fail(key)
+                if self._done:
+                    return True
+        self._pump(now_ms)
+        if not self._queue and not self._inflight:
+            self._finish()
+        return self._done
+
+    def done(self):
+        return self._done
+
+    def elapsed_ms(self):
+        end_ms = self.finished_ms if self.finished_ms is not None else _ticks_ms()
+        return _ticks_diff(end_ms, self.started_ms)
+
+    def result(self):
+        if not self._done:
+            raise ZigbeeError("descriptor discovery still in progress")
+        if self._error is not None:
+            raise ZigbeeError(self._error)
+        return self._result
+
+    def wait(self):
+        slice_ms = min(self._poll_ms, _DESC_EVENT_WAIT_MS) if self.evented else self._poll_ms
+        while not self.poll():
+            _sleep_ms(slice_ms)
+        return self.result()
+
+    async def wait_async(self):
+        try:
+            import uasyncio as asyncio  # type: ignore
+        except ImportError:
+            import asyncio
+        slice_ms = min(self._poll_ms, _DESC_EVENT_WAIT_MS) if self.evented else self._poll_ms
+        while not self.poll():
+            if hasattr(asyncio, "sleep_ms"):
+                await asyncio.sleep_ms(slice_ms)
+            else:
+                await asyncio.sleep(slice_ms / 1000.0)
+        return self.result()
+
+    def __await__(self):
+        coro = self.wait_async()
+        if hasattr(coro, "__await__"):
+            return coro.__await__()
+        return coro
+
+    __iter__ = __await__
+
+
+class AttributeRead:
+    """Pending ZCL Read Attributes request, see ZigbeeStack.start_read_attributes().
+
+    Response records are matched by transaction sequence number. ``result()``
+    maps each requested attribute ID to ``{"status", "value", "attr_type"}``;
+    attributes missing from the response keep ``status=None``.
+    """
+
+    __slots__ = (
+        "_stack",
+        "short_addr",
+        "endpoint",
+        "cluster_id",
+        "attr_ids",
+        "tsn",
+        "_src_endpoint",
+        "_timeout_ms",
+        "_poll_ms",
+        "_attributes",
+        "_error",
+        "_done",
+        "started_ms",
+        "finished_ms",
+    )
+
+    def __init__(self, stack, dst_short_addr, cluster_id, attr_ids, dst_endpoint=1, src_endpoint=1, timeout_ms=3000, poll_ms=20):
+        attr_ids = tuple(int(attr_id) & 0xFFFF for attr_id in attr_ids)
+        if not attr_ids or len(attr_ids) > int(READ_ATTR_MAX):
+            raise ValueError("attr_ids must hold 1..{} attribute IDs".format(int(READ_ATTR_MAX)))
+        self._stack = stack
+        self.short_addr = int(dst_short_addr) & 0xFFFF
+        self.endpoint = int(dst_endpoint)
+        self.cluster_id = int(cluster_id) & 0xFFFF
+        self.attr_ids = attr_ids
+        self.tsn = None
+        self._src_endpoint = int(src_endpoint)
+        self._timeout_ms = int(timeout_ms)
+        self._poll_ms = max(0, int(poll_ms))
+        self._attributes = {}
+        for attr_id in attr_ids:
+            self._attributes[attr_id] = {"status": None, "value": None, "attr_type": None}
+        self._error = None
+        self._done = False
+        self.started_ms = _ticks_ms()
+        self.finished_ms = None
+
+    def _on_read_record(self, short_addr, endpoint, cluster_id, attr_id, value, attr_type, status, last):
+        if self._done:
+            return
+        # 0xFFFF means the source address was not short; trust the TSN alone then.
+        if int(short_addr) != 0xFFFF and int(short_addr) != self.short_addr:
+            return
+        if int(cluster_id) != self.cluster_id:
+            return
+        attr_id = int(attr_id)
+        status = int(status)
+        if attr_id == _READ_ATTR_FRAME and attr_id not in self._attributes:
+            self._error = "read attributes failed with status 0x{:02x}".format(status)
+        elif attr_id in self._attributes:
+            self._attributes[attr_id] = {
+                "status": status,
+                "value": value if status == 0 else None,
+                "attr_type": None if attr_type is None else int(attr_type),
+            }
+        if last:
+            self._finish()
+
+    def _finish(self):
+        self._done = True
+        self.finished_ms = _ticks_ms()
+        self._stack._release_read_job(self)
+
+    def start(self):
+        stack = self._stack
+        stack._install_read_hook()
+        self.tsn = int(
+            stack.send_read_attr_cmd(
+                self.short_addr,
+                self.cluster_id,
+                self.attr_ids,
+                dst_endpoint=self.endpoint,
+                src_endpoint=self._src_endpoint,
+            )
+        ) & 0xFF
+        stack._bind_read_job(self)
+        return self
+
+    def poll(self):
+        if self._done:
+            return True
+        if self._timeout_ms <= 0 or _ticks_diff(_ticks_ms(), self.started_ms) >= self._timeout_ms:
+            self._error = "timeout waiting for read attributes response"
+            self._finish()
+        return self._done
+
+    def done(self):
+        return self._done
+
+    def elapsed_ms(self):
+        end_ms = self.finished_ms if self.finished_ms is not None else _ticks_ms()
+        return _ticks_diff(end_ms, self.started_ms)
+
+    def result(self):
+        if not self._done:
+            raise ZigbeeError("read attributes still in progress")
+        if self._error is not None:
+            raise ZigbeeError(self._error)
+        return self._attributes
+
+    def wait(self):
+        slice_ms = min(self._poll_ms, _DESC_EVENT_WAIT_MS)
+        while not self.poll():
+            _sleep_ms(slice_ms)
+        return self.result()
+
+    async def wait_async(self):
+        try:
+            import uasyncio as asyncio  # type: ignore
+        except ImportError:
+            import asyncio
+        slice_ms = min(self._poll_ms, _DESC_EVENT_WAIT_MS)
+        while not self.poll():
+            if hasattr(asyncio, "sleep_ms"):
+                await asyncio.sleep_ms(slice_ms)
+            else:
+                await asyncio.sleep(slice_ms / 1000.0)
+        return self.result()
+
+    def __await__(self):
+        coro = self.wait_async()
+        if hasattr(coro, "__await__"):
+            return coro.__await__()
+        return coro
+
+    __iter__ = __await__
+
+
 class ZigbeeStack:
     """Singleton wrapper for the Zigbee stack."""
 
@@ -271,6 +731,11 @@ class ZigbeeStack:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._descriptor_jobs = []
+            cls._instance._descriptor_hook = None
+            cls._instance._simple_desc_inflight = 0
+            cls._instance._read_jobs = {}
+            cls._instance._read_hook = None
         return cls._instance
 
     def init(self, role):
@@ -576,6 +1041,73 @@ class ZigbeeStack:
             transition_ds=int(transition_ds),
         )
 
+    def groupcast_supported(self):
+        return _uzigbee is not None and hasattr(_uzigbee, "groupcast_on_off_cmd")
+
+    def group_responses_supported(self):
+        return _uzigbee is not None and hasattr(_uzigbee, "set_group_response_callback")
+
+    def set_group_response_callback(self, callback=None):
+        """``callback(cmd_id, status, short_addr, endpoint, group_id)`` per Groups Add/Remove Group response.
+
+        Returns False when the firmware does not report group responses.
+        """
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        if not hasattr(_uzigbee, "set_group_response_callback"):
+            return False
+        _uzigbee.set_group_response_callback(callback)
+        return True
+
+    def groupcast_on_off_cmd(self, group_id, src_endpoint=1, cmd_id=CMD_ON_OFF_TOGGLE):
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        if not hasattr(_uzigbee, "groupcast_on_off_cmd"):
+            raise ZigbeeError("groupcast_on_off_cmd not available in firmware")
+        return _uzigbee.groupcast_on_off_cmd(
+            src_endpoint=int(src_endpoint),
+            group_id=int(group_id),
+            cmd_id=int(cmd_id),
+        )
+
+    def groupcast_level_cmd(self, group_id, level, src_endpoint=1, transition_ds=0, with_onoff=True):
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        if not hasattr(_uzigbee, "groupcast_level_cmd"):
+            raise ZigbeeError("groupcast_level_cmd not available in firmware")
+        return _uzigbee.groupcast_level_cmd(
+            src_endpoint=int(src_endpoint),
+            group_id=int(group_id),
+            level=int(level),
+            transition_ds=int(transition_ds),
+            with_onoff=bool(with_onoff),
+        )
+
+    def groupcast_color_move_to_color_cmd(self, group_id, color_x, color_y, src_endpoint=1, transition_ds=0):
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        if not hasattr(_uzigbee, "groupcast_color_move_to_color_cmd"):
+            raise ZigbeeError("groupcast_color_move_to_color_cmd not available in firmware")
+        return _uzigbee.groupcast_color_move_to_color_cmd(
+            src_endpoint=int(src_endpoint),
+            group_id=int(group_id),
+            color_x=int(color_x),
+            color_y=int(color_y),
+            transition_ds=int(transition_ds),
+        )
+
+    def groupcast_color_move_to_color_temperature_cmd(self, group_id, color_temperature, src_endpoint=1, transition_ds=0):
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        if not hasattr(_uzigbee, "groupcast_color_move_to_color_temperature_cmd"):
+            raise ZigbeeError("groupcast_color_move_to_color_temperature_cmd not available in firmware")
+        return _uzigbee.groupcast_color_move_to_color_temperature_cmd(
+            src_endpoint=int(src_endpoint),
+            group_id=int(group_id),
+            color_temperature=int(color_temperature),
+            transition_ds=int(transition_ds),
+        )
+
     def send_group_add_cmd(self, dst_short_addr, group_id, dst_endpoint=1, src_endpoint=1):
         if _uzigbee is None:
             raise ZigbeeError("_uzigbee C module not available")
@@ -959,12 +1491,16 @@ class ZigbeeStack:
         raw = _uzigbee.get_active_endpoints_snapshot()
         if raw is None:
             return None
-        status, count, endpoints = raw
-        return {
+        status, count, endpoints = raw[:3]
+        snapshot = {
             "status": int(status),
             "count": int(count),
             "endpoints": [int(ep) for ep in endpoints],
         }
+        # Older firmware returns no requested address; callers then cannot tell whose answer it is.
+        if len(raw) > 3:
+            snapshot["addr"] = int(raw[3])
+        return snapshot
 
     def request_node_descriptor(self, dst_short_addr):
         if _uzigbee is None:
@@ -1032,7 +1568,9 @@ class ZigbeeStack:
         raw = _uzigbee.get_simple_descriptor_snapshot()
         if raw is None:
             return None
+        return self._simple_descriptor_from_raw(raw)
 
+    def _simple_descriptor_from_raw(self, raw):
         status, addr, simple_desc = raw
         desc_out = None
         if simple_desc is not None:
@@ -1087,6 +1625,143 @@ class ZigbeeStack:
             "power_desc": desc_out,
         }
 
+    def get_simple_descriptor_snapshot_for(self, dst_short_addr, endpoint):
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        if not hasattr(_uzigbee, "get_simple_descriptor_snapshot_for"):
+            raise ZigbeeError("get_simple_descriptor_snapshot_for not available in firmware")
+        raw = _uzigbee.get_simple_descriptor_snapshot_for(
+            dst_short_addr=int(dst_short_addr),
+            endpoint=int(endpoint),
+        )
+        if raw is None:
+            return None
+        return self._simple_descriptor_from_raw(raw)
+
+    def descriptor_events_supported(self):
+        return (
+            _uzigbee is not None
+            and hasattr(_uzigbee, "set_descriptor_callback")
+            and hasattr(_uzigbee, "get_simple_descriptor_snapshot_for")
+        )
+
+    def _attach_descriptor_job(self, job):
+        if self._descriptor_hook is not _uzigbee:
+            _uzigbee.set_descriptor_callback(self._dispatch_descriptor_event)
+            self._descriptor_hook = _uzigbee
+            self._descriptor_jobs = []
+            self._simple_desc_inflight = 0
+        self._descriptor_jobs.append(job)
+
+    def _release_descriptor_job(self, job):
+        if job in self._descriptor_jobs:
+            self._descriptor_jobs.remove(job)
+
+    def _dispatch_descriptor_event(self, kind, status, addr, endpoint):
+        for job in tuple(self._descriptor_jobs):
+            job._on_descriptor_event(kind, status, addr, endpoint)
+
+    def read_attributes_supported(self):
+        return (
+            _uzigbee is not None
+            and hasattr(_uzigbee, "send_read_attr_cmd")
+            and hasattr(_uzigbee, "set_read_attr_callback")
+        )
+
+    def send_read_attr_cmd(self, dst_short_addr, cluster_id, attr_ids, dst_endpoint=1, src_endpoint=1):
+        """Send one Read Attributes frame for up to ``READ_ATTR_MAX`` IDs; returns its TSN."""
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        if not hasattr(_uzigbee, "send_read_attr_cmd"):
+            raise ZigbeeError("send_read_attr_cmd not available in firmware")
+        return _uzigbee.send_read_attr_cmd(
+            src_endpoint=int(src_endpoint),
+            dst_short_addr=int(dst_short_addr),
+            dst_endpoint=int(dst_endpoint),
+            cluster_id=int(cluster_id),
+            attr_ids=[int(attr_id) for attr_id in attr_ids],
+        )
+
+    def _install_read_hook(self):
+        if self._read_hook is not _uzigbee:
+            if _uzigbee is None or not hasattr(_uzigbee, "set_read_attr_callback"):
+                raise ZigbeeError("set_read_attr_callback not available in firmware")
+            _uzigbee.set_read_attr_callback(self._dispatch_read_record)
+            self._read_hook = _uzigbee
+            self._read_jobs = {}
+
+    def _bind_read_job(self, job):
+        previous = self._read_jobs.get(job.tsn)
+        if previous is not None and previous is not job:
+            # 8-bit TSN wrapped onto a request that never completed.
+            previous._error = "read attributes superseded by tsn reuse"
+            previous._finish()
+        self._read_jobs[job.tsn] = job
+
+    def _release_read_job(self, job):
+        if job.tsn is not None and self._read_jobs.get(job.tsn) is job:
+            del self._read_jobs[job.tsn]
+
+    def _dispatch_read_record(self, tsn, short_addr, endpoint, cluster_id, attr_id, value, attr_type, status, last):
+        job = self._read_jobs.get(int(tsn))
+        if job is not None:
+            job._on_read_record(short_addr, endpoint, cluster_id, attr_id, value, attr_type, status, last)
+
+    def start_read_attributes(
+        self,
+        dst_short_addr,
+        cluster_id,
+        attr_ids,
+        dst_endpoint=1,
+        src_endpoint=1,
+        timeout_ms=3000,
+        poll_ms=20,
+    ):
+        """Non-blocking remote read of several attributes of one cluster in a single frame."""
+        return AttributeRead(
+            self,
+            dst_short_addr,
+            cluster_id,
+            attr_ids,
+            dst_endpoint=dst_endpoint,
+            src_endpoint=src_endpoint,
+            timeout_ms=timeout_ms,
+            poll_ms=poll_ms,
+        ).start()
+
+    def read_attributes(self, dst_short_addr, cluster_id, attr_ids, dst_endpoint=1, src_endpoint=1, timeout_ms=3000, poll_ms=20):
+        return self.start_read_attributes(
+            dst_short_addr,
+            cluster_id,
+            attr_ids,
+            dst_endpoint=dst_endpoint,
+            src_endpoint=src_endpoint,
+            timeout_ms=timeout_ms,
+            poll_ms=poll_ms,
+        ).wait()
+
+    def start_node_discovery(
+        self,
+        dst_short_addr,
+        endpoint_ids=None,
+        include_power_desc=True,
+        include_green_power=False,
+        timeout_ms=5000,
+        poll_ms=200,
+        strict=True,
+    ):
+        return DescriptorDiscovery(
+            self,
+            dst_short_addr,
+            endpoint_ids=endpoint_ids,
+            include_power_desc=include_power_desc,
+            include_green_power=include_green_power,
+            timeout_ms=timeout_ms,
+            poll_ms=poll_ms,
+            strict=strict,
+            evented=self.descriptor_events_supported(),
+        ).start()
+
     def _poll_snapshot(self, getter, timeout_ms, poll_ms, validator=None):
         timeout_ms = int(timeout_ms)
         poll_ms = int(poll_ms)
@@ -1116,6 +1791,17 @@ class ZigbeeStack:
         poll_ms=200,
         strict=True,
     ):
+        if self.descriptor_events_supported():
+            return self.start_node_discovery(
+                dst_short_addr,
+                endpoint_ids=endpoint_ids,
+                include_power_desc=include_power_desc,
+                include_green_power=include_green_power,
+                timeout_ms=timeout_ms,
+                poll_ms=poll_ms,
+                strict=strict,
+            ).wait()
+
         dst_short_addr = int(dst_short_addr)
         result = {
             "short_addr": dst_short_addr,
@@ -1138,6 +1824,7 @@ class ZigbeeStack:
                 self.get_active_endpoints_snapshot,
                 timeout_ms=timeout_ms,
                 poll_ms=poll_ms,
+                validator=lambda snapshot: int(snapshot.get("addr", dst_short_addr)) == dst_short_addr,
             )
             if active_snapshot is None:
                 _on_error("timeout waiting for active_endpoints snapshot")
@@ -1281,6 +1968,14 @@ class ZigbeeStack:
             raise ZigbeeError("_uzigbee C module not available")
         return _uzigbee.get_ieee_addr()
 
+    def get_ieee_addr_by_short(self, short_addr):
+        """IEEE address of a remote node from the stack address table, or None if unknown."""
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        if not hasattr(_uzigbee, "get_ieee_addr_by_short"):
+            raise ZigbeeError("get_ieee_addr_by_short not available in firmware")
+        return _uzigbee.get_ieee_addr_by_short(int(short_addr) & 0xFFFF)
+
     def get_network_runtime(self):
         if _uzigbee is None:
             raise ZigbeeError("_uzigbee C module not available")
@@ -1334,17 +2029,48 @@ class ZigbeeStack:
             return _uzigbee.on_attribute(callback)
         return self.set_attribute_callback(callback)
 
+    def on_attribute_batch(self, callback=None, max_batch=ATTR_BATCH_DEFAULT):
+        """Receive attribute events as lists of ``attr_event_record`` tuples.
+
+        Returns True when firmware batches natively; otherwise each event is
+        wrapped into a one-record list on the per-event callback path.
+        """
+        if _uzigbee is None:
+            raise ZigbeeError("_uzigbee C module not available")
+        max_batch = int(max_batch)
+        if max_batch < 1 or max_batch > int(ATTR_BATCH_MAX):
+            raise ValueError("max_batch must be in 1..{}".format(int(ATTR_BATCH_MAX)))
+        if hasattr(_uzigbee, "set_attribute_batch_callback"):
+            _uzigbee.set_attribute_batch_callback(callback, max_batch)
+            return True
+        if callback is None:
+            self.on_attribute(None)
+            return False
+
+        def _single(*event):
+            record = attr_event_record(event)
+            if record is not None:
+                callback([record])
+
+        self.on_attribute(_single)
+        return False
+
     def event_stats(self):
         if _uzigbee is None:
             raise ZigbeeError("_uzigbee C module not available")
         stats = _uzigbee.get_event_stats()
+        # Older firmware reports 6 fields: no ATTR_SET coalescing, capacity unknown.
+        extended = len(stats) >= 8
         return {
             "enqueued": stats[0],
             "dropped_queue_full": stats[1],
             "dropped_schedule_fail": stats[2],
             "dispatched": stats[3],
             "max_depth": stats[4],
+            "high_watermark": stats[4],
             "depth": stats[5],
+            "coalesced": stats[6] if extended else 0,
+            "capacity": stats[7] if extended else None,
         }
 
     def heap_stats(self):
@@ -0,0 +1,123 @@
+"""Fixed-capacity ring-buffer event queue shared by the manager facades."""
+
+QUEUE_DROP_OLDEST = "drop_oldest"
+QUEUE_DROP_NEWEST = "drop_newest"
+
+_POLICY_VALUES = (
+    QUEUE_DROP_OLDEST,
+    QUEUE_DROP_NEWEST,
+)
+
+
+def _normalize_policy(value):
+    policy = str(value or QUEUE_DROP_OLDEST).strip().lower()
+    if policy not in _POLICY_VALUES:
+        raise ValueError("invalid event queue policy: {}".format(value))
+    return policy
+
+
+class EventQueue:
+    """Bounded FIFO with O(1) push/pop; overflow drops the oldest or the newest item."""
+
+    __slots__ = (
+        "capacity",
+        "policy",
+        "pushed",
+        "dropped_oldest",
+        "dropped_newest",
+        "high_watermark",
+        "_buf",
+        "_head",
+        "_count",
+    )
+
+    def __init__(self, capacity=64, policy=QUEUE_DROP_OLDEST):
+        self.capacity = int(capacity)
+        if self.capacity < 1:
+            self.capacity = 1
+        self.policy = _normalize_policy(policy)
+        self.pushed = 0
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+        self.high_watermark = 0
+        self._buf = [None] * self.capacity
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+    @property
+    def overflow(self):
+        return int(self.dropped_oldest + self.dropped_newest)
+
+    def push(self, item):
+        capacity = self.capacity
+        if self._count >= capacity:
+            if self.policy == QUEUE_DROP_NEWEST:
+                self.dropped_newest += 1
+                return False
+            self._buf[self._head] = item
+            self._head = (self._head + 1) % capacity
+            self.dropped_oldest += 1
+            self.pushed += 1
+            return True
+        self._buf[(self._head + self._count) % capacity] = item
+        self._count += 1
+        self.pushed += 1
+        if self._count > self.high_watermark:
+            self.high_watermark = self._count
+        return True
+
+    def pop(self, default=None):
+        if self._count <= 0:
+            return default
+        head = self._head
+        item = self._buf[head]
+        self._buf[head] = None
+        self._head = (head + 1) % self.capacity
+        self._count -= 1
+        return item
+
+    def _drain_count(self, max_items):
+        if max_items is None:
+            return self._count
+        max_items = int(max_items)
+        if max_items < 0:
+            return 0
+        return min(max_items, self._count)
+
+    def drain(self, max_items=None):
+        count = self._drain_count(max_items)
+        out = [None] * count
+        for index in range(count):
+            out[index] = self.pop()
+        return tuple(out)
+
+    def drain_to(self, callback, max_items=None):
+        """Pop up to ``max_items`` items straight into ``callback(item)``; returns the count."""
+        count = self._drain_count(max_items)
+        for _ in range(count):
+            callback(self.pop())
+        return int(count)
+
+    def clear(self):
+        for index in range(self.capacity):
+            self._buf[index] = None
+        self._head = 0
+        self._count = 0
+
+    def stats(self):
+        return {
+            "depth": int(self._count),
+            "capacity": int(self.capacity),
+            "policy": self.policy,
+            "pushed": int(self.pushed),
+            "overflow": self.overflow,
+            "dropped_oldest": int(self.dropped_oldest),
+            "dropped_newest": int(self.dropped_newest),
+            "high_watermark": int(self.high_watermark),
+        }
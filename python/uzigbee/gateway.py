@@ -20,7 +20,12 @@ except ImportError:
     _time = None
 
 from .core import ZigbeeError, signal_name
+from .eventqueue import EventQueue, QUEUE_DROP_OLDEST
 from .network import Coordinator
+from .scheduler import LANE_ATTRIBUTE
+
+_BATCH_MAX_DEFAULT = 32
+_STREAM_FRAME_MAX_DEFAULT = 1024
 
 
 def _ticks_ms():
@@ -31,6 +36,31 @@ def _ticks_ms():
     return int(_time.time() * 1000)
 
 
+def _ticks_diff(a, b):
+    if _time is not None and hasattr(_time, "ticks_diff"):
+        return int(_time.ticks_diff(int(a), int(b)))
+    return int(a) - int(b)
+
+
+def _parse_filter(value, parse=int):
+    """None (match all) or a set built from one value or a list of values."""
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, set)):
+        return set(parse(item) for item in value)
+    return {parse(value)}
+
+
+def _parse_id(value):
+    if isinstance(value, str):
+        return int(value.strip(), 0)
+    return int(value)
+
+
+def _parse_event_name(value):
+    return str(value).strip().lower()
+
+
 def _parse_short_addr(value):
     if isinstance(value, int):
         return int(value) & 0xFFFF
@@ -67,16 +97,41 @@ class Gateway:
         "_event_cb",
         "_events",
         "_custom_ops",
+        "batch_max",
+        "coalesce_ms",
+        "_subscriptions",
+        "_next_sub_id",
+        "_coalesce",
+        "_coalesce_order",
+        "_coalesce_head",
+        "_filtered",
+        "_coalesced",
     )
 
-    def __init__(self, coordinator=None, event_queue_max=64):
+    def __init__(
+        self,
+        coordinator=None,
+        event_queue_max=64,
+        event_queue_policy=QUEUE_DROP_OLDEST,
+        batch_max=_BATCH_MAX_DEFAULT,
+        coalesce_ms=0,
+    ):
         self.coordinator = coordinator if coordinator is not None else Coordinator(auto_discovery=True)
         self.event_queue_max = int(event_queue_max)
         if self.event_queue_max < 1:
             self.event_queue_max = 1
         self._event_cb = None
-        self._events = []
+        self._events = EventQueue(self.event_queue_max, event_queue_policy)
         self._custom_ops = {}
+        self.batch_max = max(1, int(batch_max))
+        self.coalesce_ms = max(0, int(coalesce_ms))
+        self._subscriptions = {}
+        self._next_sub_id = 1
+        self._coalesce = {}
+        self._coalesce_order = []
+        self._coalesce_head = 0
+        self._filtered = 0
+        self._coalesced = 0
 
     def on_event(self, callback=None):
         self._event_cb = callback
@@ -108,6 +163,10 @@ class Gateway:
         self.coordinator.on_attribute(self._on_attribute)
         self.coordinator.on_device_added(self._on_device_added)
         self.coordinator.on_device_updated(self._on_device_updated)
+        scheduler = getattr(self.coordinator, "scheduler", None)
+        if scheduler is not None:
+            # Releases held attribute events for push-only (on_event) consumers.
+            scheduler.set_idle(LANE_ATTRIBUTE, self._run_coalesce_lane)
         self.coordinator.start(form_network=bool(form_network))
         self._emit("gateway_started", {"form_network": bool(form_network)})
         return self
@@ -122,35 +181,148 @@ class Gateway:
             out.append(self._device_brief(device))
         return tuple(out)
 
-    def poll_event(self, default=None):
-        if not self._events:
-            return default
-        return self._events.pop(0)
+    def subscribe(self, events=None, short_addr=None, cluster_id=None, attr_id=None):
+        """Add an event filter; returns its id.
+
+        Each argument is one value or a list; None matches anything. With any
+        subscription present, only events matching at least one are queued.
+        Address/cluster/attribute fields only constrain events that carry them.
+        """
+        sub_id = self._next_sub_id
+        self._next_sub_id += 1
+        self._subscriptions[sub_id] = (
+            _parse_filter(events, _parse_event_name),
+            _parse_filter(short_addr, _parse_short_addr),
+            _parse_filter(cluster_id, _parse_id),
+            _parse_filter(attr_id, _parse_id),
+        )
+        return sub_id
+
+    def unsubscribe(self, sub_id=None):
+        """Remove one subscription, or all of them when ``sub_id`` is None; returns the count removed."""
+        if sub_id is None:
+            count = len(self._subscriptions)
+            self._subscriptions = {}
+            return count
+        if int(sub_id) in self._subscriptions:
+            del self._subscriptions[int(sub_id)]
+            return 1
+        return 0
 
-    def drain_events(self, max_items=None):
-        if max_items is None:
-            max_items = len(self._events)
-        max_items = int(max_items)
-        if max_items < 0:
-            max_items = 0
+    def subscriptions(self):
         out = []
-        while self._events and len(out) < max_items:
-            out.append(self._events.pop(0))
+        for sub_id in sorted(self._subscriptions):
+            events, short_addrs, cluster_ids, attr_ids = self._subscriptions[sub_id]
+            out.append(
+                {
+                    "id": int(sub_id),
+                    "events": None if events is None else tuple(sorted(events)),
+                    "short_addr": None if short_addrs is None else tuple(sorted(short_addrs)),
+                    "cluster_id": None if cluster_ids is None else tuple(sorted(cluster_ids)),
+                    "attr_id": None if attr_ids is None else tuple(sorted(attr_ids)),
+                }
+            )
         return tuple(out)
 
-    def process_command(self, command):
+    def configure_coalescing(self, window_ms=None):
+        """Merge repeated attribute events per (device, endpoint, cluster, attr) within ``window_ms`` (0 = off)."""
+        if window_ms is not None:
+            self.coalesce_ms = max(0, int(window_ms))
+            if self.coalesce_ms == 0:
+                self.flush_coalesced(force=True)
+        return int(self.coalesce_ms)
+
+    def flush_coalesced(self, force=False):
+        """Emit coalesced attribute events whose window has elapsed (all with ``force``); returns the count."""
+        if not self._coalesce:
+            return 0
+        now_ms = _ticks_ms()
+        window_ms = int(self.coalesce_ms)
+        emitted = 0
+        # Keys are in first-seen order, so the first one still inside its window ends the scan.
+        # Released keys advance a head index; the list is compacted in bulk, never popped from the front.
+        while True:
+            order = self._coalesce_order
+            head = self._coalesce_head
+            if head >= len(order):
+                break
+            key = order[head]
+            entry = self._coalesce[key]
+            if not force and _ticks_diff(now_ms, entry[0]) < window_ms:
+                break
+            del self._coalesce[key]
+            head += 1
+            if head >= len(order):
+                del order[:]
+                head = 0
+            elif head >= 16 and head * 2 >= len(order):
+                del order[:head]
+                head = 0
+            else:
+                order[head - 1] = None
+            self._coalesce_head = head
+            payload = self._attribute_payload(entry[2])
+            payload["coalesced"] = int(entry[3])
+            self._emit("attribute", payload, ts_ms=entry[1])
+            emitted += 1
+        return emitted
+
+    def _run_coalesce_lane(self, now_ms):
+        if self._coalesce:
+            self.flush_coalesced()
+
+    def poll_event(self, default=None):
+        self.flush_coalesced()
+        return self._events.pop(default)
+
+    def drain_events(self, max_items=None):
+        self.flush_coalesced()
+        return self._events.drain(max_items)
+
+    def event_stats(self):
+        return {
+            "filtered": int(self._filtered),
+            "coalesced": int(self._coalesced),
+            "suppressed": int(self._filtered + self._coalesced),
+            "coalesce_pending": len(self._coalesce),
+            "coalesce_ms": int(self.coalesce_ms),
+            "subscriptions": len(self._subscriptions),
+        }
+
+    def status(self):
+        return {
+            "queue_depth": len(self._events),
+            "event_queue": self._events.stats(),
+            "events": self.event_stats(),
+            "ops": self.ops(),
+        }
+
+    def process_command(self, command, sink=None):
+        """Run one command; an ``id`` field is echoed back in the response.
+
+        ``sink(response)`` receives each ``batch`` item response as soon as it completes.
+        """
         command = command or {}
+        if not isinstance(command, dict):
+            return {"ok": False, "error": "command must be an object"}
         op = str(command.get("op", "")).strip().lower()
+        request_id = command.get("id", None)
         if not op:
-            return {"ok": False, "error": "missing op"}
-        try:
-            if op in self._custom_ops:
-                result = self._invoke_custom_op(op, command)
-            else:
-                result = self._dispatch_op(op, command)
-            return {"ok": True, "op": op, "result": result}
-        except Exception as exc:
-            return {"ok": False, "op": op, "error": str(exc)}
+            response = {"ok": False, "error": "missing op"}
+        else:
+            try:
+                if op == "batch":
+                    result = self._run_batch(command, sink)
+                elif op in self._custom_ops:
+                    result = self._invoke_custom_op(op, command)
+                else:
+                    result = self._dispatch_op(op, command)
+                response = {"ok": True, "op": op, "result": result}
+            except Exception as exc:
+                response = {"ok": False, "op": op, "error": str(exc)}
+        if request_id is not None:
+            response["id"] = request_id
+        return response
 
     def decode_frame(self, frame):
         if _json is None:
@@ -171,6 +343,81 @@ class Gateway:
         response = self.process_command(command)
         return self.encode_frame(response)
 
+    def process_stream(self, data, write):
+        """Pipelined mode: run every newline-separated frame in ``data`` in order.
+
+        Each response is encoded and passed to ``write(frame)`` as soon as its
+        command completes; ``batch`` commands with ``"stream": true`` also write
+        one frame per item before their summary. Returns the number of frames.
+        """
+        if isinstance(data, (bytes, bytearray)):
+            data = bytes(data).decode("utf-8")
+        encode = self.encode_frame
+
+        def _sink(response):
+            write(encode(response))
+
+        count = 0
+        for line in str(data).split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                command = self.decode_frame(line)
+            except Exception as exc:
+                response = {"ok": False, "error": "bad frame: {}".format(exc)}
+            else:
+                response = self.process_command(command, sink=_sink)
+            write(encode(response))
+            count += 1
+        return count
+
+    def open_stream(self, write, max_frame=_STREAM_FRAME_MAX_DEFAULT, forward_events=True):
+        """``FrameStream`` bound to this gateway; feed it raw UART/socket chunks."""
+        return FrameStream(self, write, max_frame=max_frame, forward_events=forward_events)
+
+    def _run_batch(self, command, sink=None):
+        commands = command.get("commands", None)
+        if not isinstance(commands, (list, tuple)):
+            raise ValueError("batch requires a commands list")
+        if len(commands) > self.batch_max:
+            raise ValueError("batch too large ({} > {})".format(len(commands), self.batch_max))
+        stream = sink is not None and _parse_bool(command.get("stream", False), default=False)
+        stop_on_error = _parse_bool(command.get("stop_on_error", False), default=False)
+        batch_id = command.get("id", None)
+        results = []
+        ok = 0
+        failed = 0
+        for index, item in enumerate(commands):
+            if isinstance(item, dict) and str(item.get("op", "")).strip().lower() == "batch":
+                response = {"ok": False, "op": "batch", "error": "nested batch not supported"}
+                if item.get("id", None) is not None:
+                    response["id"] = item["id"]
+            else:
+                response = self.process_command(item)
+            if response.get("ok"):
+                ok += 1
+            else:
+                failed += 1
+            response["index"] = index
+            if stream:
+                if batch_id is not None:
+                    response["batch"] = batch_id
+                sink(response)
+            else:
+                results.append(response)
+            if stop_on_error and not response.get("ok"):
+                break
+        out = {
+            "count": len(commands),
+            "ok": ok,
+            "failed": failed,
+            "skipped": len(commands) - ok - failed,
+        }
+        if not stream:
+            out["results"] = results
+        return out
+
     def _invoke_custom_op(self, op, command):
         callback = self._custom_ops[op]
         try:
@@ -212,9 +459,24 @@ class Gateway:
             return {
                 "discovery": self.coordinator.discovery_stats(),
                 "automation": self.coordinator.automation_stats(),
+                "reads": self.coordinator.read_stats(),
+                "transmit": self.coordinator.transmit_stats(),
+                "groups": self.coordinator.group_stats(),
                 "pending": self.coordinator.pending_discovery(),
                 "queue_depth": len(self._events),
+                "event_queue": self._events.stats(),
+                "events": self.event_stats(),
             }
+        if op == "subscribe":
+            sub_id = self.subscribe(
+                events=command.get("events", None),
+                short_addr=command.get("short_addr", None),
+                cluster_id=command.get("cluster_id", None),
+                attr_id=command.get("attr_id", None),
+            )
+            return {"sub_id": sub_id, "subscriptions": self.subscriptions()}
+        if op == "unsubscribe":
+            return {"removed": self.unsubscribe(command.get("sub_id", None)), "subscriptions": self.subscriptions()}
         if op in ("read", "device_read"):
             device = self._resolve_device(command)
             return self._device_read(device, command)
@@ -359,16 +621,30 @@ class Gateway:
         data["ieee_addr"] = device.ieee_hex
         return data
 
-    def _emit(self, event, payload):
+    def _accept(self, event, short_addr=None, cluster_id=None, attr_id=None):
+        subscriptions = self._subscriptions
+        if not subscriptions:
+            return True
+        for events, short_addrs, cluster_ids, attr_ids in subscriptions.values():
+            if events is not None and event not in events:
+                continue
+            if short_addrs is not None and short_addr is not None and short_addr not in short_addrs:
+                continue
+            if cluster_ids is not None and cluster_id is not None and cluster_id not in cluster_ids:
+                continue
+            if attr_ids is not None and attr_id is not None and attr_id not in attr_ids:
+                continue
+            return True
+        self._filtered += 1
+        return False
+
+    def _emit(self, event, payload, ts_ms=None):
         item = {
             "event": str(event),
-            "ts_ms": int(_ticks_ms()),
+            "ts_ms": int(_ticks_ms() if ts_ms is None else ts_ms),
             "payload": payload,
         }
-        self._events.append(item)
-        overflow = len(self._events) - int(self.event_queue_max)
-        if overflow > 0:
-            del self._events[:overflow]
+        self._events.push(item)
         if self._event_cb is not None:
             try:
                 self._event_cb(item["event"], item["payload"])
@@ -378,6 +654,8 @@ class Gateway:
                 pass
 
     def _on_signal(self, signal_id, status):
+        if not self._accept("signal"):
+            return
         self._emit(
             "signal",
             {
@@ -387,7 +665,7 @@ class Gateway:
             },
         )
 
-    def _on_attribute(self, *event):
+    def _attribute_payload(self, event):
         payload = {"event_len": int(len(event))}
         if len(event) == 5:
             endpoint, cluster_id, attr_id, value, status = event
@@ -415,10 +693,171 @@ class Gateway:
             )
         else:
             payload["raw"] = event
-        self._emit("attribute", payload)
+        return payload
+
+    def _on_attribute(self, *event):
+        # Filter and coalesce on the raw tuple; the payload dict is built only for events that are queued.
+        if len(event) == 5:
+            short_addr = None
+            endpoint, cluster_id, attr_id = event[0], event[1], event[2]
+        elif len(event) >= 7:
+            short_addr = int(event[0]) & 0xFFFF
+            endpoint, cluster_id, attr_id = event[1], event[2], event[3]
+        else:
+            if self._accept("attribute"):
+                self._emit("attribute", self._attribute_payload(event))
+            return
+        cluster_id = int(cluster_id)
+        attr_id = int(attr_id)
+        if not self._accept("attribute", short_addr, cluster_id, attr_id):
+            return
+        if self.coalesce_ms <= 0:
+            self._emit("attribute", self._attribute_payload(event))
+            return
+        self.flush_coalesced()
+        now_ms = _ticks_ms()
+        key = (short_addr, int(endpoint), cluster_id, attr_id)
+        entry = self._coalesce.get(key)
+        if entry is None:
+            self._coalesce[key] = [now_ms, now_ms, event, 1]
+            self._coalesce_order.append(key)
+            return
+        self._coalesced += 1
+        entry[1] = now_ms
+        entry[2] = event
+        entry[3] += 1
 
     def _on_device_added(self, device):
-        self._emit("device_added", self._device_brief(device))
+        if self._accept("device_added", int(device.short_addr)):
+            self._emit("device_added", self._device_brief(device))
 
     def _on_device_updated(self, device):
-        self._emit("device_updated", self._device_brief(device))
+        if self._accept("device_updated", int(device.short_addr)):
+            self._emit("device_updated", self._device_brief(device))
+
+
+class FrameStream:
+    """Newline-delimited JSON framing for a byte stream (UART, TCP socket).
+
+    ``feed(chunk)`` accepts arbitrary chunks, reassembles frames in a buffer
+    bounded by ``max_frame`` bytes and dispatches each complete frame through
+    ``Gateway.process_stream``. Responses and, with ``forward_events``, queued
+    gateway events are written back on the same stream as ``write(bytes)``
+    lines. An oversized frame is dropped up to its newline and answered with
+    ``{"ok": false, "error": "frame too large"}``.
+    """
+
+    __slots__ = (
+        "gateway",
+        "write",
+        "max_frame",
+        "forward_events",
+        "frames",
+        "responses",
+        "events",
+        "overflows",
+        "bytes_in",
+        "bytes_out",
+        "peak_buffer",
+        "_buf",
+        "_discarding",
+    )
+
+    def __init__(self, gateway, write, max_frame=_STREAM_FRAME_MAX_DEFAULT, forward_events=True):
+        self.gateway = gateway
+        self.write = write
+        self.max_frame = max(16, int(max_frame))
+        self.forward_events = bool(forward_events)
+        self.frames = 0
+        self.responses = 0
+        self.events = 0
+        self.overflows = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.peak_buffer = 0
+        self._buf = b""
+        self._discarding = False
+
+    def _write_line(self, text):
+        data = text.encode() + b"\n"
+        self.bytes_out += len(data)
+        self.write(data)
+
+    def _write_response(self, text):
+        self.responses += 1
+        self._write_line(text)
+
+    def _write_event(self, item):
+        self.events += 1
+        self._write_line(self.gateway.encode_frame(item))
+
+    def _overflow(self):
+        self.overflows += 1
+        self._write_response(self.gateway.encode_frame({"ok": False, "error": "frame too large"}))
+
+    def _dispatch(self, line):
+        if line[-1:] == b"\r":
+            line = line[:-1]
+        if not line.strip():
+            return 0
+        self.frames += 1
+        self.gateway.process_stream(line, self._write_response)
+        return 1
+
+    def feed(self, chunk):
+        """Consume ``chunk``; returns the number of frames dispatched."""
+        data = bytes(chunk)
+        self.bytes_in += len(data)
+        count = 0
+        start = 0
+        while True:
+            end = data.find(b"\n", start)
+            if end < 0:
+                break
+            if self._discarding:
+                self._discarding = False
+            else:
+                line = self._buf + data[start:end] if self._buf else data[start:end]
+                self._buf = b""
+                if len(line) > self.peak_buffer:
+                    self.peak_buffer = len(line)
+                if len(line) > self.max_frame:
+                    self._overflow()
+                else:
+                    count += self._dispatch(line)
+                    if self.forward_events:
+                        self.flush_events()
+            start = end + 1
+        if start < len(data) and not self._discarding:
+            pending = len(self._buf) + len(data) - start
+            if pending > self.max_frame:
+                # Drop what we have and skip input until the next newline.
+                self._buf = b""
+                self._discarding = True
+                self._overflow()
+            else:
+                self._buf = self._buf + data[start:] if self._buf else data[start:]
+                if pending > self.peak_buffer:
+                    self.peak_buffer = pending
+        return count
+
+    def flush_events(self, max_items=None):
+        """Write queued gateway events as frames (call when idle too); returns the count."""
+        self.gateway.flush_coalesced()
+        return self.gateway._events.drain_to(self._write_event, max_items)
+
+    def pending_bytes(self):
+        return len(self._buf)
+
+    def stats(self):
+        return {
+            "frames": int(self.frames),
+            "responses": int(self.responses),
+            "events": int(self.events),
+            "overflows": int(self.overflows),
+            "bytes_in": int(self.bytes_in),
+            "bytes_out": int(self.bytes_out),
+            "buffered": len(self._buf),
+            "peak_buffer": int(self.peak_buffer),
+            "max_frame": int(self.max_frame),
+        }
@@ -8,6 +8,7 @@ from .core import (
     SIGNAL_GPP_MODE_CHANGE,
     SIGNAL_GPP_APPROVE_COMMISSIONING,
 )
+from .eventqueue import EventQueue, QUEUE_DROP_OLDEST
 
 
 _GPP_SIGNALS = (
@@ -105,7 +106,6 @@ class GreenPowerManager:
         "last_signal_name",
         "last_signal_status",
         "signal_count",
-        "_event_queue_max",
         "_events",
         "_on_event_cb",
     )
@@ -117,6 +117,7 @@ class GreenPowerManager:
         sink_enabled=False,
         commissioning_allowed=False,
         event_queue_max=64,
+        event_queue_policy=QUEUE_DROP_OLDEST,
     ):
         self.stack = stack if stack is not None else ZigbeeStack()
         self.proxy_enabled = bool(proxy_enabled)
@@ -126,10 +127,7 @@ class GreenPowerManager:
         self.last_signal_name = None
         self.last_signal_status = None
         self.signal_count = 0
-        self._event_queue_max = int(event_queue_max)
-        if self._event_queue_max < 1:
-            self._event_queue_max = 1
-        self._events = []
+        self._events = EventQueue(event_queue_max, event_queue_policy)
         self._on_event_cb = None
 
     def on_event(self, callback=None):
@@ -146,24 +144,15 @@ class GreenPowerManager:
             "last_signal_name": self.last_signal_name,
             "last_signal_status": self.last_signal_status,
             "event_queue_depth": len(self._events),
+            "event_queue": self._events.stats(),
             "capabilities": capabilities(self.stack),
         }
 
     def poll_event(self, default=None):
-        if not self._events:
-            return default
-        return self._events.pop(0)
+        return self._events.pop(default)
 
     def drain_events(self, max_items=None):
-        if max_items is None:
-            max_items = len(self._events)
-        max_items = int(max_items)
-        if max_items < 0:
-            max_items = 0
-        out = []
-        while self._events and len(out) < max_items:
-            out.append(self._events.pop(0))
-        return tuple(out)
+        return self._events.drain(max_items)
 
     def process_signal(self, signal_id, status, payload=None):
         signal_id = int(signal_id)
@@ -263,10 +252,7 @@ class GreenPowerManager:
             "event": str(event),
             "payload": payload,
         }
-        self._events.append(row)
-        overflow = len(self._events) - int(self._event_queue_max)
-        if overflow > 0:
-            del self._events[:overflow]
+        self._events.push(row)
         if self._on_event_cb is not None:
             try:
                 self._on_event_cb(row["event"], row["payload"])
@@ -1,5 +1,27 @@
 """Group management helpers for Zigbee Groups cluster."""
 
+from .core import (
+    ATTR_COLOR_CONTROL_COLOR_TEMPERATURE,
+    ATTR_COLOR_CONTROL_CURRENT_X,
+    ATTR_COLOR_CONTROL_CURRENT_Y,
+    ATTR_LEVEL_CONTROL_CURRENT_LEVEL,
+    ATTR_ON_OFF_ON_OFF,
+    CLUSTER_ID_COLOR_CONTROL,
+    CLUSTER_ID_LEVEL_CONTROL,
+    CLUSTER_ID_ON_OFF,
+    CMD_ON_OFF_OFF,
+    CMD_ON_OFF_ON,
+    CMD_ON_OFF_TOGGLE,
+    ZigbeeError,
+)
+from .transmit import (
+    TX_PRIORITY_HIGH,
+    TX_PRIORITY_LOW,
+    TX_PRIORITY_NORMAL,
+    _default_ticks_diff,
+    _default_ticks_ms,
+)
+
 
 def add_group(stack, dst_short_addr, group_id, src_endpoint=1, dst_endpoint=1):
     """Send Groups Add Group command and return normalized group id."""
@@ -33,3 +55,701 @@ def remove_all_groups(stack, dst_short_addr, src_endpoint=1, dst_endpoint=1):
         src_endpoint=int(src_endpoint),
     )
     return True
+
+
+_GROUP_ID_AUTO_BASE = 0x0100
+_GROUP_ID_MAX = 0xFFF7
+_JOIN_TIMEOUT_MS_DEFAULT = 10000
+
+# Groups cluster response command id and the statuses that mean "is a member".
+_CMD_ADD_GROUP_RESP = 0x00
+_ADD_GROUP_OK = (0x00, 0x8A)
+
+# Features whose commands can be groupcast; room tags join every endpoint serving one of them.
+_GROUPABLE_FEATURES = ("on_off", "level", "color")
+
+
+def _group_dest(group_id):
+    # Transmit scheduler key of a groupcast, distinct from the device with the same short address.
+    return ("group", int(group_id) & 0xFFFF)
+
+
+def _short(device):
+    if hasattr(device, "short_addr"):
+        return int(device.short_addr) & 0xFFFF
+    return int(device) & 0xFFFF
+
+
+class GroupManager:
+    """Groups-cluster membership per (short_addr, endpoint) with groupcast fan-out control.
+
+    ``coordinator`` provides ``stack``, ``registry``, ``transmit`` and ``local_endpoint``;
+    Add/Remove Group (low priority) and groupcasts go through its transmit scheduler.
+    Rules from ``assign(tag, group)`` join every endpoint whose device has the
+    feature ``tag`` (or the room tag set with ``tag()``) to the group. Commands
+    go to a group, tag or device list: members already in the best matching
+    group get one groupcast, the rest are unicast through ``device.control``.
+    An endpoint becomes a member only when its Add Group response reports
+    success (``handle_response()``); until then it is pending, keeps getting
+    unicasts and is asked again by ``sync()`` after ``join_timeout_ms``.
+    Firmware without group responses never confirms, so it never groupcasts.
+    ``on_change()`` fires on every membership change so the coordinator can
+    persist it with the registry.
+    """
+
+    __slots__ = (
+        "coordinator",
+        "on_change",
+        "ticks_ms",
+        "ticks_diff",
+        "join_timeout_ms",
+        "_names",
+        "_members",
+        "_pending",
+        "_rules",
+        "_tags",
+        "joins",
+        "join_retries",
+        "join_failures",
+        "confirmed",
+        "leaves",
+        "groupcasts",
+        "groupcasts_held",
+        "unicasts",
+        "frames_saved",
+        "last_error",
+    )
+
+    def __init__(self, coordinator, join_timeout_ms=_JOIN_TIMEOUT_MS_DEFAULT, ticks_ms=None, ticks_diff=None):
+        self.coordinator = coordinator
+        self.on_change = None
+        self.ticks_ms = ticks_ms if ticks_ms is not None else _default_ticks_ms
+        self.ticks_diff = ticks_diff if ticks_diff is not None else _default_ticks_diff
+        self.join_timeout_ms = max(0, int(join_timeout_ms))
+        self._names = {}
+        # group_id -> [(short_addr, endpoint)] confirmed members in join order.
+        self._members = {}
+        # (short_addr, endpoint, group_id) -> ms the Add Group went out, until answered.
+        self._pending = {}
+        self._rules = []
+        self._tags = {}
+        self.joins = 0
+        self.join_retries = 0
+        self.join_failures = 0
+        self.confirmed = 0
+        self.leaves = 0
+        self.groupcasts = 0
+        self.groupcasts_held = 0
+        self.unicasts = 0
+        self.frames_saved = 0
+        self.last_error = None
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+
+    def _submit(self, dest, priority, key, send, *args, **kwargs):
+        if not self.coordinator.transmit.submit(dest, send, args, kwargs, priority=priority, key=key):
+            if isinstance(dest, tuple):
+                dest = "group 0x{:04x}".format(dest[1])
+            else:
+                dest = "0x{:04x}".format(dest)
+            raise ZigbeeError("transmit queue full for {}".format(dest))
+
+    def _device(self, short_addr):
+        return self.coordinator.registry.get(int(short_addr) & 0xFFFF)
+
+    def _allocate(self):
+        group_id = _GROUP_ID_AUTO_BASE
+        while group_id in self._members:
+            group_id += 1
+        if group_id > _GROUP_ID_MAX:
+            raise ValueError("no free group id")
+        return group_id
+
+    def create(self, name=None, group_id=None):
+        """Register a group (auto-allocated id when ``group_id`` is None); returns the group id."""
+        if name is not None and str(name) in self._names:
+            existing = self._names[str(name)]
+            if group_id is None or (int(group_id) & 0xFFFF) == existing:
+                return existing
+            raise ValueError("group name already used: {}".format(name))
+        group_id = self._allocate() if group_id is None else int(group_id) & 0xFFFF
+        if group_id > _GROUP_ID_MAX:
+            raise ValueError("invalid group id: 0x{:04x}".format(group_id))
+        if group_id not in self._members:
+            self._members[group_id] = []
+        if name is not None:
+            self._names[str(name)] = group_id
+        self._changed()
+        return group_id
+
+    def group_id(self, group):
+        """Group id from an id or a name given to ``create()``/``assign()``."""
+        if isinstance(group, str):
+            if group not in self._names:
+                raise ValueError("unknown group: {}".format(group))
+            return self._names[group]
+        group_id = int(group) & 0xFFFF
+        if group_id not in self._members:
+            raise ValueError("unknown group: 0x{:04x}".format(group_id))
+        return group_id
+
+    def _name_of(self, group_id):
+        for name, value in self._names.items():
+            if value == group_id:
+                return name
+        return None
+
+    def groups(self):
+        out = {}
+        for group_id in sorted(self._members):
+            out[group_id] = {
+                "name": self._name_of(group_id),
+                "members": tuple(self._members[group_id]),
+                "pending": tuple(sorted((key[0], key[1]) for key in self._pending if key[2] == group_id)),
+                "tags": tuple(tag for tag, target in self._rules if target == group_id),
+            }
+        return out
+
+    def members(self, group):
+        return tuple(self._members[self.group_id(group)])
+
+    def groups_of(self, short_addr, endpoint=None):
+        short_addr = int(short_addr) & 0xFFFF
+        out = []
+        for group_id in sorted(self._members):
+            for member in self._members[group_id]:
+                if member[0] == short_addr and (endpoint is None or member[1] == int(endpoint)):
+                    out.append(group_id)
+                    break
+        return tuple(out)
+
+    def tag(self, device, *tags):
+        """Attach room tags to a device and join it to the groups assigned to them."""
+        short_addr = _short(device)
+        row = self._tags.setdefault(short_addr, [])
+        for tag in tags:
+            if str(tag) not in row:
+                row.append(str(tag))
+        self._changed()
+        return self.sync(short_addr)
+
+    def untag(self, device, *tags):
+        short_addr = _short(device)
+        row = self._tags.get(short_addr, [])
+        for tag in tags:
+            if str(tag) in row:
+                row.remove(str(tag))
+        if not row:
+            self._tags.pop(short_addr, None)
+        self._changed()
+        return tuple(row)
+
+    def tags(self, device):
+        return tuple(self._tags.get(_short(device), ()))
+
+    def assign(self, tag, group=None, group_id=None):
+        """Auto-join devices with feature or room tag ``tag`` to ``group`` (created on demand, named ``tag`` by default)."""
+        tag = str(tag)
+        if group is None or isinstance(group, str):
+            group_id = self.create(tag if group is None else group, group_id)
+        else:
+            group_id = self.create(None, group)
+        if (tag, group_id) not in self._rules:
+            self._rules.append((tag, group_id))
+            self._changed()
+        self.sync()
+        return group_id
+
+    def _tag_endpoints(self, device, tag, feature=None):
+        """Endpoints of ``device`` selected by a feature or room tag (limited to ``feature`` when given)."""
+        if device.has_feature(tag):
+            endpoints = device.feature_endpoints(tag)
+        elif tag in self._tags.get(int(device.short_addr) & 0xFFFF, ()):
+            endpoints = []
+            for name in _GROUPABLE_FEATURES:
+                for endpoint in device.feature_endpoints(name):
+                    if endpoint not in endpoints:
+                        endpoints.append(endpoint)
+        else:
+            return ()
+        if feature is not None:
+            supported = device.feature_endpoints(feature)
+            endpoints = [endpoint for endpoint in endpoints if endpoint in supported]
+        return tuple(sorted(int(endpoint) for endpoint in endpoints))
+
+    def join(self, device, group, endpoint=None):
+        """Send Add Group to the device (every groupable endpoint when ``endpoint`` is None); returns endpoints asked."""
+        group_id = self.group_id(group)
+        short_addr = _short(device)
+        if endpoint is None:
+            device = self._device(short_addr)
+            if device is None:
+                return ()
+            endpoints = []
+            for name in _GROUPABLE_FEATURES:
+                for endpoint_id in device.feature_endpoints(name):
+                    if endpoint_id not in endpoints:
+                        endpoints.append(endpoint_id)
+        else:
+            endpoints = [int(endpoint)]
+        joined = []
+        for endpoint_id in sorted(endpoints):
+            if self._join_endpoint(short_addr, int(endpoint_id), group_id):
+                joined.append(int(endpoint_id))
+        return tuple(joined)
+
+    def _waiting(self, key, now_ms):
+        sent_ms = self._pending.get(key)
+        return sent_ms is not None and self.ticks_diff(now_ms, sent_ms) < self.join_timeout_ms
+
+    def _join_endpoint(self, short_addr, endpoint, group_id):
+        member = (short_addr, endpoint)
+        if member in self._members[group_id]:
+            return True
+        coordinator = self.coordinator
+        try:
+            self._submit(
+                short_addr,
+                TX_PRIORITY_LOW,
+                None,
+                add_group,
+                coordinator.stack,
+                short_addr,
+                group_id,
+                src_endpoint=coordinator.local_endpoint,
+                dst_endpoint=endpoint,
+            )
+        except Exception as exc:
+            self.join_failures += 1
+            self.last_error = repr(exc)
+            return False
+        key = (short_addr, endpoint, group_id)
+        if key in self._pending:
+            self.join_retries += 1
+        self._pending[key] = self.ticks_ms()
+        self.joins += 1
+        return True
+
+    def handle_response(self, cmd_id, status, short_addr, endpoint, group_id):
+        """Group response hook: an Add Group success confirms the pending member; returns True when it did."""
+        if int(cmd_id) != _CMD_ADD_GROUP_RESP:
+            return False
+        short_addr = int(short_addr) & 0xFFFF
+        group_id = int(group_id) & 0xFFFF
+        if self._pending.pop((short_addr, int(endpoint), group_id), None) is None:
+            return False
+        if int(status) not in _ADD_GROUP_OK:
+            self.join_failures += 1
+            self.last_error = "add group 0x{:04x} refused by 0x{:04x}/{}: status 0x{:02x}".format(
+                group_id, short_addr, int(endpoint), int(status)
+            )
+            return False
+        rows = self._members.get(group_id)
+        if rows is None:
+            return False
+        member = (short_addr, int(endpoint))
+        if member not in rows:
+            rows.append(member)
+            self.confirmed += 1
+            self._changed()
+        return True
+
+    def leave(self, device, group, endpoint=None):
+        """Send Remove Group for the device's endpoints in ``group``; returns endpoints removed."""
+        group_id = self.group_id(group)
+        short_addr = _short(device)
+        coordinator = self.coordinator
+        candidates = list(self._members[group_id])
+        for key in self._pending:
+            if key[2] == group_id and (key[0], key[1]) not in candidates:
+                candidates.append((key[0], key[1]))
+        removed = []
+        changed = False
+        for member in candidates:
+            if member[0] != short_addr or (endpoint is not None and member[1] != int(endpoint)):
+                continue
+            self._submit(
+                short_addr,
+                TX_PRIORITY_LOW,
+                None,
+                remove_group,
+                coordinator.stack,
+                short_addr,
+                group_id,
+                src_endpoint=coordinator.local_endpoint,
+                dst_endpoint=member[1],
+            )
+            self._pending.pop((member[0], member[1], group_id), None)
+            if member in self._members[group_id]:
+                self._members[group_id].remove(member)
+                changed = True
+            removed.append(member[1])
+            self.leaves += 1
+        if changed:
+            self._changed()
+        return tuple(removed)
+
+    def forget(self, short_addr):
+        """Drop membership records and tags of a device without sending anything."""
+        short_addr = int(short_addr) & 0xFFFF
+        changed = self._tags.pop(short_addr, None) is not None
+        for key in tuple(self._pending):
+            if key[0] == short_addr:
+                del self._pending[key]
+        for group_id in self._members:
+            rows = self._members[group_id]
+            kept = [member for member in rows if member[0] != short_addr]
+            if len(kept) != len(rows):
+                self._members[group_id] = kept
+                changed = True
+        if changed:
+            self._changed()
+        return changed
+
+    def readdress(self, old_short_addr, new_short_addr):
+        """Move membership records and tags to a device's new short address; the device keeps its group table."""
+        old_short_addr = int(old_short_addr) & 0xFFFF
+        new_short_addr = int(new_short_addr) & 0xFFFF
+        changed = False
+        row = self._tags.pop(old_short_addr, None)
+        if row is not None:
+            merged = self._tags.setdefault(new_short_addr, [])
+            for tag in row:
+                if tag not in merged:
+                    merged.append(tag)
+            changed = True
+        for key in tuple(self._pending):
+            if key[0] == old_short_addr:
+                self._pending[(new_short_addr, key[1], key[2])] = self._pending.pop(key)
+        for group_id in self._members:
+            moved = []
+            for member in self._members[group_id]:
+                if member[0] == old_short_addr:
+                    member = (new_short_addr, member[1])
+                    changed = True
+                if member not in moved:
+                    moved.append(member)
+            self._members[group_id] = moved
+        if changed:
+            self._changed()
+        return changed
+
+    def has_rules(self):
+        return bool(self._rules)
+
+    def sync(self, device=None):
+        """Apply ``assign()`` rules to one device (or the whole registry); returns Add Group requests sent.
+
+        Endpoints still waiting for an Add Group response are skipped until ``join_timeout_ms`` passes.
+        """
+        if device is None:
+            devices = tuple(self.coordinator.registry.values())
+        else:
+            device = self._device(_short(device))
+            devices = () if device is None else (device,)
+        now_ms = self.ticks_ms()
+        joined = 0
+        for device in devices:
+            short_addr = int(device.short_addr) & 0xFFFF
+            for tag, group_id in self._rules:
+                for endpoint in self._tag_endpoints(device, tag):
+                    if (short_addr, endpoint) in self._members[group_id]:
+                        continue
+                    if self._waiting((short_addr, endpoint, group_id), now_ms):
+                        continue
+                    if self._join_endpoint(short_addr, endpoint, group_id):
+                        joined += 1
+        return joined
+
+    def _targets(self, target, feature):
+        """``(desired members supporting feature, preferred group id or None)``."""
+        desired = []
+        registry = self.coordinator.registry
+        if isinstance(target, int) or (isinstance(target, str) and target in self._names):
+            preferred = self.group_id(target)
+            for member in self._members[preferred]:
+                device = registry.get(member[0])
+                if device is not None and member[1] in device.feature_endpoints(feature):
+                    desired.append(member)
+            tags = tuple(tag for tag, group_id in self._rules if group_id == preferred)
+            for device in registry.values():
+                for tag in tags:
+                    for endpoint in self._tag_endpoints(device, tag, feature):
+                        member = (int(device.short_addr) & 0xFFFF, endpoint)
+                        if member not in desired:
+                            desired.append(member)
+            return desired, preferred
+        if isinstance(target, str):
+            for device in registry.values():
+                for endpoint in self._tag_endpoints(device, target, feature):
+                    desired.append((int(device.short_addr) & 0xFFFF, endpoint))
+            return desired, None
+        for item in target:
+            endpoint = None
+            if isinstance(item, tuple):
+                item, endpoint = item[0], int(item[1])
+            device = registry.get(_short(item))
+            if device is None:
+                continue
+            for endpoint_id in device.feature_endpoints(feature):
+                member = (int(device.short_addr) & 0xFFFF, int(endpoint_id))
+                if (endpoint is None or endpoint == member[1]) and member not in desired:
+                    desired.append(member)
+        return desired, None
+
+    def _best_group(self, desired):
+        # Largest group entirely inside the target set: a groupcast must not reach non-targets.
+        best = None
+        best_size = 0
+        for group_id in sorted(self._members):
+            rows = self._members[group_id]
+            if len(rows) > best_size and all(member in desired for member in rows):
+                best = group_id
+                best_size = len(rows)
+        return best
+
+    def _fanout(self, target, feature, priority, key, groupcast, unicast, state):
+        desired, preferred = self._targets(target, feature)
+        stack = self.coordinator.stack
+        group_id = None
+        if hasattr(stack, "groupcast_supported") and stack.groupcast_supported():
+            if preferred is not None and self._members[preferred]:
+                group_id = preferred
+            elif preferred is None:
+                group_id = self._best_group(desired)
+        if group_id is not None:
+            # The group has its own transmit FIFO; a member with unicasts still queued would see
+            # them after the groupcast (e.g. a queued level with on/off undoing a group off).
+            # Unicast to everyone instead so each command queues behind that member's FIFO.
+            transmit = self.coordinator.transmit
+            for short_addr, endpoint in self._members[group_id]:
+                if transmit.pending(short_addr):
+                    group_id = None
+                    self.groupcasts_held += 1
+                    break
+        covered = ()
+        if group_id is not None:
+            self._submit(_group_dest(group_id), priority, key, groupcast, stack, group_id)
+            self.groupcasts += 1
+            covered = tuple(self._members[group_id])
+            registry = self.coordinator.registry
+            for short_addr, endpoint in covered:
+                device = registry.get(short_addr)
+                if device is not None and endpoint in device.feature_endpoints(feature):
+                    state(device, endpoint)
+        sent = 0
+        registry = self.coordinator.registry
+        for short_addr, endpoint in desired:
+            if (short_addr, endpoint) in covered:
+                continue
+            device = registry.get(short_addr)
+            if device is None:
+                continue
+            unicast(device.endpoint(endpoint))
+            sent += 1
+        self.unicasts += sent
+        grouped = sum(1 for member in covered if member in desired)
+        reached = sent + grouped
+        if grouped > 1:
+            self.frames_saved += grouped - 1
+        return {
+            "group_id": group_id,
+            "groupcast": group_id is not None,
+            "unicast": int(sent),
+            "members": int(reached),
+            "frames": int(sent + (1 if group_id is not None else 0)),
+        }
+
+    def on(self, target):
+        return self._fanout(
+            target,
+            "on_off",
+            TX_PRIORITY_HIGH,
+            None,
+            lambda stack, group_id: stack.groupcast_on_off_cmd(
+                group_id, src_endpoint=self.coordinator.local_endpoint, cmd_id=CMD_ON_OFF_ON
+            ),
+            lambda endpoint: endpoint.on(),
+            lambda device, endpoint: _write_control(device, endpoint, CLUSTER_ID_ON_OFF, ATTR_ON_OFF_ON_OFF, True),
+        )
+
+    def off(self, target):
+        return self._fanout(
+            target,
+            "on_off",
+            TX_PRIORITY_HIGH,
+            None,
+            lambda stack, group_id: stack.groupcast_on_off_cmd(
+                group_id, src_endpoint=self.coordinator.local_endpoint, cmd_id=CMD_ON_OFF_OFF
+            ),
+            lambda endpoint: endpoint.off(),
+            lambda device, endpoint: _write_control(device, endpoint, CLUSTER_ID_ON_OFF, ATTR_ON_OFF_ON_OFF, False),
+        )
+
+    def toggle(self, target):
+        return self._fanout(
+            target,
+            "on_off",
+            TX_PRIORITY_HIGH,
+            None,
+            lambda stack, group_id: stack.groupcast_on_off_cmd(
+                group_id, src_endpoint=self.coordinator.local_endpoint, cmd_id=CMD_ON_OFF_TOGGLE
+            ),
+            lambda endpoint: endpoint.toggle(),
+            _write_toggle,
+        )
+
+    def level(self, target, level, transition_ds=0, with_onoff=True):
+        level = min(254, max(0, int(level)))
+        return self._fanout(
+            target,
+            "level",
+            TX_PRIORITY_NORMAL,
+            (CLUSTER_ID_LEVEL_CONTROL, "level"),
+            lambda stack, group_id: stack.groupcast_level_cmd(
+                group_id,
+                level,
+                src_endpoint=self.coordinator.local_endpoint,
+                transition_ds=int(transition_ds),
+                with_onoff=bool(with_onoff),
+            ),
+            lambda endpoint: endpoint.level(level, transition_ds=transition_ds, with_onoff=with_onoff),
+            lambda device, endpoint: _write_control(
+                device, endpoint, CLUSTER_ID_LEVEL_CONTROL, ATTR_LEVEL_CONTROL_CURRENT_LEVEL, level
+            ),
+        )
+
+    def color_xy(self, target, color_x, color_y, transition_ds=0):
+        color_x = min(0xFFFF, max(0, int(color_x)))
+        color_y = min(0xFFFF, max(0, int(color_y)))
+
+        def _state(device, endpoint):
+            _write_control(device, endpoint, CLUSTER_ID_COLOR_CONTROL, ATTR_COLOR_CONTROL_CURRENT_X, color_x)
+            _write_control(device, endpoint, CLUSTER_ID_COLOR_CONTROL, ATTR_COLOR_CONTROL_CURRENT_Y, color_y)
+
+        return self._fanout(
+            target,
+            "color",
+            TX_PRIORITY_NORMAL,
+            (CLUSTER_ID_COLOR_CONTROL, "xy"),
+            lambda stack, group_id: stack.groupcast_color_move_to_color_cmd(
+                group_id,
+                color_x,
+                color_y,
+                src_endpoint=self.coordinator.local_endpoint,
+                transition_ds=int(transition_ds),
+            ),
+            lambda endpoint: endpoint.color_xy(color_x, color_y, transition_ds=transition_ds),
+            _state,
+        )
+
+    def color_temperature(self, target, mireds, transition_ds=0):
+        mireds = min(0xFFFF, max(0, int(mireds)))
+        return self._fanout(
+            target,
+            "color",
+            TX_PRIORITY_NORMAL,
+            (CLUSTER_ID_COLOR_CONTROL, "ct"),
+            lambda stack, group_id: stack.groupcast_color_move_to_color_temperature_cmd(
+                group_id,
+                mireds,
+                src_endpoint=self.coordinator.local_endpoint,
+                transition_ds=int(transition_ds),
+            ),
+            lambda endpoint: endpoint.color_temperature(mireds, transition_ds=transition_ds),
+            lambda device, endpoint: _write_control(
+                device, endpoint, CLUSTER_ID_COLOR_CONTROL, ATTR_COLOR_CONTROL_COLOR_TEMPERATURE, mireds
+            ),
+        )
+
+    def to_dict(self):
+        groups = {}
+        for group_id in sorted(self._members):
+            groups[str(group_id)] = {
+                "name": self._name_of(group_id),
+                "members": [[member[0], member[1]] for member in self._members[group_id]],
+            }
+        tags = {}
+        for short_addr in sorted(self._tags):
+            tags[str(short_addr)] = list(self._tags[short_addr])
+        return {
+            "groups": groups,
+            "rules": [[tag, group_id] for tag, group_id in self._rules],
+            "tags": tags,
+        }
+
+    def restore(self, data):
+        """Replace membership, rules and tags with a ``to_dict()`` snapshot (nothing is sent)."""
+        data = data or {}
+        names = {}
+        members = {}
+        for key, row in (data.get("groups") or {}).items():
+            try:
+                group_id = int(key) & 0xFFFF
+                rows = []
+                for member in row.get("members") or ():
+                    member = (int(member[0]) & 0xFFFF, int(member[1]))
+                    if member not in rows:
+                        rows.append(member)
+            except Exception:
+                continue
+            members[group_id] = rows
+            if row.get("name") is not None:
+                names[str(row["name"])] = group_id
+        rules = []
+        for row in data.get("rules") or ():
+            try:
+                rule = (str(row[0]), int(row[1]) & 0xFFFF)
+            except Exception:
+                continue
+            if rule[1] in members and rule not in rules:
+                rules.append(rule)
+        tags = {}
+        for key, row in (data.get("tags") or {}).items():
+            try:
+                tags[int(key) & 0xFFFF] = [str(tag) for tag in row]
+            except Exception:
+                continue
+        self._names = names
+        self._members = members
+        self._pending = {}
+        self._rules = rules
+        self._tags = tags
+        return len(members)
+
+    def stats(self):
+        return {
+            "groups": len(self._members),
+            "members": sum(len(rows) for rows in self._members.values()),
+            "pending": len(self._pending),
+            "rules": len(self._rules),
+            "tagged_devices": len(self._tags),
+            "joins": int(self.joins),
+            "join_retries": int(self.join_retries),
+            "join_failures": int(self.join_failures),
+            "confirmed": int(self.confirmed),
+            "leaves": int(self.leaves),
+            "groupcasts": int(self.groupcasts),
+            "groupcasts_held": int(self.groupcasts_held),
+            "unicasts": int(self.unicasts),
+            "frames_saved": int(self.frames_saved),
+            "last_error": self.last_error,
+        }
+
+
+def _write_control(device, endpoint, cluster_id, attr_id, value):
+    device._write_state(
+        (int(cluster_id), int(attr_id)),
+        value,
+        source="control",
+        authoritative=False,
+        endpoint_id=int(endpoint),
+    )
+
+
+def _write_toggle(device, endpoint):
+    key = (int(CLUSTER_ID_ON_OFF), int(ATTR_ON_OFF_ON_OFF))
+    if key in device.state:
+        _write_control(device, endpoint, CLUSTER_ID_ON_OFF, ATTR_ON_OFF_ON_OFF, not bool(device.state[key]))
@@ -9,6 +9,7 @@ except ImportError:
         _json = None
 
 from .core import ZigbeeStack, ZigbeeError, signal_name
+from .eventqueue import EventQueue, QUEUE_DROP_OLDEST
 
 
 NCP_MODE_NCP = "ncp"
@@ -166,7 +167,6 @@ class NcpRcpManager:
         "last_result",
         "signal_count",
         "_events",
-        "_event_queue_max",
         "_on_event_cb",
     )
 
@@ -179,6 +179,7 @@ class NcpRcpManager:
         baudrate=115200,
         flow_control=False,
         event_queue_max=64,
+        event_queue_policy=QUEUE_DROP_OLDEST,
     ):
         self.stack = stack if stack is not None else ZigbeeStack()
         self.mode = _normalize_mode(mode)
@@ -192,10 +193,7 @@ class NcpRcpManager:
         self.last_error = None
         self.last_result = None
         self.signal_count = 0
-        self._events = []
-        self._event_queue_max = int(event_queue_max)
-        if self._event_queue_max < 1:
-            self._event_queue_max = 1
+        self._events = EventQueue(event_queue_max, event_queue_policy)
         self._on_event_cb = None
 
     def on_event(self, callback=None):
@@ -227,6 +225,7 @@ class NcpRcpManager:
             "active": bool(self.active),
             "signal_count": int(self.signal_count),
             "event_queue_depth": len(self._events),
+            "event_queue": self._events.stats(),
             "capabilities": capabilities(self.stack),
             "last_error": self.last_error,
             "last_result": self.last_result,
@@ -344,20 +343,10 @@ class NcpRcpManager:
         return _handler
 
     def poll_event(self, default=None):
-        if not self._events:
-            return default
-        return self._events.pop(0)
+        return self._events.pop(default)
 
     def drain_events(self, max_items=None):
-        if max_items is None:
-            max_items = len(self._events)
-        max_items = int(max_items)
-        if max_items < 0:
-            max_items = 0
-        out = []
-        while self._events and len(out) < max_items:
-            out.append(self._events.pop(0))
-        return tuple(out)
+        return self._events.drain(max_items)
 
     def decode_frame(self, text):
         return decode_frame_hex(text)
@@ -382,10 +371,7 @@ class NcpRcpManager:
             "event": str(event),
             "payload": payload,
         }
-        self._events.append(row)
-        overflow = len(self._events) - int(self._event_queue_max)
-        if overflow > 0:
-            del self._events[:overflow]
+        self._events.push(row)
         if self._on_event_cb is not None:
             try:
                 self._on_event_cb(row["event"], row["payload"])
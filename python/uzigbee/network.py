@@ -1,6 +1,7 @@
 """High-level coordinator/network API with auto-discovery and device registry."""
 
 from .core import (
+    attr_event_record,
     ATTR_COLOR_CONTROL_COLOR_TEMPERATURE,
     ATTR_COLOR_CONTROL_CURRENT_X,
     ATTR_COLOR_CONTROL_CURRENT_Y,
@@ -39,6 +40,7 @@ from .core import (
     CMD_ON_OFF_ON,
     CMD_ON_OFF_TOGGLE,
     IAS_ZONE_STATUS_ALARM1,
+    READ_ATTR_MAX,
     SIGNAL_DEVICE_ASSOCIATED,
     SIGNAL_DEVICE_ANNCE,
     SIGNAL_DEVICE_AUTHORIZED,
@@ -63,6 +65,26 @@ from .commissioning import (
     mode_profile_source as _mode_profile_source,
 )
 from .zcl import DATA_TYPE_S16, DATA_TYPE_U8, DATA_TYPE_U16
+from . import persistence as _persistence
+from .groups import GroupManager
+from .scheduler import (
+    LANE_ATTRIBUTE,
+    LANE_AUTOMATION,
+    LANE_CONTROL,
+    LANE_DISCOVERY,
+    LANE_PERSISTENCE,
+    LaneScheduler,
+)
+from .transmit import (
+    TX_PRIORITY_HIGH,
+    TX_PRIORITY_NORMAL,
+    TransmitScheduler,
+    _TX_BURST_DEFAULT,
+    _TX_COALESCE_INTERVAL_MS_DEFAULT,
+    _TX_GLOBAL_RATE_PER_S_DEFAULT,
+    _TX_QUEUE_MAX_DEFAULT,
+    _TX_RATE_PER_S_DEFAULT,
+)
 
 try:
     import time as _time
@@ -84,10 +106,25 @@ try:
 except ImportError:
     _json = None
 
+try:
+    import heapq as _heapq
+except ImportError:
+    try:
+        import uheapq as _heapq
+    except ImportError:
+        _heapq = None
+
 
 ROLE_COORDINATOR = 0
 ESP_ERR_INVALID_STATE = 259
 
+PERSIST_SNAPSHOT = "snapshot"
+PERSIST_JOURNAL = "journal"
+_PERSIST_MODES = (PERSIST_SNAPSHOT, PERSIST_JOURNAL)
+_JOURNAL_COMPACT_BYTES_DEFAULT = 16384
+_AUTOSAVE_ALL = "all"
+_REGISTRY_STREAM_SCHEMA = 2
+
 _JOIN_SIGNALS = {
     int(SIGNAL_DEVICE_ASSOCIATED),
     int(SIGNAL_DEVICE_ANNCE),
@@ -112,11 +149,24 @@ _DISCOVERY_TIMEOUT_MS_MIN = 500
 _DISCOVERY_TIMEOUT_MS_MAX = 120000
 _DISCOVERY_POLL_MS_MIN = 50
 _DISCOVERY_POLL_MS_MAX = 10000
+_DISCOVERY_INFLIGHT_MAX = 16
+_INTERVIEW_CACHE_MAX_DEFAULT = 64
+_SCHEDULER_LANE_MAX_DEFAULT = 32
+_READ_TIMEOUT_MS_DEFAULT = 3000
+_READ_NEGATIVE_TTL_MS_DEFAULT = 5000
+_READ_NEGATIVE_MAX_DEFAULT = 32
 _STATE_TTL_MS_MIN = 0
 _STATE_TTL_MS_MAX = 86400000
 _STATE_CACHE_MAX_MIN = 8
 _STATE_CACHE_MAX_MAX = 512
 _STATE_CACHE_MAX_DEFAULT = 64
+_STATE_SOURCE_INTERN_MAX = 32
+_STATE_FLAG_AUTHORITATIVE = 0x01
+_LOGICAL_TYPE_COORDINATOR = 0
+_LOGICAL_TYPE_ROUTER = 1
+_POWER_SOURCE_MAINS = 0x01
+EVICT_LRU = "lru"
+EVICT_NEVER_ROUTERS = "never_evict_routers"
 _OFFLINE_AFTER_MS_MIN = 0
 _OFFLINE_AFTER_MS_MAX = 86400000
 _CHANNEL_MASK_ALLOWED = 0
@@ -478,16 +528,209 @@ def _normalize_stale_policy(value):
     return policy
 
 
-def _prune_cache_map(cache, meta, max_items):
+def _normalize_persist_mode(value):
+    mode = str(value or PERSIST_SNAPSHOT).strip().lower()
+    if mode not in _PERSIST_MODES:
+        raise ValueError("invalid persistence_mode: {}".format(value))
+    return mode
+
+
+_STATE_SOURCES = {}
+
+
+def _intern_source(source):
+    source = str(source)
+    interned = _STATE_SOURCES.get(source)
+    if interned is not None:
+        return interned
+    if len(_STATE_SOURCES) < _STATE_SOURCE_INTERN_MAX:
+        _STATE_SOURCES[source] = source
+    return source
+
+
+class _StateRecord:
+    """Compact cache metadata for one attribute; shared by the default and endpoint caches."""
+
+    __slots__ = (
+        "updated_ms",
+        "source",
+        "flags",
+        "endpoint_id",
+        "source_short_addr",
+        "source_endpoint",
+        "attr_type",
+    )
+
+    def __init__(self):
+        self.updated_ms = 0
+        self.source = "unknown"
+        self.flags = 0
+        self.endpoint_id = None
+        self.source_short_addr = None
+        self.source_endpoint = None
+        self.attr_type = None
+
+    @property
+    def authoritative(self):
+        return bool(self.flags & _STATE_FLAG_AUTHORITATIVE)
+
+    def update(
+        self,
+        updated_ms,
+        source,
+        authoritative,
+        endpoint_id=None,
+        source_short_addr=None,
+        source_endpoint=None,
+        attr_type=None,
+    ):
+        self.updated_ms = int(updated_ms)
+        self.source = _intern_source(source)
+        self.flags = _STATE_FLAG_AUTHORITATIVE if authoritative else 0
+        self.endpoint_id = None if endpoint_id is None else int(endpoint_id)
+        self.source_short_addr = None if source_short_addr is None else int(source_short_addr) & 0xFFFF
+        self.source_endpoint = None if source_endpoint is None else int(source_endpoint)
+        self.attr_type = None if attr_type is None else int(attr_type)
+        return self
+
+    @classmethod
+    def from_meta(cls, meta, endpoint_id=None):
+        meta = meta or {}
+        return cls().update(
+            meta.get("updated_ms", 0),
+            meta.get("source", "unknown"),
+            bool(meta.get("authoritative", False)),
+            endpoint_id=endpoint_id,
+            source_short_addr=meta.get("source_short_addr"),
+            source_endpoint=meta.get("source_endpoint"),
+            attr_type=meta.get("attr_type"),
+        )
+
+    def to_meta(self, with_endpoint=False):
+        out = {
+            "updated_ms": int(self.updated_ms),
+            "source": self.source,
+            "authoritative": self.authoritative,
+        }
+        if with_endpoint and self.endpoint_id is not None:
+            out["endpoint_id"] = int(self.endpoint_id)
+        if self.source_short_addr is not None:
+            out["source_short_addr"] = int(self.source_short_addr)
+        if self.source_endpoint is not None:
+            out["source_endpoint"] = int(self.source_endpoint)
+        if self.attr_type is not None:
+            out["attr_type"] = int(self.attr_type)
+        return out
+
+
+def _meta_updated_ms(row):
+    if row is None:
+        return 0
+    if isinstance(row, dict):
+        return int(row.get("updated_ms", 0))
+    return int(getattr(row, "updated_ms", 0))
+
+
+class _CacheOrder:
+    """Write-order index for a state cache: amortized O(1) touch and oldest-key eviction.
+
+    The ring holds key references only; ``_by_key`` counts live occurrences so
+    re-touching a key costs no extra allocation beyond the list slot.
+    """
+
+    __slots__ = ("_by_key", "_ring", "_head")
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self):
+        return len(self._by_key)
+
+    def clear(self):
+        self._by_key = {}
+        self._ring = []
+        self._head = 0
+
+    def touch(self, key):
+        self._by_key[key] = self._by_key.get(key, 0) + 1
+        self._ring.append(key)
+        if len(self._ring) - self._head > (2 * len(self._by_key)) + 16:
+            self._compact()
+
+    def discard(self, key):
+        if self._by_key.pop(key, None) is not None:
+            self._compact()
+
+    def pop_oldest(self):
+        ring = self._ring
+        by_key = self._by_key
+        while self._head < len(ring):
+            key = ring[self._head]
+            self._head += 1
+            count = by_key.get(key)
+            if count is None:
+                continue
+            if count > 1:
+                by_key[key] = count - 1
+                continue
+            del by_key[key]
+            if self._head > 32 and (self._head * 2) > len(ring):
+                self._compact()
+            return key
+        self._ring = []
+        self._head = 0
+        return None
+
+    def rebuild(self, cache, meta):
+        rows = []
+        for key in cache.keys():
+            rows.append((_meta_updated_ms(meta.get(key)), len(rows), key))
+        rows.sort()
+        self.clear()
+        for _, _, key in rows:
+            self.touch(key)
+
+    def _compact(self):
+        by_key = self._by_key
+        live = {}
+        kept = []
+        ring = self._ring
+        index = len(ring) - 1
+        while index >= self._head:
+            key = ring[index]
+            if key in by_key and key not in live:
+                live[key] = 1
+                kept.append(key)
+            index -= 1
+        kept.reverse()
+        self._by_key = live
+        self._ring = kept
+        self._head = 0
+
+
+def _normalize_eviction_policy(value):
+    if callable(value):
+        return value
+    policy = str(value or EVICT_LRU).strip().lower()
+    if policy not in (EVICT_LRU, EVICT_NEVER_ROUTERS):
+        raise ValueError("invalid eviction_policy: {}".format(value))
+    return policy
+
+
+def _prune_cache_map(cache, meta, max_items, order=None):
     max_items = _clamp_int(max_items, _STATE_CACHE_MAX_MIN, _STATE_CACHE_MAX_MAX)
+    while order is not None and len(cache) > int(max_items):
+        oldest_key = order.pop_oldest()
+        if oldest_key is None:
+            break
+        if oldest_key in cache:
+            cache.pop(oldest_key, None)
+            meta.pop(oldest_key, None)
     while len(cache) > int(max_items):
         oldest_key = None
         oldest_ms = None
         for key in cache.keys():
-            row = meta.get(key)
-            updated_ms = 0
-            if isinstance(row, dict):
-                updated_ms = int(row.get("updated_ms", 0))
+            updated_ms = _meta_updated_ms(meta.get(key))
             if oldest_ms is None or updated_ms < oldest_ms:
                 oldest_ms = updated_ms
                 oldest_key = key
@@ -498,6 +741,8 @@ def _prune_cache_map(cache, meta, max_items):
                 break
         cache.pop(oldest_key, None)
         meta.pop(oldest_key, None)
+        if order is not None:
+            order.discard(oldest_key)
 
 
 def _state_key_to_text(key):
@@ -570,6 +815,7 @@ class DeviceIdentity:
         "device_version",
         "power_source",
         "power_source_level",
+        "logical_type",
         "_by_endpoint",
     )
 
@@ -581,6 +827,7 @@ class DeviceIdentity:
         by_endpoint=None,
         power_source=None,
         power_source_level=None,
+        logical_type=None,
     ):
         self.short_addr = int(short_addr) & 0xFFFF
         self.ieee_addr = _normalize_ieee_addr(ieee_addr) if ieee_addr is not None else None
@@ -599,6 +846,7 @@ class DeviceIdentity:
             self.device_version = None if primary.get("device_version") is None else int(primary.get("device_version"))
         self.power_source = None if power_source is None else int(power_source)
         self.power_source_level = None if power_source_level is None else int(power_source_level)
+        self.logical_type = None if logical_type is None else int(logical_type) & 0x07
         self._by_endpoint = by_endpoint
 
     def endpoint(self, endpoint_id=None):
@@ -625,6 +873,7 @@ class DeviceIdentity:
             "device_version": self.device_version,
             "power_source": self.power_source,
             "power_source_level": self.power_source_level,
+            "logical_type": self.logical_type,
             "by_endpoint": endpoints,
         }
 
@@ -635,6 +884,7 @@ class DeviceIdentity:
         ieee_addr = discovered.get("ieee_addr")
         node_desc = ((discovered.get("node_descriptor") or {}).get("node_desc") or {})
         manufacturer_code = node_desc.get("manufacturer_code")
+        node_desc_flags = node_desc.get("node_desc_flags")
 
         by_endpoint = {}
         for row in discovered.get("simple_descriptors", ()):
@@ -658,6 +908,7 @@ class DeviceIdentity:
             by_endpoint=by_endpoint,
             power_source=power_desc.get("current_power_source"),
             power_source_level=power_desc.get("current_power_source_level"),
+            logical_type=None if node_desc_flags is None else int(node_desc_flags) & 0x07,
         )
 
     @classmethod
@@ -685,9 +936,47 @@ class DeviceIdentity:
             by_endpoint=by_endpoint,
             power_source=data.get("power_source"),
             power_source_level=data.get("power_source_level"),
+            logical_type=data.get("logical_type"),
         )
 
 
+# read_many() metric names -> (cluster_id, attr_id); values are returned raw.
+_READ_METRICS = {
+    "on_off": (CLUSTER_ID_ON_OFF, ATTR_ON_OFF_ON_OFF),
+    "level": (CLUSTER_ID_LEVEL_CONTROL, ATTR_LEVEL_CONTROL_CURRENT_LEVEL),
+    "lock_state": (CLUSTER_ID_DOOR_LOCK, ATTR_DOOR_LOCK_LOCK_STATE),
+    "temperature": (CLUSTER_ID_TEMP_MEASUREMENT, ATTR_TEMP_MEASUREMENT_VALUE),
+    "humidity": (CLUSTER_ID_REL_HUMIDITY_MEASUREMENT, ATTR_REL_HUMIDITY_MEASUREMENT_VALUE),
+    "pressure": (CLUSTER_ID_PRESSURE_MEASUREMENT, ATTR_PRESSURE_MEASUREMENT_VALUE),
+    "occupancy": (CLUSTER_ID_OCCUPANCY_SENSING, ATTR_OCCUPANCY_SENSING_OCCUPANCY),
+    "thermostat_temperature": (CLUSTER_ID_THERMOSTAT, ATTR_THERMOSTAT_LOCAL_TEMPERATURE),
+    "thermostat_heating_setpoint": (CLUSTER_ID_THERMOSTAT, ATTR_THERMOSTAT_OCCUPIED_HEATING_SETPOINT),
+    "thermostat_system_mode": (CLUSTER_ID_THERMOSTAT, ATTR_THERMOSTAT_SYSTEM_MODE),
+    "cover_lift": (CLUSTER_ID_WINDOW_COVERING, ATTR_WINDOW_COVERING_CURRENT_POSITION_LIFT_PERCENTAGE),
+    "cover_tilt": (CLUSTER_ID_WINDOW_COVERING, ATTR_WINDOW_COVERING_CURRENT_POSITION_TILT_PERCENTAGE),
+    "ias_zone_status": (CLUSTER_ID_IAS_ZONE, ATTR_IAS_ZONE_STATUS),
+    "power_w": (CLUSTER_ID_ELECTRICAL_MEASUREMENT, ATTR_ELECTRICAL_MEASUREMENT_ACTIVE_POWER),
+    "voltage_v": (CLUSTER_ID_ELECTRICAL_MEASUREMENT, ATTR_ELECTRICAL_MEASUREMENT_RMSVOLTAGE),
+    "current_a": (CLUSTER_ID_ELECTRICAL_MEASUREMENT, ATTR_ELECTRICAL_MEASUREMENT_RMSCURRENT),
+    "color_x": (CLUSTER_ID_COLOR_CONTROL, ATTR_COLOR_CONTROL_CURRENT_X),
+    "color_y": (CLUSTER_ID_COLOR_CONTROL, ATTR_COLOR_CONTROL_CURRENT_Y),
+    "color_temperature": (CLUSTER_ID_COLOR_CONTROL, ATTR_COLOR_CONTROL_COLOR_TEMPERATURE),
+}
+
+
+def _read_item_key(item):
+    if isinstance(item, str):
+        key = _READ_METRICS.get(item)
+        if key is None:
+            raise ValueError("unknown read metric: {}".format(item))
+        return (int(key[0]), int(key[1]))
+    try:
+        cluster_id, attr_id = item
+    except (TypeError, ValueError):
+        raise ValueError("read item must be a metric name or (cluster_id, attr_id)")
+    return (int(cluster_id), int(attr_id))
+
+
 class DeviceReadProxy:
     __slots__ = ("_device", "_endpoint_id")
 
@@ -716,6 +1005,104 @@ class DeviceReadProxy:
             )
         return endpoint
 
+    def _cached(self, endpoint, cluster_id, attr_id):
+        value = self._device.get_state(
+            cluster_id,
+            attr_id,
+            default=None,
+            allow_stale=True,
+            endpoint_id=endpoint,
+        )
+        if value is not None:
+            is_stale = self._device._is_state_stale_key((cluster_id, attr_id), endpoint_id=endpoint)
+            if is_stale:
+                if self._device.stale_read_policy == "raise":
+                    raise ZigbeeError(
+                        "stale cached value for endpoint {} cluster 0x{:04x} attr 0x{:04x}".format(
+                            endpoint, cluster_id, attr_id
+                        )
+                    )
+                if self._device.stale_read_policy == "refresh":
+                    value = None
+        return value
+
+    def _is_local(self):
+        stack = self._device.stack
+        if not hasattr(stack, "get_short_addr"):
+            return True
+        try:
+            local_short = int(stack.get_short_addr()) & 0xFFFF
+        except Exception:
+            return True
+        return int(self._device.short_addr) == int(local_short)
+
+    def _remote_supported(self):
+        stack = self._device.stack
+        if not hasattr(stack, "read_attributes_supported"):
+            return False
+        try:
+            return bool(stack.read_attributes_supported())
+        except Exception:
+            return False
+
+    def _start_remote(self, endpoint, cluster_id, attr_ids, timeout_ms):
+        """Map each attribute ID to the pending read answering it (None: negatively cached)."""
+        device = self._device
+        if device._reads is not None:
+            return device._reads.start(device.stack, device.short_addr, endpoint, cluster_id, attr_ids, timeout_ms)
+        shares = {}
+        max_ids = max(1, int(READ_ATTR_MAX))
+        for index in range(0, len(attr_ids), max_ids):
+            chunk = tuple(attr_ids[index:index + max_ids])
+            handle = device.stack.start_read_attributes(
+                device.short_addr,
+                cluster_id,
+                chunk,
+                dst_endpoint=endpoint,
+                timeout_ms=timeout_ms,
+            )
+            for attr_id in chunk:
+                shares[int(attr_id)] = handle
+        return shares
+
+    def _collect_remote(self, endpoint, cluster_id, shares, out):
+        """Wait for the reads in ``shares``; successful records go to the state cache and ``out``."""
+        device = self._device
+        cluster_id = int(cluster_id)
+        by_handle = []
+        for attr_id, handle in shares.items():
+            records = None
+            if handle is not None:
+                for seen, seen_records in by_handle:
+                    if seen is handle:
+                        records = seen_records
+                        break
+                if records is None:
+                    try:
+                        records = handle.wait()
+                    except ZigbeeError:
+                        records = {}
+                    if device._reads is not None:
+                        device._reads.settle(handle, records)
+                    by_handle.append((handle, records))
+            record = None if records is None else records.get(attr_id)
+            value = None
+            if record is not None and record.get("status") == 0:
+                value = record.get("value")
+            if value is not None:
+                device._write_state(
+                    (cluster_id, attr_id),
+                    value,
+                    source="read",
+                    authoritative=True,
+                    endpoint_id=endpoint,
+                    source_short_addr=device.short_addr,
+                    source_endpoint=endpoint,
+                    attr_type=record.get("attr_type"),
+                )
+            out[(cluster_id, int(attr_id))] = value
+        return out
+
     def _read_raw(self, cluster_id, attr_id, use_cache=True):
         cluster_id = int(cluster_id)
         attr_id = int(attr_id)
@@ -723,35 +1110,23 @@ class DeviceReadProxy:
         key = (cluster_id, attr_id)
 
         if use_cache:
-            value = self._device.get_state(
-                cluster_id,
-                attr_id,
-                default=None,
-                allow_stale=True,
-                endpoint_id=endpoint,
-            )
+            value = self._cached(endpoint, cluster_id, attr_id)
             if value is not None:
-                is_stale = self._device._is_state_stale_key(key, endpoint_id=endpoint)
-                if is_stale:
-                    if self._device.stale_read_policy == "raise":
-                        raise ZigbeeError(
-                            "stale cached value for endpoint {} cluster 0x{:04x} attr 0x{:04x}".format(
-                                endpoint, cluster_id, attr_id
-                            )
-                        )
-                    if self._device.stale_read_policy == "refresh":
-                        value = None
+                if self._device._reads is not None:
+                    self._device._reads.hits += 1
+                return value
+
+        if not self._is_local():
+            if self._remote_supported():
+                shares = self._start_remote(endpoint, cluster_id, (attr_id,), _READ_TIMEOUT_MS_DEFAULT)
+                value = self._collect_remote(endpoint, cluster_id, shares, {}).get(key)
                 if value is not None:
                     return value
-
-        is_local_device = True
-        if hasattr(self._device.stack, "get_short_addr"):
-            try:
-                local_short = int(self._device.stack.get_short_addr()) & 0xFFFF
-                is_local_device = int(self._device.short_addr) == int(local_short)
-            except Exception:
-                is_local_device = True
-        if not is_local_device:
+                raise ZigbeeError(
+                    "remote read failed on endpoint {} cluster 0x{:04x} attr 0x{:04x}".format(
+                        endpoint, cluster_id, attr_id
+                    )
+                )
             value = self._device.get_state(
                 cluster_id,
                 attr_id,
@@ -782,6 +1157,57 @@ class DeviceReadProxy:
         )
         return value
 
+    def read_many(self, items, use_cache=True, timeout_ms=_READ_TIMEOUT_MS_DEFAULT):
+        """Read several attributes, one Read Attributes frame per (endpoint, cluster).
+
+        ``items`` holds metric names (``"level"``, ``"temperature"``, ...) or
+        ``(cluster_id, attr_id)`` pairs. Returns ``{item: raw_value}``; an
+        attribute the device did not return reads as None. All frames are sent
+        before the first response is awaited.
+        """
+        keys = []
+        for item in items:
+            key = _read_item_key(item)
+            keys.append((item if isinstance(item, str) else key, key))
+        values = {}
+        wanted = {}
+        order = []
+        for _, key in keys:
+            if key in values:
+                continue
+            endpoint = self._resolve_endpoint(key[0])
+            value = self._cached(endpoint, key[0], key[1]) if use_cache else None
+            if value is not None:
+                if self._device._reads is not None:
+                    self._device._reads.hits += 1
+                values[key] = value
+                continue
+            group = (endpoint, key[0])
+            if group not in wanted:
+                wanted[group] = []
+                order.append(group)
+            if key[1] not in wanted[group]:
+                wanted[group].append(key[1])
+
+        if order and not self._is_local() and self._remote_supported():
+            pending = []
+            for endpoint, cluster_id in order:
+                pending.append((endpoint, cluster_id, self._start_remote(endpoint, cluster_id, wanted[(endpoint, cluster_id)], timeout_ms)))
+            for endpoint, cluster_id, shares in pending:
+                self._collect_remote(endpoint, cluster_id, shares, values)
+        else:
+            for endpoint, cluster_id in order:
+                for attr_id in wanted[(endpoint, cluster_id)]:
+                    try:
+                        values[(cluster_id, attr_id)] = self._read_raw(cluster_id, attr_id, use_cache=False)
+                    except ZigbeeError:
+                        values[(cluster_id, attr_id)] = None
+
+        out = {}
+        for item, key in keys:
+            out[item] = values.get(key)
+        return out
+
     def on_off(self, use_cache=True):
         return _safe_bool(self._read_raw(CLUSTER_ID_ON_OFF, ATTR_ON_OFF_ON_OFF, use_cache=use_cache))
 
@@ -965,6 +1391,20 @@ class DeviceControlProxy:
             )
         return endpoint
 
+    def _send(self, priority, key, send, *args, **kwargs):
+        """Hand a command to the coordinator's transmit scheduler, or send it directly when unmanaged.
+
+        ``key`` (endpoint, cluster_id, kind) marks last-writer-wins commands that may replace an unsent one.
+        Raises ``ZigbeeError`` when the scheduler's queue is full, before any optimistic state write.
+        """
+        tx = self._device._tx
+        if tx is None:
+            send(*args, **kwargs)
+            return True
+        if not tx.submit(self._device.short_addr, send, args, kwargs, priority=priority, key=key):
+            raise ZigbeeError("transmit queue full for 0x{:04x}".format(int(self._device.short_addr) & 0xFFFF))
+        return True
+
     def _set_attr(self, cluster_id, attr_id, value, check=False):
         endpoint = self._endpoint(cluster_id)
         self._device.stack.set_attribute(
@@ -979,7 +1419,10 @@ class DeviceControlProxy:
 
     def on(self):
         endpoint = self._endpoint(CLUSTER_ID_ON_OFF)
-        self._device.stack.send_on_off_cmd(
+        self._send(
+            TX_PRIORITY_HIGH,
+            None,
+            self._device.stack.send_on_off_cmd,
             self._device.short_addr,
             dst_endpoint=endpoint,
             cmd_id=CMD_ON_OFF_ON,
@@ -995,7 +1438,10 @@ class DeviceControlProxy:
 
     def off(self):
         endpoint = self._endpoint(CLUSTER_ID_ON_OFF)
-        self._device.stack.send_on_off_cmd(
+        self._send(
+            TX_PRIORITY_HIGH,
+            None,
+            self._device.stack.send_on_off_cmd,
             self._device.short_addr,
             dst_endpoint=endpoint,
             cmd_id=CMD_ON_OFF_OFF,
@@ -1011,7 +1457,10 @@ class DeviceControlProxy:
 
     def toggle(self):
         endpoint = self._endpoint(CLUSTER_ID_ON_OFF)
-        self._device.stack.send_on_off_cmd(
+        self._send(
+            TX_PRIORITY_HIGH,
+            None,
+            self._device.stack.send_on_off_cmd,
             self._device.short_addr,
             dst_endpoint=endpoint,
             cmd_id=CMD_ON_OFF_TOGGLE,
@@ -1034,7 +1483,10 @@ class DeviceControlProxy:
             value = 0
         if value > 254:
             value = 254
-        self._device.stack.send_level_cmd(
+        self._send(
+            TX_PRIORITY_NORMAL,
+            (endpoint, CLUSTER_ID_LEVEL_CONTROL, "level"),
+            self._device.stack.send_level_cmd,
             self._device.short_addr,
             value,
             dst_endpoint=endpoint,
@@ -1052,7 +1504,10 @@ class DeviceControlProxy:
 
     def lock(self):
         endpoint = self._endpoint(CLUSTER_ID_DOOR_LOCK)
-        self._device.stack.send_lock_cmd(
+        self._send(
+            TX_PRIORITY_HIGH,
+            None,
+            self._device.stack.send_lock_cmd,
             self._device.short_addr,
             lock=True,
             dst_endpoint=endpoint,
@@ -1068,7 +1523,10 @@ class DeviceControlProxy:
 
     def unlock(self):
         endpoint = self._endpoint(CLUSTER_ID_DOOR_LOCK)
-        self._device.stack.send_lock_cmd(
+        self._send(
+            TX_PRIORITY_HIGH,
+            None,
+            self._device.stack.send_lock_cmd,
             self._device.short_addr,
             lock=False,
             dst_endpoint=endpoint,
@@ -1235,7 +1693,10 @@ class DeviceControlProxy:
         color_x = _clamp_int(color_x, 0, 0xFFFF)
         color_y = _clamp_int(color_y, 0, 0xFFFF)
         transition_ds = _clamp_int(transition_ds, 0, 0xFFFF)
-        self._device.stack.send_color_move_to_color_cmd(
+        self._send(
+            TX_PRIORITY_NORMAL,
+            (endpoint, CLUSTER_ID_COLOR_CONTROL, "xy"),
+            self._device.stack.send_color_move_to_color_cmd,
             self._device.short_addr,
             color_x,
             color_y,
@@ -1262,7 +1723,10 @@ class DeviceControlProxy:
         endpoint = self._endpoint(CLUSTER_ID_COLOR_CONTROL)
         mireds = _clamp_int(mireds, 0, 0xFFFF)
         transition_ds = _clamp_int(transition_ds, 0, 0xFFFF)
-        self._device.stack.send_color_move_to_color_temperature_cmd(
+        self._send(
+            TX_PRIORITY_NORMAL,
+            (endpoint, CLUSTER_ID_COLOR_CONTROL, "ct"),
+            self._device.stack.send_color_move_to_color_temperature_cmd,
             self._device.short_addr,
             mireds,
             dst_endpoint=endpoint,
@@ -1335,6 +1799,8 @@ class DiscoveredDevice:
         "state_ttl_ms",
         "stale_read_policy",
         "state_cache_max",
+        "_state_order",
+        "_endpoint_state_order",
         "meta",
         "identity",
         "last_seen_ms",
@@ -1342,6 +1808,9 @@ class DiscoveredDevice:
         "_forced_offline",
         "_offline_reason",
         "_offline_set_ms",
+        "_dirty_cb",
+        "_reads",
+        "_tx",
         "read",
         "control",
     )
@@ -1393,6 +1862,8 @@ class DiscoveredDevice:
         self.state_meta = {}
         self.state_by_endpoint = {}
         self.state_meta_by_endpoint = {}
+        self._state_order = _CacheOrder()
+        self._endpoint_state_order = _CacheOrder()
         self.state_ttl_ms = _clamp_int(state_ttl_ms, _STATE_TTL_MS_MIN, _STATE_TTL_MS_MAX)
         self.stale_read_policy = _normalize_stale_policy(stale_read_policy)
         self.state_cache_max = _clamp_int(state_cache_max, _STATE_CACHE_MAX_MIN, _STATE_CACHE_MAX_MAX)
@@ -1403,6 +1874,9 @@ class DiscoveredDevice:
         self._forced_offline = False
         self._offline_reason = None
         self._offline_set_ms = None
+        self._dirty_cb = None
+        self._reads = None
+        self._tx = None
         self.read = DeviceReadProxy(self)
         self.control = DeviceControlProxy(self)
 
@@ -1417,6 +1891,14 @@ class DiscoveredDevice:
     def ieee_hex(self):
         return _ieee_to_hex(self.identity.ieee_addr)
 
+    @property
+    def is_router(self):
+        logical_type = self.identity.logical_type
+        if logical_type is not None:
+            return logical_type in (_LOGICAL_TYPE_COORDINATOR, _LOGICAL_TYPE_ROUTER)
+        power_source = self.identity.power_source
+        return power_source is not None and bool(int(power_source) & _POWER_SOURCE_MAINS)
+
     def endpoint_for(self, cluster_id):
         return self.cluster_to_endpoint.get(int(cluster_id))
 
@@ -1603,8 +2085,7 @@ class DiscoveredDevice:
         if ttl_ms <= 0:
             return False
         now_ms = _ticks_ms() if now_ms is None else int(now_ms)
-        updated_ms = int(meta.get("updated_ms", 0))
-        age_ms = _ticks_diff(now_ms, updated_ms)
+        age_ms = _ticks_diff(now_ms, int(meta.updated_ms))
         if age_ms < 0:
             return False
         return age_ms > ttl_ms
@@ -1628,35 +2109,58 @@ class DiscoveredDevice:
             if endpoint_id is None
             else int(endpoint_id)
         )
-        meta = {
-            "updated_ms": now_ms,
-            "source": str(source),
-            "authoritative": bool(authoritative),
-        }
-        if source_short_addr is not None:
-            meta["source_short_addr"] = int(source_short_addr) & 0xFFFF
-        if source_endpoint is not None:
-            meta["source_endpoint"] = int(source_endpoint)
-        if attr_type is not None:
-            meta["attr_type"] = int(attr_type)
-
+        default_endpoint = self.endpoint_for(key[0])
+        write_default = endpoint_id is None or default_endpoint is None or int(default_endpoint) == int(endpoint_id)
+        # Reuse the record in place only when it is shared exactly like this write.
+        endpoint_key = None
         if endpoint_id is not None:
-            endpoint_key = (int(endpoint_id), int(key[0]), int(key[1]))
-            endpoint_meta = dict(meta)
-            endpoint_meta["endpoint_id"] = int(endpoint_id)
+            endpoint_key = (int(endpoint_id), key[0], key[1])
+            record = self.state_meta_by_endpoint.get(endpoint_key)
+            if record is not None and write_default != (record is self.state_meta.get(key)):
+                record = None
+        else:
+            record = self.state_meta.get(key)
+            if record is not None and record.endpoint_id is not None:
+                record = None
+        if record is None:
+            record = _StateRecord()
+        record.update(
+            now_ms,
+            source,
+            authoritative,
+            endpoint_id=endpoint_id,
+            source_short_addr=source_short_addr,
+            source_endpoint=source_endpoint,
+            attr_type=attr_type,
+        )
+
+        if endpoint_key is not None:
             self.state_by_endpoint[endpoint_key] = value
-            self.state_meta_by_endpoint[endpoint_key] = endpoint_meta
+            self.state_meta_by_endpoint[endpoint_key] = record
+            self._endpoint_state_order.touch(endpoint_key)
 
-        default_endpoint = self.endpoint_for(key[0])
-        if endpoint_id is None or default_endpoint is None or int(default_endpoint) == int(endpoint_id):
+        if write_default:
             self.state[key] = value
-            self.state_meta[key] = dict(meta)
+            self.state_meta[key] = record
+            self._state_order.touch(key)
         self._prune_state_caches()
         self.touch_seen(now_ms=now_ms, source=source)
+        dirty_cb = self._dirty_cb
+        if dirty_cb is not None:
+            dirty_cb(self.short_addr)
 
     def _prune_state_caches(self):
-        _prune_cache_map(self.state_by_endpoint, self.state_meta_by_endpoint, self.state_cache_max)
-        _prune_cache_map(self.state, self.state_meta, self.state_cache_max)
+        _prune_cache_map(
+            self.state_by_endpoint,
+            self.state_meta_by_endpoint,
+            self.state_cache_max,
+            order=self._endpoint_state_order,
+        )
+        _prune_cache_map(self.state, self.state_meta, self.state_cache_max, order=self._state_order)
+
+    def _rebuild_state_order(self):
+        self._endpoint_state_order.rebuild(self.state_by_endpoint, self.state_meta_by_endpoint)
+        self._state_order.rebuild(self.state, self.state_meta)
 
     def state_info(self, cluster_id, attr_id, endpoint_id=None):
         key = (int(cluster_id), int(attr_id))
@@ -1667,7 +2171,7 @@ class DiscoveredDevice:
             meta = self.state_meta_by_endpoint.get((endpoint_id, key[0], key[1]))
         if meta is None:
             return None
-        out = dict(meta)
+        out = meta.to_meta(with_endpoint=endpoint_id is not None)
         out["stale"] = self._is_state_stale_key(key, endpoint_id=endpoint_id)
         return out
 
@@ -1702,13 +2206,13 @@ class DiscoveredDevice:
         state_meta = {}
         for key, meta in self.state_meta.items():
             state_meta[_state_key_to_text(key)] = {
-                "updated_ms": int(meta.get("updated_ms", 0)),
-                "source": str(meta.get("source", "unknown")),
-                "authoritative": bool(meta.get("authoritative", False)),
+                "updated_ms": int(meta.updated_ms),
+                "source": meta.source,
+                "authoritative": meta.authoritative,
                 "stale": self._is_state_stale_key(key),
-                "source_short_addr": meta.get("source_short_addr"),
-                "source_endpoint": meta.get("source_endpoint"),
-                "attr_type": meta.get("attr_type"),
+                "source_short_addr": meta.source_short_addr,
+                "source_endpoint": meta.source_endpoint,
+                "attr_type": meta.attr_type,
             }
         return {
             "short_addr": int(self.short_addr),
@@ -1737,17 +2241,17 @@ class DiscoveredDevice:
             "state_meta": state_meta,
             "state_meta_by_endpoint": {
                 _state_key_to_text(key): {
-                    "updated_ms": int(meta.get("updated_ms", 0)),
-                    "source": str(meta.get("source", "unknown")),
-                    "authoritative": bool(meta.get("authoritative", False)),
-                    "endpoint_id": int(meta.get("endpoint_id", key[0])),
+                    "updated_ms": int(meta.updated_ms),
+                    "source": meta.source,
+                    "authoritative": meta.authoritative,
+                    "endpoint_id": int(key[0] if meta.endpoint_id is None else meta.endpoint_id),
                     "stale": self._is_state_stale_key(
                         (int(key[1]), int(key[2])),
                         endpoint_id=int(key[0]),
                     ),
-                    "source_short_addr": meta.get("source_short_addr"),
-                    "source_endpoint": meta.get("source_endpoint"),
-                    "attr_type": meta.get("attr_type"),
+                    "source_short_addr": meta.source_short_addr,
+                    "source_endpoint": meta.source_endpoint,
+                    "attr_type": meta.attr_type,
                 }
                 for key, meta in self.state_meta_by_endpoint.items()
             },
@@ -1854,55 +2358,100 @@ class DiscoveredDevice:
             key = _state_key_from_text(key_text)
             if key is None or len(key) != 2:
                 continue
-            meta = meta or {}
-            cleaned = {
-                "updated_ms": int(meta.get("updated_ms", 0)),
-                "source": str(meta.get("source", "unknown")),
-                "authoritative": bool(meta.get("authoritative", False)),
-            }
-            if meta.get("source_short_addr") is not None:
-                cleaned["source_short_addr"] = int(meta.get("source_short_addr")) & 0xFFFF
-            if meta.get("source_endpoint") is not None:
-                cleaned["source_endpoint"] = int(meta.get("source_endpoint"))
-            if meta.get("attr_type") is not None:
-                cleaned["attr_type"] = int(meta.get("attr_type"))
-            device.state_meta[key] = cleaned
+            device.state_meta[key] = _StateRecord.from_meta(meta)
         for key_text, meta in (data.get("state_meta_by_endpoint") or {}).items():
             key = _state_key_from_text(key_text)
             if key is None or len(key) != 3:
                 continue
             meta = meta or {}
-            cleaned = {
-                "updated_ms": int(meta.get("updated_ms", 0)),
-                "source": str(meta.get("source", "unknown")),
-                "authoritative": bool(meta.get("authoritative", False)),
-                "endpoint_id": int(meta.get("endpoint_id", key[0])),
-            }
-            if meta.get("source_short_addr") is not None:
-                cleaned["source_short_addr"] = int(meta.get("source_short_addr")) & 0xFFFF
-            if meta.get("source_endpoint") is not None:
-                cleaned["source_endpoint"] = int(meta.get("source_endpoint"))
-            if meta.get("attr_type") is not None:
-                cleaned["attr_type"] = int(meta.get("attr_type"))
-            device.state_meta_by_endpoint[(int(key[0]), int(key[1]), int(key[2]))] = cleaned
+            device.state_meta_by_endpoint[(int(key[0]), int(key[1]), int(key[2]))] = _StateRecord.from_meta(
+                meta,
+                endpoint_id=int(meta.get("endpoint_id", key[0])),
+            )
         device.last_seen_ms = int(data.get("last_seen_ms", _ticks_ms()))
         device._last_seen_source = data.get("last_seen_source")
         device._forced_offline = bool(data.get("forced_offline", False))
         device._offline_reason = data.get("offline_reason")
         offline_set_ms = data.get("offline_set_ms")
         device._offline_set_ms = None if offline_set_ms is None else int(offline_set_ms)
+        device._rebuild_state_order()
         device._prune_state_caches()
         return device
 
 
+def _index_add(index, key, short_addr):
+    row = index.get(key)
+    if row is None:
+        index[key] = set((short_addr,))
+    else:
+        row.add(short_addr)
+
+
+def _index_remove(index, key, short_addr):
+    row = index.get(key)
+    if row is None:
+        return
+    row.discard(short_addr)
+    if not row:
+        index.pop(key, None)
+
+
 class DeviceRegistry:
-    """Bounded in-memory registry keyed by short address."""
+    """Bounded in-memory registry keyed by short address, with routing and lookup indexes.
+
+    When full, the least recently seen evictable device is dropped. ``eviction_policy``
+    is ``"lru"``, ``"never_evict_routers"`` or a callable ``policy(device) -> bool``
+    returning whether the device may be evicted; pinned devices are never evicted.
+    """
 
-    __slots__ = ("max_devices", "_by_short")
+    __slots__ = (
+        "max_devices",
+        "eviction_policy",
+        "_pinned",
+        "_lru_heap",
+        "_evicted",
+        "_eviction_blocked",
+        "_by_short",
+        "_by_route",
+        "_by_ieee",
+        "_by_feature",
+        "_by_manufacturer",
+        "_by_profile",
+        "_by_device_id",
+        "_sorted",
+        "on_change",
+        "on_remove",
+        "reads",
+        "transmit",
+    )
 
-    def __init__(self, max_devices=32):
+    def __init__(self, max_devices=32, eviction_policy=EVICT_LRU, pinned=()):
         self.max_devices = max(1, int(max_devices))
+        self.eviction_policy = _normalize_eviction_policy(eviction_policy)
+        self._pinned = set(int(short_addr) & 0xFFFF for short_addr in (pinned or ()))
+        self._lru_heap = []
+        self._evicted = 0
+        self._eviction_blocked = 0
         self._by_short = {}
+        self._by_route = {}
+        self._by_ieee = {}
+        self._by_feature = {}
+        self._by_manufacturer = {}
+        self._by_profile = {}
+        self._by_device_id = {}
+        self._sorted = None
+        # on_change(short_addr) after a device record changes; short_addr None for pins/policy.
+        self.on_change = None
+        # on_remove(short_addr, moved_to) after a removal or eviction; moved_to is the new
+        # short address when the same IEEE rejoined under another one, else None.
+        self.on_remove = None
+        self.reads = None
+        self.transmit = None
+
+    def _changed(self, short_addr):
+        on_change = self.on_change
+        if on_change is not None:
+            on_change(short_addr)
 
     def __len__(self):
         return len(self._by_short)
@@ -1910,30 +2459,535 @@ class DeviceRegistry:
     def get(self, short_addr, default=None):
         return self._by_short.get(int(short_addr) & 0xFFFF, default)
 
+    def get_by_ieee(self, ieee_addr, default=None):
+        short_addr = self._by_ieee.get(_normalize_ieee_addr(ieee_addr))
+        if short_addr is None:
+            return default
+        return self._by_short.get(short_addr, default)
+
     def values(self):
         return tuple(self._by_short.values())
 
+    def sorted_values(self):
+        if self._sorted is None:
+            self._sorted = tuple(self._by_short[short] for short in sorted(self._by_short))
+        return self._sorted
+
     def by_short(self):
         return dict(self._by_short)
 
+    def remove(self, short_addr):
+        return self._drop(int(short_addr) & 0xFFFF)
+
+    def pin(self, short_addr):
+        self._pinned.add(int(short_addr) & 0xFFFF)
+        self._changed(None)
+
+    def unpin(self, short_addr):
+        self._pinned.discard(int(short_addr) & 0xFFFF)
+        self._changed(None)
+        self._prune()
+
+    def pinned(self):
+        return tuple(sorted(self._pinned))
+
+    def is_evictable(self, device):
+        if (int(device.short_addr) & 0xFFFF) in self._pinned:
+            return False
+        policy = self.eviction_policy
+        if policy == EVICT_LRU:
+            return True
+        if policy == EVICT_NEVER_ROUTERS:
+            return not device.is_router
+        return bool(policy(device))
+
+    def stats(self):
+        return {
+            "devices": len(self._by_short),
+            "max_devices": int(self.max_devices),
+            "pinned": len(self._pinned),
+            "evicted": int(self._evicted),
+            "eviction_blocked": int(self._eviction_blocked),
+        }
+
+    def route(self, endpoint, cluster_id):
+        shorts = self._by_route.get((int(endpoint), int(cluster_id)), ())
+        return tuple(self._by_short[short] for short in shorts)
+
+    def select(self, features=(), manufacturer_code=None, profile_id=None, device_id=None, ieee_addr=None):
+        """Devices matching every given criterion, sorted by short address."""
+        rows = []
+        for name in features or ():
+            rows.append(self._by_feature.get(str(name), ()))
+        if manufacturer_code is not None:
+            rows.append(self._by_manufacturer.get(int(manufacturer_code), ()))
+        if profile_id is not None:
+            rows.append(self._by_profile.get(int(profile_id), ()))
+        if device_id is not None:
+            rows.append(self._by_device_id.get(int(device_id), ()))
+        if ieee_addr is not None:
+            short_addr = self._by_ieee.get(_normalize_ieee_addr(ieee_addr))
+            rows.append(() if short_addr is None else (short_addr,))
+        if not rows:
+            return self.sorted_values()
+        rows.sort(key=len)
+        if not rows[0]:
+            return ()
+        matches = [short for short in rows[0] if all(short in row for row in rows[1:])]
+        matches.sort()
+        return tuple(self._by_short[short] for short in matches)
+
     def upsert(self, device):
         key = int(device.short_addr) & 0xFFFF
+        ieee_addr = device.identity.ieee_addr
+        if ieee_addr is not None:
+            moved_from = self._by_ieee.get(ieee_addr)
+            if moved_from is not None and moved_from != key:
+                # Same radio rejoined under a new short address; retire the stale entry.
+                if moved_from in self._pinned:
+                    self._pinned.discard(moved_from)
+                    self._pinned.add(key)
+                self._drop(moved_from, moved_to=key)
+        previous = self._by_short.get(key)
+        if previous is not None:
+            self._unindex(key, previous)
+            if previous is not device:
+                previous._dirty_cb = None
+                previous._reads = None
+                previous._tx = None
         self._by_short[key] = device
+        self._index(key, device)
+        self._push_lru(key, device)
+        device._dirty_cb = self._changed
+        device._reads = self.reads
+        device._tx = self.transmit
+        self._changed(key)
         self._prune()
         return device
 
+    def _push_lru(self, key, device):
+        if _heapq is None:
+            return
+        heap = self._lru_heap
+        if len(heap) > (2 * len(self._by_short)) + 16:
+            heap = [(int(item.last_seen_ms), short) for short, item in self._by_short.items()]
+            _heapq.heapify(heap)
+            self._lru_heap = heap
+        else:
+            _heapq.heappush(heap, (int(device.last_seen_ms), key))
+
+    def _pop_victim(self):
+        # Lazy min-heap: entries whose last_seen moved on are re-queued with the fresh value.
+        heap = self._lru_heap
+        by_short = self._by_short
+        held = []
+        victim = None
+        while heap:
+            seen_ms, short_addr = _heapq.heappop(heap)
+            device = by_short.get(short_addr)
+            if device is None:
+                continue
+            current_ms = int(device.last_seen_ms)
+            if current_ms != seen_ms:
+                _heapq.heappush(heap, (current_ms, short_addr))
+                continue
+            if not self.is_evictable(device):
+                held.append((seen_ms, short_addr))
+                continue
+            victim = short_addr
+            break
+        for item in held:
+            _heapq.heappush(heap, item)
+        return victim
+
+    def _scan_victim(self):
+        oldest_key = None
+        oldest_ts = None
+        for key, device in self._by_short.items():
+            if not self.is_evictable(device):
+                continue
+            ts = int(device.last_seen_ms)
+            if oldest_ts is None or ts < oldest_ts:
+                oldest_ts = ts
+                oldest_key = key
+        return oldest_key
+
+    def _index(self, key, device):
+        self._sorted = None
+        for cluster_id, endpoint_ids in device.cluster_to_endpoints.items():
+            for endpoint_id in endpoint_ids:
+                route_key = (int(endpoint_id), int(cluster_id))
+                row = self._by_route.get(route_key)
+                if row is None:
+                    self._by_route[route_key] = (key,)
+                elif key not in row:
+                    self._by_route[route_key] = row + (key,)
+        identity = device.identity
+        if identity.ieee_addr is not None:
+            self._by_ieee[identity.ieee_addr] = key
+        for name in device.features:
+            _index_add(self._by_feature, str(name), key)
+        if identity.manufacturer_code is not None:
+            _index_add(self._by_manufacturer, int(identity.manufacturer_code), key)
+        if identity.profile_id is not None:
+            _index_add(self._by_profile, int(identity.profile_id), key)
+        if identity.device_id is not None:
+            _index_add(self._by_device_id, int(identity.device_id), key)
+
+    def _unindex(self, key, device):
+        self._sorted = None
+        for cluster_id, endpoint_ids in device.cluster_to_endpoints.items():
+            for endpoint_id in endpoint_ids:
+                route_key = (int(endpoint_id), int(cluster_id))
+                row = self._by_route.get(route_key)
+                if row is None or key not in row:
+                    continue
+                row = tuple(short for short in row if short != key)
+                if row:
+                    self._by_route[route_key] = row
+                else:
+                    self._by_route.pop(route_key, None)
+        identity = device.identity
+        if identity.ieee_addr is not None and self._by_ieee.get(identity.ieee_addr) == key:
+            self._by_ieee.pop(identity.ieee_addr, None)
+        for name in device.features:
+            _index_remove(self._by_feature, str(name), key)
+        if identity.manufacturer_code is not None:
+            _index_remove(self._by_manufacturer, int(identity.manufacturer_code), key)
+        if identity.profile_id is not None:
+            _index_remove(self._by_profile, int(identity.profile_id), key)
+        if identity.device_id is not None:
+            _index_remove(self._by_device_id, int(identity.device_id), key)
+
+    def _drop(self, key, moved_to=None):
+        device = self._by_short.pop(key, None)
+        if device is not None:
+            self._unindex(key, device)
+            device._dirty_cb = None
+            device._reads = None
+            device._tx = None
+            self._changed(key)
+            if self.on_remove is not None:
+                self.on_remove(key, moved_to)
+        return device
+
     def _prune(self):
         while len(self._by_short) > self.max_devices:
-            oldest_key = None
-            oldest_ts = None
-            for key, device in self._by_short.items():
-                ts = int(device.last_seen_ms)
-                if oldest_ts is None or ts < oldest_ts:
-                    oldest_ts = ts
-                    oldest_key = key
+            if _heapq is None:
+                oldest_key = self._scan_victim()
+            else:
+                oldest_key = self._pop_victim()
             if oldest_key is None:
+                self._eviction_blocked += 1
                 break
-            self._by_short.pop(oldest_key, None)
+            self._drop(oldest_key)
+            self._evicted += 1
+
+
+class InterviewCache:
+    """Descriptor sets of interviewed devices keyed by IEEE address.
+
+    Entries point at a template keyed by the model fingerprint (manufacturer
+    code, logical type and per-endpoint profile/device id/clusters), so devices
+    of one model share a single descriptor set. A lookup hit still has to pass
+    ``verify()`` against a fresh node descriptor before it is trusted.
+    """
+
+    __slots__ = (
+        "max_entries",
+        "hits",
+        "misses",
+        "verify_failed",
+        "_by_ieee",
+        "_templates",
+        "_refs",
+        "_order",
+    )
+
+    def __init__(self, max_entries=_INTERVIEW_CACHE_MAX_DEFAULT):
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self.verify_failed = 0
+        self._by_ieee = {}
+        self._templates = {}
+        self._refs = {}
+        self._order = []
+
+    def __len__(self):
+        return len(self._by_ieee)
+
+    @staticmethod
+    def fingerprint(identity):
+        parts = ["{}:{}".format(identity.manufacturer_code, identity.logical_type)]
+        for endpoint_id in identity.endpoints:
+            data = identity.endpoint(endpoint_id) or {}
+            parts.append(
+                "{}:{}:{}:{}:{}:{}".format(
+                    int(endpoint_id),
+                    data.get("profile_id"),
+                    data.get("device_id"),
+                    data.get("device_version"),
+                    ",".join("{:x}".format(int(cluster_id)) for cluster_id in (data.get("input_clusters") or ())),
+                    ",".join("{:x}".format(int(cluster_id)) for cluster_id in (data.get("output_clusters") or ())),
+                )
+            )
+        return "|".join(parts)
+
+    def learn(self, device):
+        identity = device.identity
+        ieee_addr = identity.ieee_addr
+        if ieee_addr is None or not identity.endpoints:
+            return False
+        key = self.fingerprint(identity)
+        if key not in self._templates:
+            by_endpoint = {}
+            for endpoint_id in identity.endpoints:
+                by_endpoint[int(endpoint_id)] = identity.endpoint(endpoint_id)
+            self._templates[key] = {
+                "manufacturer_code": identity.manufacturer_code,
+                "logical_type": identity.logical_type,
+                "by_endpoint": by_endpoint,
+            }
+            self._refs[key] = 0
+        self._refs[key] += 1
+        previous = self._by_ieee.get(ieee_addr)
+        if previous is None:
+            self._order.append(ieee_addr)
+        else:
+            self._release(previous[0])
+        self._by_ieee[ieee_addr] = (key, identity.power_source, identity.power_source_level)
+        while len(self._order) > self.max_entries:
+            self.forget(self._order[0])
+        return True
+
+    def _release(self, key):
+        refs = self._refs.get(key, 0) - 1
+        if refs > 0:
+            self._refs[key] = refs
+            return
+        self._refs.pop(key, None)
+        self._templates.pop(key, None)
+
+    def forget(self, ieee_addr):
+        entry = self._by_ieee.pop(ieee_addr, None)
+        if entry is None:
+            return False
+        try:
+            self._order.remove(ieee_addr)
+        except ValueError:
+            pass
+        self._release(entry[0])
+        return True
+
+    def get(self, ieee_addr):
+        if ieee_addr is None:
+            return None
+        return self._by_ieee.get(ieee_addr)
+
+    def verify(self, entry, discovered):
+        """True when a fresh node descriptor matches the cached model."""
+        template = self._templates.get(entry[0])
+        node_desc = ((discovered or {}).get("node_descriptor") or {}).get("node_desc") or {}
+        if template is None or node_desc.get("manufacturer_code") is None:
+            return False
+        if int(node_desc["manufacturer_code"]) != template["manufacturer_code"]:
+            return False
+        flags = node_desc.get("node_desc_flags")
+        if flags is not None and template["logical_type"] is not None:
+            return (int(flags) & 0x07) == template["logical_type"]
+        return True
+
+    def build(self, short_addr, ieee_addr, entry, node_descriptor=None):
+        """Rebuild a ``discover_node_descriptors()`` result from the cached template."""
+        short_addr = int(short_addr) & 0xFFFF
+        template = self._templates[entry[0]]
+        endpoint_ids = sorted(template["by_endpoint"])
+        rows = []
+        for endpoint_id in endpoint_ids:
+            data = template["by_endpoint"][endpoint_id]
+            rows.append(
+                {
+                    "endpoint": endpoint_id,
+                    "snapshot": {
+                        "status": 0,
+                        "addr": short_addr,
+                        "simple_desc": {
+                            "endpoint": endpoint_id,
+                            "profile_id": data.get("profile_id"),
+                            "device_id": data.get("device_id"),
+                            "device_version": data.get("device_version"),
+                            "input_clusters": list(data.get("input_clusters") or ()),
+                            "output_clusters": list(data.get("output_clusters") or ()),
+                        },
+                    },
+                }
+            )
+        if node_descriptor is None:
+            node_descriptor = {
+                "status": 0,
+                "addr": short_addr,
+                "node_desc": {
+                    "manufacturer_code": template["manufacturer_code"],
+                    "node_desc_flags": template["logical_type"],
+                },
+            }
+        power_desc = {}
+        if entry[1] is not None:
+            power_desc["current_power_source"] = entry[1]
+        if entry[2] is not None:
+            power_desc["current_power_source_level"] = entry[2]
+        return {
+            "short_addr": short_addr,
+            "ieee_addr": ieee_addr,
+            "endpoint_ids": endpoint_ids,
+            "active_endpoints": {"status": 0, "count": len(endpoint_ids), "endpoints": endpoint_ids},
+            "node_descriptor": node_descriptor,
+            "simple_descriptors": rows,
+            "power_descriptor": {"status": 0, "addr": short_addr, "power_desc": power_desc} if power_desc else None,
+            "errors": [],
+            "cached": True,
+        }
+
+    def stats(self):
+        return {
+            "entries": len(self._by_ieee),
+            "templates": len(self._templates),
+            "max_entries": int(self.max_entries),
+            "hits": int(self.hits),
+            "misses": int(self.misses),
+            "verify_failed": int(self.verify_failed),
+        }
+
+
+class ReadCoalescer:
+    """Single-flight front for remote attribute reads.
+
+    Concurrent reads of one ``(short_addr, endpoint, cluster_id, attr_id)`` share
+    the pending ``AttributeRead``. Attributes that failed are remembered for
+    ``negative_ttl_ms`` (0 disables) so callers do not re-poll a dead device.
+    ``hits`` counts reads served from the device state cache.
+    """
+
+    __slots__ = (
+        "negative_ttl_ms",
+        "negative_max",
+        "hits",
+        "coalesced",
+        "misses",
+        "negative_hits",
+        "failures",
+        "_inflight",
+        "_negative",
+        "_negative_order",
+    )
+
+    def __init__(self, negative_ttl_ms=_READ_NEGATIVE_TTL_MS_DEFAULT, negative_max=_READ_NEGATIVE_MAX_DEFAULT):
+        self.negative_ttl_ms = max(0, int(negative_ttl_ms))
+        self.negative_max = max(1, int(negative_max))
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.failures = 0
+        self._inflight = {}
+        self._negative = {}
+        self._negative_order = []
+
+    def _negative_active(self, key, now_ms):
+        expires_ms = self._negative.get(key)
+        if expires_ms is None:
+            return False
+        if _ticks_diff(expires_ms, now_ms) > 0:
+            return True
+        del self._negative[key]
+        try:
+            self._negative_order.remove(key)
+        except ValueError:
+            pass
+        return False
+
+    def _remember_failure(self, key, now_ms):
+        self.failures += 1
+        if self.negative_ttl_ms <= 0:
+            return
+        if key in self._negative:
+            self._negative_order.remove(key)
+        self._negative[key] = _ticks_add(now_ms, self.negative_ttl_ms)
+        self._negative_order.append(key)
+        while len(self._negative_order) > self.negative_max:
+            self._negative.pop(self._negative_order.pop(0), None)
+
+    def start(self, stack, short_addr, endpoint, cluster_id, attr_ids, timeout_ms):
+        """Map each attribute ID to the handle that will answer it, or None when negatively cached."""
+        now_ms = _ticks_ms()
+        short_addr = int(short_addr) & 0xFFFF
+        endpoint = int(endpoint)
+        cluster_id = int(cluster_id)
+        shares = {}
+        missing = []
+        for attr_id in attr_ids:
+            attr_id = int(attr_id)
+            key = (short_addr, endpoint, cluster_id, attr_id)
+            handle = self._inflight.get(key)
+            if handle is not None:
+                self.coalesced += 1
+                shares[attr_id] = handle
+                continue
+            if self._negative_active(key, now_ms):
+                self.negative_hits += 1
+                shares[attr_id] = None
+                continue
+            if attr_id not in missing:
+                missing.append(attr_id)
+        self.misses += len(missing)
+        max_ids = max(1, int(READ_ATTR_MAX))
+        for index in range(0, len(missing), max_ids):
+            chunk = tuple(missing[index:index + max_ids])
+            handle = stack.start_read_attributes(short_addr, cluster_id, chunk, dst_endpoint=endpoint, timeout_ms=timeout_ms)
+            for attr_id in chunk:
+                self._inflight[(short_addr, endpoint, cluster_id, attr_id)] = handle
+                shares[attr_id] = handle
+        return shares
+
+    def settle(self, handle, records):
+        """Retire a finished handle; the first caller records its failures. Safe to call again."""
+        now_ms = _ticks_ms()
+        short_addr = int(handle.short_addr) & 0xFFFF
+        endpoint = int(handle.endpoint)
+        cluster_id = int(handle.cluster_id)
+        for attr_id in handle.attr_ids:
+            key = (short_addr, endpoint, cluster_id, int(attr_id))
+            if self._inflight.get(key) is not handle:
+                continue
+            del self._inflight[key]
+            record = records.get(attr_id)
+            if record is None or record.get("status") != 0 or record.get("value") is None:
+                self._remember_failure(key, now_ms)
+
+    def forget(self, short_addr=None):
+        """Drop negative entries (all, or one device's after it rejoined)."""
+        if short_addr is None:
+            self._negative = {}
+            self._negative_order = []
+            return
+        short_addr = int(short_addr) & 0xFFFF
+        for key in tuple(self._negative_order):
+            if key[0] == short_addr:
+                self._negative_order.remove(key)
+                self._negative.pop(key, None)
+
+    def stats(self):
+        return {
+            "hits": int(self.hits),
+            "coalesced": int(self.coalesced),
+            "misses": int(self.misses),
+            "negative_hits": int(self.negative_hits),
+            "failures": int(self.failures),
+            "inflight": len(self._inflight),
+            "negative_entries": len(self._negative),
+            "negative_ttl_ms": int(self.negative_ttl_ms),
+        }
 
 
 class Coordinator:
@@ -1957,12 +3011,16 @@ class Coordinator:
         "discovery_retry_base_ms",
         "discovery_retry_max_backoff_ms",
         "discovery_queue_max",
+        "discovery_max_inflight",
+        "interview_cache",
         "offline_after_ms",
         "auto_bind",
         "auto_configure_reporting",
         "local_endpoint",
         "persistence_path",
         "persistence_min_interval_ms",
+        "persistence_mode",
+        "journal_compact_bytes",
         "network_mode",
         "pan_id",
         "extended_pan_id",
@@ -1982,6 +3040,7 @@ class Coordinator:
         "_commissioning_stats",
         "_self_heal_stats",
         "_self_heal_inflight",
+        "_self_heal_job",
         "_started",
         "_form_network",
         "_on_signal_cb",
@@ -1992,15 +3051,31 @@ class Coordinator:
         "_join_order",
         "_join_last_seen_ms",
         "_discovery_stats",
+        "_discovery_inflight",
+        "_discovery_rate_start_ms",
+        "_discovery_rate_end_ms",
         "_automation_stats",
+        "_attribute_route_stats",
         "_last_discovery_error",
         "_last_persist_ms",
+        "_journal_path",
+        "_journal_epoch",
+        "_journal_digests",
+        "_journal_meta_digest",
+        "_autosave",
+        "cooperative",
+        "scheduler",
+        "read_coalescer",
+        "transmit",
+        "groups",
     )
 
     def __init__(
         self,
         stack=None,
         max_devices=32,
+        eviction_policy=EVICT_LRU,
+        pinned_devices=(),
         auto_discovery=True,
         strict_discovery=False,
         discover_timeout_ms=5000,
@@ -2016,12 +3091,17 @@ class Coordinator:
         discovery_retry_base_ms=400,
         discovery_retry_max_backoff_ms=5000,
         discovery_queue_max=16,
+        discovery_max_inflight=4,
+        interview_cache_max=_INTERVIEW_CACHE_MAX_DEFAULT,
         offline_after_ms=300000,
         auto_bind=False,
         auto_configure_reporting=False,
         local_endpoint=1,
         persistence_path=None,
         persistence_min_interval_ms=30000,
+        persistence_mode=PERSIST_SNAPSHOT,
+        journal_compact_bytes=_JOURNAL_COMPACT_BYTES_DEFAULT,
+        autosave_interval_ms=None,
         network_mode="auto",
         pan_id=None,
         extended_pan_id=None,
@@ -2036,9 +3116,39 @@ class Coordinator:
         self_heal_retry_max=_SELF_HEAL_RETRY_MAX_DEFAULT,
         self_heal_retry_base_ms=_SELF_HEAL_RETRY_BASE_MS_DEFAULT,
         self_heal_retry_max_backoff_ms=_SELF_HEAL_RETRY_MAX_BACKOFF_MS_DEFAULT,
+        cooperative=False,
+        scheduler_lane_max=_SCHEDULER_LANE_MAX_DEFAULT,
+        read_negative_ttl_ms=_READ_NEGATIVE_TTL_MS_DEFAULT,
+        tx_rate_per_s=_TX_RATE_PER_S_DEFAULT,
+        tx_burst=_TX_BURST_DEFAULT,
+        tx_global_rate_per_s=_TX_GLOBAL_RATE_PER_S_DEFAULT,
+        tx_queue_max=_TX_QUEUE_MAX_DEFAULT,
+        tx_coalesce_interval_ms=_TX_COALESCE_INTERVAL_MS_DEFAULT,
     ):
         self.stack = stack if stack is not None else ZigbeeStack()
-        self.registry = DeviceRegistry(max_devices=max_devices)
+        self.registry = DeviceRegistry(
+            max_devices=max_devices,
+            eviction_policy=eviction_policy,
+            pinned=pinned_devices,
+        )
+        self.read_coalescer = ReadCoalescer(_clamp_int(read_negative_ttl_ms, 0, 3600000))
+        self.registry.reads = self.read_coalescer
+        self.transmit = TransmitScheduler(
+            rate_per_s=_clamp_int(tx_rate_per_s, 1, 1000),
+            burst=_clamp_int(tx_burst, 1, 256),
+            global_rate_per_s=_clamp_int(tx_global_rate_per_s, 1, 1000),
+            capacity=_clamp_int(tx_queue_max, 1, 256),
+            coalesce_interval_ms=_clamp_int(tx_coalesce_interval_ms, 0, 60000),
+            ticks_ms=lambda: _ticks_ms(),
+            ticks_diff=lambda a, b: _ticks_diff(a, b),
+        )
+        self.registry.transmit = self.transmit
+        self.groups = GroupManager(
+            self,
+            ticks_ms=lambda: _ticks_ms(),
+            ticks_diff=lambda a, b: _ticks_diff(a, b),
+        )
+        self.groups.on_change = self._groups_changed
         self.auto_discovery = bool(auto_discovery)
         self.strict_discovery = bool(strict_discovery)
         self.discover_timeout_ms = int(discover_timeout_ms)
@@ -2054,12 +3164,17 @@ class Coordinator:
         self.discovery_retry_base_ms = _clamp_int(discovery_retry_base_ms, 50, 60000)
         self.discovery_retry_max_backoff_ms = _clamp_int(discovery_retry_max_backoff_ms, self.discovery_retry_base_ms, 300000)
         self.discovery_queue_max = _clamp_int(discovery_queue_max, 1, 128)
+        self.discovery_max_inflight = _clamp_int(discovery_max_inflight, 1, _DISCOVERY_INFLIGHT_MAX)
+        interview_cache_max = _clamp_int(interview_cache_max, 0, 1024)
+        self.interview_cache = InterviewCache(interview_cache_max) if interview_cache_max > 0 else None
         self.offline_after_ms = _clamp_int(offline_after_ms, _OFFLINE_AFTER_MS_MIN, _OFFLINE_AFTER_MS_MAX)
         self.auto_bind = bool(auto_bind)
         self.auto_configure_reporting = bool(auto_configure_reporting)
         self.local_endpoint = _clamp_int(local_endpoint, 1, 240)
         self.persistence_path = persistence_path
         self.persistence_min_interval_ms = _clamp_int(persistence_min_interval_ms, 0, 86400000)
+        self.persistence_mode = _normalize_persist_mode(persistence_mode)
+        self.journal_compact_bytes = _clamp_int(journal_compact_bytes, 512, 1048576)
         pan_id_value = _normalize_pan_id(pan_id)
         extended_pan_id_value = _normalize_extended_pan_id(extended_pan_id)
         channel_mask_value = _normalize_channel_mask(channel=channel, channel_mask=channel_mask)
@@ -2107,6 +3222,7 @@ class Coordinator:
             "last_result": None,
         }
         self._self_heal_inflight = False
+        self._self_heal_job = None
         self._network_profile = NetworkProfile(
             channel_mask=self.channel_mask,
             pan_id=self.pan_id,
@@ -2133,7 +3249,12 @@ class Coordinator:
             "failures": 0,
             "requeued": 0,
             "gave_up": 0,
+            "interview_ms_total": 0,
+            "interview_ms_max": 0,
         }
+        self._discovery_inflight = {}
+        self._discovery_rate_start_ms = None
+        self._discovery_rate_end_ms = None
         self._automation_stats = {
             "reporting_applied": 0,
             "reporting_failed": 0,
@@ -2141,8 +3262,33 @@ class Coordinator:
             "bind_skipped": 0,
             "bind_failed": 0,
         }
+        self._attribute_route_stats = {
+            "routed": 0,
+            "unrouted": 0,
+            "ambiguous": 0,
+        }
         self._last_discovery_error = None
         self._last_persist_ms = 0
+        self._journal_path = None
+        self._journal_epoch = None
+        self._journal_digests = {}
+        self._journal_meta_digest = None
+        self._autosave = None
+        self.registry.on_change = self._registry_changed
+        self.registry.on_remove = self._registry_removed
+        self.cooperative = bool(cooperative)
+        # Late-bound clock so host tests can patch _ticks_ms.
+        self.scheduler = LaneScheduler(
+            _clamp_int(scheduler_lane_max, 1, 256),
+            ticks_ms=lambda: _ticks_ms(),
+            ticks_diff=lambda a, b: _ticks_diff(a, b),
+        )
+        self.scheduler.set_idle(LANE_CONTROL, self._run_transmit_lane)
+        self.scheduler.set_idle(LANE_DISCOVERY, self._run_discovery_lane)
+        self.scheduler.set_idle(LANE_AUTOMATION, self._run_self_heal_lane)
+        self.scheduler.set_idle(LANE_PERSISTENCE, self._run_persistence_lane)
+        if autosave_interval_ms is not None:
+            self.configure_autosave(enabled=True, interval_ms=autosave_interval_ms)
         self._normalize_discovery_timing()
 
     def configure_state_engine(self, state_ttl_ms=None, stale_read_policy=None, state_cache_max=None):
@@ -2163,6 +3309,18 @@ class Coordinator:
             "state_cache_max": int(self.state_cache_max),
         }
 
+    def configure_reads(self, negative_ttl_ms=None, clear=False):
+        """Tune the remote-read negative cache; ``clear=True`` forgets remembered failures."""
+        reads = self.read_coalescer
+        if negative_ttl_ms is not None:
+            reads.negative_ttl_ms = _clamp_int(negative_ttl_ms, 0, 3600000)
+        if clear:
+            reads.forget()
+        return reads.stats()
+
+    def read_stats(self):
+        return self.read_coalescer.stats()
+
     def configure_automation(self, auto_bind=None, auto_configure_reporting=None, local_endpoint=None):
         if auto_bind is not None:
             self.auto_bind = bool(auto_bind)
@@ -2231,6 +3389,8 @@ class Coordinator:
                 self._self_heal_retry_base_ms,
                 300000,
             )
+        if enabled is not None or retry_max is not None or retry_base_ms is not None or retry_max_backoff_ms is not None:
+            self._mark_dirty("meta")
         return {
             "enabled": bool(self._self_heal_enabled),
             "retry_max": int(self._self_heal_retry_max),
@@ -2327,19 +3487,37 @@ class Coordinator:
     def automation_stats(self):
         return dict(self._automation_stats)
 
-    def dump_registry(self):
-        devices = [device.to_dict() for device in self.registry.values()]
+    def attribute_route_stats(self):
+        return dict(self._attribute_route_stats)
+
+    def pin_device(self, short_addr):
+        self.registry.pin(short_addr)
+        return self.registry.pinned()
+
+    def unpin_device(self, short_addr):
+        self.registry.unpin(short_addr)
+        return self.registry.pinned()
+
+    def registry_stats(self):
+        return self.registry.stats()
+
+    def _registry_meta(self):
         return {
-            "schema": 1,
-            "saved_ms": int(_ticks_ms()),
             "network_mode": self.network_mode,
             "network_profile": self._network_profile.to_dict(),
             "self_heal_policy": self.configure_self_heal(),
-            "devices": devices,
+            "pinned": list(self.registry.pinned()),
+            "groups": self.groups.to_dict(),
         }
 
-    def restore_registry(self, snapshot, merge=False):
-        snapshot = snapshot or {}
+    def dump_registry(self):
+        snapshot = self._registry_meta()
+        snapshot["schema"] = 1
+        snapshot["saved_ms"] = int(_ticks_ms())
+        snapshot["devices"] = [device.to_dict() for device in self.registry.values()]
+        return snapshot
+
+    def _restore_registry_meta(self, snapshot):
         restored_mode = snapshot.get("network_mode", None)
         if restored_mode is not None:
             try:
@@ -2352,6 +3530,9 @@ class Coordinator:
                 self._network_profile = NetworkProfile.from_dict(restored_profile)
             except Exception:
                 pass
+        restored_groups = snapshot.get("groups", None)
+        if isinstance(restored_groups, dict):
+            self.groups.restore(restored_groups)
         restored_self_heal_policy = snapshot.get("self_heal_policy", None)
         if isinstance(restored_self_heal_policy, dict):
             self.configure_self_heal(
@@ -2360,21 +3541,47 @@ class Coordinator:
                 retry_base_ms=restored_self_heal_policy.get("retry_base_ms", None),
                 retry_max_backoff_ms=restored_self_heal_policy.get("retry_max_backoff_ms", None),
             )
+
+    def _restore_device_row(self, row):
+        try:
+            device = DiscoveredDevice.from_dict(row, stack=self.stack)
+        except Exception:
+            return False
+        device.state_ttl_ms = int(self.state_ttl_ms)
+        device.stale_read_policy = self.stale_read_policy
+        device.state_cache_max = int(self.state_cache_max)
+        device._prune_state_caches()
+        self.registry.upsert(device)
+        if self.interview_cache is not None:
+            self.interview_cache.learn(device)
+        return True
+
+    def restore_registry(self, snapshot, merge=False):
+        snapshot = snapshot or {}
+        self._restore_registry_meta(snapshot)
         rows = snapshot.get("devices") or ()
-        if not merge:
-            self.registry = DeviceRegistry(max_devices=self.registry.max_devices)
-        restored = 0
-        for row in rows:
+        pinned = set(self.registry.pinned())
+        for short_addr in snapshot.get("pinned") or ():
             try:
-                device = DiscoveredDevice.from_dict(row, stack=self.stack)
+                pinned.add(int(short_addr) & 0xFFFF)
             except Exception:
                 continue
-            device.state_ttl_ms = int(self.state_ttl_ms)
-            device.stale_read_policy = self.stale_read_policy
-            device.state_cache_max = int(self.state_cache_max)
-            device._prune_state_caches()
-            self.registry.upsert(device)
-            restored += 1
+        if not merge:
+            self.registry = DeviceRegistry(
+                max_devices=self.registry.max_devices,
+                eviction_policy=self.registry.eviction_policy,
+            )
+            self.registry.on_change = self._registry_changed
+            self.registry.on_remove = self._registry_removed
+            self.registry.reads = self.read_coalescer
+            self.registry.transmit = self.transmit
+            self._mark_dirty(_AUTOSAVE_ALL)
+        for short_addr in pinned:
+            self.registry.pin(short_addr)
+        restored = 0
+        for row in rows:
+            if self._restore_device_row(row):
+                restored += 1
         return int(restored)
 
     def save_registry(self, path=None, force=False):
@@ -2387,36 +3594,269 @@ class Coordinator:
         if not force and int(self.persistence_min_interval_ms) > 0:
             age_ms = _ticks_diff(now_ms, int(self._last_persist_ms))
             if age_ms >= 0 and age_ms < int(self.persistence_min_interval_ms):
+                deferred = self._autosave is not None and self._autosave.enabled and str(path) == str(self.persistence_path)
+                if deferred:
+                    self._mark_dirty(_AUTOSAVE_ALL)
                 return {
                     "saved": False,
                     "reason": "throttled",
+                    "deferred": bool(deferred),
                     "age_ms": int(age_ms),
                     "min_interval_ms": int(self.persistence_min_interval_ms),
                     "path": str(path),
                 }
-        snapshot = self.dump_registry()
-        with open(path, "w") as fp:
-            _json.dump(snapshot, fp)
+        if self.persistence_mode == PERSIST_JOURNAL:
+            out = self._save_registry_journal(path)
+        else:
+            out = self._write_registry_snapshot(path)
         self._last_persist_ms = int(now_ms)
+        return out
+
+    def _write_registry_snapshot(self, path, journaled=False, digests=None):
+        """Stream the registry as NDJSON: one header line, then one line per device.
+
+        Peak RAM is one serialized device, not the whole snapshot. When
+        ``digests`` is a dict it is filled with per-device journal digests.
+        """
+        writer = _persistence.open_snapshot(path)
+        head = self._registry_meta()
+        head["schema"] = _REGISTRY_STREAM_SCHEMA
+        head["format"] = "ndjson"
+        head["saved_ms"] = int(_ticks_ms())
+        head["count"] = len(self.registry)
+        if journaled:
+            # The snapshot generation doubles as the journal epoch.
+            head["journal_epoch"] = int(writer.generation)
+        count = 0
+        try:
+            writer.write(_json.dumps(head))
+            head = None
+            for device in self.registry.values():
+                line = _json.dumps(device.to_dict())
+                if digests is not None:
+                    digests[int(device.short_addr) & 0xFFFF] = _persistence.digest(line)
+                writer.write("\n")
+                writer.write(line)
+                count += 1
+            writer.write("\n")
+        except Exception:
+            writer.abort()
+            raise
+        info = writer.commit()
         return {
             "saved": True,
             "path": str(path),
-            "count": len(snapshot.get("devices") or ()),
+            "mode": self.persistence_mode,
+            "count": int(count),
+            "bytes": int(info["bytes"]),
+            "generation": int(info["generation"]),
         }
 
+    def _journal_rebase(self, path, epoch, digests=None):
+        self._journal_path = str(path)
+        self._journal_epoch = epoch
+        if digests is None:
+            digests = {}
+            for device in self.registry.values():
+                digests[int(device.short_addr) & 0xFFFF] = _persistence.digest(_json.dumps(device.to_dict()))
+        self._journal_digests = digests
+        self._journal_meta_digest = _persistence.digest(_json.dumps(self._registry_meta()))
+
+    def _compact_registry(self, path):
+        digests = {}
+        out = self._write_registry_snapshot(path, journaled=True, digests=digests)
+        # A crash before this removal leaves a journal whose epoch no longer matches; replay skips it.
+        _persistence.remove_file(_persistence.journal_path(path))
+        self._journal_rebase(path, out["generation"], digests=digests)
+        out["compacted"] = True
+        out["records"] = 0
+        return out
+
+    def _save_registry_journal(self, path, dirty=None):
+        log_path = _persistence.journal_path(path)
+        if (
+            self._journal_epoch is None
+            or self._journal_path != str(path)
+            or _persistence.file_size(log_path) >= int(self.journal_compact_bytes)
+        ):
+            return self._compact_registry(path)
+
+        # Only records whose serialized form changed since the last save are appended.
+        digests = self._journal_digests
+        live = set()
+        with _persistence.JournalAppender(log_path, header={"op": "epoch", "epoch": int(self._journal_epoch)}) as log:
+            for device in self.registry.values():
+                short_addr = int(device.short_addr) & 0xFFFF
+                live.add(short_addr)
+                if dirty is not None and short_addr not in dirty and short_addr in digests:
+                    continue
+                row = device.to_dict()
+                digest = _persistence.digest(_json.dumps(row))
+                if digests.get(short_addr) != digest:
+                    digests[short_addr] = digest
+                    log.append({"op": "put", "device": row})
+            for short_addr in tuple(digests):
+                if short_addr not in live:
+                    digests.pop(short_addr)
+                    log.append({"op": "del", "short_addr": short_addr})
+            if dirty is None or "meta" in dirty:
+                meta = self._registry_meta()
+                meta_digest = _persistence.digest(_json.dumps(meta))
+                if meta_digest != self._journal_meta_digest:
+                    self._journal_meta_digest = meta_digest
+                    meta["op"] = "meta"
+                    log.append(meta)
+        return {
+            "saved": True,
+            "path": str(path),
+            "mode": self.persistence_mode,
+            "compacted": False,
+            "count": len(self.registry),
+            "records": int(log.records),
+            "bytes": int(log.bytes),
+        }
+
+    def _mark_dirty(self, section):
+        autosave = self._autosave
+        if autosave is not None:
+            autosave.mark(section, _ticks_ms())
+
+    def _groups_changed(self):
+        self._mark_dirty("meta")
+
+    def _registry_changed(self, short_addr):
+        autosave = self._autosave
+        if autosave is not None:
+            autosave.mark("meta" if short_addr is None else short_addr, _ticks_ms())
+
+    def _registry_removed(self, short_addr, moved_to):
+        # Group records are keyed by short address: follow a rejoin, drop a removed device.
+        if moved_to is None:
+            self.groups.forget(short_addr)
+        else:
+            self.groups.readdress(short_addr, moved_to)
+
+    def _autosave_flush(self, sections):
+        path = self.persistence_path
+        if self.persistence_mode == PERSIST_JOURNAL:
+            # Only devices marked since the last flush are re-serialized.
+            dirty = None if _AUTOSAVE_ALL in sections else sections
+            out = self._save_registry_journal(path, dirty=dirty)
+        else:
+            out = self._write_registry_snapshot(path)
+        self._last_persist_ms = int(_ticks_ms())
+        out["sections"] = len(sections)
+        return out
+
+    def configure_autosave(self, enabled=None, interval_ms=None):
+        """Coalesce dirty marks into at most one save per ``interval_ms`` (default: persistence_min_interval_ms)."""
+        autosave = self._autosave
+        if autosave is None and enabled:
+            if not self.persistence_path:
+                raise ZigbeeError("persistence path not configured")
+            if interval_ms is None:
+                interval_ms = self.persistence_min_interval_ms
+            autosave = _persistence.AutosaveScheduler(self._autosave_flush, interval_ms=interval_ms)
+            # Whatever is in memory now has not been written by this scheduler yet.
+            autosave.mark(_AUTOSAVE_ALL, _ticks_ms())
+            self._autosave = autosave
+        if autosave is None:
+            return {"enabled": False}
+        if enabled is not None:
+            autosave.enabled = bool(enabled)
+        if interval_ms is not None:
+            autosave.interval_ms = _clamp_int(interval_ms, 0, 86400000)
+        return autosave.stats()
+
+    def autosave_stats(self):
+        if self._autosave is None:
+            return {"enabled": False}
+        return self._autosave.stats()
+
+    def poll_autosave(self):
+        """Flush pending dirty state when the coalescing interval has elapsed; returns the save result or None."""
+        if self._autosave is None:
+            return None
+        return self._autosave.poll(_ticks_ms())
+
+    def flush_autosave(self):
+        """Write pending dirty state now, regardless of the interval (call on shutdown)."""
+        if self._autosave is None:
+            return None
+        return self._autosave.flush(_ticks_ms())
+
+    def _replay_registry_journal(self, path, epoch, status=None):
+        if epoch is None:
+            return 0
+        replayed = 0
+        matched = False
+        for record in _persistence.read_records(_persistence.journal_path(path), status):
+            op = record.get("op")
+            if not matched:
+                # Journal must open with the base snapshot's epoch; anything else is stale.
+                if op != "epoch" or record.get("epoch") != epoch:
+                    break
+                matched = True
+                continue
+            if op == "put":
+                self._restore_device_row(record.get("device") or {})
+            elif op == "del":
+                self.registry.remove(record.get("short_addr", 0))
+            elif op == "meta":
+                self._restore_registry_meta(record)
+                for short_addr in tuple(self.registry.pinned()):
+                    self.registry.unpin(short_addr)
+                for short_addr in record.get("pinned") or ():
+                    self.registry.pin(short_addr)
+            replayed += 1
+        return int(replayed)
+
     def load_registry(self, path=None, merge=False):
         if _json is None:
             raise ZigbeeError("json module unavailable")
         path = path or self.persistence_path
         if not path:
             raise ZigbeeError("persistence path not configured")
-        with open(path, "r") as fp:
-            snapshot = _json.load(fp)
-        restored = self.restore_registry(snapshot, merge=bool(merge))
+        started_ms = _ticks_ms()
+        fp, info = _persistence.open_snapshot_stream(path)
+        with fp:
+            first = fp.readline()
+            try:
+                head = _json.loads(first.decode())
+            except ValueError:
+                head = None
+            if isinstance(head, dict) and head.get("format") == "ndjson":
+                # Devices are decoded one line at a time so only one row is in RAM.
+                restored = self.restore_registry(head, merge=bool(merge))
+                for line in fp:
+                    line = line.strip()
+                    if line and self._restore_device_row(_json.loads(line.decode())):
+                        restored += 1
+            else:
+                # Single-document snapshot from older releases, possibly pretty-printed.
+                head = _json.loads((first + fp.read()).decode())
+                restored = self.restore_registry(head, merge=bool(merge))
+        epoch = head.get("journal_epoch", None)
+        status = {}
+        replayed = self._replay_registry_journal(path, epoch, status)
+        torn = bool(status.get("torn"))
+        if self.persistence_mode == PERSIST_JOURNAL and epoch is not None:
+            if torn:
+                # Records appended after a torn line would never replay; start a fresh base now.
+                self._compact_registry(path)
+            else:
+                self._journal_rebase(path, int(epoch))
+        if self._autosave is not None and not merge and str(path) == str(self.persistence_path):
+            self._autosave.clear()
         return {
             "loaded": True,
             "path": str(path),
+            "source": info["source"],
+            "generation": int(info["generation"]),
             "restored": int(restored),
+            "journal_records": int(replayed),
+            "journal_torn": torn,
+            "load_ms": int(_ticks_diff(_ticks_ms(), started_ms)),
         }
 
     def _safe_apply_reporting_preset(self, device, feature_name, cluster_id, preset):
@@ -2549,6 +3989,8 @@ class Coordinator:
             automation_meta["reporting"] = self._auto_configure_reporting_for_device(device)
         if self.auto_bind:
             automation_meta["bind"] = self._auto_bind_for_device(device)
+        if self.groups.has_rules():
+            automation_meta["groups_joined"] = self.groups.sync(device)
         device.meta["automation"] = automation_meta
 
     def on_signal(self, callback=None):
@@ -2724,6 +4166,7 @@ class Coordinator:
                 source=_mode_profile_source(self.network_mode),
                 formed_at_ms=formed_at_ms,
             )
+            self._mark_dirty("meta")
         return bool(changed)
 
     def _emit_commissioning_event(self, event, reason=None, signal_id=None, status=None, attempt=None, ok=None, backoff_ms=None):
@@ -2755,58 +4198,60 @@ class Coordinator:
         try:
             attempt = 0
             while True:
-                ok = True
-                if str(action) == "reform":
-                    self._mark_commissioning_attempt("form")
-                else:
-                    self._mark_commissioning_attempt("join")
-                try:
-                    if str(action) == "reform":
-                        self.stack.start(True)
-                    elif hasattr(self.stack, "start_network_steering"):
-                        self.stack.start_network_steering()
-                    else:
-                        self.stack.start(False)
-                except OSError as exc:
-                    if exc.args and int(exc.args[0]) == ESP_ERR_INVALID_STATE:
-                        ok = False
-                    else:
-                        ok = False
-                except Exception:
-                    ok = False
-
-                self._self_heal_stats["attempts"] += 1
-                self._self_heal_stats["last_reason"] = None if reason is None else str(reason)
-                self._self_heal_stats["last_signal"] = None if signal_id is None else int(signal_id)
-                self._self_heal_stats["last_status"] = None if status is None else int(status)
-                self._self_heal_stats["last_attempt_ms"] = int(_ticks_ms())
-                self._self_heal_stats["last_result"] = "success" if ok else "retrying"
-                self._emit_commissioning_event(
-                    "self_heal_retry",
-                    reason=reason,
-                    signal_id=signal_id,
-                    status=status,
-                    attempt=attempt,
-                    ok=ok,
-                    backoff_ms=0,
-                )
-                if ok:
-                    self._self_heal_stats["success"] += 1
-                    self._self_heal_stats["last_backoff_ms"] = 0
-                    return True
-                if attempt >= int(self._self_heal_retry_max):
-                    self._self_heal_stats["failed"] += 1
-                    self._self_heal_stats["last_result"] = "failed"
-                    return False
-                backoff_ms = int(self._self_heal_retry_base_ms) * (1 << int(attempt))
-                if backoff_ms > int(self._self_heal_retry_max_backoff_ms):
-                    backoff_ms = int(self._self_heal_retry_max_backoff_ms)
-                self._self_heal_stats["last_backoff_ms"] = int(backoff_ms)
-                _sleep_ms(backoff_ms)
+                result = self._self_heal_attempt(reason, signal_id, status, action, attempt)
+                if result is True or result is False:
+                    return result
+                _sleep_ms(result)
                 attempt += 1
         finally:
             self._self_heal_inflight = False
 
+    def _self_heal_attempt(self, reason, signal_id, status, action, attempt):
+        """Run one retrigger attempt; return True/False when done, else the backoff in ms."""
+        ok = True
+        if str(action) == "reform":
+            self._mark_commissioning_attempt("form")
+        else:
+            self._mark_commissioning_attempt("join")
+        try:
+            if str(action) == "reform":
+                self.stack.start(True)
+            elif hasattr(self.stack, "start_network_steering"):
+                self.stack.start_network_steering()
+            else:
+                self.stack.start(False)
+        except Exception:
+            ok = False
+
+        self._self_heal_stats["attempts"] += 1
+        self._self_heal_stats["last_reason"] = None if reason is None else str(reason)
+        self._self_heal_stats["last_signal"] = None if signal_id is None else int(signal_id)
+        self._self_heal_stats["last_status"] = None if status is None else int(status)
+        self._self_heal_stats["last_attempt_ms"] = int(_ticks_ms())
+        self._self_heal_stats["last_result"] = "success" if ok else "retrying"
+        self._emit_commissioning_event(
+            "self_heal_retry",
+            reason=reason,
+            signal_id=signal_id,
+            status=status,
+            attempt=attempt,
+            ok=ok,
+            backoff_ms=0,
+        )
+        if ok:
+            self._self_heal_stats["success"] += 1
+            self._self_heal_stats["last_backoff_ms"] = 0
+            return True
+        if attempt >= int(self._self_heal_retry_max):
+            self._self_heal_stats["failed"] += 1
+            self._self_heal_stats["last_result"] = "failed"
+            return False
+        backoff_ms = int(self._self_heal_retry_base_ms) * (1 << int(attempt))
+        if backoff_ms > int(self._self_heal_retry_max_backoff_ms):
+            backoff_ms = int(self._self_heal_retry_max_backoff_ms)
+        self._self_heal_stats["last_backoff_ms"] = int(backoff_ms)
+        return int(backoff_ms)
+
     def start(self, form_network=True):
         now_ms = int(_ticks_ms())
         self._commissioning_stats["start_count"] += 1
@@ -2841,7 +4286,13 @@ class Coordinator:
             # paths valid on firmware that gates ZCL requests behind registration.
             _ignore_invalid_state(self.stack.register_device)
         self.stack.on_signal(self._handle_signal)
-        self.stack.on_attribute(self._handle_attribute)
+        if hasattr(self.stack, "on_attribute_batch"):
+            self.stack.on_attribute_batch(self._handle_attribute_batch)
+        else:
+            self.stack.on_attribute(self._handle_attribute)
+        if hasattr(self.stack, "set_group_response_callback"):
+            # Group membership is only confirmed by Add Group responses.
+            self.stack.set_group_response_callback(self.groups.handle_response)
         _ignore_invalid_state(self.stack.start, bool(form_network))
         if hasattr(self.stack, "enable_wifi_i154_coex"):
             # Coex needs both Wi-Fi and 802.15.4 stacks active on some firmwares.
@@ -2928,8 +4379,82 @@ class Coordinator:
         return int(duration_s)
 
     def process_pending_discovery(self, max_items=4):
+        self._run_transmit_lane(None)
+        # Attribute-lane polling is attached from outside (Gateway coalescing).
+        self.scheduler.run_idle(LANE_ATTRIBUTE)
+        self.poll_autosave()
         return self._process_discovery_queue(max_items=max_items)
 
+    def submit(self, lane, fn, *args):
+        """Queue ``fn(*args)`` on a scheduler lane (``LANE_CONTROL`` for user commands); runs in ``run_once()``."""
+        return self.scheduler.submit(lane, fn, *args)
+
+    def run_once(self, budget_ms=20):
+        """Run queued work by lane priority (control > attribute > discovery > automation > persistence) for about ``budget_ms``."""
+        return self.scheduler.run_once(budget_ms)
+
+    def scheduler_stats(self):
+        stats = self.scheduler.stats()
+        stats["cooperative"] = bool(self.cooperative)
+        return stats
+
+    def configure_transmit(
+        self,
+        rate_per_s=None,
+        burst=None,
+        global_rate_per_s=None,
+        global_burst=None,
+        queue_max=None,
+        coalesce_interval_ms=None,
+    ):
+        """Tune per-destination and global command rates (commands per second, burst size) and level/color coalescing."""
+        self.transmit.configure(
+            rate_per_s=None if rate_per_s is None else _clamp_int(rate_per_s, 1, 1000),
+            burst=None if burst is None else _clamp_int(burst, 1, 256),
+            global_rate_per_s=None if global_rate_per_s is None else _clamp_int(global_rate_per_s, 1, 1000),
+            global_burst=None if global_burst is None else _clamp_int(global_burst, 1, 256),
+            capacity=None if queue_max is None else _clamp_int(queue_max, 1, 256),
+            coalesce_interval_ms=None if coalesce_interval_ms is None else _clamp_int(coalesce_interval_ms, 0, 60000),
+        )
+        return self.transmit.stats()
+
+    def process_transmit(self, max_items=None):
+        """Send rate-limited commands whose tokens have refilled; returns how many were sent."""
+        return self.transmit.pump(max_items=max_items)
+
+    def transmit_stats(self):
+        return self.transmit.stats()
+
+    def group_stats(self):
+        return self.groups.stats()
+
+    def _run_transmit_lane(self, now_ms):
+        if len(self.transmit):
+            self.transmit.pump(now_ms)
+
+    def _run_discovery_lane(self, now_ms):
+        if self._join_order or self._discovery_inflight or self.opportunistic_last_joined_scan:
+            self._process_discovery_queue(max_items=1)
+
+    def _run_self_heal_lane(self, now_ms):
+        job = self._self_heal_job
+        if job is None or _ticks_diff(now_ms, job[5]) < 0:
+            return
+        if not bool(self._self_heal_enabled) or not bool(self._started):
+            self._self_heal_job = None
+            self._self_heal_inflight = False
+            return
+        result = self._self_heal_attempt(job[0], job[1], job[2], job[3], job[4])
+        if result is True or result is False:
+            self._self_heal_job = None
+            self._self_heal_inflight = False
+            return
+        job[4] += 1
+        job[5] = _ticks_add(now_ms, result)
+
+    def _run_persistence_lane(self, now_ms):
+        self.poll_autosave()
+
     def pending_discovery(self):
         pending = []
         for short_addr in self._join_order:
@@ -2949,38 +4474,50 @@ class Coordinator:
     def discovery_stats(self):
         stats = dict(self._discovery_stats)
         stats["queue_depth"] = len(self._join_order)
+        stats["inflight"] = len(self._discovery_inflight)
         stats["last_error"] = self._last_discovery_error
+        cache = self.interview_cache
+        stats["cache_hits"] = 0 if cache is None else int(cache.hits)
+        stats["cache_misses"] = 0 if cache is None else int(cache.misses)
+        stats["cache_verify_failed"] = 0 if cache is None else int(cache.verify_failed)
+        stats["cache_entries"] = 0 if cache is None else len(cache)
+        done = int(stats["success"]) + int(stats["failures"])
+        stats["mean_interview_ms"] = int(stats["interview_ms_total"]) // done if done > 0 else 0
+        stats["interviews_per_min"] = 0
+        if self._discovery_rate_start_ms is not None and self._discovery_rate_end_ms is not None:
+            window_ms = _ticks_diff(self._discovery_rate_end_ms, self._discovery_rate_start_ms)
+            if window_ms > 0:
+                stats["interviews_per_min"] = (int(stats["success"]) * 60000) // window_ms
         return stats
 
-    def _discover_descriptors_with_fallback(self, short_addr, endpoint_ids=None, strict_mode=False):
-        short_addr = int(short_addr) & 0xFFFF
-        strict_mode = bool(strict_mode)
+    def _discovery_plan(self, short_addr, endpoint_ids=None, strict=None):
+        """Interview steps shared by the blocking and ``aio`` discovery paths.
+
+        Yields ``(endpoint_ids, include_power_desc, strict)`` descriptor requests;
+        the driver sends back each result (or throws its exception) and the
+        generator returns the registered device.
+        """
+        strict_mode = self.strict_discovery if strict is None else bool(strict)
+        self._normalize_discovery_timing()
+
+        cached = self._interview_cache_lookup(short_addr) if endpoint_ids is None else None
+        if cached is not None:
+            # Node descriptor only: no endpoint list means no simple descriptor requests.
+            try:
+                verify = yield ((), False, False)
+            except Exception:
+                verify = None
+            discovered = self._interview_cache_verified(short_addr, cached, verify)
+            if discovered is not None:
+                return self._register_discovered(short_addr, discovered)
 
         try:
-            return self.stack.discover_node_descriptors(
-                short_addr,
-                endpoint_ids=endpoint_ids,
-                include_power_desc=self.include_power_desc,
-                timeout_ms=self.discover_timeout_ms,
-                poll_ms=self.discover_poll_ms,
-                strict=strict_mode,
-            )
+            discovered = yield (endpoint_ids, self.include_power_desc, strict_mode)
         except Exception:
-            if strict_mode:
-                raise
-            if not self.include_power_desc:
-                raise
-            if not self.fallback_without_power_desc:
+            if strict_mode or not self.include_power_desc or not self.fallback_without_power_desc:
                 raise
-
-        return self.stack.discover_node_descriptors(
-            short_addr,
-            endpoint_ids=endpoint_ids,
-            include_power_desc=False,
-            timeout_ms=self.discover_timeout_ms,
-            poll_ms=self.discover_poll_ms,
-            strict=False,
-        )
+            discovered = yield (endpoint_ids, False, False)
+        return self._register_discovered(short_addr, discovered)
 
     def _queue_from_last_joined_hint(self, now_ms=None):
         if not self.opportunistic_last_joined_scan:
@@ -3003,19 +4540,80 @@ class Coordinator:
 
     def discover_device(self, short_addr, endpoint_ids=None, strict=None):
         short_addr = int(short_addr) & 0xFFFF
-        strict_mode = self.strict_discovery if strict is None else bool(strict)
-        self._normalize_discovery_timing()
+        plan = self._discovery_plan(short_addr, endpoint_ids=endpoint_ids, strict=strict)
+        result = None
+        error = None
+        while True:
+            try:
+                step = plan.send(result) if error is None else plan.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                result = self.stack.discover_node_descriptors(
+                    short_addr,
+                    endpoint_ids=step[0],
+                    include_power_desc=step[1],
+                    timeout_ms=self.discover_timeout_ms,
+                    poll_ms=self.discover_poll_ms,
+                    strict=step[2],
+                )
+                error = None
+            except Exception as exc:
+                result = None
+                error = exc
 
-        discovered = self._discover_descriptors_with_fallback(
-            short_addr,
-            endpoint_ids=endpoint_ids,
-            strict_mode=strict_mode,
-        )
+    def _remote_ieee_addr(self, short_addr):
+        lookup = getattr(self.stack, "get_ieee_addr_by_short", None)
+        if lookup is None:
+            return None
+        try:
+            ieee_addr = lookup(int(short_addr) & 0xFFFF)
+            return None if ieee_addr is None else _normalize_ieee_addr(ieee_addr)
+        except Exception:
+            return None
+
+    def _interview_cache_lookup(self, short_addr):
+        """``(ieee_addr, entry)`` for a cached device, else None (counted as a miss)."""
+        cache = self.interview_cache
+        if cache is None:
+            return None
+        ieee_addr = self._remote_ieee_addr(short_addr)
+        entry = cache.get(ieee_addr)
+        if entry is None:
+            cache.misses += 1
+            return None
+        return (ieee_addr, entry)
+
+    def _interview_cache_verified(self, short_addr, cached, verify):
+        """Cached descriptors when ``verify`` (a node-descriptor-only interview) matches; None means re-interview."""
+        cache = self.interview_cache
+        ieee_addr, entry = cached
+        if cache.verify(entry, verify):
+            cache.hits += 1
+            return cache.build(short_addr, ieee_addr, entry, node_descriptor=verify.get("node_descriptor"))
+        cache.verify_failed += 1
+        cache.misses += 1
+        cache.forget(ieee_addr)
+        return None
+
+    def _register_discovered(self, short_addr, discovered):
+        if discovered.get("ieee_addr") is None:
+            ieee_addr = self._remote_ieee_addr(short_addr)
+            if ieee_addr is not None:
+                discovered = dict(discovered)
+                discovered["ieee_addr"] = ieee_addr
         device = self._build_device_from_descriptors(discovered)
         device.touch_seen(source="discovery")
         existing = self.registry.get(short_addr)
         self.registry.upsert(device)
-        self._post_discovery_automation(device)
+        # A fresh interview proves the device answers again.
+        self.read_coalescer.forget(short_addr)
+        if self.interview_cache is not None:
+            self.interview_cache.learn(device)
+        if self.cooperative:
+            self.scheduler.submit(LANE_AUTOMATION, self._post_discovery_automation, device)
+        else:
+            self._post_discovery_automation(device)
         if existing is None:
             if self._on_device_added_cb is not None:
                 self._on_device_added_cb(device)
@@ -3036,11 +4634,7 @@ class Coordinator:
         return device
 
     def get_device_by_ieee(self, ieee_addr, default=None):
-        ieee_addr = _normalize_ieee_addr(ieee_addr)
-        for device in self.registry.values():
-            if device.identity.ieee_addr == ieee_addr:
-                return device
-        return default
+        return self.registry.get_by_ieee(ieee_addr, default)
 
     def device_status(self, short_addr, default=None):
         device = self.registry.get(short_addr)
@@ -3080,29 +4674,21 @@ class Coordinator:
         for name in (features or ()):
             required_features.add(str(name))
 
-        manufacturer_code = None if manufacturer_code is None else int(manufacturer_code)
-        profile_id = None if profile_id is None else int(profile_id)
-        device_id = None if device_id is None else int(device_id)
-        ieee_addr = _normalize_ieee_addr(ieee_addr) if ieee_addr is not None else None
-
-        out = []
-        for device in self.registry.values():
-            if online is not None and bool(device.is_online(offline_after_ms=self.offline_after_ms)) != bool(online):
-                continue
-            if required_features and not all(device.has_feature(name) for name in required_features):
-                continue
-            identity = device.identity
-            if manufacturer_code is not None and identity.manufacturer_code != manufacturer_code:
-                continue
-            if profile_id is not None and identity.profile_id != profile_id:
-                continue
-            if device_id is not None and identity.device_id != device_id:
-                continue
-            if ieee_addr is not None and identity.ieee_addr != ieee_addr:
-                continue
-            out.append(device)
-        out.sort(key=lambda item: int(item.short_addr))
-        return tuple(out)
+        candidates = self.registry.select(
+            features=required_features,
+            manufacturer_code=manufacturer_code,
+            profile_id=profile_id,
+            device_id=device_id,
+            ieee_addr=ieee_addr,
+        )
+        if online is None:
+            return candidates
+        online = bool(online)
+        return tuple(
+            device
+            for device in candidates
+            if bool(device.is_online(offline_after_ms=self.offline_after_ms)) == online
+        )
 
     def select_device(
         self,
@@ -3190,12 +4776,12 @@ class Coordinator:
     def list_devices(self, online=None):
         if online is None:
             return self.registry.values()
-        out = []
-        for device in self.registry.values():
-            if bool(device.is_online(offline_after_ms=self.offline_after_ms)) == bool(online):
-                out.append(device)
-        out.sort(key=lambda item: int(item.short_addr))
-        return tuple(out)
+        online = bool(online)
+        return tuple(
+            device
+            for device in self.registry.sorted_values()
+            if bool(device.is_online(offline_after_ms=self.offline_after_ms)) == online
+        )
 
     @property
     def devices(self):
@@ -3264,12 +4850,179 @@ class Coordinator:
             entry = self._join_pending.get(short_addr)
             if entry is None:
                 continue
+            if short_addr in self._discovery_inflight:
+                continue
             if _ticks_diff(int(now_ms), int(entry.get("next_try_ms", 0))) >= 0:
                 return int(short_addr)
         return None
 
+    def _record_interview(self, started_ms, now_ms):
+        elapsed_ms = _ticks_diff(now_ms, started_ms)
+        if elapsed_ms < 0:
+            elapsed_ms = 0
+        self._discovery_stats["interview_ms_total"] += elapsed_ms
+        if elapsed_ms > self._discovery_stats["interview_ms_max"]:
+            self._discovery_stats["interview_ms_max"] = elapsed_ms
+        if self._discovery_rate_start_ms is None:
+            self._discovery_rate_start_ms = started_ms
+        self._discovery_rate_end_ms = now_ms
+
+    def _discovery_failed(self, short_addr, entry, exc, now_ms):
+        self._discovery_stats["failures"] += 1
+        if entry is None:
+            return
+        attempt = int(entry.get("attempt", 1))
+        if attempt > int(self.discovery_retry_max):
+            self._remove_pending(short_addr)
+            self._discovery_stats["gave_up"] += 1
+            self._last_discovery_error = {
+                "short_addr": int(short_addr),
+                "attempt": attempt,
+                "error": _error_repr(exc),
+            }
+        else:
+            backoff_ms = self._retry_backoff_ms(attempt)
+            entry["next_try_ms"] = _ticks_add(now_ms, backoff_ms)
+            entry["last_error"] = _error_repr(exc)
+            entry["last_error_ms"] = now_ms
+            self._discovery_stats["requeued"] += 1
+
+    def _start_interview(self, short_addr, include_power_desc):
+        return self.stack.start_node_discovery(
+            short_addr,
+            include_power_desc=include_power_desc,
+            timeout_ms=self.discover_timeout_ms,
+            poll_ms=self.discover_poll_ms,
+            strict=False,
+        )
+
+    def _start_cache_verify(self, short_addr):
+        # Node descriptor only: no endpoint list means no simple descriptor requests.
+        return self.stack.start_node_discovery(
+            short_addr,
+            endpoint_ids=(),
+            include_power_desc=False,
+            timeout_ms=self.discover_timeout_ms,
+            poll_ms=self.discover_poll_ms,
+            strict=False,
+        )
+
+    def _fail_inflight(self, short_addr, job, exc, now_ms):
+        del self._discovery_inflight[short_addr]
+        self._record_interview(job["started_ms"], now_ms)
+        self._discovery_failed(short_addr, self._join_pending.get(short_addr), exc, now_ms)
+
+    def _interview_inflight_cap(self):
+        supported = getattr(self.stack, "descriptor_events_supported", None)
+        if supported is not None and supported():
+            return int(self.discovery_max_inflight)
+        # Polling-only firmware keeps one snapshot slot per descriptor kind.
+        return 1
+
+    def _process_discovery_pipeline(self, max_items):
+        now_ms = _ticks_ms()
+        self._queue_from_last_joined_hint(now_ms=now_ms)
+        self._normalize_discovery_timing()
+        success = 0
+        failed = 0
+        processed = 0
+        started = 0
+
+        for short_addr in tuple(self._discovery_inflight):
+            job = self._discovery_inflight[short_addr]
+            cached = job["cached"]
+            try:
+                if not job["handle"].poll():
+                    continue
+                discovered = job["handle"].result()
+            except Exception as exc:
+                if cached is not None:
+                    discovered = None
+                else:
+                    now_ms = _ticks_ms()
+                    if job["include_power_desc"] and self.fallback_without_power_desc:
+                        job["include_power_desc"] = False
+                        try:
+                            job["handle"] = self._start_interview(short_addr, False)
+                            continue
+                        except Exception as restart_exc:
+                            exc = restart_exc
+                    self._fail_inflight(short_addr, job, exc, now_ms)
+                    failed += 1
+                    processed += 1
+                    continue
+            if cached is not None:
+                job["cached"] = None
+                discovered = self._interview_cache_verified(short_addr, cached, discovered)
+                if discovered is None:
+                    # Verification failed: fall back to the full interview in the same slot.
+                    try:
+                        job["handle"] = self._start_interview(short_addr, job["include_power_desc"])
+                        continue
+                    except Exception as exc:
+                        self._fail_inflight(short_addr, job, exc, _ticks_ms())
+                        failed += 1
+                        processed += 1
+                        continue
+            del self._discovery_inflight[short_addr]
+            now_ms = _ticks_ms()
+            try:
+                self._register_discovered(short_addr, discovered)
+            except Exception as exc:
+                self._record_interview(job["started_ms"], now_ms)
+                self._discovery_failed(short_addr, self._join_pending.get(short_addr), exc, now_ms)
+                failed += 1
+                processed += 1
+                continue
+            self._record_interview(job["started_ms"], now_ms)
+            self._discovery_stats["success"] += 1
+            success += 1
+            processed += 1
+
+        cap = self._interview_inflight_cap()
+        while started < max_items and len(self._discovery_inflight) < cap:
+            short_addr = self._next_due_short(now_ms)
+            if short_addr is None:
+                break
+            entry = self._join_pending.get(short_addr)
+            if entry is None:
+                self._remove_pending(short_addr)
+                continue
+
+            entry["attempt"] = int(entry.get("attempt", 0)) + 1
+            self._discovery_stats["attempts"] += 1
+            started += 1
+            cached = self._interview_cache_lookup(short_addr)
+            try:
+                if cached is None:
+                    handle = self._start_interview(short_addr, self.include_power_desc)
+                else:
+                    handle = self._start_cache_verify(short_addr)
+            except Exception as exc:
+                self._discovery_failed(short_addr, entry, exc, now_ms)
+                failed += 1
+                processed += 1
+                continue
+            self._discovery_inflight[short_addr] = {
+                "handle": handle,
+                "started_ms": now_ms,
+                "include_power_desc": self.include_power_desc,
+                "cached": cached,
+            }
+
+        return {
+            "processed": int(processed),
+            "success": int(success),
+            "failed": int(failed),
+            "started": int(started),
+            "inflight": len(self._discovery_inflight),
+            "queue_depth": len(self._join_order),
+        }
+
     def _process_discovery_queue(self, max_items=4):
         max_items = _clamp_int(max_items, 1, 128)
+        if hasattr(self.stack, "start_node_discovery"):
+            return self._process_discovery_pipeline(max_items)
         now_ms = _ticks_ms()
         self._queue_from_last_joined_hint(now_ms=now_ms)
         success = 0
@@ -3288,28 +5041,15 @@ class Coordinator:
             entry["attempt"] = int(entry.get("attempt", 0)) + 1
             self._discovery_stats["attempts"] += 1
 
+            started_ms = _ticks_ms()
             try:
                 self.discover_device(short_addr, strict=False)
                 self._discovery_stats["success"] += 1
                 success += 1
             except Exception as exc:
-                self._discovery_stats["failures"] += 1
                 failed += 1
-                attempt = int(entry.get("attempt", 1))
-                if attempt > int(self.discovery_retry_max):
-                    self._remove_pending(short_addr)
-                    self._discovery_stats["gave_up"] += 1
-                    self._last_discovery_error = {
-                        "short_addr": int(short_addr),
-                        "attempt": attempt,
-                        "error": _error_repr(exc),
-                    }
-                else:
-                    backoff_ms = self._retry_backoff_ms(attempt)
-                    entry["next_try_ms"] = _ticks_add(now_ms, backoff_ms)
-                    entry["last_error"] = _error_repr(exc)
-                    entry["last_error_ms"] = now_ms
-                    self._discovery_stats["requeued"] += 1
+                self._discovery_failed(short_addr, entry, exc, now_ms)
+            self._record_interview(started_ms, _ticks_ms())
             processed += 1
 
         return {
@@ -3390,20 +5130,10 @@ class Coordinator:
                 signal_id=signal_id,
                 status=status,
             )
-            self._self_heal_retrigger(
-                reason="panid_conflict_detected",
-                signal_id=signal_id,
-                status=status,
-                action="reform",
-            )
+            self._schedule_self_heal("panid_conflict_detected", signal_id, status, "reform")
         elif signal_id in _STEERING_FAILURE_SIGNALS and status != 0:
             self._self_heal_stats["steering_failures"] += 1
-            self._self_heal_retrigger(
-                reason="steering_failure",
-                signal_id=signal_id,
-                status=status,
-                action="rejoin",
-            )
+            self._schedule_self_heal("steering_failure", signal_id, status, "rejoin")
 
         if not self.auto_discovery:
             return
@@ -3423,21 +5153,40 @@ class Coordinator:
             return
 
         self._queue_discovery(short_addr)
-        self._process_discovery_queue(max_items=1)
+        if not self.cooperative:
+            self._process_discovery_queue(max_items=1)
+
+    def _schedule_self_heal(self, reason, signal_id, status, action):
+        if self.cooperative:
+            # One attempt per run_once(); backoff is a due time, never a sleep.
+            if not bool(self._self_heal_enabled) or not bool(self._started) or bool(self._self_heal_inflight):
+                return
+            self._self_heal_inflight = True
+            self._self_heal_job = [reason, signal_id, status, action, 0, int(_ticks_ms())]
+            return
+        self._self_heal_retrigger(reason=reason, signal_id=signal_id, status=status, action=action)
 
     def _handle_attribute(self, *event):
-        source_short_addr = None
-        attr_type = None
-
-        if len(event) == 5:
-            endpoint, cluster_id, attr_id, value, status = event
-        elif len(event) == 6:
-            endpoint, cluster_id, attr_id, value, attr_type, status = event
-        elif len(event) >= 7:
-            source_short_addr, endpoint, cluster_id, attr_id, value, attr_type, status = event[:7]
-        else:
+        record = attr_event_record(event)
+        if record is None:
+            return
+        if self.cooperative:
+            self.scheduler.submit(LANE_ATTRIBUTE, self._apply_attribute, *record)
             return
+        self._apply_attribute(*record)
 
+    def _handle_attribute_batch(self, records):
+        if self.cooperative:
+            self.scheduler.submit(LANE_ATTRIBUTE, self._apply_attribute_batch, records)
+            return
+        self._apply_attribute_batch(records)
+
+    def _apply_attribute_batch(self, records):
+        apply = self._apply_attribute
+        for record in records:
+            apply(*record)
+
+    def _apply_attribute(self, source_short_addr, endpoint, cluster_id, attr_id, value, attr_type, status):
         endpoint = int(endpoint)
         cluster_id = int(cluster_id)
         attr_id = int(attr_id)
@@ -3461,13 +5210,13 @@ class Coordinator:
             return
 
         key = (cluster_id, attr_id)
+        route_stats = self._attribute_route_stats
         if source_short_addr is not None:
             device = self.registry.get(source_short_addr)
-            if device is None:
-                return
-            mapped_eps = device.endpoints_for(cluster_id)
-            if endpoint not in mapped_eps:
+            if device is None or endpoint not in device.endpoints_for(cluster_id):
+                route_stats["unrouted"] += 1
                 return
+            route_stats["routed"] += 1
             device._write_state(
                 key,
                 value,
@@ -3480,16 +5229,21 @@ class Coordinator:
             )
             return
 
-        for device in self.registry.values():
-            mapped_eps = device.endpoints_for(cluster_id)
-            if endpoint not in mapped_eps:
-                continue
-            device._write_state(
-                key,
-                value,
-                source="attribute",
-                authoritative=True,
-                endpoint_id=endpoint,
-                source_endpoint=endpoint,
-                attr_type=attr_type,
-            )
+        # No source address: deliver only when exactly one device owns (endpoint, cluster).
+        devices = self.registry.route(endpoint, cluster_id)
+        if not devices:
+            route_stats["unrouted"] += 1
+            return
+        if len(devices) > 1:
+            route_stats["ambiguous"] += 1
+            return
+        route_stats["routed"] += 1
+        devices[0]._write_state(
+            key,
+            value,
+            source="attribute",
+            authoritative=True,
+            endpoint_id=endpoint,
+            source_endpoint=endpoint,
+            attr_type=attr_type,
+        )
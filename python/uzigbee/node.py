@@ -7,6 +7,7 @@ except ImportError:
     import json
 
 from .core import (
+    attr_event_record,
     ATTR_DOOR_LOCK_LOCK_STATE,
     ATTR_IAS_ZONE_IAS_CIE_ADDRESS,
     ATTR_LEVEL_CONTROL_CURRENT_LEVEL,
@@ -52,6 +53,7 @@ from .commissioning import (
     infer_mode as _infer_commissioning_mode,
     mode_profile_source as _mode_profile_source,
 )
+from . import persistence as _persistence
 
 ROLE_ROUTER = 1
 ROLE_END_DEVICE = 2
@@ -844,6 +846,9 @@ class _NodeBase:
         "_binding_policies",
         "_persistence_min_interval_ms",
         "_persistence_last_save_ms",
+        "_autosave",
+        "_autosave_path",
+        "_snapshot_base",
         "_channel_mask",
         "_pan_id",
         "_extended_pan_id",
@@ -909,6 +914,10 @@ class _NodeBase:
         self._binding_policies = {}
         self._persistence_min_interval_ms = 30000
         self._persistence_last_save_ms = 0
+        self._autosave = None
+        self._autosave_path = None
+        # (path, generation) of the last snapshot this node wrote or loaded in NDJSON form.
+        self._snapshot_base = None
         channel_mask_value = _normalize_channel_mask(channel=channel, channel_mask=channel_mask)
         auto_join_channel_mask_value = _normalize_channel_mask(channel_mask=auto_join_channel_mask)
         pan_id_value = _normalize_pan_id(pan_id)
@@ -1001,6 +1010,7 @@ class _NodeBase:
                 "provisioned": False,
             }
         )
+        self._mark_dirty("config")
         return self
 
     def builder(self):
@@ -1029,6 +1039,7 @@ class _NodeBase:
             alias_key = _normalize_capability_name(alias)
             self._custom_capability_aliases[alias_key] = capability_name
             alias_map[alias_key] = capability_name
+        self._mark_dirty("config")
         return {
             "name": capability_name,
             "kind": capability_kind,
@@ -1048,6 +1059,7 @@ class _NodeBase:
                 aliases_to_remove.append(alias_key)
         for alias_key in tuple(aliases_to_remove):
             del self._custom_capability_aliases[alias_key]
+        self._mark_dirty("config")
         return int(removed)
 
     def custom_capabilities(self):
@@ -1243,6 +1255,7 @@ class _NodeBase:
             "sent": False,
         }
         self._actuator_state[state_key] = row
+        self._mark_dirty("actuators")
         if str(field) == "on_off":
             writer = self._onoff_outputs.get(int(endpoint_id), None)
             if writer is not None:
@@ -1351,6 +1364,7 @@ class _NodeBase:
                 "entries": tuple(entries),
             }
             self._reporting_policies[item_endpoint] = policy
+            self._mark_dirty("config")
             self._invoke_policy_hooks("reporting_configured", policy)
             configured.append(dict(policy))
 
@@ -1372,10 +1386,12 @@ class _NodeBase:
         if endpoint_id is None:
             count = len(self._reporting_policies)
             self._reporting_policies.clear()
+            self._mark_dirty("config")
             return count
         endpoint_id = _normalize_endpoint(endpoint_id)
         if endpoint_id in self._reporting_policies:
             del self._reporting_policies[endpoint_id]
+            self._mark_dirty("config")
             return 1
         return 0
 
@@ -1479,6 +1495,7 @@ class _NodeBase:
                 "ias_enroll": bool(ias_enroll),
             }
             self._binding_policies[item_endpoint] = policy
+            self._mark_dirty("config")
             self._invoke_policy_hooks("binding_configured", policy)
             configured.append(dict(policy))
         if auto_apply:
@@ -1499,10 +1516,12 @@ class _NodeBase:
         if endpoint_id is None:
             count = len(self._binding_policies)
             self._binding_policies.clear()
+            self._mark_dirty("config")
             return count
         endpoint_id = _normalize_endpoint(endpoint_id)
         if endpoint_id in self._binding_policies:
             del self._binding_policies[endpoint_id]
+            self._mark_dirty("config")
             return 1
         return 0
 
@@ -1654,6 +1673,7 @@ class _NodeBase:
             "updated_ms": int(updated_ms),
         }
         self._sensor_state[state_key] = row
+        self._mark_dirty("sensors")
         return dict(row)
 
     def update(self, capability, value, endpoint_id=None, timestamp_ms=None):
@@ -1767,6 +1787,13 @@ class _NodeBase:
                 self._join_retry_base_ms,
                 300000,
             )
+        if (
+            auto_join_channel_mask is not None
+            or join_retry_max is not None
+            or join_retry_base_ms is not None
+            or join_retry_max_backoff_ms is not None
+        ):
+            self._mark_dirty("config")
         return {
             "auto_join_channel_mask": int(self._auto_join_channel_mask),
             "join_retry_max": int(self._join_retry_max),
@@ -1793,6 +1820,8 @@ class _NodeBase:
                 self._self_heal_retry_base_ms,
                 300000,
             )
+        if enabled is not None or retry_max is not None or retry_base_ms is not None or retry_max_backoff_ms is not None:
+            self._mark_dirty("config")
         return {
             "enabled": bool(self._self_heal_enabled),
             "retry_max": int(self._self_heal_retry_max),
@@ -1944,6 +1973,7 @@ class _NodeBase:
                 source=_mode_profile_source(self.commissioning_mode),
                 formed_at_ms=formed_at_ms,
             )
+            self._mark_dirty("config")
         return bool(changed)
 
     def _emit_commissioning_event(self, event, reason=None, signal_id=None, status=None, attempt=None, ok=None, backoff_ms=None):
@@ -2129,18 +2159,17 @@ class _NodeBase:
             self._on_signal_cb(int(signal_id), int(status))
 
     def _handle_attribute(self, *event):
-        source_short_addr = None
-        attr_type = None
-
-        if len(event) == 5:
-            endpoint, cluster_id, attr_id, value, status = event
-        elif len(event) == 6:
-            endpoint, cluster_id, attr_id, value, attr_type, status = event
-        elif len(event) >= 7:
-            source_short_addr, endpoint, cluster_id, attr_id, value, attr_type, status = event[:7]
-        else:
+        record = attr_event_record(event)
+        if record is None:
             return
+        self._apply_attribute(*record)
 
+    def _handle_attribute_batch(self, records):
+        apply = self._apply_attribute
+        for record in records:
+            apply(*record)
+
+    def _apply_attribute(self, source_short_addr, endpoint, cluster_id, attr_id, value, attr_type, status):
         endpoint = int(endpoint)
         cluster_id = int(cluster_id)
         attr_id = int(attr_id)
@@ -2302,7 +2331,9 @@ class _NodeBase:
             _ignore_invalid_state(self.stack.set_primary_channel_mask, int(self._auto_join_channel_mask))
         _ignore_invalid_state(self.stack.init, self.role)
         self.stack.on_signal(self._handle_signal)
-        if hasattr(self.stack, "on_attribute"):
+        if hasattr(self.stack, "on_attribute_batch"):
+            self.stack.on_attribute_batch(self._handle_attribute_batch)
+        elif hasattr(self.stack, "on_attribute"):
             self.stack.on_attribute(self._handle_attribute)
         self.register()
         if form_network is None:
@@ -2320,6 +2351,7 @@ class _NodeBase:
             source=_mode_profile_source(self.commissioning_mode),
             formed_at_ms=formed_at_ms,
         )
+        self._mark_dirty("config")
         if self.commissioning_mode in (NETWORK_MODE_AUTO, NETWORK_MODE_GUIDED):
             self._sync_network_profile_from_runtime()
         return self
@@ -2442,12 +2474,48 @@ class _NodeBase:
     def configure_persistence(self, min_interval_ms=None):
         if min_interval_ms is not None:
             self._persistence_min_interval_ms = int(min_interval_ms)
+            self._mark_dirty("config")
         return {
             "min_interval_ms": int(self._persistence_min_interval_ms),
             "last_save_ms": int(self._persistence_last_save_ms),
         }
 
-    def dump_node_state(self):
+    def _mark_dirty(self, section):
+        autosave = self._autosave
+        if autosave is not None:
+            autosave.mark(section, _ticks_ms())
+
+    def _snapshot_chunks(self, previous=None, dirty=()):
+        """Yield the node state as NDJSON: a header line, then one line per sensor/actuator row.
+
+        With ``previous`` (the body of the last generation, read from its start), sections
+        not in ``dirty`` are copied from it line by line instead of being serialized again.
+        """
+        line = previous.readline() if previous is not None else b""
+        if line and "config" not in dirty:
+            yield line.rstrip(b"\r\n")
+        else:
+            head = self.dump_node_state(include_states=False)
+            head["format"] = "ndjson"
+            yield json.dumps(head)
+            head = None
+        line = previous.readline() if previous is not None else b""
+        for key, section, rows in (
+            ("sensor_state", "sensors", self.sensor_states),
+            ("actuator_state", "actuators", self.actuator_states),
+        ):
+            prefix = ("{\"%s\"" % key).encode()
+            reuse = previous is not None and section not in dirty
+            while line.startswith(prefix):
+                if reuse:
+                    yield b"\n" + line.rstrip(b"\r\n")
+                line = previous.readline()
+            if not reuse:
+                for item in rows():
+                    yield "\n" + json.dumps({key: item})
+        yield "\n"
+
+    def dump_node_state(self, include_states=True):
         components = []
         for item in self.components():
             create_method = None
@@ -2505,12 +2573,13 @@ class _NodeBase:
             "self_heal_policy": self.configure_self_heal(),
             "components": components,
             "custom_capabilities": [dict(item) for item in self.custom_capabilities()],
-            "sensor_states": [dict(item) for item in self.sensor_states()],
-            "actuator_states": [dict(item) for item in self.actuator_states()],
             "reporting_policies": reporting_policies,
             "binding_policies": binding_policies,
             "persistence": self.configure_persistence(),
         }
+        if include_states:
+            out["sensor_states"] = [dict(item) for item in self.sensor_states()]
+            out["actuator_states"] = [dict(item) for item in self.actuator_states()]
         if hasattr(self, "sleepy_profile"):
             out["sleepy_profile"] = self.sleepy_profile()
         return out
@@ -2518,6 +2587,8 @@ class _NodeBase:
     def restore_node_state(self, snapshot, merge=False):
         if not isinstance(snapshot, dict):
             raise ValueError("snapshot must be dict")
+        for section in ("config", "sensors", "actuators"):
+            self._mark_dirty(section)
 
         if not merge:
             self._endpoint_plan = []
@@ -2592,30 +2663,10 @@ class _NodeBase:
             )
 
         for item in tuple(snapshot.get("sensor_states", ())):
-            endpoint_id = _normalize_endpoint(item.get("endpoint_id"))
-            capability = str(item.get("capability"))
-            self._sensor_state[(int(endpoint_id), capability)] = {
-                "endpoint_id": int(endpoint_id),
-                "capability": capability,
-                "value": item.get("value"),
-                "raw_value": item.get("raw_value"),
-                "updated_ms": int(item.get("updated_ms", 0)),
-            }
+            self._restore_sensor_row(item)
 
         for item in tuple(snapshot.get("actuator_states", ())):
-            endpoint_id = _normalize_endpoint(item.get("endpoint_id"))
-            field = str(item.get("field"))
-            self._actuator_state[(int(endpoint_id), field)] = {
-                "endpoint_id": int(endpoint_id),
-                "name": str(item.get("name", "")),
-                "capability": str(item.get("capability", "")),
-                "field": field,
-                "value": item.get("value"),
-                "raw_value": item.get("raw_value"),
-                "updated_ms": int(item.get("updated_ms", 0)),
-                "changed": bool(item.get("changed", False)),
-                "sent": bool(item.get("sent", False)),
-            }
+            self._restore_actuator_row(item)
 
         for item in tuple(snapshot.get("reporting_policies", ())):
             endpoint_id = _normalize_endpoint(item.get("endpoint_id"))
@@ -2675,6 +2726,32 @@ class _NodeBase:
             "binding_policies": len(self._binding_policies),
         }
 
+    def _restore_sensor_row(self, item):
+        endpoint_id = _normalize_endpoint(item.get("endpoint_id"))
+        capability = str(item.get("capability"))
+        self._sensor_state[(int(endpoint_id), capability)] = {
+            "endpoint_id": int(endpoint_id),
+            "capability": capability,
+            "value": item.get("value"),
+            "raw_value": item.get("raw_value"),
+            "updated_ms": int(item.get("updated_ms", 0)),
+        }
+
+    def _restore_actuator_row(self, item):
+        endpoint_id = _normalize_endpoint(item.get("endpoint_id"))
+        field = str(item.get("field"))
+        self._actuator_state[(int(endpoint_id), field)] = {
+            "endpoint_id": int(endpoint_id),
+            "name": str(item.get("name", "")),
+            "capability": str(item.get("capability", "")),
+            "field": field,
+            "value": item.get("value"),
+            "raw_value": item.get("raw_value"),
+            "updated_ms": int(item.get("updated_ms", 0)),
+            "changed": bool(item.get("changed", False)),
+            "sent": bool(item.get("sent", False)),
+        }
+
     def save_node_state(self, path="uzigbee_node_state.json", force=False):
         now_ms = _ticks_ms()
         elapsed = int(now_ms) - int(self._persistence_last_save_ms)
@@ -2686,26 +2763,127 @@ class _NodeBase:
                 "elapsed_ms": int(elapsed),
                 "min_interval_ms": int(self._persistence_min_interval_ms),
             }
+        return self._write_node_state(path, now_ms)
 
-        snapshot = self.dump_node_state()
-        payload = json.dumps(snapshot)
-        with open(path, "w") as handle:
-            handle.write(payload)
+    def _open_snapshot_base(self, path):
+        # Unchanged sections may only be copied from the generation this node itself wrote or loaded.
+        base = self._snapshot_base
+        if base is None or base[0] != str(path):
+            return None
+        try:
+            fp, info = _persistence.open_snapshot_stream(path)
+        except OSError:
+            return None
+        if info["source"] == "temp" or int(info["generation"]) != int(base[1]):
+            fp.close()
+            return None
+        return fp
+
+    def _write_node_state(self, path, now_ms, dirty=None):
+        previous = None if dirty is None else self._open_snapshot_base(path)
+        reused = ()
+        if previous is not None:
+            reused = tuple(section for section in ("config", "sensors", "actuators") if section not in dirty)
+        # Chunks go straight to flash; the full document is never joined in RAM.
+        writer = _persistence.open_snapshot(path)
+        try:
+            for chunk in self._snapshot_chunks(previous, dirty or ()):
+                writer.write(chunk)
+        except Exception:
+            writer.abort()
+            raise
+        finally:
+            if previous is not None:
+                previous.close()
+        info = writer.commit()
+        self._snapshot_base = (str(path), int(info["generation"]))
         self._persistence_last_save_ms = int(now_ms)
         return {
             "saved": True,
             "path": str(path),
-            "bytes": int(len(payload)),
+            "bytes": int(writer.length),
+            "generation": int(info["generation"]),
             "saved_ms": int(self._persistence_last_save_ms),
+            "reused": reused,
         }
 
+    def configure_autosave(self, path=None, enabled=None, interval_ms=None):
+        """Save to ``path`` at most once per ``interval_ms`` after state is marked dirty."""
+        if path is not None:
+            self._autosave_path = str(path)
+        autosave = self._autosave
+        if autosave is None and enabled:
+            if self._autosave_path is None:
+                self._autosave_path = "uzigbee_node_state.json"
+            if interval_ms is None:
+                interval_ms = self._persistence_min_interval_ms
+            autosave = _persistence.AutosaveScheduler(self._autosave_flush, interval_ms=interval_ms)
+            # Changes made before autosave existed were never marked; the first flush writes everything.
+            for section in ("config", "sensors", "actuators"):
+                autosave.mark(section, _ticks_ms())
+            self._autosave = autosave
+        if autosave is None:
+            return {"enabled": False, "path": self._autosave_path}
+        if enabled is not None:
+            autosave.enabled = bool(enabled)
+        if interval_ms is not None:
+            autosave.interval_ms = max(0, int(interval_ms))
+        out = autosave.stats()
+        out["path"] = self._autosave_path
+        return out
+
+    def autosave_stats(self):
+        return self.configure_autosave()
+
+    def _autosave_flush(self, sections):
+        out = self._write_node_state(self._autosave_path, _ticks_ms(), dirty=sections)
+        out["sections"] = tuple(sorted(sections))
+        return out
+
+    def poll_autosave(self):
+        if self._autosave is None:
+            return None
+        return self._autosave.poll(_ticks_ms())
+
+    def flush_autosave(self):
+        """Write pending dirty state now (call on shutdown)."""
+        if self._autosave is None:
+            return None
+        return self._autosave.flush(_ticks_ms())
+
     def load_node_state(self, path="uzigbee_node_state.json", merge=False):
-        with open(path, "r") as handle:
-            payload = handle.read()
-        snapshot = json.loads(payload)
-        restored = self.restore_node_state(snapshot, merge=merge)
+        fp, info = _persistence.open_snapshot_stream(path)
+        with fp:
+            first = fp.readline()
+            try:
+                head = json.loads(first.decode())
+            except ValueError:
+                head = None
+            if isinstance(head, dict) and head.get("format") == "ndjson":
+                # State rows are decoded one line at a time so only one row is in RAM.
+                restored = self.restore_node_state(head, merge=merge)
+                for line in fp:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    row = json.loads(line.decode())
+                    if "sensor_state" in row:
+                        self._restore_sensor_row(row["sensor_state"])
+                    elif "actuator_state" in row:
+                        self._restore_actuator_row(row["actuator_state"])
+                restored["sensor_states"] = len(self._sensor_state)
+                restored["actuator_states"] = len(self._actuator_state)
+                if not merge:
+                    self._snapshot_base = (str(path), int(info["generation"]))
+            else:
+                # Single-document snapshot from older releases.
+                restored = self.restore_node_state(json.loads((first + fp.read()).decode()), merge=merge)
+        if self._autosave is not None and not merge and str(path) == self._autosave_path:
+            self._autosave.clear()
         restored["loaded"] = True
         restored["path"] = str(path)
+        restored["source"] = info["source"]
+        restored["generation"] = int(info["generation"])
         return restored
 
     def components(self):
@@ -2917,6 +3095,15 @@ class EndDevice(Router):
             self.checkin_interval_ms = int(checkin_interval_ms)
         if low_power_reporting is not None:
             self.low_power_reporting = bool(low_power_reporting)
+        if (
+            sleepy is not None
+            or keep_alive_ms is not None
+            or poll_interval_ms is not None
+            or wake_window_ms is not None
+            or checkin_interval_ms is not None
+            or low_power_reporting is not None
+        ):
+            self._mark_dirty("config")
         return self.sleepy_profile()
 
     def configure_sleepy_profile(
@@ -0,0 +1,479 @@
+"""Flash persistence helpers: atomic checksummed snapshots and an append-only NDJSON journal."""
+
+try:
+    import os as _os
+except ImportError:
+    try:
+        import uos as _os
+    except ImportError:
+        _os = None
+
+try:
+    import json as _json
+except ImportError:
+    _json = None
+
+try:
+    from binascii import crc32 as _crc32
+except ImportError:
+    _crc32 = None
+
+try:
+    import time as _time
+except ImportError:
+    _time = None
+
+JOURNAL_SUFFIX = ".journal"
+TEMP_SUFFIX = ".tmp"
+BACKUP_SUFFIX = ".bak"
+
+# Fixed-width header: b"#UZB1 <generation> <length> <crc32>\n", all 8-digit hex.
+_MAGIC = b"#UZB1 "
+HEADER_LEN = 33
+# Placeholder length written before the body; no real body can match it, so a temp torn after the header never verifies.
+_LENGTH_UNSET = 0xFFFFFFFF
+_CHUNK = 512
+
+
+def _crc_update(data, crc):
+    if _crc32 is not None:
+        return _crc32(data, crc) & 0xFFFFFFFF
+    crc = ~crc & 0xFFFFFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ (0xEDB88320 if crc & 1 else 0)
+    return ~crc & 0xFFFFFFFF
+
+
+def digest(text):
+    """Change-detection digest of a serialized record: ``(length, crc32)``.
+
+    ``hash()`` is not usable here: MicroPython truncates str hashes to 8-16 bits.
+    """
+    if isinstance(text, str):
+        text = text.encode()
+    return (len(text), _crc_update(text, 0))
+
+
+def _header(generation, length, crc):
+    return _MAGIC + "{:08x} {:08x} {:08x}\n".format(
+        int(generation) & 0xFFFFFFFF,
+        int(length) & 0xFFFFFFFF,
+        int(crc) & 0xFFFFFFFF,
+    ).encode()
+
+
+def _parse_header(raw):
+    if len(raw) != HEADER_LEN or raw[:6] != _MAGIC or raw[-1:] != b"\n":
+        return None
+    try:
+        fields = raw[6:-1].decode().split(" ")
+        return (int(fields[0], 16), int(fields[1], 16), int(fields[2], 16))
+    except (ValueError, IndexError):
+        return None
+
+
+def _rename(src, dst):
+    remove_file(dst)
+    _os.rename(src, dst)
+
+
+def _verify(path):
+    """Return ``(generation, length)`` when the body matches its header, else None.
+
+    Only the checksum is computed; the JSON body is not parsed.
+    """
+    try:
+        fp = open(path, "rb")
+    except OSError:
+        return None
+    with fp:
+        header = _parse_header(fp.read(HEADER_LEN))
+        if header is None:
+            return None
+        generation, length, crc = header
+        seen = 0
+        actual = 0
+        while True:
+            chunk = fp.read(_CHUNK)
+            if not chunk:
+                break
+            seen += len(chunk)
+            actual = _crc_update(chunk, actual)
+    if seen != length or actual != crc:
+        return None
+    return (generation, length)
+
+
+class SnapshotWriter:
+    """Streams a snapshot body into ``<path>.tmp``; ``commit()`` verifies and swaps it in."""
+
+    __slots__ = ("path", "generation", "length", "_fp", "_crc")
+
+    def __init__(self, path, generation):
+        self.path = str(path)
+        self.generation = int(generation)
+        self.length = 0
+        self._crc = 0
+        self._fp = open(self.path + TEMP_SUFFIX, "wb")
+        self._fp.write(_header(self.generation, _LENGTH_UNSET, 0))
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+        self._fp.write(data)
+        self.length += len(data)
+        self._crc = _crc_update(data, self._crc)
+        return len(data)
+
+    def abort(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        remove_file(self.path + TEMP_SUFFIX)
+
+    def commit(self):
+        fp = self._fp
+        fp.seek(0)
+        fp.write(_header(self.generation, self.length, self._crc))
+        fp.close()
+        self._fp = None
+        tmp_path = self.path + TEMP_SUFFIX
+        if _verify(tmp_path) != (self.generation, self.length):
+            remove_file(tmp_path)
+            raise OSError("snapshot verification failed: {}".format(tmp_path))
+        # Keep the previous generation as a fallback before promoting the new one.
+        if file_size(self.path) > 0:
+            _rename(self.path, self.path + BACKUP_SUFFIX)
+        _rename(tmp_path, self.path)
+        return {
+            "path": self.path,
+            "generation": self.generation,
+            "bytes": int(self.length + HEADER_LEN),
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+
+def _candidates(path):
+    path = str(path)
+    return (
+        ("temp", path + TEMP_SUFFIX),
+        ("primary", path),
+        ("backup", path + BACKUP_SUFFIX),
+    )
+
+
+def _read_header(path):
+    try:
+        fp = open(path, "rb")
+    except OSError:
+        return None
+    with fp:
+        return _parse_header(fp.read(HEADER_LEN))
+
+
+def newest_generation(path):
+    """``(source, path, generation)`` of the newest candidate whose checksum holds, or None."""
+    ranked = []
+    for source, candidate in _candidates(path):
+        header = _read_header(candidate)
+        # A zero or placeholder length is a header without a committed body.
+        if header is not None and header[1] not in (0, _LENGTH_UNSET):
+            ranked.append((header[0], source, candidate))
+    # Headers are cheap; only checksum candidates newest-first until one is intact.
+    ranked.sort(reverse=True)
+    for generation, source, candidate in ranked:
+        if _verify(candidate) is not None:
+            return (source, candidate, generation)
+    return None
+
+
+def open_snapshot(path):
+    """Start an atomic snapshot write; use as a context manager or call ``commit()``."""
+    generation = 0
+    for _, candidate in _candidates(path):
+        header = _read_header(candidate)
+        if header is not None and header[0] > generation:
+            generation = header[0]
+    return SnapshotWriter(path, (generation + 1) & 0xFFFFFFFF)
+
+
+def write_snapshot(path, payload):
+    with open_snapshot(path) as writer:
+        writer.write(payload)
+    return {
+        "path": writer.path,
+        "generation": writer.generation,
+        "bytes": int(writer.length + HEADER_LEN),
+    }
+
+
+def open_snapshot_stream(path):
+    """Open the newest valid generation positioned at its body; returns ``(fp, info)``.
+
+    The caller reads (e.g. line by line) and closes ``fp``. Headerless files
+    from older releases are returned at offset 0 with ``source="legacy"``.
+    """
+    best = newest_generation(path)
+    if best is not None:
+        source, candidate, generation = best
+        fp = open(candidate, "rb")
+        fp.seek(HEADER_LEN)
+        return fp, {"source": source, "path": candidate, "generation": int(generation)}
+    for source, candidate in _candidates(path)[1:]:
+        try:
+            fp = open(candidate, "rb")
+        except OSError:
+            continue
+        if fp.read(1) != b"{":
+            fp.close()
+            continue
+        fp.seek(0)
+        return fp, {"source": "legacy" if source == "primary" else "legacy_backup", "path": candidate, "generation": 0}
+    raise OSError("no valid snapshot: {}".format(path))
+
+
+def load_snapshot(path):
+    """Parse the newest valid generation of ``path``; returns ``(obj, info)``.
+
+    Files without a header (written before checksummed snapshots) load as ``legacy``.
+    """
+    best = newest_generation(path)
+    if best is not None:
+        source, candidate, generation = best
+        with open(candidate, "rb") as fp:
+            fp.seek(HEADER_LEN)
+            payload = fp.read()
+        return _json.loads(payload.decode()), {
+            "source": source,
+            "path": candidate,
+            "generation": int(generation),
+        }
+    for source, candidate in _candidates(path)[1:]:
+        try:
+            fp = open(candidate, "r")
+        except OSError:
+            continue
+        with fp:
+            head = fp.read(1)
+            if head != "{":
+                continue
+            try:
+                obj = _json.loads(head + fp.read())
+            except ValueError:
+                continue
+        return obj, {"source": "legacy" if source == "primary" else "legacy_backup", "path": candidate, "generation": 0}
+    raise OSError("no valid snapshot: {}".format(path))
+
+
+def _ticks_diff(a, b):
+    if _time is not None and hasattr(_time, "ticks_diff"):
+        return int(_time.ticks_diff(int(a), int(b)))
+    return int(a) - int(b)
+
+
+class AutosaveScheduler:
+    """Coalesces dirty marks into at most one ``save(sections)`` call per interval.
+
+    ``sections`` is the set of subsystem keys marked since the last flush, so the
+    caller can serialize only what changed. A failed save keeps the marks.
+    """
+
+    __slots__ = (
+        "save",
+        "interval_ms",
+        "enabled",
+        "marks",
+        "flushes",
+        "failures",
+        "last_result",
+        "last_error",
+        "_dirty",
+        "_dirty_since_ms",
+        "_last_flush_ms",
+    )
+
+    def __init__(self, save, interval_ms=30000, enabled=True):
+        self.save = save
+        self.interval_ms = max(0, int(interval_ms))
+        self.enabled = bool(enabled)
+        self.marks = 0
+        self.flushes = 0
+        self.failures = 0
+        self.last_result = None
+        self.last_error = None
+        self._dirty = set()
+        self._dirty_since_ms = None
+        self._last_flush_ms = None
+
+    def mark(self, section, now_ms):
+        self.marks += 1
+        if not self._dirty:
+            self._dirty_since_ms = int(now_ms)
+        self._dirty.add(section)
+
+    def dirty(self):
+        return tuple(sorted(self._dirty, key=str))
+
+    def clear(self):
+        """Forget pending marks (state was just loaded from the file it would be saved to)."""
+        self._dirty = set()
+        self._dirty_since_ms = None
+
+    def due(self, now_ms):
+        if not self.enabled or not self._dirty:
+            return False
+        if self._last_flush_ms is None:
+            return True
+        return _ticks_diff(now_ms, self._last_flush_ms) >= int(self.interval_ms)
+
+    def poll(self, now_ms):
+        if not self.due(now_ms):
+            return None
+        return self.flush(now_ms)
+
+    def flush(self, now_ms):
+        if not self._dirty:
+            return None
+        sections = self._dirty
+        self._dirty = set()
+        self._last_flush_ms = int(now_ms)
+        try:
+            result = self.save(sections)
+        except Exception as exc:
+            for section in sections:
+                self._dirty.add(section)
+            self.failures += 1
+            self.last_error = repr(exc)
+            return None
+        self._dirty_since_ms = None
+        self.flushes += 1
+        self.last_result = result
+        return result
+
+    def stats(self):
+        return {
+            "enabled": bool(self.enabled),
+            "interval_ms": int(self.interval_ms),
+            "dirty": self.dirty(),
+            "dirty_since_ms": self._dirty_since_ms,
+            "last_flush_ms": self._last_flush_ms,
+            "marks": int(self.marks),
+            "flushes": int(self.flushes),
+            "failures": int(self.failures),
+            "last_error": self.last_error,
+        }
+
+
+def journal_path(path):
+    return str(path) + JOURNAL_SUFFIX
+
+
+def file_size(path):
+    """Size in bytes, or 0 when the file does not exist."""
+    if _os is None:
+        return 0
+    try:
+        return int(_os.stat(path)[6])
+    except OSError:
+        return 0
+
+
+def remove_file(path):
+    if _os is None:
+        return False
+    try:
+        _os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+def _ends_with_newline(path, size):
+    try:
+        with open(path, "rb") as fp:
+            fp.seek(size - 1)
+            return fp.read(1) == b"\n"
+    except OSError:
+        return True
+
+
+class JournalAppender:
+    """Appends records one line at a time; ``header`` is written first when the file is empty."""
+
+    __slots__ = ("path", "header", "records", "bytes", "_fp")
+
+    def __init__(self, path, header=None):
+        self.path = str(path)
+        self.header = header
+        self.records = 0
+        self.bytes = 0
+        self._fp = None
+
+    def _write_line(self, record):
+        line = _json.dumps(record) + "\n"
+        self._fp.write(line)
+        self.bytes += len(line)
+
+    def append(self, record):
+        if self._fp is None:
+            size = file_size(self.path)
+            torn = size > 0 and not _ends_with_newline(self.path, size)
+            self._fp = open(self.path, "a")
+            if torn:
+                # A brown-out left a partial line; never glue the next record onto it.
+                self._fp.write("\n")
+                self.bytes += 1
+            if size == 0 and self.header is not None:
+                self._write_line(self.header)
+        self._write_line(record)
+        self.records += 1
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def read_records(path, status=None):
+    """Yield journal records in order; a torn or invalid line ends the replay.
+
+    When ``status`` is a dict, ``status["torn"]`` tells whether replay stopped early.
+    """
+    if status is not None:
+        status["torn"] = False
+    try:
+        fp = open(path, "r")
+    except OSError:
+        return
+    with fp:
+        for line in fp:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _json.loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict):
+                if status is not None:
+                    status["torn"] = True
+                return
+            yield record
@@ -0,0 +1,214 @@
+"""Cooperative time-budgeted scheduler with strict-priority work lanes."""
+
+from .eventqueue import EventQueue, QUEUE_DROP_OLDEST
+
+LANE_CONTROL = 0
+LANE_ATTRIBUTE = 1
+LANE_DISCOVERY = 2
+LANE_AUTOMATION = 3
+LANE_PERSISTENCE = 4
+
+LANE_NAMES = ("control", "attribute", "discovery", "automation", "persistence")
+
+_LANE_CAPACITY_DEFAULT = 32
+
+
+def _default_ticks_ms():
+    try:
+        import time
+    except ImportError:
+        return 0
+    if hasattr(time, "ticks_ms"):
+        return int(time.ticks_ms())
+    return int(time.time() * 1000)
+
+
+def _default_ticks_diff(a, b):
+    try:
+        import time
+    except ImportError:
+        time = None
+    if time is not None and hasattr(time, "ticks_diff"):
+        return int(time.ticks_diff(int(a), int(b)))
+    return int(a) - int(b)
+
+
+def lane_id(lane):
+    """Lane index from an int or a name in ``LANE_NAMES``."""
+    if isinstance(lane, str):
+        name = lane.strip().lower()
+        if name not in LANE_NAMES:
+            raise ValueError("unknown lane: {}".format(lane))
+        return LANE_NAMES.index(name)
+    lane = int(lane)
+    if lane < 0 or lane >= len(LANE_NAMES):
+        raise ValueError("unknown lane: {}".format(lane))
+    return lane
+
+
+class _Lane:
+    __slots__ = (
+        "queue",
+        "idle",
+        "ran",
+        "errors",
+        "last_error",
+        "latency_ms_total",
+        "latency_ms_max",
+        "run_ms_total",
+        "run_ms_max",
+    )
+
+    def __init__(self, capacity, policy):
+        self.queue = EventQueue(capacity, policy)
+        self.idle = None
+        self.ran = 0
+        self.errors = 0
+        self.last_error = None
+        self.latency_ms_total = 0
+        self.latency_ms_max = 0
+        self.run_ms_total = 0
+        self.run_ms_max = 0
+
+
+class LaneScheduler:
+    """Runs queued callables, highest-priority lane first, until a time budget is spent.
+
+    Each lane may also have an ``idle(now_ms)`` hook for polled work
+    (discovery pipeline, autosave). It runs at most once per ``run_once()``
+    when its queue and every higher lane are empty.
+    """
+
+    __slots__ = ("ticks_ms", "ticks_diff", "_lanes", "runs", "overruns")
+
+    def __init__(self, capacity=_LANE_CAPACITY_DEFAULT, policy=QUEUE_DROP_OLDEST, ticks_ms=None, ticks_diff=None):
+        self.ticks_ms = ticks_ms if ticks_ms is not None else _default_ticks_ms
+        self.ticks_diff = ticks_diff if ticks_diff is not None else _default_ticks_diff
+        if isinstance(capacity, int):
+            capacity = (capacity,) * len(LANE_NAMES)
+        self._lanes = tuple(_Lane(int(capacity[index]), policy) for index in range(len(LANE_NAMES)))
+        self.runs = 0
+        self.overruns = 0
+
+    def set_idle(self, lane, hook):
+        self._lanes[lane_id(lane)].idle = hook
+
+    def run_idle(self, lane):
+        """Call ``lane``'s idle hook now (outside ``run_once()``); False when it has none."""
+        lane = self._lanes[lane_id(lane)]
+        if lane.idle is None:
+            return False
+        started_ms = self.ticks_ms()
+        try:
+            lane.idle(started_ms)
+        except Exception as exc:
+            lane.errors += 1
+            lane.last_error = repr(exc)
+        run_ms = max(0, self.ticks_diff(self.ticks_ms(), started_ms))
+        lane.run_ms_total += run_ms
+        if run_ms > lane.run_ms_max:
+            lane.run_ms_max = run_ms
+        return True
+
+    def submit(self, lane, fn, *args):
+        """Queue ``fn(*args)`` on ``lane``; False when a full drop-newest lane refused it."""
+        return self._lanes[lane_id(lane)].queue.push((fn, args, self.ticks_ms()))
+
+    def pending(self, lane=None):
+        if lane is not None:
+            return len(self._lanes[lane_id(lane)].queue)
+        return sum(len(item.queue) for item in self._lanes)
+
+    def _next(self):
+        for index, lane in enumerate(self._lanes):
+            if lane.queue:
+                return index, lane
+        return None, None
+
+    def _run(self, lane, fn, args, queued_ms):
+        started_ms = self.ticks_ms()
+        latency_ms = max(0, self.ticks_diff(started_ms, queued_ms))
+        lane.latency_ms_total += latency_ms
+        if latency_ms > lane.latency_ms_max:
+            lane.latency_ms_max = latency_ms
+        try:
+            fn(*args)
+        except Exception as exc:
+            lane.errors += 1
+            lane.last_error = repr(exc)
+        run_ms = max(0, self.ticks_diff(self.ticks_ms(), started_ms))
+        lane.ran += 1
+        lane.run_ms_total += run_ms
+        if run_ms > lane.run_ms_max:
+            lane.run_ms_max = run_ms
+
+    def run_once(self, budget_ms=20):
+        """One cooperative slice; returns ``{"ran", "idle", "elapsed_ms", "pending"}``."""
+        budget_ms = max(0, int(budget_ms))
+        started_ms = self.ticks_ms()
+        ran = [0] * len(self._lanes)
+        idle_done = [False] * len(self._lanes)
+        idle_ran = []
+        self.runs += 1
+        while True:
+            elapsed_ms = self.ticks_diff(self.ticks_ms(), started_ms)
+            if elapsed_ms >= budget_ms and (sum(ran) or idle_ran):
+                break
+            index, lane = self._next()
+            floor = len(self._lanes) if index is None else index
+            # Polled work only runs once queued work above (and in) its lane is drained.
+            hook_index = None
+            for candidate in range(floor):
+                if not idle_done[candidate] and self._lanes[candidate].idle is not None:
+                    hook_index = candidate
+                    break
+            if hook_index is not None:
+                idle_done[hook_index] = True
+                self.run_idle(hook_index)
+                idle_ran.append(LANE_NAMES[hook_index])
+                continue
+            if lane is None:
+                break
+            fn, args, queued_ms = lane.queue.pop()
+            self._run(lane, fn, args, queued_ms)
+            ran[index] += 1
+        elapsed_ms = self.ticks_diff(self.ticks_ms(), started_ms)
+        if elapsed_ms > budget_ms:
+            self.overruns += 1
+        out = {}
+        for index, name in enumerate(LANE_NAMES):
+            if ran[index]:
+                out[name] = ran[index]
+        return {
+            "ran": out,
+            "idle": tuple(idle_ran),
+            "elapsed_ms": int(elapsed_ms),
+            "pending": self.pending(),
+        }
+
+    def stats(self):
+        lanes = {}
+        for index, name in enumerate(LANE_NAMES):
+            lane = self._lanes[index]
+            queue = lane.queue.stats()
+            lanes[name] = {
+                "priority": index,
+                "depth": queue["depth"],
+                "capacity": queue["capacity"],
+                "submitted": queue["pushed"],
+                "dropped": queue["overflow"],
+                "high_watermark": queue["high_watermark"],
+                "ran": int(lane.ran),
+                "errors": int(lane.errors),
+                "last_error": lane.last_error,
+                "latency_ms_max": int(lane.latency_ms_max),
+                "mean_latency_ms": int(lane.latency_ms_total) // lane.ran if lane.ran else 0,
+                "run_ms_max": int(lane.run_ms_max),
+                "run_ms_total": int(lane.run_ms_total),
+            }
+        return {
+            "runs": int(self.runs),
+            "overruns": int(self.overruns),
+            "pending": self.pending(),
+            "lanes": lanes,
+        }
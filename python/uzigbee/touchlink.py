@@ -11,6 +11,7 @@ from .core import (
     SIGNAL_TOUCHLINK_NWK,
     SIGNAL_TOUCHLINK_TARGET_FINISHED,
 )
+from .eventqueue import EventQueue, QUEUE_DROP_OLDEST
 
 
 TOUCHLINK_STATE_IDLE = "idle"
@@ -121,12 +122,11 @@ class TouchlinkManager:
         "last_signal_id",
         "last_signal_name",
         "last_signal_status",
-        "_event_queue_max",
         "_events",
         "_on_event_cb",
     )
 
-    def __init__(self, stack=None, event_queue_max=64):
+    def __init__(self, stack=None, event_queue_max=64, event_queue_policy=QUEUE_DROP_OLDEST):
         self.stack = stack if stack is not None else ZigbeeStack()
         self.state = TOUCHLINK_STATE_IDLE
         self.initiator_active = False
@@ -135,10 +135,7 @@ class TouchlinkManager:
         self.last_signal_id = None
         self.last_signal_name = None
         self.last_signal_status = None
-        self._event_queue_max = int(event_queue_max)
-        if self._event_queue_max < 1:
-            self._event_queue_max = 1
-        self._events = []
+        self._events = EventQueue(event_queue_max, event_queue_policy)
         self._on_event_cb = None
 
     def on_event(self, callback=None):
@@ -155,24 +152,15 @@ class TouchlinkManager:
             "last_signal_name": self.last_signal_name,
             "last_signal_status": self.last_signal_status,
             "event_queue_depth": len(self._events),
+            "event_queue": self._events.stats(),
             "capabilities": capabilities(self.stack),
         }
 
     def poll_event(self, default=None):
-        if not self._events:
-            return default
-        return self._events.pop(0)
+        return self._events.pop(default)
 
     def drain_events(self, max_items=None):
-        if max_items is None:
-            max_items = len(self._events)
-        max_items = int(max_items)
-        if max_items < 0:
-            max_items = 0
-        out = []
-        while self._events and len(out) < max_items:
-            out.append(self._events.pop(0))
-        return tuple(out)
+        return self._events.drain(max_items)
 
     def process_signal(self, signal_id, status, payload=None):
         signal_id = int(signal_id)
@@ -286,10 +274,7 @@ class TouchlinkManager:
             "event": str(event),
             "payload": payload,
         }
-        self._events.append(row)
-        overflow = len(self._events) - int(self._event_queue_max)
-        if overflow > 0:
-            del self._events[:overflow]
+        self._events.push(row)
         if self._on_event_cb is not None:
             try:
                 self._on_event_cb(row["event"], row["payload"])
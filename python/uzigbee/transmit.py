@@ -0,0 +1,394 @@
+"""Per-destination token-bucket transmit scheduler for outgoing ZCL commands."""
+
+TX_PRIORITY_HIGH = 0
+TX_PRIORITY_NORMAL = 1
+TX_PRIORITY_LOW = 2
+
+TX_PRIORITY_NAMES = ("high", "normal", "low")
+
+_TX_RATE_PER_S_DEFAULT = 8
+_TX_BURST_DEFAULT = 8
+_TX_GLOBAL_RATE_PER_S_DEFAULT = 40
+_TX_GLOBAL_BURST_DEFAULT = 16
+_TX_QUEUE_MAX_DEFAULT = 32
+_TX_COALESCE_INTERVAL_MS_DEFAULT = 100
+
+# Buckets hold milli-tokens so refill stays integer: 1 ms at r/s adds r milli-tokens.
+_TOKEN = 1000
+
+
+def _default_ticks_ms():
+    try:
+        import time
+    except ImportError:
+        return 0
+    if hasattr(time, "ticks_ms"):
+        return int(time.ticks_ms())
+    return int(time.time() * 1000)
+
+
+def _default_ticks_diff(a, b):
+    try:
+        import time
+    except ImportError:
+        time = None
+    if time is not None and hasattr(time, "ticks_diff"):
+        return int(time.ticks_diff(int(a), int(b)))
+    return int(a) - int(b)
+
+
+def tx_dest(dest):
+    """Scheduler key of a destination: a short address, or a tuple such as ``("group", group_id)`` kept as is."""
+    if isinstance(dest, tuple):
+        return dest
+    return int(dest) & 0xFFFF
+
+
+def tx_priority(priority):
+    """Priority index from an int or a name in ``TX_PRIORITY_NAMES``."""
+    if isinstance(priority, str):
+        name = priority.strip().lower()
+        if name not in TX_PRIORITY_NAMES:
+            raise ValueError("unknown priority: {}".format(priority))
+        return TX_PRIORITY_NAMES.index(name)
+    priority = int(priority)
+    if priority < 0 or priority >= len(TX_PRIORITY_NAMES):
+        raise ValueError("unknown priority: {}".format(priority))
+    return priority
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated_ms")
+
+    def __init__(self, tokens, now_ms):
+        self.tokens = int(tokens)
+        self.updated_ms = int(now_ms)
+
+
+class TransmitScheduler:
+    """Rate-limits commands per destination and globally; excess waits in per-destination FIFOs.
+
+    Destinations are short addresses or tuples such as ``("group", group_id)``,
+    so a groupcast gets its own bucket and FIFO apart from the device sharing
+    its 16-bit value. A command whose destination has nothing queued and
+    tokens to spare is sent inline by ``submit()`` (errors propagate to the
+    caller). Everything else is queued and sent by ``pump()``. Commands to one destination always go out in
+    submission order; priority only decides which destination is served first
+    (a destination ranks by its most important queued command, ties by arrival).
+    When ``capacity`` commands are queued the new command is refused; an
+    accepted command is only ever removed by sending it or by ``clear()``.
+
+    Commands submitted with a ``key`` are last-writer-wins: a newer command
+    replaces the unsent one queued under the same (destination, key) in place,
+    and sends per key are at least ``coalesce_interval_ms`` apart.
+    """
+
+    __slots__ = (
+        "rate_per_s",
+        "burst",
+        "global_rate_per_s",
+        "global_burst",
+        "capacity",
+        "coalesce_interval_ms",
+        "ticks_ms",
+        "ticks_diff",
+        "_fifos",
+        "_order",
+        "_depth",
+        "_buckets",
+        "_global",
+        "_key_sent",
+        "sent",
+        "immediate",
+        "queued",
+        "dropped",
+        "refused",
+        "coalesced",
+        "errors",
+        "last_error",
+        "high_watermark",
+        "latency_ms_total",
+        "latency_ms_max",
+        "_queued_sent",
+    )
+
+    def __init__(
+        self,
+        rate_per_s=_TX_RATE_PER_S_DEFAULT,
+        burst=_TX_BURST_DEFAULT,
+        global_rate_per_s=_TX_GLOBAL_RATE_PER_S_DEFAULT,
+        global_burst=_TX_GLOBAL_BURST_DEFAULT,
+        capacity=_TX_QUEUE_MAX_DEFAULT,
+        coalesce_interval_ms=_TX_COALESCE_INTERVAL_MS_DEFAULT,
+        ticks_ms=None,
+        ticks_diff=None,
+    ):
+        self.ticks_ms = ticks_ms if ticks_ms is not None else _default_ticks_ms
+        self.ticks_diff = ticks_diff if ticks_diff is not None else _default_ticks_diff
+        self.configure(rate_per_s, burst, global_rate_per_s, global_burst, capacity, coalesce_interval_ms)
+        # dest -> FIFO of (dest, send, args, kwargs, queued_ms, key, priority);
+        # _order lists destinations by arrival since dicts are unordered on target.
+        self._fifos = {}
+        self._order = []
+        self._depth = 0
+        self._buckets = {}
+        self._global = _Bucket(self.global_burst * _TOKEN, self.ticks_ms())
+        # (dest, key) -> ms of the last send, kept only while the interval runs.
+        self._key_sent = {}
+        self.sent = 0
+        self.immediate = 0
+        self.queued = 0
+        self.dropped = 0
+        self.refused = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_error = None
+        self.high_watermark = 0
+        self.latency_ms_total = 0
+        self.latency_ms_max = 0
+        self._queued_sent = 0
+
+    def configure(
+        self,
+        rate_per_s=None,
+        burst=None,
+        global_rate_per_s=None,
+        global_burst=None,
+        capacity=None,
+        coalesce_interval_ms=None,
+    ):
+        if rate_per_s is not None:
+            self.rate_per_s = max(1, int(rate_per_s))
+        if burst is not None:
+            self.burst = max(1, int(burst))
+        if global_rate_per_s is not None:
+            self.global_rate_per_s = max(1, int(global_rate_per_s))
+        if global_burst is not None:
+            self.global_burst = max(1, int(global_burst))
+        if capacity is not None:
+            self.capacity = max(1, int(capacity))
+        if coalesce_interval_ms is not None:
+            self.coalesce_interval_ms = max(0, int(coalesce_interval_ms))
+
+    def __len__(self):
+        return self._depth
+
+    def pending(self, dest=None):
+        if dest is not None:
+            return len(self._fifos.get(tx_dest(dest), ()))
+        return self._depth
+
+    def _refill(self, bucket, rate_per_s, burst, now_ms):
+        elapsed_ms = self.ticks_diff(now_ms, bucket.updated_ms)
+        if elapsed_ms > 0:
+            bucket.tokens = min(burst * _TOKEN, bucket.tokens + elapsed_ms * rate_per_s)
+            bucket.updated_ms = int(now_ms)
+
+    def _dest_bucket(self, dest, now_ms):
+        bucket = self._buckets.get(dest)
+        if bucket is None:
+            bucket = _Bucket(self.burst * _TOKEN, now_ms)
+            self._buckets[dest] = bucket
+        else:
+            self._refill(bucket, self.rate_per_s, self.burst, now_ms)
+        return bucket
+
+    def _take(self, dest, now_ms):
+        if self._global.tokens < _TOKEN:
+            return False
+        bucket = self._dest_bucket(dest, now_ms)
+        if bucket.tokens < _TOKEN:
+            return False
+        bucket.tokens -= _TOKEN
+        self._global.tokens -= _TOKEN
+        return True
+
+    def _key_ready(self, key, now_ms):
+        if key is None or key not in self._key_sent:
+            return True
+        return self.ticks_diff(now_ms, self._key_sent[key]) >= self.coalesce_interval_ms
+
+    def _key_mark(self, key, now_ms):
+        if key is not None and self.coalesce_interval_ms > 0:
+            self._key_sent[key] = int(now_ms)
+
+    def _forget_idle(self, now_ms):
+        # A missing bucket reads as full, so refilled idle destinations cost no memory.
+        full = self.burst * _TOKEN
+        for dest in tuple(self._buckets):
+            if dest in self._fifos:
+                continue
+            bucket = self._buckets[dest]
+            if bucket.tokens >= full:
+                del self._buckets[dest]
+        for key in tuple(self._key_sent):
+            if self._key_ready(key, now_ms):
+                del self._key_sent[key]
+
+    def _remove(self, dest, index):
+        fifo = self._fifos[dest]
+        entry = fifo.pop(index)
+        self._depth -= 1
+        if not fifo:
+            del self._fifos[dest]
+            self._order.remove(dest)
+        return entry
+
+    def _ranked(self):
+        ranked = []
+        for position, dest in enumerate(self._order):
+            ranked.append((min(entry[6] for entry in self._fifos[dest]), position, dest))
+        ranked.sort()
+        return ranked
+
+    def _run(self, entry, now_ms):
+        dest, send, args, kwargs, queued_ms, key, _ = entry
+        self._key_mark(key, now_ms)
+        latency_ms = max(0, self.ticks_diff(now_ms, queued_ms))
+        self.latency_ms_total += latency_ms
+        self._queued_sent += 1
+        if latency_ms > self.latency_ms_max:
+            self.latency_ms_max = latency_ms
+        self.sent += 1
+        try:
+            send(*args, **kwargs)
+        except Exception as exc:
+            self.errors += 1
+            self.last_error = repr(exc)
+
+    def _replace(self, dest, key, send, args, kwargs, priority):
+        fifo = self._fifos.get(dest, ())
+        index = len(fifo)
+        while index > 0:
+            index -= 1
+            entry = fifo[index]
+            if entry[5] is None:
+                # An unkeyed command (on/off) queued later is a barrier: moving the new
+                # value ahead of it would reorder what the device sees.
+                return False
+            if entry[5] == key:
+                # Keep the queue slot and original enqueue time; only the payload is newer.
+                fifo[index] = (dest, send, args, kwargs, entry[4], key, min(entry[6], priority))
+                return True
+        return False
+
+    def submit(self, dest, send, args=(), kwargs=None, priority=TX_PRIORITY_NORMAL, key=None):
+        """Send ``send(*args, **kwargs)`` to ``dest`` now or queue it; False when refused.
+
+        With ``key`` the command replaces an unsent one queued under the same key,
+        unless an unkeyed command was queued after it for ``dest``.
+        """
+        dest = tx_dest(dest)
+        priority = tx_priority(priority)
+        args = tuple(args)
+        kwargs = kwargs or {}
+        now_ms = self.ticks_ms()
+        if len(self):
+            self.pump(now_ms)
+        else:
+            self._refill(self._global, self.global_rate_per_s, self.global_burst, now_ms)
+            self._forget_idle(now_ms)
+        if key is not None:
+            key = (dest, key)
+            if self._replace(dest, key, send, args, kwargs, priority):
+                self.coalesced += 1
+                return True
+        if dest not in self._fifos and self._key_ready(key, now_ms) and self._take(dest, now_ms):
+            self.sent += 1
+            self.immediate += 1
+            self._key_mark(key, now_ms)
+            send(*args, **kwargs)
+            return True
+        if self._depth >= self.capacity:
+            self.refused += 1
+            return False
+        fifo = self._fifos.get(dest)
+        if fifo is None:
+            fifo = []
+            self._fifos[dest] = fifo
+            self._order.append(dest)
+        fifo.append((dest, send, args, kwargs, now_ms, key, priority))
+        self._depth += 1
+        self.queued += 1
+        if self._depth > self.high_watermark:
+            self.high_watermark = self._depth
+        return True
+
+    def pump(self, now_ms=None, max_items=None):
+        """Send queued commands the buckets allow; returns how many were sent."""
+        now_ms = self.ticks_ms() if now_ms is None else int(now_ms)
+        self._refill(self._global, self.global_rate_per_s, self.global_burst, now_ms)
+        sent = 0
+        ranked = self._ranked()
+        start = 0
+        while start < len(ranked):
+            # Round-robin the destinations of one priority rank until each is drained or blocked.
+            end = start
+            while end < len(ranked) and ranked[end][0] == ranked[start][0]:
+                end += 1
+            active = [item[2] for item in ranked[start:end]]
+            while active:
+                for dest in tuple(active):
+                    if self._global.tokens < _TOKEN or (max_items is not None and sent >= int(max_items)):
+                        self._forget_idle(now_ms)
+                        return sent
+                    # Only the head may go: a blocked head (no tokens, or inside its
+                    # coalescing interval) holds back the rest of that destination's FIFO.
+                    if not self._key_ready(self._fifos[dest][0][5], now_ms) or not self._take(dest, now_ms):
+                        active.remove(dest)
+                        continue
+                    entry = self._remove(dest, 0)
+                    if dest not in self._fifos:
+                        active.remove(dest)
+                    self._run(entry, now_ms)
+                    sent += 1
+            start = end
+        self._forget_idle(now_ms)
+        return sent
+
+    def clear(self, dest=None):
+        """Drop queued commands (all, or one destination's); returns how many."""
+        if dest is None:
+            removed = self._depth
+            self._fifos = {}
+            self._order = []
+        else:
+            dest = tx_dest(dest)
+            removed = len(self._fifos.pop(dest, ()))
+            if removed:
+                self._order.remove(dest)
+        self._depth -= removed
+        self.dropped += removed
+        return removed
+
+    def stats(self):
+        counts = [0] * len(TX_PRIORITY_NAMES)
+        for fifo in self._fifos.values():
+            for entry in fifo:
+                counts[entry[6]] += 1
+        queues = {}
+        for index, name in enumerate(TX_PRIORITY_NAMES):
+            queues[name] = counts[index]
+        return {
+            "depth": len(self),
+            "capacity": int(self.capacity),
+            "high_watermark": int(self.high_watermark),
+            "queues": queues,
+            "destinations_waiting": len(self._fifos),
+            "sent": int(self.sent),
+            "immediate": int(self.immediate),
+            "queued": int(self.queued),
+            "dropped": int(self.dropped),
+            "refused": int(self.refused),
+            "coalesced": int(self.coalesced),
+            "coalesce_interval_ms": int(self.coalesce_interval_ms),
+            "errors": int(self.errors),
+            "last_error": self.last_error,
+            "latency_ms_max": int(self.latency_ms_max),
+            "mean_latency_ms": int(self.latency_ms_total) // self._queued_sent if self._queued_sent else 0,
+            "rate_per_s": int(self.rate_per_s),
+            "burst": int(self.burst),
+            "global_rate_per_s": int(self.global_rate_per_s),
+            "global_burst": int(self.global_burst),
+            "global_tokens": int(self._global.tokens) // _TOKEN,
+        }
@@ -0,0 +1,181 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import uzigbee
+from uzigbee import aio, network
+
+
+def _descriptor(short_addr, clusters, manufacturer_code=0x1234):
+    return {
+        "short_addr": int(short_addr),
+        "endpoint_ids": [1],
+        "active_endpoints": {"status": 0, "count": 1, "endpoints": [1]},
+        "node_descriptor": {"status": 0, "addr": int(short_addr), "node_desc": {"manufacturer_code": manufacturer_code}},
+        "simple_descriptors": [
+            {
+                "endpoint": 1,
+                "snapshot": {
+                    "status": 0,
+                    "addr": int(short_addr),
+                    "simple_desc": {
+                        "endpoint": 1,
+                        "profile_id": 0x0104,
+                        "device_id": 0x0100,
+                        "device_version": 1,
+                        "input_clusters": list(clusters),
+                        "output_clusters": [],
+                    },
+                },
+            }
+        ],
+        "power_descriptor": None,
+        "errors": [],
+    }
+
+
+class _Handle:
+    def __init__(self, outcome, polls):
+        self.outcome = outcome
+        self.polls = int(polls)
+
+    def poll(self):
+        self.polls -= 1
+        return self.polls < 0
+
+    def result(self):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+class _AsyncStack:
+    def __init__(self, polls=3):
+        self.polls = polls
+        self.descriptors = {}
+        self.started = []
+        self.ieee_by_short = {}
+
+    def start_node_discovery(self, dst_short_addr, endpoint_ids=None, include_power_desc=True, **kwargs):
+        self.started.append((int(dst_short_addr), endpoint_ids, bool(include_power_desc)))
+        outcome = self.descriptors[int(dst_short_addr)]
+        if callable(outcome):
+            outcome = outcome(include_power_desc)
+        return _Handle(outcome, self.polls)
+
+    def descriptor_events_supported(self):
+        return True
+
+    def get_last_joined_short_addr(self):
+        return None
+
+    def get_ieee_addr_by_short(self, short_addr):
+        return self.ieee_by_short.get(int(short_addr))
+
+
+def _facade(stack):
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, opportunistic_last_joined_scan=False)
+    return aio.AsyncCoordinator(coordinator, poll_ms=1).attach()
+
+
+def test_async_discover_device_yields_to_other_tasks():
+    stack = _AsyncStack(polls=5)
+    stack.descriptors[0x1234] = _descriptor(0x1234, [uzigbee.CLUSTER_ID_ON_OFF])
+    facade = _facade(stack)
+    ticks = []
+
+    async def _ticker():
+        for _ in range(3):
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def _main():
+        ticker = asyncio.ensure_future(_ticker())
+        device = await facade.discover_device(0x1234)
+        # The interview awaited between polls, so the other task already finished.
+        assert ticker.done()
+        return device
+
+    device = asyncio.run(_main())
+    assert device.short_addr == 0x1234
+    assert ticks == [0, 1, 2]
+    assert facade.get_device(0x1234) is device
+    event = facade.poll_event()
+    assert event["event"] == "device_added"
+    assert event["payload"]["short_addr"] == 0x1234
+
+
+def test_async_discover_device_retries_without_power_descriptor():
+    stack = _AsyncStack(polls=0)
+    good = _descriptor(0x2001, [uzigbee.CLUSTER_ID_ON_OFF])
+    stack.descriptors[0x2001] = lambda include_power: RuntimeError("power") if include_power else good
+    facade = _facade(stack)
+
+    device = asyncio.run(facade.discover_device(0x2001))
+    assert device.short_addr == 0x2001
+    assert [item[2] for item in stack.started] == [True, False]
+
+    stack.descriptors[0x2002] = RuntimeError("offline")
+    with pytest.raises(RuntimeError):
+        asyncio.run(facade.discover_device(0x2002, strict=True))
+
+
+def test_async_wait_for_device_with_background_task_and_event_stream():
+    stack = _AsyncStack(polls=2)
+    stack.descriptors[0x3001] = _descriptor(0x3001, [uzigbee.CLUSTER_ID_ON_OFF])
+    facade = _facade(stack)
+
+    async def _main():
+        facade.start_task(interval_ms=1)
+        missing = await facade.wait_for_device(feature="on_off", timeout_ms=5, default="missing")
+        assert missing == "missing"
+        facade.coordinator._queue_discovery(0x3001)
+        device = await facade.wait_for_device(feature="on_off", timeout_ms=2000)
+        facade.coordinator._handle_attribute(0x3001, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, True, 0x10, 0)
+        seen = []
+        async for event in facade:
+            seen.append(event["event"])
+            if len(seen) == 2:
+                break
+        assert await facade.next_event(timeout_ms=5) is None
+        facade.stop()
+        assert await facade.next_event() is None
+        return device, seen
+
+    device, seen = asyncio.run(_main())
+    assert device.short_addr == 0x3001
+    assert seen == ["device_added", "attribute"]
+    assert facade.stats()["ticks"] >= 1
+    assert facade.stats()["running"] is False
+
+
+def test_async_wait_for_device_drives_queue_without_task():
+    stack = _AsyncStack(polls=1)
+    stack.descriptors[0x4001] = _descriptor(0x4001, [uzigbee.CLUSTER_ID_ON_OFF])
+    facade = _facade(stack)
+    facade.coordinator._queue_discovery(0x4001)
+
+    device = asyncio.run(facade.wait_for_device(feature="on_off", timeout_ms=2000))
+    assert device.short_addr == 0x4001
+
+
+def test_async_discover_device_uses_interview_cache():
+    ieee = b"\x01\x02\x03\x04\x05\x06\x07\x08"
+    stack = _AsyncStack(polls=0)
+    stack.descriptors[0x5001] = _descriptor(0x5001, [uzigbee.CLUSTER_ID_ON_OFF])
+    stack.descriptors[0x5002] = _descriptor(0x5002, [uzigbee.CLUSTER_ID_ON_OFF])
+    stack.ieee_by_short = {0x5001: ieee, 0x5002: ieee}
+    facade = _facade(stack)
+
+    asyncio.run(facade.discover_device(0x5001))
+    device = asyncio.run(facade.discover_device(0x5002))
+    assert stack.started[-1] == (0x5002, (), False)
+    assert device.meta["discovered"]["cached"] is True
+    assert facade.discovery_stats()["cache_hits"] == 1
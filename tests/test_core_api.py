@@ -1,4 +1,5 @@
 import importlib
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -359,7 +360,7 @@ class _FakeUZigbee:
 
     def get_active_endpoints_snapshot(self):
         self.calls.append(("get_active_endpoints_snapshot",))
-        return (0, 2, (1, 242))
+        return (0, 2, (1, 242), 0x1234)
 
     def request_node_descriptor(self, dst_short_addr):
         self.calls.append(("request_node_descriptor", dst_short_addr))
@@ -648,6 +649,7 @@ def test_core_wrapper_calls():
     assert active_ep_snapshot["status"] == 0
     assert active_ep_snapshot["count"] == 2
     assert active_ep_snapshot["endpoints"] == [1, 242]
+    assert active_ep_snapshot["addr"] == 0x1234
     assert node_desc_snapshot["status"] == 0
     assert node_desc_snapshot["addr"] == 0x1234
     assert node_desc_snapshot["node_desc"]["manufacturer_code"] == 0x1234
@@ -668,6 +670,9 @@ def test_core_wrapper_calls():
     assert stats["enqueued"] == 7
     assert stats["dropped_queue_full"] == 1
     assert stats["dispatched"] == 6
+    assert stats["high_watermark"] == 2
+    assert stats["coalesced"] == 0
+    assert stats["capacity"] is None
     assert heap["free_8bit"] == 123456
     assert heap["min_free_8bit"] == 120000
     assert heap["largest_free_8bit"] == 110000
@@ -1228,3 +1233,262 @@ def test_ota_client_helpers_missing_in_firmware():
     with pytest.raises(core.ZigbeeError, match="ota_client_query_image_stop not available in firmware"):
         stack.ota_client_query_image_stop()
     assert stack.ota_client_control_supported() is False
+
+
+def _load_host_bench():
+    spec = importlib.util.spec_from_file_location("host_bench", ROOT / "tools" / "host_bench.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_start_node_discovery_evented_pipelines_simple_descriptors(monkeypatch):
+    core = importlib.import_module("uzigbee.core")
+    bench = _load_host_bench()
+    clock = bench.VirtualClock()
+    fake = bench.LatencyEventUZigbee(clock, {0x1234: (1, 2, 3, 242)}, latency_ms=50)
+    monkeypatch.setattr(core, "_uzigbee", fake)
+    monkeypatch.setattr(core, "_ticks_ms", clock.ticks_ms)
+    monkeypatch.setattr(core, "_sleep_ms", clock.sleep_ms)
+
+    handle = core.ZigbeeStack().start_node_discovery(0x1234, timeout_ms=1000, poll_ms=100)
+    assert handle.evented is True
+    assert handle.poll() is False
+    with pytest.raises(core.ZigbeeError, match="still in progress"):
+        handle.result()
+
+    clock.sleep_ms(50)
+    assert handle.poll() is False
+    clock.sleep_ms(50)
+    assert handle.poll() is True
+    result = handle.result()
+    assert result["endpoint_ids"] == [1, 2, 3]
+    assert [item["endpoint"] for item in result["simple_descriptors"]] == [1, 2, 3]
+    assert result["node_descriptor"]["addr"] == 0x1234
+    assert result["power_descriptor"] is not None
+    assert result["errors"] == []
+    assert handle.elapsed_ms() == 100
+    assert fake.requests == 6
+    assert core.ZigbeeStack()._descriptor_jobs == []
+
+
+def test_start_node_discovery_shares_simple_slots_across_interviews(monkeypatch):
+    core = importlib.import_module("uzigbee.core")
+    bench = _load_host_bench()
+    clock = bench.VirtualClock()
+    devices = {0x1001: (1, 2, 3, 4), 0x1002: (1, 2, 3, 4), 0x1003: (1, 2, 3, 4)}
+    fake = bench.LatencyEventUZigbee(clock, devices, latency_ms=50)
+    monkeypatch.setattr(core, "_uzigbee", fake)
+    monkeypatch.setattr(core, "_ticks_ms", clock.ticks_ms)
+    monkeypatch.setattr(core, "_sleep_ms", clock.sleep_ms)
+
+    stack = core.ZigbeeStack()
+    handles = [
+        stack.start_node_discovery(addr, endpoint_ids=[1, 2, 3, 4], include_power_desc=False, timeout_ms=1000, poll_ms=100)
+        for addr in sorted(devices)
+    ]
+    # Twelve simple requests across three interviews, but only eight firmware slots.
+    assert stack._simple_desc_inflight == core.SIMPLE_DESC_SLOTS
+    while not all([handle.poll() for handle in handles]):
+        clock.sleep_ms(10)
+    assert fake.peak_simple_pending == core.SIMPLE_DESC_SLOTS
+    assert fake.requests == 3 * 5
+    for handle in handles:
+        result = handle.result()
+        assert [item["endpoint"] for item in result["simple_descriptors"]] == [1, 2, 3, 4]
+        assert [item["snapshot"]["addr"] for item in result["simple_descriptors"]] == [handle.short_addr] * 4
+    assert stack._simple_desc_inflight == 0
+
+    # Slots still held by answers this host already gave up on: the firmware refuses, the job waits.
+    for slot in fake._simple_slots:
+        slot[0], slot[1], slot[2] = 0x2000, 1, 1
+    handle = stack.start_node_discovery(0x1001, endpoint_ids=[1], include_power_desc=False, timeout_ms=1000, poll_ms=100)
+    assert stack._simple_desc_inflight == 0
+    assert handle._queue == [(core.DESC_KIND_SIMPLE, 1)]
+    fake._simple_slots[3][2] = 0
+    result = handle.wait()
+    assert result["simple_descriptors"][0]["snapshot"]["addr"] == 0x1001
+    assert stack._simple_desc_inflight == 0
+
+
+def test_start_node_discovery_rejects_foreign_active_endpoints_snapshot(monkeypatch):
+    core = importlib.import_module("uzigbee.core")
+    bench = _load_host_bench()
+    clock = bench.VirtualClock()
+    fake = bench.LatencyEventUZigbee(clock, {0x1234: (1, 2), 0x5678: (7,)}, latency_ms=50)
+    monkeypatch.setattr(core, "_uzigbee", fake)
+    monkeypatch.setattr(core, "_ticks_ms", clock.ticks_ms)
+    monkeypatch.setattr(core, "_sleep_ms", clock.sleep_ms)
+
+    handle = core.ZigbeeStack().start_node_discovery(0x1234, include_power_desc=False, timeout_ms=1000, poll_ms=100)
+    requests = fake.requests
+    # Another interview's answer landed in the shared slot before this completion was dispatched.
+    fake._active = (0, 1, (7,), 0x5678)
+    handle._on_descriptor_event(core.DESC_KIND_ACTIVE_EP, 0, 0x1234, 0)
+    assert fake.requests == requests + 1
+
+    result = handle.wait()
+    assert result["endpoint_ids"] == [1, 2]
+    assert result["active_endpoints"]["addr"] == 0x1234
+
+def test_start_node_discovery_evented_timeout_strict(monkeypatch):
+    core = importlib.import_module("uzigbee.core")
+    bench = _load_host_bench()
+    clock = bench.VirtualClock()
+    fake = bench.LatencyEventUZigbee(clock, {0x1234: (1,)}, latency_ms=500)
+    monkeypatch.setattr(core, "_uzigbee", fake)
+    monkeypatch.setattr(core, "_ticks_ms", clock.ticks_ms)
+    monkeypatch.setattr(core, "_sleep_ms", clock.sleep_ms)
+
+    handle = core.ZigbeeStack().start_node_discovery(0x1234, endpoint_ids=[1], timeout_ms=100, poll_ms=20)
+    with pytest.raises(core.ZigbeeError, match="timeout waiting for node_descriptor snapshot"):
+        handle.wait()
+    assert handle.done() is True
+
+
+def test_start_node_discovery_await_and_polling_fallback(monkeypatch):
+    import asyncio
+
+    core = importlib.import_module("uzigbee.core")
+    bench = _load_host_bench()
+    clock = bench.VirtualClock()
+    fake = bench.LatencyUZigbee(clock, {0x1234: (1, 2)}, latency_ms=30)
+    monkeypatch.setattr(core, "_uzigbee", fake)
+    monkeypatch.setattr(core, "_ticks_ms", clock.ticks_ms)
+
+    handle = core.ZigbeeStack().start_node_discovery(0x1234, include_power_desc=False, timeout_ms=1000, poll_ms=10)
+    assert handle.evented is False
+
+    async def _wait():
+        return await handle
+
+    async def _drive():
+        task = asyncio.ensure_future(_wait())
+        while not task.done():
+            clock.sleep_ms(10)
+            await asyncio.sleep(0)
+        return task.result()
+
+    result = asyncio.run(_drive())
+    assert [item["endpoint"] for item in result["simple_descriptors"]] == [1, 2]
+    assert result["power_descriptor"] is None
+
+
+def test_on_attribute_batch_native_and_per_event_fallback(monkeypatch):
+    core = importlib.import_module("uzigbee.core")
+    bench = _load_host_bench()
+    received = []
+
+    native = bench.BatchUZigbee(native_batch=True)
+    monkeypatch.setattr(core, "_uzigbee", native)
+    assert core.ZigbeeStack().on_attribute_batch(received.append, max_batch=4) is True
+    assert native.max_batch == 4
+    native.replay([(0x1234, 1, 6, 0, True, 0x10, 0)] * 5)
+    assert [len(batch) for batch in received] == [4, 1]
+    singles = []
+    core.ZigbeeStack().on_attribute(lambda *event: singles.append(event))
+    native.replay([(0x1234, 1, 6, 0, False, 0x10, 0)] * 2)
+    assert len(received) == 3
+    assert singles == [(0x1234, 1, 6, 0, False, 0x10, 0)] * 2
+    with pytest.raises(ValueError, match="max_batch"):
+        core.ZigbeeStack().on_attribute_batch(received.append, max_batch=core.ATTR_BATCH_MAX + 1)
+
+    del received[:]
+    legacy = bench.BatchUZigbee(native_batch=False)
+    monkeypatch.setattr(core, "_uzigbee", legacy)
+    assert core.ZigbeeStack().on_attribute_batch(received.append) is False
+    legacy.callback(1, 6, 0, True, 0)
+    legacy.callback(1, 6, 0, True, 0x10, 0)
+    legacy.callback(0x1234, 1, 6, 0, False, 0x10, 0)
+    assert received == [
+        [(None, 1, 6, 0, True, None, 0)],
+        [(None, 1, 6, 0, True, 0x10, 0)],
+        [(0x1234, 1, 6, 0, False, 0x10, 0)],
+    ]
+
+
+def test_event_stats_reports_coalescing_and_capacity(monkeypatch):
+    core = importlib.import_module("uzigbee.core")
+    fake = _FakeUZigbee()
+    fake.get_event_stats = lambda: (40, 0, 0, 28, 9, 3, 12, 32)
+    monkeypatch.setattr(core, "_uzigbee", fake)
+
+    stats = core.ZigbeeStack().event_stats()
+    assert stats["coalesced"] == 12
+    assert stats["high_watermark"] == stats["max_depth"] == 9
+    assert stats["capacity"] == 32
+
+
+class _ReadAttrUZigbee:
+    def __init__(self, clock):
+        self.clock = clock
+        self.sent = []
+        self.callback = None
+        self._tsn = 0x40
+
+    def set_read_attr_callback(self, callback):
+        self.callback = callback
+
+    def send_read_attr_cmd(self, src_endpoint, dst_short_addr, dst_endpoint, cluster_id, attr_ids):
+        self._tsn = (self._tsn + 1) & 0xFF
+        self.sent.append((self._tsn, dst_short_addr, dst_endpoint, cluster_id, tuple(attr_ids)))
+        return self._tsn
+
+
+def test_start_read_attributes_correlates_records_by_tsn(monkeypatch):
+    core = importlib.import_module("uzigbee.core")
+    bench = _load_host_bench()
+    clock = bench.VirtualClock()
+    fake = _ReadAttrUZigbee(clock)
+    monkeypatch.setattr(core, "_uzigbee", fake)
+    monkeypatch.setattr(core, "_ticks_ms", clock.ticks_ms)
+    monkeypatch.setattr(core, "_sleep_ms", clock.sleep_ms)
+
+    stack = core.ZigbeeStack()
+    assert stack.read_attributes_supported() is True
+    level = stack.start_read_attributes(0x1234, 0x0008, [0x0000, 0x0011], dst_endpoint=2)
+    onoff = stack.start_read_attributes(0x1234, 0x0006, [0x0000])
+    assert [item[0] for item in fake.sent] == [level.tsn, onoff.tsn]
+    assert fake.sent[0][1:] == (0x1234, 2, 0x0008, (0x0000, 0x0011))
+
+    # Wrong source / unknown TSN records are ignored; each frame completes on its own ``last`` record.
+    fake.callback(onoff.tsn, 0x9999, 1, 0x0006, 0x0000, True, 0x10, 0, True)
+    fake.callback(0x01, 0x1234, 1, 0x0006, 0x0000, True, 0x10, 0, True)
+    assert onoff.poll() is False
+    fake.callback(level.tsn, 0x1234, 2, 0x0008, 0x0000, 200, 0x20, 0, False)
+    fake.callback(onoff.tsn, 0x1234, 1, 0x0006, 0x0000, False, 0x10, 0, True)
+    assert onoff.result()[0x0000] == {"status": 0, "value": False, "attr_type": 0x10}
+    assert level.poll() is False
+    fake.callback(level.tsn, 0x1234, 2, 0x0008, 0x0011, None, 0x20, 0x86, True)
+    result = level.wait()
+    assert result[0x0000]["value"] == 200
+    assert result[0x0011] == {"status": 0x86, "value": None, "attr_type": 0x20}
+    assert stack._read_jobs == {}
+
+
+def test_read_attributes_timeout_frame_failure_and_missing_firmware(monkeypatch):
+    core = importlib.import_module("uzigbee.core")
+    bench = _load_host_bench()
+    clock = bench.VirtualClock()
+    fake = _ReadAttrUZigbee(clock)
+    monkeypatch.setattr(core, "_uzigbee", fake)
+    monkeypatch.setattr(core, "_ticks_ms", clock.ticks_ms)
+    monkeypatch.setattr(core, "_sleep_ms", clock.sleep_ms)
+
+    stack = core.ZigbeeStack()
+    with pytest.raises(core.ZigbeeError, match="timeout waiting for read attributes response"):
+        stack.read_attributes(0x1234, 0x0402, [0x0000], timeout_ms=100)
+    assert clock.now_ms >= 100
+
+    handle = stack.start_read_attributes(0x1234, 0x0402, [0x0000])
+    fake.callback(handle.tsn, 0xFFFF, 1, 0x0402, 0xFFFF, None, 0, 0xC3, True)
+    with pytest.raises(core.ZigbeeError, match="status 0xc3"):
+        handle.result()
+
+    with pytest.raises(ValueError, match="attr_ids"):
+        stack.start_read_attributes(0x1234, 0x0402, list(range(core.READ_ATTR_MAX + 1)))
+
+    monkeypatch.setattr(core, "_uzigbee", _FakeUZigbee())
+    assert stack.read_attributes_supported() is False
+    with pytest.raises(core.ZigbeeError, match="set_read_attr_callback not available in firmware"):
+        stack.start_read_attributes(0x1234, 0x0402, [0x0000])
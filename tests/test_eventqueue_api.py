@@ -0,0 +1,66 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+
+def test_event_queue_fifo_wraps_and_drops_oldest():
+    eq = importlib.import_module("uzigbee.eventqueue")
+    queue = eq.EventQueue(capacity=3)
+    for item in range(5):
+        assert queue.push(item) is True
+    assert len(queue) == 3
+    assert queue.pop() == 2
+    queue.push(5)
+    assert queue.drain(2) == (3, 4)
+    assert queue.drain() == (5,)
+    assert queue.pop("empty") == "empty"
+    stats = queue.stats()
+    assert stats["dropped_oldest"] == 2
+    assert stats["overflow"] == 2
+    assert stats["high_watermark"] == 3
+    assert stats["pushed"] == 6
+
+
+def test_event_queue_drop_newest_and_drain_to():
+    eq = importlib.import_module("uzigbee.eventqueue")
+    queue = eq.EventQueue(capacity=2, policy=eq.QUEUE_DROP_NEWEST)
+    assert queue.push("a") is True
+    assert queue.push("b") is True
+    assert queue.push("c") is False
+    seen = []
+    assert queue.drain_to(seen.append, max_items=5) == 2
+    assert seen == ["a", "b"]
+    assert queue.drain(-1) == ()
+    assert queue.stats()["dropped_newest"] == 1
+
+    with pytest.raises(ValueError):
+        eq.EventQueue(policy="drop_random")
+
+
+def test_managers_report_event_queue_overflow():
+    uzigbee = importlib.import_module("uzigbee")
+    gateway = uzigbee.Gateway(coordinator=object(), event_queue_max=2, event_queue_policy="drop_newest")
+    for index in range(4):
+        gateway._emit("tick", {"index": index})
+    assert [row["payload"]["index"] for row in gateway.drain_events()] == [0, 1]
+    assert gateway.status()["event_queue"]["dropped_newest"] == 2
+
+    tl = importlib.import_module("uzigbee.touchlink")
+
+    class _Stack:
+        def on_signal(self, callback):
+            return None
+
+    manager = tl.TouchlinkManager(stack=_Stack(), event_queue_max=1)
+    manager.process_signal(tl.SIGNAL_TOUCHLINK_NWK_STARTED, 0)
+    manager.process_signal(tl.SIGNAL_TOUCHLINK_TARGET, 0)
+    status = manager.status()
+    assert status["event_queue_depth"] == 1
+    assert status["event_queue"]["overflow"] == 1
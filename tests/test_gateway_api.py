@@ -0,0 +1,314 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import uzigbee
+
+
+class _FakeCoordinator:
+    def get_device(self, short_addr, default=None):
+        return default
+
+    def discovery_stats(self):
+        return {}
+
+    def automation_stats(self):
+        return {}
+
+    def read_stats(self):
+        return {}
+
+    def transmit_stats(self):
+        return {}
+
+    def group_stats(self):
+        return {}
+
+    def pending_discovery(self):
+        return ()
+
+
+def _gateway(**kwargs):
+    gateway = uzigbee.Gateway(coordinator=_FakeCoordinator(), **kwargs)
+    switched = []
+
+    def _switch(command):
+        if command.get("fail"):
+            raise ValueError("switch failed")
+        switched.append(int(command["short_addr"], 0))
+        return {"short_addr": switched[-1]}
+
+    gateway.register_op("switch", _switch)
+    return gateway, switched
+
+
+def test_gateway_batch_runs_in_order_with_per_item_errors():
+    gateway, switched = _gateway()
+    response = gateway.process_command(
+        {
+            "op": "batch",
+            "id": 7,
+            "commands": [
+                {"op": "switch", "short_addr": "0x0001", "id": "a"},
+                {"op": "read", "short_addr": "0x0002", "metric": "on_off"},
+                {"op": "switch", "short_addr": "0x0003"},
+                {"op": "batch", "commands": []},
+                "bogus",
+            ],
+        }
+    )
+    assert response["ok"] is True
+    assert response["id"] == 7
+    result = response["result"]
+    assert (result["count"], result["ok"], result["failed"], result["skipped"]) == (5, 2, 3, 0)
+    items = result["results"]
+    assert [item["index"] for item in items] == [0, 1, 2, 3, 4]
+    assert items[0]["id"] == "a"
+    assert items[0]["result"] == {"short_addr": 1}
+    assert "device not found" in items[1]["error"]
+    assert items[3]["error"] == "nested batch not supported"
+    assert items[4]["ok"] is False
+    assert switched == [1, 3]
+
+
+def test_gateway_batch_stop_on_error_and_limits():
+    gateway, switched = _gateway(batch_max=3)
+    response = gateway.process_command(
+        {
+            "op": "batch",
+            "stop_on_error": True,
+            "commands": [
+                {"op": "switch", "short_addr": "0x0001"},
+                {"op": "switch", "short_addr": "0x0002", "fail": True},
+                {"op": "switch", "short_addr": "0x0003"},
+            ],
+        }
+    )
+    result = response["result"]
+    assert (result["ok"], result["failed"], result["skipped"]) == (1, 1, 1)
+    assert switched == [1]
+
+    too_many = gateway.process_command({"op": "batch", "commands": [{"op": "ping"}] * 4})
+    assert too_many["ok"] is False
+    assert "too large" in too_many["error"]
+    assert gateway.process_command({"op": "batch"})["ok"] is False
+
+
+def test_gateway_process_stream_writes_responses_as_commands_complete():
+    gateway, switched = _gateway()
+    frames = []
+
+    def _write(frame):
+        # Each response is written before the next command runs.
+        frames.append((json.loads(frame), tuple(switched)))
+
+    data = "\n".join(
+        [
+            json.dumps({"op": "switch", "short_addr": "0x0001", "id": 1}),
+            "{not json",
+            json.dumps(
+                {
+                    "op": "batch",
+                    "id": 2,
+                    "stream": True,
+                    "commands": [
+                        {"op": "switch", "short_addr": "0x0002", "id": "2a"},
+                        {"op": "switch", "short_addr": "0x0003", "id": "2b"},
+                    ],
+                }
+            ),
+            "",
+        ]
+    ).encode()
+    assert gateway.process_stream(data, _write) == 3
+
+    responses = [item[0] for item in frames]
+    assert [item.get("id") for item in responses] == [1, None, "2a", "2b", 2]
+    assert responses[1]["ok"] is False and responses[1]["error"].startswith("bad frame")
+    assert responses[2]["batch"] == 2 and frames[2][1] == (1, 2)
+    assert frames[3][1] == (1, 2, 3)
+    assert responses[4]["result"] == {"count": 2, "ok": 2, "failed": 0, "skipped": 0}
+
+    # Without a sink the stream flag is ignored and results are collected.
+    single = json.loads(gateway.process_frame(json.dumps({"op": "batch", "stream": True, "commands": [{"op": "ping"}]})))
+    assert single["result"]["results"][0]["result"]["status"] == "pong"
+
+
+def test_frame_stream_reassembles_chunks_and_interleaves_events():
+    gateway, switched = _gateway()
+    out = []
+    stream = gateway.open_stream(out.append, max_frame=64)
+    data = (
+        json.dumps({"op": "switch", "short_addr": "0x0001", "id": 1}) + "\r\n"
+        + json.dumps({"op": "ping", "id": 2}) + "\n\n"
+    ).encode()
+
+    dispatched = 0
+    for index in range(0, len(data), 5):
+        dispatched += stream.feed(data[index:index + 5])
+        if index == 0:
+            gateway._emit("signal", {"signal_id": 5, "status": 0})
+    assert dispatched == 2
+    lines = [json.loads(item) for item in out]
+    assert all(item.endswith(b"\n") for item in out)
+    assert lines[0]["id"] == 1 and lines[0]["ok"] is True
+    # The queued event is written right after the response that followed it.
+    assert lines[1]["event"] == "signal"
+    assert lines[2]["id"] == 2 and lines[2]["result"]["status"] == "pong"
+    assert switched == [1]
+    assert stream.pending_bytes() == 0
+
+
+def test_frame_stream_bounds_buffer_and_recovers_after_oversized_frame():
+    gateway, switched = _gateway()
+    out = []
+    stream = uzigbee.FrameStream(gateway, out.append, max_frame=32, forward_events=False)
+    stream.feed(b'{"op": "switch", "short_addr": "0x0001", "padding": "')
+    stream.feed(b"x" * 100)
+    assert stream.pending_bytes() == 0
+    stream.feed(b'"}\n{"op":"ping","id":9}\n')
+    lines = [json.loads(item) for item in out]
+    assert lines[0] == {"ok": False, "error": "frame too large"}
+    assert lines[1]["id"] == 9
+    assert switched == []
+
+    stream.feed(b"garbage\n")
+    assert json.loads(out[-1])["error"].startswith("bad frame")
+    stats = stream.stats()
+    assert stats["overflows"] == 1
+    assert stats["frames"] == 2
+    assert stats["peak_buffer"] <= 32
+    assert stats["bytes_in"] > 100
+
+
+def test_gateway_subscription_filters_events_before_building_payloads(monkeypatch):
+    gateway, _ = _gateway()
+    built = []
+    original = uzigbee.Gateway._attribute_payload
+    monkeypatch.setattr(uzigbee.Gateway, "_attribute_payload", lambda self, event: built.append(event) or original(self, event))
+    sub_id = gateway.subscribe(events="attribute", short_addr="0x1234", cluster_id=[0x0006])
+    gateway.subscribe(events=["signal"])
+
+    gateway._on_attribute(0x1234, 1, 0x0006, 0x0000, True, 0x10, 0)
+    gateway._on_attribute(0x1234, 1, 0x0702, 0x0400, 512, 0x2A, 0)
+    gateway._on_attribute(0x9999, 1, 0x0006, 0x0000, False, 0x10, 0)
+    gateway._on_signal(5, 0)
+
+    events = gateway.drain_events()
+    assert [item["event"] for item in events] == ["attribute", "signal"]
+    assert events[0]["payload"]["source_short_addr"] == 0x1234
+    assert len(built) == 1
+    assert gateway.event_stats()["filtered"] == 2
+
+    response = gateway.process_command({"op": "unsubscribe", "sub_id": sub_id})
+    assert response["result"]["removed"] == 1
+    response = gateway.process_command({"op": "subscribe", "events": "attribute", "attr_id": "0x0400"})
+    assert response["result"]["subscriptions"][-1]["attr_id"] == (0x0400,)
+    gateway._on_attribute(0x1234, 1, 0x0702, 0x0400, 600, 0x2A, 0)
+    assert gateway.poll_event()["payload"]["value"] == 600
+    assert gateway.unsubscribe() == 2
+    gateway._on_attribute(0x1234, 1, 0x0702, 0x0000, 1, 0x2A, 0)
+    assert gateway.poll_event() is not None
+
+
+def test_gateway_coalesces_attribute_bursts_into_latest_value(monkeypatch):
+    gateway_mod = sys.modules["uzigbee.gateway"]
+    now_ms = {"value": 1000}
+    monkeypatch.setattr(gateway_mod, "_ticks_ms", lambda: now_ms["value"])
+    gateway, _ = _gateway(coalesce_ms=100)
+
+    for value in range(5):
+        gateway._on_attribute(0x1234, 1, 0x0702, 0x0400, value, 0x2A, 0)
+        now_ms["value"] += 10
+    gateway._on_attribute(0x1234, 2, 0x0702, 0x0400, 77, 0x2A, 0)
+    # Still inside the window: nothing is queued yet.
+    assert gateway.poll_event() is None
+
+    now_ms["value"] = 1100
+    events = gateway.drain_events()
+    assert len(events) == 1
+    assert events[0]["payload"]["value"] == 4
+    assert events[0]["payload"]["coalesced"] == 5
+    assert events[0]["ts_ms"] == 1040
+
+    events = gateway.process_command({"op": "stats"})["result"]["events"]
+    assert events["coalesced"] == 4
+    assert events["suppressed"] == 4
+    assert events["coalesce_pending"] == 1
+
+    gateway.configure_coalescing(0)
+    assert gateway.poll_event()["payload"]["value"] == 77
+    gateway._on_attribute(0x1234, 1, 0x0702, 0x0400, 5, 0x2A, 0)
+    assert gateway.poll_event()["payload"]["value"] == 5
+
+
+def test_gateway_flushes_coalesced_events_for_push_consumers_from_idle_hook(monkeypatch):
+    gateway_mod = sys.modules["uzigbee.gateway"]
+    now_ms = {"value": 1000}
+    monkeypatch.setattr(gateway_mod, "_ticks_ms", lambda: now_ms["value"])
+
+    class _LoopCoordinator(_FakeCoordinator):
+        def __init__(self):
+            self.scheduler = uzigbee.scheduler.LaneScheduler(ticks_ms=lambda: now_ms["value"])
+
+        def on_signal(self, callback=None):
+            pass
+
+        on_attribute = on_device_added = on_device_updated = on_signal
+
+        def start(self, form_network=True):
+            pass
+
+    coordinator = _LoopCoordinator()
+    gateway = uzigbee.Gateway(coordinator=coordinator, coalesce_ms=100).start()
+    pushed = []
+    gateway.on_event(lambda event, payload: pushed.append(payload))
+
+    gateway._on_attribute(0x1234, 1, 0x0702, 0x0400, 1, 0x2A, 0)
+    now_ms["value"] += 50
+    gateway._on_attribute(0x1234, 2, 0x0702, 0x0400, 2, 0x2A, 0)
+    gateway._on_attribute(0x1234, 1, 0x0702, 0x0400, 3, 0x2A, 0)
+    assert coordinator.scheduler.run_once()["idle"] == ("attribute",)
+    assert pushed == []
+
+    # No further reports arrive; the loop alone releases each key as its window ends.
+    now_ms["value"] = 1100
+    coordinator.scheduler.run_once()
+    assert [(item["endpoint"], item["value"], item["coalesced"]) for item in pushed] == [(1, 3, 2)]
+    assert gateway.event_stats()["coalesce_pending"] == 1
+
+    now_ms["value"] = 1150
+    assert coordinator.scheduler.run_idle(uzigbee.LANE_ATTRIBUTE) is True
+    assert [item["endpoint"] for item in pushed] == [1, 2]
+    assert gateway.event_stats()["coalesce_pending"] == 0
+
+
+def test_gateway_coalesce_release_keeps_first_seen_order_without_front_pops(monkeypatch):
+    gateway_mod = sys.modules["uzigbee.gateway"]
+    now_ms = {"value": 1000}
+    monkeypatch.setattr(gateway_mod, "_ticks_ms", lambda: now_ms["value"])
+    gateway, _ = _gateway(coalesce_ms=100)
+
+    for attr_id in range(40):
+        gateway._on_attribute(0x1234, 1, 0x0702, attr_id, attr_id, 0x2A, 0)
+        now_ms["value"] += 2
+    # Only the first 20 keys (seen at 1000..1038) are due at 1139.
+    now_ms["value"] = 1139
+    assert gateway.flush_coalesced() == 20
+    assert len(gateway._coalesce_order) - gateway._coalesce_head == 20
+    assert gateway.event_stats()["coalesce_pending"] == 20
+    # A key released earlier starts a new window at the tail.
+    gateway._on_attribute(0x1234, 1, 0x0702, 0, 99, 0x2A, 0)
+    now_ms["value"] = 1400
+    assert gateway.flush_coalesced() == 21
+    values = [item["payload"]["value"] for item in gateway.drain_events()]
+    assert values == list(range(40)) + [99]
+    assert gateway._coalesce_order == []
+    assert gateway._coalesce_head == 0
@@ -0,0 +1,88 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_module():
+    root = Path(__file__).resolve().parents[1]
+    mod_path = root / "tools" / "host_bench.py"
+    spec = importlib.util.spec_from_file_location("host_bench", mod_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec is not None and spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_descriptor_discovery_bench_evented_beats_polling():
+    module = _load_module()
+    report = module.bench_descriptor_discovery(endpoints=4, latency_ms=120, poll_ms=200)
+    assert report["polling"]["simple_descriptors"] == 4
+    assert report["evented"]["simple_descriptors"] == 4
+    assert report["polling"]["requests"] == report["evented"]["requests"]
+    assert report["evented"]["wall_ms"] < report["polling"]["wall_ms"]
+    assert report["speedup"] > 2
+
+
+def test_discovery_pipeline_bench_keeps_interviews_in_flight():
+    module = _load_module()
+    report = module.bench_discovery_pipeline(devices=8, endpoints=2, latency_ms=100, inflight=4)
+    assert report["serial"]["registered"] == 8
+    assert report["pipelined"]["registered"] == 8
+    assert report["serial"]["peak_inflight"] == 1
+    assert report["pipelined"]["peak_inflight"] == 4
+    assert report["pipelined"]["interviews_per_min"] > report["serial"]["interviews_per_min"]
+    assert report["speedup"] > 2
+
+
+def test_state_cache_bench_stays_bounded_and_beats_scan():
+    module = _load_module()
+    report = module.bench_state_cache(sizes=(8, 512), reports=300)
+    assert report["reports"] == 300
+    for size in ("8", "512"):
+        row = report["sizes"][size]
+        assert row["cached"] == int(size)
+        assert row["cached_by_endpoint"] == int(size)
+    big = report["sizes"]["512"]
+    assert big["indexed_us_per_report"] < big["scan_us_per_report"]
+
+
+def test_state_memory_bench_records_are_smaller_than_meta_dicts():
+    module = _load_module()
+    report = module.bench_state_memory(attrs=32, reports=1000)
+    assert report["heap_probe"] in ("tracemalloc", "gc.mem_alloc")
+    assert report["record"]["bytes_per_attr"] < report["dict_meta"]["bytes_per_attr"]
+    assert "delta_per_1000_reports" in report["record"]
+
+
+def test_registry_restore_bench_heap_matches_scan_survivors():
+    module = _load_module()
+    report = module.bench_registry_restore(devices=120, max_devices=16)
+    assert report["same_survivors"] is True
+    assert report["heap"]["kept"] == 16
+    assert report["heap"]["evicted"] == report["scan"]["evicted"] == 104
+
+
+def test_attribute_batch_bench_cuts_callbacks():
+    module = _load_module()
+    report = module.bench_attribute_batch(devices=4, reports=64, max_batch=8)
+    assert report["per_event"]["callbacks"] == 64
+    assert report["batched"]["callbacks"] == 8
+    assert report["per_event"]["routed"] == report["batched"]["routed"] == 64
+
+
+def test_registry_snapshot_bench_streaming_lowers_save_peak():
+    module = _load_module()
+    report = module.bench_registry_snapshot(devices=64)
+    assert report["restored"] == 64
+    assert report["stream"]["save_peak_bytes"] < report["document"]["save_peak_bytes"]
+
+
+def test_gateway_stream_bench_dispatches_every_frame_with_bounded_buffer():
+    module = _load_module()
+    report = module.bench_gateway_stream(frames=200, max_chunk=32)
+    assert report["frames"] == 200
+    assert report["responses"] == 200
+    assert report["chunks"] > report["frames"]
+    assert 0 < report["peak_buffer_bytes"] <= report["max_frame"]
+    assert report["frames_per_s"] > 0
@@ -1,6 +1,9 @@
+import json
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 PYTHON_DIR = ROOT / "python"
 if str(PYTHON_DIR) not in sys.path:
@@ -874,6 +877,110 @@ def test_get_device_by_ieee_roundtrip_with_registry_persistence():
     assert second.short_addr == 0x7777
 
 
+def test_registry_indexes_follow_short_address_change_and_prune(monkeypatch):
+    now_ms = {"value": 1000}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    stack = _FakeStack()
+    ieee = b"\x10\x11\x12\x13\x14\x15\x16\x17"
+    stack._descriptors[0x7A7A] = _descriptor(0x7A7A, {1: [uzigbee.CLUSTER_ID_ON_OFF]}, ieee_addr=ieee)
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, max_devices=3)
+    coordinator.discover_device(0x7777)
+    coordinator.discover_device(0x1111)
+    assert [d.short_addr for d in coordinator.find_devices(feature="on_off")] == [0x1111, 0x7777]
+
+    now_ms["value"] += 10
+    moved = coordinator.discover_device(0x7A7A)
+    assert coordinator.get_device(0x7777) is None
+    assert coordinator.get_device_by_ieee(ieee) is moved
+    assert [d.short_addr for d in coordinator.find_devices(feature="on_off")] == [0x1111, 0x7A7A]
+    assert coordinator.find_devices(manufacturer_code=0x1A2B)[0].short_addr == 0x1111
+    assert coordinator.find_devices(profile_id=0x0104, device_id=0x0101)[0].short_addr == 0x1111
+    assert coordinator.find_devices(feature="on_off", manufacturer_code=0x9999) == ()
+
+    now_ms["value"] += 10
+    coordinator.discover_device(0x3333)
+    now_ms["value"] += 10
+    coordinator.discover_device(0x4444)
+    assert coordinator.get_device(0x1111) is None
+    assert coordinator.find_devices(manufacturer_code=0x1A2B) == ()
+    assert coordinator.find_devices(feature="temperature") == ()
+    assert [d.short_addr for d in coordinator.list_devices(online=True)] == [0x3333, 0x4444, 0x7A7A]
+
+    restored = network.Coordinator(stack=_FakeStack(), auto_discovery=False)
+    restored.restore_registry(coordinator.dump_registry(), merge=False)
+    assert restored.get_device_by_ieee(ieee).short_addr == 0x7A7A
+    assert [d.short_addr for d in restored.find_devices(feature="on_off")] == [0x3333, 0x4444, 0x7A7A]
+
+
+def _registry_device(short_addr, last_seen_ms, logical_type=None):
+    device = network.DiscoveredDevice(
+        stack=None,
+        short_addr=short_addr,
+        endpoint_clusters={1: {"input": (uzigbee.CLUSTER_ID_ON_OFF,), "output": ()}},
+        cluster_to_endpoint={uzigbee.CLUSTER_ID_ON_OFF: 1},
+        features=("on_off",),
+        identity=network.DeviceIdentity(short_addr=short_addr, logical_type=logical_type),
+    )
+    device.last_seen_ms = last_seen_ms
+    return device
+
+
+def test_registry_eviction_uses_fresh_last_seen_and_respects_pins():
+    registry = network.DeviceRegistry(max_devices=3, pinned=(0x0001,))
+    for short_addr in (0x0001, 0x0002, 0x0003):
+        registry.upsert(_registry_device(short_addr, 100 + short_addr))
+    registry.get(0x0002).last_seen_ms = 500
+
+    registry.upsert(_registry_device(0x0004, 400))
+    assert sorted(d.short_addr for d in registry.values()) == [0x0001, 0x0002, 0x0004]
+
+    registry.upsert(_registry_device(0x0005, 600))
+    assert sorted(d.short_addr for d in registry.values()) == [0x0001, 0x0002, 0x0005]
+    assert registry.stats()["evicted"] == 2
+
+    registry.unpin(0x0001)
+    registry.upsert(_registry_device(0x0006, 700))
+    assert registry.get(0x0001) is None
+
+
+def test_registry_never_evict_routers_and_callable_policy():
+    registry = network.DeviceRegistry(max_devices=2, eviction_policy="never_evict_routers")
+    registry.upsert(_registry_device(0x0010, 10, logical_type=1))
+    registry.upsert(_registry_device(0x0011, 20, logical_type=2))
+    registry.upsert(_registry_device(0x0012, 30, logical_type=2))
+    assert sorted(d.short_addr for d in registry.values()) == [0x0010, 0x0012]
+
+    registry.upsert(_registry_device(0x0013, 40, logical_type=1))
+    registry.upsert(_registry_device(0x0014, 50, logical_type=1))
+    assert len(registry) == 3
+    assert registry.stats()["eviction_blocked"] == 1
+
+    keep_odd = network.DeviceRegistry(max_devices=1, eviction_policy=lambda device: device.short_addr % 2 == 0)
+    keep_odd.upsert(_registry_device(0x0021, 1))
+    keep_odd.upsert(_registry_device(0x0022, 2))
+    assert keep_odd.get(0x0021) is not None
+    assert keep_odd.get(0x0022) is None
+
+    with pytest.raises(ValueError):
+        network.DeviceRegistry(eviction_policy="fifo")
+
+
+def test_restore_into_smaller_registry_keeps_recent_and_pinned_devices():
+    source = network.Coordinator(stack=_FakeStack(), auto_discovery=False, max_devices=64)
+    for index in range(40):
+        source.registry.upsert(_registry_device(0x5000 + index, 1000 + index))
+    source.pin_device(0x5000)
+    snapshot = source.dump_registry()
+    assert snapshot["pinned"] == [0x5000]
+
+    target = network.Coordinator(stack=_FakeStack(), auto_discovery=False, max_devices=8)
+    assert target.restore_registry(snapshot, merge=False) == 40
+    kept = sorted(d.short_addr for d in target.list_devices())
+    assert kept == [0x5000] + [0x5000 + index for index in range(33, 40)]
+    assert target.registry_stats()["evicted"] == 32
+    assert target.registry.pinned() == (0x5000,)
+
+
 def test_device_lifecycle_online_filters_and_manual_marking(monkeypatch):
     now_ms = {"value": 1000}
     monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
@@ -936,6 +1043,75 @@ def test_device_read_and_control_paths():
     assert onoff_meta["authoritative"] is False
 
 
+def test_control_commands_are_rate_limited_per_destination(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now[0])
+    stack = _FakeStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, tx_rate_per_s=10, tx_burst=1)
+    device = coordinator.discover_device(0x1111)
+    stack.calls.clear()
+
+    device.set_level(50)
+    device.on()
+    device.set_level(60)
+    sends = [call[0] for call in stack.calls if call[0].startswith("send_")]
+    assert sends == ["send_level_cmd"]
+    assert coordinator.transmit_stats()["queues"]["high"] == 1
+
+    now[0] += 100
+    assert coordinator.process_transmit() == 1
+    now[0] += 100
+    assert coordinator.process_transmit() == 1
+    sends = [call for call in stack.calls if call[0].startswith("send_")]
+    assert sends[1] == ("send_on_off_cmd", 0x1111, 1, 1, uzigbee.CMD_ON_OFF_ON)
+    assert sends[2][:3] == ("send_level_cmd", 0x1111, 60)
+    stats = coordinator.transmit_stats()
+    assert stats["depth"] == 0
+    assert stats["latency_ms_max"] == 200
+
+    assert coordinator.configure_transmit(rate_per_s=5, queue_max=4)["capacity"] == 4
+
+    # A full queue refuses the command and leaves the optimistic state alone.
+    coordinator.configure_transmit(queue_max=1)
+    device.on()
+    with pytest.raises(uzigbee.ZigbeeError):
+        device.off()
+    assert device.read.on_off() is True
+    assert coordinator.transmit_stats()["refused"] == 1
+
+
+def test_level_and_color_commands_coalesce_per_endpoint(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now[0])
+    stack = _FakeStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, tx_coalesce_interval_ms=200)
+    device = coordinator.discover_device(0x1111)
+    stack.calls.clear()
+
+    for value in (10, 40, 80, 120):
+        device.set_level(value, transition_ds=value // 10)
+        now[0] += 20
+    device.on()
+    levels = [call for call in stack.calls if call[0] == "send_level_cmd"]
+    assert [call[2] for call in levels] == [10]
+    assert device.read.level() == 120
+    # The held level keeps the destination queued; the on waits behind it to keep command order.
+    assert coordinator.process_transmit() == 0
+
+    now[0] += 200
+    # process_pending_discovery() also flushes queued commands for loops that never call run_once().
+    coordinator.process_pending_discovery()
+    levels = [call for call in stack.calls if call[0] == "send_level_cmd"]
+    assert [call[2] for call in levels] == [10, 120]
+    sends = [call for call in stack.calls if call[0] in ("send_level_cmd", "send_on_off_cmd")]
+    assert sends[-2:] == [
+        ("send_level_cmd", 0x1111, 120, 1, 1, 12, True),
+        ("send_on_off_cmd", 0x1111, 1, 1, uzigbee.CMD_ON_OFF_ON),
+    ]
+    assert coordinator.transmit_stats()["coalesced"] == 2
+    assert coordinator.configure_transmit(coalesce_interval_ms=0)["coalesce_interval_ms"] == 0
+
+
 def test_remote_direct_read_uses_cache_when_local_short_is_known():
     stack = _FakeStack()
     stack.get_short_addr = lambda: 0x0000
@@ -965,6 +1141,144 @@ def test_remote_direct_read_raises_when_cache_is_missing():
     assert not any(call and call[0] == "get_attribute" for call in stack.calls)
 
 
+class _ReadHandle:
+    def __init__(self, stack, short_addr, cluster_id, attr_ids, endpoint):
+        self.stack = stack
+        self.short_addr = int(short_addr)
+        self.cluster_id = int(cluster_id)
+        self.attr_ids = tuple(attr_ids)
+        self.endpoint = int(endpoint)
+
+    def wait(self):
+        self.stack.log.append("wait")
+        hook, self.stack.on_wait = self.stack.on_wait, None
+        if hook is not None:
+            hook()
+        out = {}
+        for attr_id in self.attr_ids:
+            value = self.stack._attr_values.get((self.endpoint, self.cluster_id, attr_id))
+            status = 0 if value is not None else 0x86
+            out[attr_id] = {"status": status, "value": value, "attr_type": 0x21 if status == 0 else None}
+        return out
+
+
+class _RemoteReadStack(_FakeStack):
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+        self.log = []
+        self.on_wait = None
+
+    def get_short_addr(self):
+        return 0x0000
+
+    def read_attributes_supported(self):
+        return True
+
+    def start_read_attributes(self, dst_short_addr, cluster_id, attr_ids, dst_endpoint=1, src_endpoint=1, timeout_ms=3000):
+        self.log.append("send")
+        self.frames.append((int(dst_short_addr), int(dst_endpoint), int(cluster_id), tuple(attr_ids)))
+        return _ReadHandle(self, dst_short_addr, cluster_id, attr_ids, dst_endpoint)
+
+
+def test_read_many_batches_attributes_per_cluster_frame():
+    stack = _RemoteReadStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False)
+    device = coordinator.discover_device(0x1111)
+
+    values = device.read.read_many(
+        ["on_off", "level", "temperature", (uzigbee.CLUSTER_ID_ON_OFF, 0x4003), "on_off"]
+    )
+    assert values == {
+        "on_off": True,
+        "level": 120,
+        "temperature": 2150,
+        (uzigbee.CLUSTER_ID_ON_OFF, 0x4003): None,
+    }
+    assert sorted(stack.frames) == [
+        (0x1111, 1, uzigbee.CLUSTER_ID_ON_OFF, (uzigbee.ATTR_ON_OFF_ON_OFF, 0x4003)),
+        (0x1111, 1, uzigbee.CLUSTER_ID_LEVEL_CONTROL, (uzigbee.ATTR_LEVEL_CONTROL_CURRENT_LEVEL,)),
+        (0x1111, 2, uzigbee.CLUSTER_ID_TEMP_MEASUREMENT, (uzigbee.ATTR_TEMP_MEASUREMENT_VALUE,)),
+    ]
+    # Every frame is on air before the first response is awaited.
+    assert stack.log == ["send"] * 3 + ["wait"] * 3
+    meta = device.state_info(uzigbee.CLUSTER_ID_TEMP_MEASUREMENT, uzigbee.ATTR_TEMP_MEASUREMENT_VALUE)
+    assert meta["source"] == "read"
+    assert meta["authoritative"] is True
+    assert device.read.temperature() == 21.5
+
+    del stack.frames[:]
+    assert device.read.read_many(["level"]) == {"level": 120}
+    assert stack.frames == []
+    device.read.read_many(["level"], use_cache=False)
+    assert len(stack.frames) == 1
+
+    with pytest.raises(ValueError, match="unknown read metric"):
+        device.read.read_many(["brightness"])
+
+
+def test_remote_direct_read_fetches_over_the_air_when_supported():
+    stack = _RemoteReadStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False)
+    device = coordinator.discover_device(0x1111)
+
+    assert device.temperature_sensor().read.temperature(use_cache=False) == 21.5
+    assert stack.frames == [(0x1111, 2, uzigbee.CLUSTER_ID_TEMP_MEASUREMENT, (uzigbee.ATTR_TEMP_MEASUREMENT_VALUE,))]
+    assert not any(call and call[0] == "get_attribute" for call in stack.calls)
+
+    del stack._attr_values[(1, uzigbee.CLUSTER_ID_LEVEL_CONTROL, uzigbee.ATTR_LEVEL_CONTROL_CURRENT_LEVEL)]
+    with pytest.raises(uzigbee.ZigbeeError, match="remote read failed"):
+        device.read.level()
+
+
+def test_remote_reads_are_single_flight_with_negative_cache():
+    stack = _RemoteReadStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False)
+    device = coordinator.discover_device(0x1111)
+    nested = []
+
+    # A second caller asking while the first frame is in flight shares it.
+    stack.on_wait = lambda: nested.append(device.read.level(use_cache=False))
+    assert device.read.level(use_cache=False) == 120
+    assert nested == [120]
+    assert len(stack.frames) == 1
+    assert device.read.level() == 120
+    stats = coordinator.read_stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"], stats["inflight"]) == (1, 1, 1, 0)
+
+    del stack._attr_values[(1, uzigbee.CLUSTER_ID_LEVEL_CONTROL, uzigbee.ATTR_LEVEL_CONTROL_CURRENT_LEVEL)]
+    for _ in range(3):
+        with pytest.raises(uzigbee.ZigbeeError, match="remote read failed"):
+            device.read.level(use_cache=False)
+    assert len(stack.frames) == 2
+    stats = coordinator.read_stats()
+    assert (stats["failures"], stats["negative_hits"], stats["negative_entries"]) == (1, 2, 1)
+
+    coordinator.configure_reads(negative_ttl_ms=0, clear=True)
+    for _ in range(2):
+        with pytest.raises(uzigbee.ZigbeeError):
+            device.read.level(use_cache=False)
+    assert len(stack.frames) == 4
+    assert coordinator.read_stats()["negative_entries"] == 0
+
+
+def test_negative_read_cache_expires(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now[0])
+    stack = _RemoteReadStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, read_negative_ttl_ms=500)
+    device = coordinator.discover_device(0x1111)
+    del stack._attr_values[(2, uzigbee.CLUSTER_ID_TEMP_MEASUREMENT, uzigbee.ATTR_TEMP_MEASUREMENT_VALUE)]
+
+    assert device.read.read_many(["temperature", "level"], use_cache=False) == {"temperature": None, "level": 120}
+    assert device.read.read_many(["temperature"], use_cache=False) == {"temperature": None}
+    assert len(stack.frames) == 2
+    now[0] += 500
+    device.read.read_many(["temperature"], use_cache=False)
+    assert len(stack.frames) == 3
+    assert coordinator.read_stats()["negative_hits"] == 1
+
+
 def test_state_engine_refresh_policy_refreshes_stale_cache(monkeypatch):
     now_ms = {"value": 1000}
     monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
@@ -1057,6 +1371,68 @@ def test_state_cache_max_prunes_oldest_entries(monkeypatch):
     assert device.get_state(last_key[0], last_key[1], default=None) == 8
 
 
+def test_state_cache_eviction_follows_write_order_after_restore(monkeypatch):
+    now_ms = {"value": 5000}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+
+    stack = _FakeStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, state_cache_max=8)
+    device = coordinator.discover_device(0x1111)
+    for idx in range(8):
+        device._write_state((0x9000 + idx, 0x0001), idx, source="test", endpoint_id=1, now_ms=1000 + idx)
+    device._write_state((0x9000, 0x0001), 100, source="test", endpoint_id=1, now_ms=2000)
+
+    restored = network.DiscoveredDevice.from_dict(device.to_dict(), stack=stack)
+    assert sorted(restored.state.keys()) == sorted(device.state.keys())
+    restored._write_state((0x9100, 0x0001), 1, source="test", endpoint_id=1, now_ms=3000)
+    restored._write_state((0x9101, 0x0001), 2, source="test", endpoint_id=1, now_ms=3001)
+
+    assert len(restored.state) == 8
+    assert len(restored.state_meta_by_endpoint) == 8
+    assert restored.get_state(0x9000, 0x0001) == 100
+    assert restored.get_state(0x9001, 0x0001) is None
+    assert restored.get_state(0x9002, 0x0001) is None
+    assert restored.get_state(0x9003, 0x0001, endpoint_id=1) == 3
+    assert restored.get_state(0x9101, 0x0001, endpoint_id=1) == 2
+
+
+def test_state_records_keep_meta_shapes_and_endpoint_isolation(monkeypatch):
+    monkeypatch.setattr(network, "_ticks_ms", lambda: 1000)
+    device = network.DiscoveredDevice(
+        stack=_FakeStack(),
+        short_addr=0x2222,
+        endpoint_clusters={1: {"input": (0x0006,), "output": ()}, 2: {"input": (0x0006,), "output": ()}},
+        cluster_to_endpoint={},
+        features=(),
+    )
+    device._write_state((0x0006, 0x0000), True, source="attribute", endpoint_id=1, now_ms=900, attr_type=0x10)
+    device._write_state((0x0006, 0x0000), False, source="control", authoritative=False, endpoint_id=2, now_ms=950)
+
+    assert device.state_info(0x0006, 0x0000) == {
+        "updated_ms": 950,
+        "source": "control",
+        "authoritative": False,
+        "stale": False,
+    }
+    assert device.state_info(0x0006, 0x0000, endpoint_id=1) == {
+        "updated_ms": 900,
+        "source": "attribute",
+        "authoritative": True,
+        "endpoint_id": 1,
+        "attr_type": 0x10,
+        "stale": False,
+    }
+    assert device.get_state(0x0006, 0x0000) is False
+    assert device.get_state(0x0006, 0x0000, endpoint_id=1) is True
+
+    snapshot = device.to_dict()
+    assert snapshot["state_meta"]["6:0"]["source"] == "control"
+    assert snapshot["state_meta_by_endpoint"]["1:6:0"]["endpoint_id"] == 1
+    restored = network.DiscoveredDevice.from_dict(snapshot, stack=device.stack)
+    assert restored.state_info(0x0006, 0x0000, endpoint_id=1) == device.state_info(0x0006, 0x0000, endpoint_id=1)
+    assert restored.to_dict()["state_meta_by_endpoint"] == snapshot["state_meta_by_endpoint"]
+
+
 def test_capability_matrix_advanced_read_wrappers():
     stack = _FakeStack()
     coordinator = network.Coordinator(stack=stack, auto_discovery=False)
@@ -1184,6 +1560,241 @@ def test_automation_auto_bind_executes_when_ieee_present():
     assert bind_meta["status"] in ("ok", "partial")
 
 
+class _GroupcastStack(_FakeStack):
+    def __init__(self):
+        super().__init__()
+        self.fail_group_add = set()
+        self.group_response_cb = None
+        self.unanswered = []
+
+    def set_group_response_callback(self, callback=None):
+        self.group_response_cb = callback
+        return True
+
+    def send_group_add_cmd(self, dst_short_addr, group_id, dst_endpoint=1, src_endpoint=1):
+        if int(dst_short_addr) in self.fail_group_add:
+            raise OSError("no route")
+        self.calls.append(("send_group_add_cmd", int(dst_short_addr), int(dst_endpoint), int(group_id)))
+        self.unanswered.append((int(dst_short_addr), int(dst_endpoint), int(group_id)))
+
+    def answer_group_adds(self, status=0x00, short_addr=None):
+        for request in tuple(self.unanswered):
+            if short_addr is None or request[0] == short_addr:
+                self.unanswered.remove(request)
+                self.group_response_cb(0x00, status, request[0], request[1], request[2])
+
+    def send_group_remove_cmd(self, dst_short_addr, group_id, dst_endpoint=1, src_endpoint=1):
+        self.calls.append(("send_group_remove_cmd", int(dst_short_addr), int(dst_endpoint), int(group_id)))
+
+    def groupcast_supported(self):
+        return True
+
+    def groupcast_on_off_cmd(self, group_id, src_endpoint=1, cmd_id=2):
+        self.calls.append(("groupcast_on_off_cmd", int(group_id), int(cmd_id)))
+
+    def groupcast_level_cmd(self, group_id, level, src_endpoint=1, transition_ds=0, with_onoff=True):
+        self.calls.append(("groupcast_level_cmd", int(group_id), int(level), int(transition_ds)))
+
+
+def _sent(stack, prefix):
+    return [call for call in stack.calls if call[0].startswith(prefix)]
+
+
+def test_group_manager_assigns_groups_and_groupcasts(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now[0])
+    stack = _GroupcastStack()
+    stack.fail_group_add.add(0x4444)
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False)
+    coordinator.start(form_network=True)
+    for short_addr in (0x1111, 0x3333, 0x4444):
+        coordinator.discover_device(short_addr)
+    groups = coordinator.groups
+
+    lights = groups.assign("on_off", "lights")
+    assert lights == 0x0100
+    # Sent is not joined: members are confirmed by the Add Group responses.
+    assert groups.members("lights") == ()
+    assert groups.groups()[lights]["pending"] == ((0x1111, 1), (0x3333, 1))
+    stack.answer_group_adds()
+    assert groups.members("lights") == ((0x1111, 1), (0x3333, 1))
+    assert groups.stats()["join_failures"] == 1
+
+    stack.calls.clear()
+    out = groups.on("lights")
+    # 0x4444 never confirmed the Add Group, so it still gets a unicast.
+    assert _sent(stack, "groupcast") == [("groupcast_on_off_cmd", lights, uzigbee.CMD_ON_OFF_ON)]
+    assert _sent(stack, "send_on_off_cmd") == [("send_on_off_cmd", 0x4444, 1, 1, uzigbee.CMD_ON_OFF_ON)]
+    assert out == {"group_id": lights, "groupcast": True, "unicast": 1, "members": 3, "frames": 2}
+    assert coordinator.get_device(0x3333).read.on_off() is True
+
+    stack.fail_group_add.clear()
+    stack.calls.clear()
+    assert groups.tag(0x1111, "kitchen") == 0
+    kitchen = groups.assign("kitchen")
+    groups.tag(0x4444, "kitchen")
+    stack.answer_group_adds()
+    assert groups.members("kitchen") == ((0x1111, 1), (0x4444, 1))
+    # Tagging re-ran the rules, so the earlier failed join was retried.
+    assert groups.groups_of(0x4444) == (lights, kitchen)
+
+    # An ad-hoc device list reuses the largest group that lies entirely inside it.
+    stack.calls.clear()
+    out = groups.off([0x4444, 0x1111])
+    assert _sent(stack, "groupcast") == [("groupcast_on_off_cmd", kitchen, uzigbee.CMD_ON_OFF_OFF)]
+    assert out["unicast"] == 0
+    out = groups.level("lights", 90, transition_ds=4)
+    assert _sent(stack, "groupcast")[-1] == ("groupcast_level_cmd", lights, 90, 4)
+    assert out["members"] == 1
+    assert coordinator.get_device(0x1111).read.level() == 90
+
+    # Devices discovered later join through the post-discovery automation.
+    coordinator.discover_device(0x7777)
+    assert coordinator.get_device(0x7777).meta["automation"]["groups_joined"] == 1
+    # Until the device answers it is unicast next to the groupcast, and re-asked only after the timeout.
+    stack.calls.clear()
+    assert groups.on("lights")["unicast"] == 1
+    assert _sent(stack, "send_on_off_cmd") == [("send_on_off_cmd", 0x7777, 1, 1, uzigbee.CMD_ON_OFF_ON)]
+    assert groups.sync(0x7777) == 0
+    now[0] += groups.join_timeout_ms
+    assert groups.sync(0x7777) == 1
+    stack.answer_group_adds(status=0x89, short_addr=0x7777)
+    assert (0x7777, 1) not in groups.members("lights")
+    now[0] += groups.join_timeout_ms
+    assert groups.sync(0x7777) == 1
+    stack.answer_group_adds()
+    assert (0x7777, 1) in groups.members("lights")
+
+    stats = groups.stats()
+    assert stats["groupcasts"] == 4
+    assert stats["frames_saved"] == 4
+    assert stats["join_retries"] == 1
+    assert stats["join_failures"] == 2
+    assert stats["pending"] == 0
+    assert groups.leave(0x7777, "lights") == (1,)
+    assert ("send_group_remove_cmd", 0x7777, 1, lights) in stack.calls
+
+
+def test_group_membership_persists_with_registry():
+    stack = _GroupcastStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False)
+    coordinator.start(form_network=True)
+    coordinator.discover_device(0x1111)
+    coordinator.discover_device(0x3333)
+    coordinator.groups.tag(0x3333, "hall")
+    coordinator.groups.assign("hall", group_id=0x0042)
+    stack.answer_group_adds()
+
+    snapshot = json.loads(json.dumps(coordinator.dump_registry()))
+    restored = network.Coordinator(stack=_FakeStack(), auto_discovery=False)
+    restored.restore_registry(snapshot)
+    assert restored.groups.members("hall") == ((0x3333, 1),)
+    assert restored.groups.tags(0x3333) == ("hall",)
+    assert restored.groups.groups()[0x0042]["tags"] == ("hall",)
+
+    # Firmware without groupcast falls back to unicast for every member.
+    restored.stack.calls.clear()
+    out = restored.groups.off(0x0042)
+    assert out["groupcast"] is False
+    assert _sent(restored.stack, "send_on_off_cmd") == [("send_on_off_cmd", 0x3333, 1, 1, uzigbee.CMD_ON_OFF_OFF)]
+    # The restored registry still routes control through the coordinator's transmit scheduler.
+    assert restored.get_device(0x3333)._tx is restored.transmit
+
+
+def test_group_commands_go_through_transmit_scheduler(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now[0])
+    stack = _GroupcastStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, tx_burst=1, tx_coalesce_interval_ms=0)
+    coordinator.start(form_network=True)
+    coordinator.discover_device(0x1111)
+    device = coordinator.get_device(0x1111)
+    device.on()
+    stack.calls.clear()
+
+    # Add Group waits behind the device's spent bucket at low priority.
+    lights = coordinator.groups.assign("on_off", "lights")
+    assert _sent(stack, "send_group_add_cmd") == []
+    assert coordinator.transmit.stats()["queues"]["low"] == 1
+    now[0] += 200
+    assert coordinator.process_transmit() == 1
+    stack.answer_group_adds()
+    assert coordinator.groups.members(lights) == ((0x1111, 1),)
+
+    # The group has its own bucket; a held group level is replaced, not repeated.
+    stack.calls.clear()
+    coordinator.groups.level(lights, 10)
+    coordinator.groups.level(lights, 20)
+    coordinator.groups.level(lights, 30)
+    assert _sent(stack, "groupcast") == [("groupcast_level_cmd", lights, 10, 0)]
+    assert coordinator.transmit.pending(("group", lights)) == 1
+    now[0] += 200
+    coordinator.process_transmit()
+    assert _sent(stack, "groupcast") == [("groupcast_level_cmd", lights, 10, 0), ("groupcast_level_cmd", lights, 30, 0)]
+    assert coordinator.transmit_stats()["coalesced"] == 1
+
+    # A member with a unicast level (with on/off) still queued must not see it after a group off.
+    stack.calls.clear()
+    now[0] += 200
+    device.control.level(50)
+    device.control.level(60)
+    assert coordinator.transmit.pending(0x1111) == 1
+    out = coordinator.groups.off(lights)
+    assert out["groupcast"] is False
+    assert out["unicast"] == 1
+    assert _sent(stack, "groupcast") == []
+    assert coordinator.group_stats()["groupcasts_held"] == 1
+    for _ in range(2):
+        now[0] += 200
+        coordinator.process_transmit()
+    assert [call[0] for call in _sent(stack, "send_")] == ["send_level_cmd", "send_level_cmd", "send_on_off_cmd"]
+    assert _sent(stack, "send_level_cmd")[-1][2] == 60
+    assert _sent(stack, "send_on_off_cmd")[-1][-1] == uzigbee.CMD_ON_OFF_OFF
+
+    # Once the member's queue is drained the group command is groupcast again.
+    now[0] += 200
+    assert coordinator.groups.off(lights)["groupcast"] is True
+
+
+def test_group_records_follow_rejoin_and_drop_with_device(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now[0])
+    stack = _GroupcastStack()
+    ieee = b"\x10\x11\x12\x13\x14\x15\x16\x17"
+    stack._descriptors[0x7A7A] = _descriptor(0x7A7A, {1: [uzigbee.CLUSTER_ID_ON_OFF]}, ieee_addr=ieee)
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, max_devices=3)
+    coordinator.start(form_network=True)
+    coordinator.discover_device(0x7777)
+    coordinator.discover_device(0x1111)
+    groups = coordinator.groups
+    groups.tag(0x7777, "porch")
+    porch = groups.assign("porch")
+    stack.answer_group_adds()
+    assert groups.members(porch) == ((0x7777, 1),)
+
+    # The same radio rejoined under a new short address: its group table came along.
+    stack.calls.clear()
+    now[0] += 10
+    coordinator.discover_device(0x7A7A)
+    assert groups.members(porch) == ((0x7A7A, 1),)
+    assert groups.tags(0x7A7A) == ("porch",)
+    assert groups.tags(0x7777) == ()
+    assert _sent(stack, "send_group_add_cmd") == []
+
+    groups.tag(0x1111, "porch")
+    stack.answer_group_adds()
+    coordinator.registry.remove(0x1111)
+    assert groups.members(porch) == ((0x7A7A, 1),)
+    assert groups.tags(0x1111) == ()
+
+    # Evicted devices are forgotten too.
+    for short_addr in (0x3333, 0x4444, 0x6666):
+        now[0] += 10
+        coordinator.discover_device(short_addr)
+    assert coordinator.get_device(0x7A7A) is None
+    assert groups.members(porch) == ()
+    assert groups.stats()["tagged_devices"] == 0
+
 def test_registry_dump_restore_roundtrip():
     stack = _FakeStack()
     coordinator = network.Coordinator(stack=stack, auto_discovery=False)
@@ -1245,6 +1856,163 @@ def test_registry_save_load_with_write_throttle(tmp_path, monkeypatch):
     assert loaded.get_device(0x1111) is not None
 
 
+def test_registry_snapshot_streams_one_line_per_device(tmp_path):
+    db_path = tmp_path / "uzigbee_registry.json"
+    coordinator = network.Coordinator(stack=_FakeStack(), auto_discovery=False, persistence_path=str(db_path))
+    coordinator.discover_device(0x1111)
+    coordinator.discover_device(0x3333)
+    coordinator.pin_device(0x3333)
+
+    saved = coordinator.save_registry(force=True)
+    assert saved["count"] == 2
+    lines = db_path.read_bytes()[33:].decode().splitlines()
+    head = json.loads(lines[0])
+    assert head["format"] == "ndjson"
+    assert head["count"] == 2
+    assert head["pinned"] == [0x3333]
+    assert "devices" not in head
+    assert sorted(json.loads(line)["short_addr"] for line in lines[1:]) == [0x1111, 0x3333]
+
+    loaded = network.Coordinator(stack=_FakeStack(), auto_discovery=False, persistence_path=str(db_path))
+    result = loaded.load_registry()
+    assert result["restored"] == 2
+    assert result["source"] == "primary"
+    assert loaded.registry.pinned() == (0x3333,)
+    assert loaded.dump_registry()["devices"] == coordinator.dump_registry()["devices"]
+
+
+def test_registry_load_accepts_single_document_snapshot(tmp_path):
+    source = network.Coordinator(stack=_FakeStack(), auto_discovery=False)
+    source.discover_device(0x1111)
+    db_path = tmp_path / "uzigbee_registry.json"
+    db_path.write_text(json.dumps(source.dump_registry(), indent=2))
+
+    loaded = network.Coordinator(stack=_FakeStack(), auto_discovery=False, persistence_path=str(db_path))
+    result = loaded.load_registry()
+    assert result["source"] == "legacy"
+    assert result["restored"] == 1
+    assert loaded.get_device(0x1111) is not None
+
+
+def test_registry_journal_appends_deltas_and_replays(tmp_path):
+    db_path = tmp_path / "uzigbee_registry.json"
+    journal = tmp_path / "uzigbee_registry.json.journal"
+    key = (uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF)
+    coordinator = network.Coordinator(
+        stack=_FakeStack(),
+        auto_discovery=False,
+        persistence_path=str(db_path),
+        persistence_mode="journal",
+        journal_compact_bytes=4096,
+    )
+    coordinator.discover_device(0x1111)
+    coordinator.discover_device(0x3333)
+
+    base = coordinator.save_registry(force=True)
+    assert base["compacted"] is True
+    assert base["bytes"] == db_path.stat().st_size
+    assert not journal.exists()
+
+    assert coordinator.save_registry(force=True)["bytes"] == 0
+
+    coordinator._handle_attribute(0x3333, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, False, 0x10, 0)
+    coordinator.registry.remove(0x1111)
+    delta = coordinator.save_registry(force=True)
+    assert delta["compacted"] is False
+    assert delta["records"] == 2
+    assert 0 < delta["bytes"] < base["bytes"]
+    with open(journal, "a") as fp:
+        fp.write('{"op": "put", "dev')
+
+    loaded = network.Coordinator(
+        stack=_FakeStack(),
+        auto_discovery=False,
+        persistence_path=str(db_path),
+        persistence_mode="journal",
+    )
+    result = loaded.load_registry()
+    assert result["restored"] == 2
+    assert result["journal_records"] == 2
+    assert result["journal_torn"] is True
+    assert result["load_ms"] >= 0
+    assert loaded.get_device(0x1111) is None
+    assert loaded.get_device(0x3333).state[key] is False
+    # The torn tail was compacted away on load, so new deltas are not appended behind it.
+    assert not journal.exists()
+    assert loaded.save_registry(force=True)["bytes"] == 0
+
+    loaded._handle_attribute(0x3333, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, True, 0x10, 0)
+    assert loaded.save_registry(force=True)["records"] == 1
+    reloaded = network.Coordinator(
+        stack=_FakeStack(),
+        auto_discovery=False,
+        persistence_path=str(db_path),
+        persistence_mode="journal",
+    )
+    result = reloaded.load_registry()
+    assert result["journal_torn"] is False
+    assert result["journal_records"] == 1
+    assert reloaded.get_device(0x3333).state[key] is True
+
+    # An appender never glues a record onto a partial line left in the file.
+    with open(journal, "a") as fp:
+        fp.write('{"op": "put", "dev')
+    loaded._handle_attribute(0x3333, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, False, 0x10, 0)
+    loaded.save_registry(force=True)
+    with open(journal) as fp:
+        assert fp.read().splitlines()[-2] == '{"op": "put", "dev'
+
+    loaded.journal_compact_bytes = 1
+    assert loaded.save_registry(force=True)["compacted"] is True
+    assert not journal.exists()
+    with pytest.raises(ValueError):
+        network.Coordinator(stack=_FakeStack(), persistence_mode="wal")
+
+
+def test_coordinator_autosave_coalesces_reports_and_defers_throttled_saves(tmp_path, monkeypatch):
+    now_ms = {"value": 10000}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    db_path = tmp_path / "uzigbee_registry.json"
+    coordinator = network.Coordinator(
+        stack=_FakeStack(),
+        auto_discovery=False,
+        persistence_path=str(db_path),
+        persistence_mode="journal",
+        persistence_min_interval_ms=5000,
+        autosave_interval_ms=5000,
+        opportunistic_last_joined_scan=False,
+    )
+    coordinator.discover_device(0x1111)
+    coordinator.discover_device(0x3333)
+    first = coordinator.poll_autosave()
+    assert first["compacted"] is True
+
+    for index in range(100):
+        coordinator._handle_attribute(0x3333, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, bool(index & 1), 0x10, 0)
+    assert coordinator.autosave_stats()["dirty"] == (0x3333,)
+    assert coordinator.poll_autosave() is None
+
+    throttled = coordinator.save_registry()
+    assert throttled["saved"] is False
+    assert throttled["deferred"] is True
+
+    now_ms["value"] += 5000
+    coordinator.process_pending_discovery()
+    flushed = coordinator.autosave_stats()
+    assert flushed["flushes"] == 2
+    assert flushed["dirty"] == ()
+    assert coordinator._autosave.last_result["records"] == 1
+
+    coordinator.pin_device(0x1111)
+    now_ms["value"] += 5000
+    assert coordinator.flush_autosave()["records"] == 1
+
+    loaded = network.Coordinator(stack=_FakeStack(), auto_discovery=False, persistence_path=str(db_path))
+    loaded.load_registry()
+    assert loaded.get_device(0x3333).state[(uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF)] is True
+    assert loaded.registry.pinned() == (0x1111,)
+
+
 def test_registry_restore_restores_network_profile():
     source = network.Coordinator(
         stack=_FakeStack(),
@@ -1310,6 +2078,71 @@ def test_attribute_callback_with_source_short_updates_only_target():
     assert b_meta["attr_type"] == 0x10
 
 
+def test_attribute_without_source_routes_by_index_and_counts_ambiguous():
+    stack = _FakeStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False)
+    device_a = coordinator.discover_device(0x1111)
+    device_b = coordinator.discover_device(0x3333)
+    key = (uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF)
+    before_a = device_a.state.get(key)
+    before_b = device_b.state.get(key)
+
+    coordinator._handle_attribute(1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, not before_a, 0)
+    coordinator._handle_attribute(9, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, False, 0)
+    coordinator._handle_attribute(0x4444, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, False, 0x10, 0)
+
+    assert device_a.state.get(key) == before_a
+    assert device_b.state.get(key) == before_b
+    assert coordinator.attribute_route_stats() == {"routed": 0, "unrouted": 2, "ambiguous": 1}
+
+    coordinator._handle_attribute(0x3333, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, False, 0x10, 0)
+    assert coordinator.attribute_route_stats()["routed"] == 1
+
+
+def test_attribute_batch_handler_applies_each_record_and_user_callback():
+    stack = _FakeStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False)
+    device_a = coordinator.discover_device(0x1111)
+    device_b = coordinator.discover_device(0x3333)
+    seen = []
+    coordinator.on_attribute(lambda *event: seen.append(event))
+    key = (uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF)
+
+    coordinator._handle_attribute_batch([
+        (0x1111, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, False, 0x10, 0),
+        (0x3333, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, True, 0x10, 0),
+        (0x3333, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, False, 0x10, 0x86),
+    ])
+
+    assert device_a.state[key] is False
+    assert device_b.state[key] is True
+    assert len(seen) == 3
+    assert coordinator.attribute_route_stats()["routed"] == 2
+
+
+def test_registry_route_index_tracks_upsert_and_prune(monkeypatch):
+    now_ms = {"value": 1000}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    stack = _FakeStack()
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, max_devices=2)
+    device_a = coordinator.discover_device(0x1111)
+    now_ms["value"] += 10
+    device_b = coordinator.discover_device(0x3333)
+    route = (1, uzigbee.CLUSTER_ID_ON_OFF)
+    assert coordinator.registry.route(*route) == (device_a, device_b)
+
+    refreshed = coordinator.discover_device(0x1111)
+    assert coordinator.registry.route(*route) == (device_b, refreshed)
+
+    now_ms["value"] += 10
+    coordinator.registry.get(0x1111).last_seen_ms = now_ms["value"]
+    coordinator.discover_device(0x8888)
+    assert coordinator.registry.get(0x3333) is None
+    assert device_b not in coordinator.registry.route(*route)
+    assert coordinator.registry.route(2, uzigbee.CLUSTER_ID_ON_OFF) == (coordinator.registry.get(0x8888),)
+    assert coordinator.registry.route(7, 0x1234) == ()
+
+
 def test_attribute_callback_with_source_short_routes_to_matching_endpoint():
     stack = _FakeStack()
     coordinator = network.Coordinator(stack=stack, auto_discovery=False)
@@ -1589,3 +2422,357 @@ def test_auto_discovery_ignores_unknown_short_fffe():
 
     discover_calls = [call for call in stack.calls if call and call[0] == "discover_node_descriptors"]
     assert discover_calls == []
+
+
+class _PipelineHandle:
+    def __init__(self, short_addr, include_power_desc, outcome):
+        self.short_addr = short_addr
+        self.include_power_desc = include_power_desc
+        self.outcome = outcome
+        self.ready = False
+
+    def poll(self):
+        return self.ready
+
+    def result(self):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+class _PipelineStack(_FakeStack):
+    def __init__(self, outcomes, evented=True):
+        super().__init__()
+        self.outcomes = outcomes
+        self.evented = evented
+        self.handles = []
+
+    def descriptor_events_supported(self):
+        return self.evented
+
+    def start_node_discovery(self, dst_short_addr, include_power_desc=True, **kwargs):
+        outcome = self.outcomes[int(dst_short_addr)]
+        if callable(outcome):
+            outcome = outcome(include_power_desc)
+        handle = _PipelineHandle(int(dst_short_addr), include_power_desc, outcome)
+        self.handles.append(handle)
+        return handle
+
+
+def test_discovery_pipeline_caps_inflight_and_tracks_throughput(monkeypatch):
+    now_ms = {"value": 1000}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    outcomes = dict(
+        (short_addr, _descriptor(short_addr, {1: [0x0006]}))
+        for short_addr in (0x1001, 0x1002, 0x1003, 0x1004)
+    )
+    stack = _PipelineStack(outcomes)
+    coordinator = uzigbee.Coordinator(stack=stack, discovery_max_inflight=3, opportunistic_last_joined_scan=False)
+    for short_addr in outcomes:
+        coordinator._queue_discovery(short_addr, now_ms=now_ms["value"])
+
+    out = coordinator.process_pending_discovery(max_items=8)
+    assert out["started"] == 3
+    assert out["inflight"] == 3
+    assert out["processed"] == 0
+    assert coordinator.discovery_stats()["inflight"] == 3
+
+    now_ms["value"] += 400
+    for handle in stack.handles:
+        handle.ready = True
+    out = coordinator.process_pending_discovery(max_items=8)
+    assert out["success"] == 3
+    assert out["started"] == 1
+    assert len(coordinator.registry) == 3
+
+    now_ms["value"] += 200
+    stack.handles[-1].ready = True
+    out = coordinator.process_pending_discovery(max_items=8)
+    assert out["success"] == 1
+    assert coordinator.pending_discovery() == ()
+
+    stats = coordinator.discovery_stats()
+    assert stats["success"] == 4
+    assert stats["attempts"] == 4
+    assert stats["mean_interview_ms"] == (3 * 400 + 200) // 4
+    assert stats["interview_ms_max"] == 400
+    assert stats["interviews_per_min"] == (4 * 60000) // 600
+
+
+def test_discovery_pipeline_serialises_without_descriptor_events(monkeypatch):
+    now_ms = {"value": 0}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    outcomes = {0x2001: _descriptor(0x2001, {1: [0x0006]}), 0x2002: _descriptor(0x2002, {1: [0x0006]})}
+    stack = _PipelineStack(outcomes, evented=False)
+    coordinator = uzigbee.Coordinator(stack=stack, discovery_max_inflight=4, opportunistic_last_joined_scan=False)
+    coordinator._queue_discovery(0x2001, now_ms=0)
+    coordinator._queue_discovery(0x2002, now_ms=0)
+
+    out = coordinator.process_pending_discovery(max_items=4)
+    assert out["started"] == 1
+    assert out["inflight"] == 1
+
+
+def test_discovery_pipeline_retry_and_power_fallback(monkeypatch):
+    now_ms = {"value": 0}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    good = _descriptor(0x3001, {1: [0x0006]})
+    stack = _PipelineStack(
+        {
+            0x3001: lambda include_power: RuntimeError("power desc failed") if include_power else good,
+            0x3002: RuntimeError("offline"),
+        }
+    )
+    coordinator = uzigbee.Coordinator(
+        stack=stack,
+        discovery_retry_max=1,
+        discovery_retry_base_ms=100,
+        opportunistic_last_joined_scan=False,
+    )
+    coordinator._queue_discovery(0x3001, now_ms=0)
+    coordinator._queue_discovery(0x3002, now_ms=0)
+    coordinator.process_pending_discovery(max_items=4)
+
+    for handle in stack.handles:
+        handle.ready = True
+    out = coordinator.process_pending_discovery(max_items=4)
+    assert out["processed"] == 0
+    assert [handle.include_power_desc for handle in stack.handles] == [True, True, False, False]
+
+    for handle in stack.handles:
+        handle.ready = True
+    out = coordinator.process_pending_discovery(max_items=4)
+    assert out["success"] == 1
+    assert out["failed"] == 1
+    assert coordinator.get_device(0x3001) is not None
+
+    stats = coordinator.discovery_stats()
+    assert stats["requeued"] == 1
+    pending = coordinator.pending_discovery()
+    assert [item["short_addr"] for item in pending] == [0x3002]
+    assert pending[0]["next_try_ms"] == 100
+
+    now_ms["value"] = 100
+    coordinator.process_pending_discovery(max_items=4)
+    for _ in range(2):
+        stack.handles[-1].ready = True
+        coordinator.process_pending_discovery(max_items=4)
+    stats = coordinator.discovery_stats()
+    assert stats["gave_up"] == 1
+    assert stats["last_error"]["short_addr"] == 0x3002
+    assert coordinator.pending_discovery() == ()
+
+
+class _IeeeStack(_FakeStack):
+    def __init__(self):
+        super().__init__()
+        self.ieee_by_short = {}
+
+    def get_ieee_addr_by_short(self, short_addr):
+        return self.ieee_by_short.get(int(short_addr))
+
+
+def test_interview_cache_restores_rejoined_device_after_one_verify_request():
+    ieee = b"\x00\x11\x22\x33\x44\x55\x66\x77"
+    stack = _IeeeStack()
+    stack.ieee_by_short[0x1111] = ieee
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, opportunistic_last_joined_scan=False)
+    coordinator.discover_device(0x1111)
+    assert coordinator.discovery_stats()["cache_misses"] == 1
+    assert coordinator.get_device(0x1111).identity.ieee_addr == ieee
+
+    # Same radio re-announces under a new short address.
+    stack._descriptors[0x5555] = stack._descriptors[0x1111]
+    stack.ieee_by_short[0x5555] = ieee
+    stack.calls = []
+    device = coordinator.discover_device(0x5555)
+    discover_calls = [call for call in stack.calls if call[0] == "discover_node_descriptors"]
+    assert len(discover_calls) == 1
+    assert discover_calls[0][2] == ()
+    assert discover_calls[0][3] is False
+    assert device.meta["discovered"]["cached"] is True
+    assert device.short_addr == 0x5555
+    assert device.identity.manufacturer_code == 0x1A2B
+    assert device.identity.power_source == 0x03
+    assert device.endpoints_for(uzigbee.CLUSTER_ID_TEMP_MEASUREMENT) == (2,)
+    assert coordinator.get_device(0x1111) is None
+
+    stats = coordinator.discovery_stats()
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 1
+    assert stats["cache_entries"] == 1
+
+
+def test_interview_cache_verify_mismatch_falls_back_to_full_interview():
+    ieee = b"\x00\x11\x22\x33\x44\x55\x66\x77"
+    stack = _IeeeStack()
+    stack.ieee_by_short[0x1111] = ieee
+    coordinator = network.Coordinator(stack=stack, auto_discovery=False, opportunistic_last_joined_scan=False)
+    coordinator.discover_device(0x1111)
+
+    stack.ieee_by_short[0x3333] = ieee
+    stack.calls = []
+    device = coordinator.discover_device(0x3333)
+    discover_calls = [call for call in stack.calls if call[0] == "discover_node_descriptors"]
+    assert [call[2] for call in discover_calls] == [(), None]
+    assert "cached" not in device.meta["discovered"]
+    assert device.endpoints_for(uzigbee.CLUSTER_ID_ON_OFF) == (1,)
+
+    stats = coordinator.discovery_stats()
+    assert stats["cache_hits"] == 0
+    assert stats["cache_verify_failed"] == 1
+    assert stats["cache_misses"] == 2
+
+
+def test_interview_cache_is_seeded_from_registry_snapshot_and_shares_templates(tmp_path, monkeypatch):
+    now_ms = {"value": 0}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    db_path = tmp_path / "uzigbee_registry.json"
+    source = network.Coordinator(stack=_IeeeStack(), auto_discovery=False, persistence_path=str(db_path))
+    for index, short_addr in enumerate((0x4001, 0x4002, 0x4003)):
+        source.stack._descriptors[short_addr] = _descriptor(short_addr, {1: [uzigbee.CLUSTER_ID_ON_OFF]})
+        source.stack.ieee_by_short[short_addr] = bytes((0xA0, index, 0, 0, 0, 0, 0, 1))
+        source.discover_device(short_addr)
+    assert source.interview_cache.stats()["templates"] == 1
+    source.save_registry(force=True)
+
+    outcomes = {0x5001: _descriptor(0x5001, {1: [uzigbee.CLUSTER_ID_ON_OFF]})}
+    stack = _PipelineStack(outcomes)
+    stack.ieee_by_short = {0x5001: bytes((0xA0, 1, 0, 0, 0, 0, 0, 1))}
+    stack.get_ieee_addr_by_short = stack.ieee_by_short.get
+    loaded = network.Coordinator(stack=stack, persistence_path=str(db_path), opportunistic_last_joined_scan=False)
+    loaded.load_registry()
+    assert loaded.interview_cache.stats()["entries"] == 3
+
+    loaded._queue_discovery(0x5001, now_ms=0)
+    loaded.process_pending_discovery()
+    assert stack.handles[0].include_power_desc is False
+    stack.handles[0].ready = True
+    out = loaded.process_pending_discovery()
+    assert out["success"] == 1
+    assert len(stack.handles) == 1
+    assert loaded.get_device(0x5001).meta["discovered"]["cached"] is True
+    assert loaded.get_device(0x4002) is None
+    assert loaded.discovery_stats()["cache_hits"] == 1
+
+
+def test_cooperative_coordinator_defers_work_to_run_once(monkeypatch):
+    now_ms = {"value": 1000}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    stack = _FakeStack()
+    coordinator = network.Coordinator(
+        stack=stack,
+        auto_discovery=True,
+        auto_bind=True,
+        opportunistic_last_joined_scan=False,
+        cooperative=True,
+    )
+    coordinator.start(form_network=True)
+    coordinator.discover_device(0x1111)
+    stack._last_joined_short = 0x7777
+    seen = []
+    coordinator.on_attribute(lambda *event: seen.append(event[0]))
+
+    stack._signal_cb(uzigbee.SIGNAL_DEVICE_ANNCE, 0)
+    coordinator._handle_attribute(0x1111, 1, uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF, True, 0x10, 0)
+    # Callbacks only queued work.
+    assert coordinator.get_device(0x7777) is None
+    assert seen == []
+    assert coordinator.pending_discovery()[0]["short_addr"] == 0x7777
+
+    now_ms["value"] += 5
+    result = coordinator.run_once(budget_ms=50)
+    assert seen == [0x1111]
+    assert result["ran"]["attribute"] == 1
+    assert result["idle"][:2] == ("control", "discovery")
+    device = coordinator.get_device(0x7777)
+    assert device is not None
+    assert coordinator.get_device(0x1111).state.get((uzigbee.CLUSTER_ID_ON_OFF, uzigbee.ATTR_ON_OFF_ON_OFF)) is True
+
+    # Auto-bind for both interviews ran from the automation lane, after discovery.
+    assert result["ran"]["automation"] == 2
+    assert device.meta["automation"]["bind"]["status"] in ("ok", "partial")
+
+    stats = coordinator.scheduler_stats()
+    assert stats["cooperative"] is True
+    assert stats["lanes"]["attribute"]["ran"] == 1
+    assert stats["lanes"]["attribute"]["latency_ms_max"] == 5
+    assert stats["lanes"]["automation"]["ran"] == 2
+
+
+def test_cooperative_coordinator_queues_self_heal_and_control():
+    stack = _FakeStack()
+    coordinator = network.Coordinator(
+        stack=stack,
+        auto_discovery=False,
+        self_heal_retry_max=1,
+        self_heal_retry_base_ms=0,
+        self_heal_retry_max_backoff_ms=0,
+        cooperative=True,
+    )
+    coordinator.start(form_network=True)
+    baseline = len([call for call in stack.calls if call[0] == "start"])
+
+    stack._signal_cb(network.SIGNAL_STEERING, -1)
+    assert len([call for call in stack.calls if call[0] == "start"]) == baseline
+    assert coordinator.network_info()["self_heal"]["stats"]["steering_failures"] == 1
+
+    order = []
+    coordinator.submit(uzigbee.LANE_CONTROL, order.append, "toggle")
+    coordinator.run_once(budget_ms=50)
+    assert order == ["toggle"]
+    start_calls = [call for call in stack.calls if call[0] == "start"]
+    assert len(start_calls) == baseline + 1
+    assert start_calls[-1] == ("start", False)
+
+
+def test_cooperative_self_heal_backs_off_by_tick_without_sleeping(monkeypatch):
+    now_ms = {"value": 1000}
+    monkeypatch.setattr(network, "_ticks_ms", lambda: now_ms["value"])
+    monkeypatch.setattr(network, "_sleep_ms", lambda ms: (_ for _ in ()).throw(AssertionError("slept")))
+    stack = _FakeStack()
+    coordinator = network.Coordinator(
+        stack=stack,
+        auto_discovery=False,
+        self_heal_retry_max=2,
+        self_heal_retry_base_ms=100,
+        self_heal_retry_max_backoff_ms=1000,
+        cooperative=True,
+    )
+    coordinator.start(form_network=True)
+    starts = []
+
+    def failing_start(form_network=False):
+        starts.append(bool(form_network))
+        raise OSError(-1)
+
+    stack.start = failing_start
+    stack._signal_cb(network.SIGNAL_STEERING, -1)
+    # A second failure while the first is pending does not stack another job.
+    stack._signal_cb(network.SIGNAL_STEERING, -1)
+
+    coordinator.run_once(budget_ms=50)
+    assert starts == [False]
+    assert coordinator.self_heal_stats()["last_backoff_ms"] == 100
+
+    # Not due yet: the tick returns without retrying.
+    now_ms["value"] += 50
+    coordinator.run_once(budget_ms=50)
+    assert len(starts) == 1
+
+    now_ms["value"] += 50
+    coordinator.run_once(budget_ms=50)
+    assert len(starts) == 2
+    assert coordinator.self_heal_stats()["last_backoff_ms"] == 200
+
+    now_ms["value"] += 200
+    coordinator.run_once(budget_ms=50)
+    stats = coordinator.self_heal_stats()
+    assert len(starts) == 3
+    assert stats["attempts"] == 3
+    assert stats["failed"] == 1
+    assert stats["last_result"] == "failed"
+
+    now_ms["value"] += 5000
+    coordinator.run_once(budget_ms=50)
+    assert len(starts) == 3
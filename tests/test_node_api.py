@@ -1,3 +1,4 @@
+import json
 import sys
 import tempfile
 from pathlib import Path
@@ -8,6 +9,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.insert(0, str(PYTHON_DIR))
 
 import uzigbee
+import uzigbee.node as node_module
 
 
 class _FakeStack:
@@ -933,6 +935,108 @@ def test_enddevice_low_power_reporting_defaults():
     assert reporting_calls[0][8] >= 900
 
 
+def test_node_state_load_falls_back_to_previous_generation():
+    router = uzigbee.Router(stack=_FakeStack()).add_contact_sensor(endpoint_id=5, name="door")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state_path = Path(temp_dir) / "node_state.json"
+        router.update("contact", False, endpoint_id=5, timestamp_ms=1000)
+        assert router.save_node_state(path=str(state_path), force=True)["generation"] == 1
+        router.update("contact", True, endpoint_id=5, timestamp_ms=2000)
+        assert router.save_node_state(path=str(state_path), force=True)["generation"] == 2
+
+        state_path.write_bytes(state_path.read_bytes()[:-5])
+        restored = uzigbee.Router(stack=_FakeStack())
+        loaded = restored.load_node_state(path=str(state_path))
+        assert loaded["source"] == "backup"
+        assert loaded["generation"] == 1
+        assert restored.sensor_state("contact", endpoint_id=5)["value"] is False
+
+
+def test_node_autosave_flushes_dirty_sections_once_per_interval(monkeypatch):
+    clock = {"value": 1000}
+    monkeypatch.setattr(node_module, "_ticks_ms", lambda: clock["value"])
+    router = uzigbee.Router(stack=_FakeStack()).add_light(endpoint_id=1, name="light").add_contact_sensor(
+        endpoint_id=5, name="door"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state_path = Path(temp_dir) / "node_state.json"
+        router.configure_autosave(path=str(state_path), enabled=True, interval_ms=2000)
+        first = router.poll_autosave()
+        assert first["saved"] is True
+        assert first["reused"] == ()
+
+        router.actor("light").on(timestamp_ms=1100)
+        for index in range(20):
+            router.update("contact", bool(index & 1), endpoint_id=5, timestamp_ms=1200 + index)
+        assert router.poll_autosave() is None
+        assert router.autosave_stats()["dirty"] == ("actuators", "sensors")
+
+        clock["value"] += 2000
+        flushed = router.poll_autosave()
+        assert flushed["sections"] == ("actuators", "sensors")
+        # Only dirty sections are serialized; the rest is copied from the previous generation.
+        assert flushed["reused"] == ("config",)
+        assert router.poll_autosave() is None
+
+        router.update("contact", False, endpoint_id=5, timestamp_ms=4000)
+        flushed = router.flush_autosave()
+        assert flushed["sections"] == ("sensors",)
+        assert flushed["reused"] == ("config", "actuators")
+
+        restored = uzigbee.Router(stack=_FakeStack())
+        restored.load_node_state(path=str(state_path))
+        assert restored.sensor_state("contact", endpoint_id=5)["value"] is False
+        assert restored.actuator_state("light", field="on_off")["value"] is True
+        for key in ("components", "sensor_states", "actuator_states"):
+            assert restored.dump_node_state()[key] == router.dump_node_state()[key]
+
+        # Stack callbacks never write flash; the application loop's poll does.
+        router.start(join_parent=False)
+        router.update("contact", True, endpoint_id=5, timestamp_ms=5000)
+        clock["value"] += 2000
+        router.stack._signal_cb(0x36, 0)
+        assert "sensors" in router.autosave_stats()["dirty"]
+
+        # Another writer produced a newer generation: nothing is copied from it.
+        restored.save_node_state(path=str(state_path), force=True)
+        assert router.poll_autosave()["reused"] == ()
+        reloaded = uzigbee.Router(stack=_FakeStack())
+        reloaded.load_node_state(path=str(state_path))
+        assert reloaded.sensor_state("contact", endpoint_id=5)["value"] is True
+        assert reloaded.actuator_state("light", field="on_off")["value"] is True
+
+
+def test_node_state_is_streamed_as_ndjson_and_legacy_documents_still_load():
+    router = uzigbee.Router(stack=_FakeStack()).add_light(endpoint_id=1, name="light").add_contact_sensor(
+        endpoint_id=5, name="door"
+    )
+    router.update("contact", True, endpoint_id=5, timestamp_ms=1234)
+    router.actor("light").on(timestamp_ms=2345)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state_path = Path(temp_dir) / "node_state.json"
+        router.save_node_state(path=str(state_path), force=True)
+        fp, _ = node_module._persistence.open_snapshot_stream(str(state_path))
+        with fp:
+            lines = [json.loads(line.decode()) for line in fp if line.strip()]
+        assert lines[0]["format"] == "ndjson"
+        assert "sensor_states" not in lines[0]
+        assert [tuple(row.keys())[0] for row in lines[1:]] == ["sensor_state", "actuator_state"]
+
+        loaded = uzigbee.Router(stack=_FakeStack())
+        result = loaded.load_node_state(path=str(state_path))
+        assert result["sensor_states"] == 1
+        assert result["actuator_states"] == 1
+        for key in ("components", "sensor_states", "actuator_states"):
+            assert loaded.dump_node_state()[key] == router.dump_node_state()[key]
+
+        legacy_path = Path(temp_dir) / "legacy.json"
+        node_module._persistence.write_snapshot(str(legacy_path), json.dumps(router.dump_node_state()))
+        legacy = uzigbee.Router(stack=_FakeStack())
+        assert legacy.load_node_state(path=str(legacy_path))["sensor_states"] == 1
+        for key in ("components", "sensor_states", "actuator_states"):
+            assert legacy.dump_node_state()[key] == router.dump_node_state()[key]
+
+
 def test_node_state_persistence_roundtrip():
     stack_a = _FakeStack()
     router_a = uzigbee.Router(stack=stack_a).add_light(endpoint_id=1, name="light").add_contact_sensor(
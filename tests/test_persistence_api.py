@@ -0,0 +1,147 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+
+def _persistence():
+    return importlib.import_module("uzigbee.persistence")
+
+
+def test_snapshot_write_rotates_generations_and_keeps_backup(tmp_path):
+    persistence = _persistence()
+    path = tmp_path / "state.json"
+
+    first = persistence.write_snapshot(str(path), json.dumps({"value": 1}))
+    second = persistence.write_snapshot(str(path), json.dumps({"value": 2}))
+    assert (first["generation"], second["generation"]) == (1, 2)
+    assert second["bytes"] == path.stat().st_size
+    assert path.read_bytes().startswith(b"#UZB1 00000002 ")
+    assert not (tmp_path / "state.json.tmp").exists()
+
+    obj, info = persistence.load_snapshot(str(path))
+    assert obj == {"value": 2}
+    assert info == {"source": "primary", "path": str(path), "generation": 2}
+
+
+def test_snapshot_loader_skips_torn_primary_and_prefers_promotable_temp(tmp_path):
+    persistence = _persistence()
+    path = tmp_path / "state.json"
+    persistence.write_snapshot(str(path), json.dumps({"value": 1}))
+    persistence.write_snapshot(str(path), json.dumps({"value": 2, "pad": "x" * 64}))
+
+    # Brown-out mid-write: body shorter than the header claims.
+    path.write_bytes(path.read_bytes()[:-10])
+    obj, info = persistence.load_snapshot(str(path))
+    assert obj == {"value": 1}
+    assert info["source"] == "backup"
+
+    # A verified temp left behind by a crash before the rename is the newest generation.
+    writer = persistence.open_snapshot(str(path))
+    assert writer.generation == 3
+    writer.write(json.dumps({"value": 3}))
+    writer._fp.seek(0)
+    writer._fp.write(persistence._header(writer.generation, writer.length, writer._crc))
+    writer._fp.close()
+    obj, info = persistence.load_snapshot(str(path))
+    assert obj == {"value": 3}
+    assert info["source"] == "temp"
+
+
+def test_snapshot_loader_ignores_temp_torn_after_header(tmp_path):
+    persistence = _persistence()
+    path = tmp_path / "state.json"
+    persistence.write_snapshot(str(path), json.dumps({"value": 1}))
+    persistence.write_snapshot(str(path), json.dumps({"value": 2}))
+
+    # Power loss right after the placeholder header: the temp is the newest generation but has no body.
+    writer = persistence.open_snapshot(str(path))
+    writer._fp.close()
+    assert (tmp_path / "state.json.tmp").stat().st_size == persistence.HEADER_LEN
+    assert persistence.newest_generation(str(path))[0] == "primary"
+    obj, info = persistence.load_snapshot(str(path))
+    assert obj == {"value": 2}
+    assert info["source"] == "primary"
+
+    # Temps written by older releases carried a (0, 0) placeholder that checksums as an empty body.
+    (tmp_path / "state.json.tmp").write_bytes(persistence._header(9, 0, 0))
+    obj, info = persistence.load_snapshot(str(path))
+    assert obj == {"value": 2}
+    fp, info = persistence.open_snapshot_stream(str(path))
+    fp.close()
+    assert info["source"] == "primary"
+
+
+def test_snapshot_abort_and_legacy_files(tmp_path):
+    persistence = _persistence()
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps({"schema": 1}))
+    obj, info = persistence.load_snapshot(str(path))
+    assert obj == {"schema": 1}
+    assert info["source"] == "legacy"
+
+    with pytest.raises(RuntimeError):
+        with persistence.open_snapshot(str(path)) as writer:
+            writer.write("{")
+            raise RuntimeError("boom")
+    assert not (tmp_path / "legacy.json.tmp").exists()
+    with pytest.raises(OSError):
+        persistence.load_snapshot(str(tmp_path / "missing.json"))
+
+
+def test_crc_fallback_matches_binascii(monkeypatch):
+    import binascii
+
+    persistence = _persistence()
+    data = b"uzigbee snapshot payload"
+    expected = binascii.crc32(data) & 0xFFFFFFFF
+    monkeypatch.setattr(persistence, "_crc32", None)
+    assert persistence._crc_update(data[7:], persistence._crc_update(data[:7], 0)) == expected
+
+
+def test_digest_is_length_and_crc32():
+    import binascii
+
+    persistence = _persistence()
+    text = '{"short_addr": 4369, "state": {"6:0": true}}'
+    assert persistence.digest(text) == (len(text), binascii.crc32(text.encode()) & 0xFFFFFFFF)
+    assert persistence.digest(text) == persistence.digest(text.encode())
+    assert persistence.digest(text) != persistence.digest(text.replace("true", "false"))
+
+def test_autosave_scheduler_coalesces_marks_and_keeps_them_on_failure():
+    persistence = _persistence()
+    calls = []
+    fail = {"value": False}
+
+    def save(sections):
+        if fail["value"]:
+            raise OSError("flash full")
+        calls.append(tuple(sorted(sections)))
+        return {"saved": True}
+
+    autosave = persistence.AutosaveScheduler(save, interval_ms=1000)
+    assert autosave.poll(0) is None
+    for index in range(50):
+        autosave.mark("sensors", index)
+    autosave.mark("config", 60)
+    assert autosave.poll(100) == {"saved": True}
+    assert calls == [("config", "sensors")]
+
+    autosave.mark("sensors", 200)
+    assert autosave.poll(500) is None
+    fail["value"] = True
+    assert autosave.poll(1100) is None
+    assert autosave.stats()["failures"] == 1
+    assert autosave.dirty() == ("sensors",)
+
+    fail["value"] = False
+    assert autosave.flush(1200) == {"saved": True}
+    stats = autosave.stats()
+    assert (stats["marks"], stats["flushes"], stats["dirty"]) == (52, 2, ())
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from uzigbee import scheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000
+
+    def __call__(self):
+        return self.now
+
+
+def test_scheduler_runs_lanes_in_priority_order():
+    clock = _Clock()
+    sched = scheduler.LaneScheduler(ticks_ms=clock)
+    order = []
+    sched.submit(scheduler.LANE_PERSISTENCE, order.append, "persist")
+    sched.submit(scheduler.LANE_DISCOVERY, order.append, "discovery")
+    sched.submit("attribute", order.append, "attr")
+    sched.submit(scheduler.LANE_CONTROL, order.append, "control")
+    sched.submit(scheduler.LANE_AUTOMATION, order.append, "automation")
+
+    result = sched.run_once(budget_ms=20)
+    assert order == ["control", "attr", "discovery", "automation", "persist"]
+    assert result["ran"] == {"control": 1, "attribute": 1, "discovery": 1, "automation": 1, "persistence": 1}
+    assert result["pending"] == 0
+
+    with pytest.raises(ValueError):
+        sched.submit("bogus", order.append, 1)
+    with pytest.raises(ValueError):
+        sched.submit(9, order.append, 1)
+
+
+def test_scheduler_stops_at_budget_and_tracks_latency():
+    clock = _Clock()
+    sched = scheduler.LaneScheduler(ticks_ms=clock)
+
+    def _slow(step_ms):
+        clock.now += step_ms
+
+    for _ in range(4):
+        sched.submit(scheduler.LANE_DISCOVERY, _slow, 10)
+    clock.now += 7
+    result = sched.run_once(budget_ms=15)
+    assert result["ran"] == {"discovery": 2}
+    assert result["pending"] == 2
+
+    # A control item queued now still jumps ahead of the remaining discovery work.
+    sched.submit(scheduler.LANE_CONTROL, _slow, 1)
+    result = sched.run_once(budget_ms=1)
+    assert result["ran"] == {"control": 1}
+
+    lanes = sched.stats()["lanes"]
+    assert lanes["discovery"]["ran"] == 2
+    assert lanes["discovery"]["latency_ms_max"] == 17
+    assert lanes["discovery"]["mean_latency_ms"] == 12
+    assert lanes["discovery"]["run_ms_max"] == 10
+    assert lanes["discovery"]["depth"] == 2
+    assert lanes["control"]["latency_ms_max"] == 0
+    assert sched.stats()["overruns"] == 1
+
+
+def test_scheduler_idle_hooks_and_errors():
+    clock = _Clock()
+    sched = scheduler.LaneScheduler(capacity=2, ticks_ms=clock)
+    calls = []
+    sched.set_idle(scheduler.LANE_DISCOVERY, lambda now_ms: calls.append(("discovery_poll", now_ms)))
+    sched.set_idle(scheduler.LANE_PERSISTENCE, lambda now_ms: calls.append(("autosave", now_ms)))
+
+    def _boom():
+        raise RuntimeError("boom")
+
+    sched.submit(scheduler.LANE_AUTOMATION, _boom)
+    sched.submit(scheduler.LANE_ATTRIBUTE, calls.append, ("attr", 0))
+    result = sched.run_once()
+    assert [item[0] for item in calls] == ["attr", "discovery_poll", "autosave"]
+    assert result["idle"] == ("discovery", "persistence")
+    stats = sched.stats()["lanes"]
+    assert stats["automation"]["errors"] == 1
+    assert "boom" in stats["automation"]["last_error"]
+
+    for value in range(3):
+        sched.submit(scheduler.LANE_CONTROL, calls.append, value)
+    assert sched.stats()["lanes"]["control"]["dropped"] == 1
@@ -0,0 +1,194 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from uzigbee import transmit
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000
+
+    def __call__(self):
+        return self.now
+
+
+def _scheduler(clock, **kwargs):
+    return transmit.TransmitScheduler(ticks_ms=clock, ticks_diff=lambda a, b: a - b, **kwargs)
+
+
+def test_transmit_sends_inline_until_destination_bucket_is_empty():
+    clock = _Clock()
+    tx = _scheduler(clock, rate_per_s=10, burst=2)
+    sent = []
+
+    assert tx.submit(0x1111, sent.append, ("a",)) is True
+    assert tx.submit(0x1111, sent.append, ("b",)) is True
+    assert tx.submit(0x1111, sent.append, ("c",)) is True
+    assert tx.submit(0x2222, sent.append, ("other",)) is True
+    assert sent == ["a", "b", "other"]
+    assert tx.pending(0x1111) == 1
+    assert tx.pump() == 0
+
+    clock.now += 100
+    assert tx.pump() == 1
+    assert sent[-1] == "c"
+    stats = tx.stats()
+    assert stats["immediate"] == 3
+    assert stats["queued"] == 1
+    assert stats["sent"] == 4
+    assert stats["latency_ms_max"] == 100
+    assert stats["depth"] == 0
+
+
+def test_transmit_keeps_destination_order_and_priority():
+    clock = _Clock()
+    tx = _scheduler(clock, rate_per_s=10, burst=1, global_rate_per_s=10, global_burst=1)
+    sent = []
+
+    tx.submit(0x1111, sent.append, ("first",))
+    tx.submit(0x1111, sent.append, ("level",), priority=transmit.TX_PRIORITY_LOW)
+    tx.submit(0x1111, sent.append, ("off",), priority="high")
+    tx.submit(0x2222, sent.append, ("other",), priority=transmit.TX_PRIORITY_NORMAL)
+    # Once queued, later commands for the destination never overtake the queue inline.
+    tx.submit(0x1111, sent.append, ("later",))
+    assert sent == ["first"]
+    # 0x1111 holds a high command, so it is served before 0x2222, but in its own FIFO order.
+    for _ in range(4):
+        clock.now += 100
+        assert tx.pump() == 1
+    assert sent == ["first", "level", "off", "later", "other"]
+    with pytest.raises(ValueError):
+        tx.submit(0x1111, sent.append, priority="urgent")
+
+
+def test_transmit_global_budget_limits_all_destinations():
+    clock = _Clock()
+    tx = _scheduler(clock, rate_per_s=100, burst=4, global_rate_per_s=10, global_burst=2)
+    sent = []
+
+    for dest in (1, 2, 3, 4):
+        tx.submit(dest, sent.append, (dest,))
+    assert sent == [1, 2]
+    assert tx.stats()["destinations_waiting"] == 2
+    clock.now += 100
+    assert tx.pump() == 1
+    clock.now += 100
+    assert tx.pump() == 1
+    assert sent == [1, 2, 3, 4]
+
+
+def test_transmit_refuses_when_full_and_never_drops_accepted_commands():
+    clock = _Clock()
+    tx = _scheduler(clock, rate_per_s=1, burst=1, capacity=2)
+    sent = []
+
+    tx.submit(0x1111, sent.append, ("inline",))
+    assert tx.submit(0x1111, sent.append, ("low",), priority=transmit.TX_PRIORITY_LOW) is True
+    assert tx.submit(0x1111, sent.append, ("high1",), priority=transmit.TX_PRIORITY_HIGH) is True
+    assert tx.submit(0x1111, sent.append, ("high2",), priority=transmit.TX_PRIORITY_HIGH) is False
+    assert tx.submit(0x1111, sent.append, ("normal",)) is False
+    stats = tx.stats()
+    assert stats["dropped"] == 0
+    assert stats["refused"] == 2
+    assert stats["queues"] == {"high": 1, "normal": 0, "low": 1}
+    assert stats["high_watermark"] == 2
+
+    assert tx.clear(0x1111) == 2
+    assert tx.pending() == 0
+    assert tx.stats()["dropped"] == 2
+
+
+def test_transmit_records_queued_send_errors():
+    clock = _Clock()
+    tx = _scheduler(clock, rate_per_s=10, burst=1)
+
+    def _fail():
+        raise OSError("busy")
+
+    tx.submit(0x1111, lambda: None)
+    tx.submit(0x1111, _fail)
+    clock.now += 100
+    assert tx.pump() == 1
+    stats = tx.stats()
+    assert stats["errors"] == 1
+    assert "busy" in stats["last_error"]
+    with pytest.raises(OSError):
+        tx.submit(0x2222, _fail)
+
+
+def test_transmit_coalesces_keyed_commands_last_writer_wins():
+    clock = _Clock()
+    tx = _scheduler(clock, rate_per_s=100, burst=4, coalesce_interval_ms=100)
+    sent = []
+
+    def _level(value, transition_ds=0):
+        sent.append((value, transition_ds))
+
+    key = (1, 0x0008, "level")
+    tx.submit(0x1111, _level, (10,), {"transition_ds": 1}, key=key)
+    for value in (20, 30, 40):
+        clock.now += 10
+        tx.submit(0x1111, _level, (value,), {"transition_ds": value // 10}, key=key)
+    # Another key on the same destination waits behind the held one to keep order.
+    tx.submit(0x1111, sent.append, ("other",), key=(1, 0x0300, "xy"))
+    assert sent == [(10, 1)]
+    assert tx.pending(0x1111) == 2
+
+    clock.now += 70
+    assert tx.pump() == 2
+    assert sent == [(10, 1), (40, 4), "other"]
+    stats = tx.stats()
+    assert stats["coalesced"] == 2
+    assert stats["latency_ms_max"] == 90
+
+    clock.now += 100
+    tx.submit(0x1111, _level, (50,), key=key)
+    assert sent[-1] == (50, 0)
+    tx.configure(coalesce_interval_ms=0)
+    tx.submit(0x1111, _level, (60,), key=key)
+    assert sent[-1] == (60, 0)
+
+
+def test_transmit_unkeyed_command_blocks_coalescing_across_it():
+    clock = _Clock()
+    tx = _scheduler(clock, rate_per_s=1, burst=1)
+    sent = []
+    key = (1, 0x0008, "level")
+
+    tx.submit(0x1111, sent.append, ("level 10",), key=key)
+    tx.submit(0x1111, sent.append, ("level 50",), key=key)
+    tx.submit(0x1111, sent.append, ("off",))
+    # level(80, with_onoff) after off must not jump ahead of it.
+    tx.submit(0x1111, sent.append, ("level 80",), key=key)
+    assert tx.pending(0x1111) == 3
+    # Behind the barrier, keyed commands still coalesce with each other.
+    tx.submit(0x1111, sent.append, ("level 90",), key=key)
+    assert tx.pending(0x1111) == 3
+
+    for _ in range(3):
+        clock.now += 1000
+        tx.pump()
+    assert sent == ["level 10", "level 50", "off", "level 90"]
+    assert tx.stats()["coalesced"] == 1
+
+
+def test_transmit_keeps_group_destinations_apart_from_short_addresses():
+    clock = _Clock()
+    tx = _scheduler(clock, rate_per_s=10, burst=1)
+    sent = []
+
+    tx.submit(0x0100, sent.append, ("device",))
+    tx.submit(("group", 0x0100), sent.append, ("group",))
+    tx.submit(0x10100, sent.append, ("masked",))
+    assert sent == ["device", "group"]
+    assert tx.pending(0x0100) == 1
+    assert tx.pending(("group", 0x0100)) == 0
+    assert tx.clear(("group", 0x0100)) == 0
+    assert tx.clear(0x0100) == 1
@@ -0,0 +1,622 @@
+#!/usr/bin/env python
+"""Host-side benchmarks for uzigbee Python API hot paths (no hardware needed)."""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PYTHON_DIR = os.path.join(ROOT, "python")
+if PYTHON_DIR not in sys.path:
+    sys.path.insert(0, PYTHON_DIR)
+
+
+class VirtualClock:
+    """Deterministic millisecond clock; sleeping advances time and fires listeners."""
+
+    def __init__(self):
+        self.now_ms = 0
+        self.listeners = []
+
+    def ticks_ms(self):
+        return self.now_ms
+
+    def sleep_ms(self, ms):
+        self.now_ms += max(1, int(ms))
+        for listener in tuple(self.listeners):
+            listener(self.now_ms)
+
+
+ESP_ERR_NO_MEM = 0x101
+SIMPLE_DESC_SLOTS = 8
+
+
+class LatencyUZigbee:
+    """Fake _uzigbee answering ZDO descriptor requests after a fixed latency (polling-only firmware).
+
+    Simple descriptor answers land in ``SIMPLE_DESC_SLOTS`` shared slots reused round-robin like
+    uzb_core.c: a slot still awaiting its response is never handed out, and a request finding no
+    free slot fails with ``OSError(ESP_ERR_NO_MEM)``.
+    """
+
+    def __init__(self, clock, devices, latency_ms=120):
+        self.clock = clock
+        self.devices = devices
+        self.latency_ms = int(latency_ms)
+        self.requests = 0
+        self._pending = []
+        self._active = None
+        self._node = None
+        self._simple = None
+        # [addr, endpoint, pending responses, snapshot] per firmware slot.
+        self._simple_slots = [[0, 0, 0, None] for _ in range(SIMPLE_DESC_SLOTS)]
+        self._simple_next = 0
+        self.peak_simple_pending = 0
+        self._power = None
+        clock.listeners.append(self._deliver)
+
+    def _schedule(self, kind, addr, endpoint, slot=None):
+        self.requests += 1
+        self._pending.append((self.clock.now_ms + self.latency_ms, kind, int(addr), int(endpoint), slot))
+
+    def _simple_slot_acquire(self, addr, endpoint):
+        for index, slot in enumerate(self._simple_slots):
+            if slot[0] == addr and slot[1] == endpoint:
+                return index
+        for step in range(SIMPLE_DESC_SLOTS):
+            index = (self._simple_next + step) % SIMPLE_DESC_SLOTS
+            if self._simple_slots[index][2] == 0:
+                self._simple_next = (index + 1) % SIMPLE_DESC_SLOTS
+                return index
+        return None
+
+    def request_active_endpoints(self, dst_short_addr):
+        self._active = None
+        self._schedule(1, dst_short_addr, 0)
+
+    def request_node_descriptor(self, dst_short_addr):
+        self._node = None
+        self._schedule(2, dst_short_addr, 0)
+
+    def request_simple_descriptor(self, dst_short_addr, endpoint):
+        addr = int(dst_short_addr)
+        index = self._simple_slot_acquire(addr, int(endpoint))
+        if index is None:
+            raise OSError(ESP_ERR_NO_MEM)
+        slot = self._simple_slots[index]
+        slot[0], slot[1], slot[3] = addr, int(endpoint), None
+        slot[2] += 1
+        self.peak_simple_pending = max(self.peak_simple_pending, sum(item[2] for item in self._simple_slots))
+        self._simple = None
+        self._schedule(3, addr, endpoint, slot=index)
+
+    def request_power_descriptor(self, dst_short_addr):
+        self._power = None
+        self._schedule(4, dst_short_addr, 0)
+
+    def _deliver(self, now_ms):
+        due = [item for item in self._pending if item[0] <= now_ms]
+        if not due:
+            return
+        self._pending = [item for item in self._pending if item[0] > now_ms]
+        for _, kind, addr, endpoint, slot_index in due:
+            endpoints = self.devices.get(addr, ())
+            if kind == 1:
+                self._active = (0, len(endpoints), tuple(endpoints), addr)
+            elif kind == 2:
+                self._node = (0, addr, (0x0001, 0x8E, 0x1234, 82, 128, 0, 128, 0))
+            elif kind == 3:
+                # Like the firmware callback, the answer is filed under whoever owns the slot now.
+                slot = self._simple_slots[slot_index]
+                snapshot = (0, addr, (endpoint, 0x0104, 0x0100, 0, (0x0000, 0x0006, 0x0008), (0x0019,)))
+                self._simple = snapshot
+                slot[3] = (0, slot[0], snapshot[2])
+                slot[2] = max(0, slot[2] - 1)
+                addr, endpoint = slot[0], slot[1]
+            else:
+                self._power = (0, addr, (0, 0x01, 0x01, 0x0C))
+            self._emit(kind, addr, endpoint)
+
+    def _emit(self, kind, addr, endpoint):
+        return None
+
+    def get_active_endpoints_snapshot(self):
+        return self._active
+
+    def get_node_descriptor_snapshot(self):
+        return self._node
+
+    def get_simple_descriptor_snapshot(self):
+        return self._simple
+
+    def get_power_descriptor_snapshot(self):
+        return self._power
+
+
+class LatencyEventUZigbee(LatencyUZigbee):
+    """Same latency model, but firmware exposes the descriptor completion hook."""
+
+    def __init__(self, clock, devices, latency_ms=120):
+        super().__init__(clock, devices, latency_ms=latency_ms)
+        self._descriptor_cb = None
+
+    def set_descriptor_callback(self, callback):
+        self._descriptor_cb = callback
+
+    def get_simple_descriptor_snapshot_for(self, dst_short_addr, endpoint):
+        for slot in self._simple_slots:
+            if slot[0] == int(dst_short_addr) and slot[1] == int(endpoint):
+                return slot[3]
+        return None
+
+    def _emit(self, kind, addr, endpoint):
+        if self._descriptor_cb is not None:
+            self._descriptor_cb(kind, 0, addr, endpoint)
+
+
+class _CorePatch:
+    def __init__(self, core, fake, clock):
+        self.core = core
+        self.fake = fake
+        self.clock = clock
+        self.saved = None
+
+    def __enter__(self):
+        core = self.core
+        self.saved = (core._uzigbee, core._ticks_ms, core._sleep_ms)
+        core._uzigbee = self.fake
+        core._ticks_ms = self.clock.ticks_ms
+        core._sleep_ms = self.clock.sleep_ms
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.core._uzigbee, self.core._ticks_ms, self.core._sleep_ms = self.saved
+        return False
+
+
+def bench_descriptor_discovery(endpoints=4, latency_ms=120, poll_ms=200, timeout_ms=5000):
+    """Simulated wall-clock of one interview: sequential polling vs completion-driven pipeline."""
+    core = importlib.import_module("uzigbee.core")
+    devices = {0x1234: tuple(range(1, int(endpoints) + 1))}
+    out = {"endpoints": int(endpoints), "latency_ms": int(latency_ms), "poll_ms": int(poll_ms)}
+    for label, fake_cls in (("polling", LatencyUZigbee), ("evented", LatencyEventUZigbee)):
+        clock = VirtualClock()
+        fake = fake_cls(clock, devices, latency_ms=latency_ms)
+        with _CorePatch(core, fake, clock):
+            result = core.ZigbeeStack().discover_node_descriptors(
+                0x1234,
+                timeout_ms=timeout_ms,
+                poll_ms=poll_ms,
+                strict=True,
+            )
+        out[label] = {
+            "wall_ms": clock.now_ms,
+            "requests": fake.requests,
+            "simple_descriptors": len(result["simple_descriptors"]),
+        }
+    evented_ms = max(1, out["evented"]["wall_ms"])
+    out["speedup"] = round(out["polling"]["wall_ms"] / float(evented_ms), 2)
+    return out
+
+
+def run_discovery_pipeline(clock, coordinator, short_addrs, step_ms=5, limit_ms=600000):
+    """Queue joins and drive process_pending_discovery() on the virtual clock until all are registered."""
+    for short_addr in short_addrs:
+        coordinator._queue_discovery(short_addr, now_ms=clock.now_ms)
+    peak_inflight = 0
+    while clock.now_ms < limit_ms:
+        out = coordinator.process_pending_discovery(max_items=len(short_addrs))
+        peak_inflight = max(peak_inflight, int(out.get("inflight", 0)))
+        if not coordinator.pending_discovery():
+            break
+        clock.sleep_ms(step_ms)
+    return peak_inflight
+
+
+def bench_discovery_pipeline(devices=20, endpoints=2, latency_ms=120, inflight=4):
+    """Simulated time to interview a burst of joins: one at a time vs N interviews in flight."""
+    core = importlib.import_module("uzigbee.core")
+    network = importlib.import_module("uzigbee.network")
+    short_addrs = [0x2000 + index for index in range(int(devices))]
+    device_map = dict((short_addr, tuple(range(1, int(endpoints) + 1))) for short_addr in short_addrs)
+    out = {"devices": int(devices), "endpoints": int(endpoints), "latency_ms": int(latency_ms)}
+    for label, cap in (("serial", 1), ("pipelined", int(inflight))):
+        clock = VirtualClock()
+        fake = LatencyEventUZigbee(clock, device_map, latency_ms=latency_ms)
+        saved_ticks = network._ticks_ms
+        network._ticks_ms = clock.ticks_ms
+        try:
+            with _CorePatch(core, fake, clock):
+                coordinator = network.Coordinator(
+                    stack=core.ZigbeeStack(),
+                    max_devices=int(devices),
+                    discovery_queue_max=int(devices),
+                    discovery_max_inflight=cap,
+                    opportunistic_last_joined_scan=False,
+                )
+                peak = run_discovery_pipeline(clock, coordinator, short_addrs)
+                stats = coordinator.discovery_stats()
+        finally:
+            network._ticks_ms = saved_ticks
+        out[label] = {
+            "wall_ms": clock.now_ms,
+            "registered": len(coordinator.registry),
+            "peak_inflight": peak,
+            "interviews_per_min": stats["interviews_per_min"],
+            "mean_interview_ms": stats["mean_interview_ms"],
+        }
+    out["speedup"] = round(out["serial"]["wall_ms"] / float(max(1, out["pipelined"]["wall_ms"])), 2)
+    return out
+
+
+def _legacy_write(network, cache, meta, key, value, now_ms, max_items):
+    cache[key] = value
+    meta[key] = {"updated_ms": now_ms, "source": "bench", "authoritative": True}
+    network._prune_cache_map(cache, meta, max_items)
+
+
+def bench_state_cache(sizes=(32, 128, 512), reports=2000):
+    """Per-report cost of a full state cache: linear oldest-scan vs write-order index."""
+    network = importlib.import_module("uzigbee.network")
+    out = {"reports": int(reports), "sizes": {}}
+    for size in sizes:
+        size = int(size)
+        device = network.DiscoveredDevice(
+            stack=None,
+            short_addr=0x1234,
+            endpoint_clusters={1: {"input": (), "output": ()}},
+            cluster_to_endpoint={},
+            features=(),
+            state_cache_max=size,
+        )
+        legacy_state, legacy_meta = {}, {}
+        for index in range(size):
+            key = (0x0B04, index)
+            device._write_state(key, index, source="bench", endpoint_id=1, now_ms=index)
+            _legacy_write(network, legacy_state, legacy_meta, key, index, index, size)
+
+        started = time.perf_counter()
+        for index in range(size, size + int(reports)):
+            device._write_state((0x0B04, index), index, source="bench", endpoint_id=1, now_ms=index)
+        indexed_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for index in range(size, size + int(reports)):
+            _legacy_write(network, legacy_state, legacy_meta, (0x0B04, index), index, index, size)
+        scan_s = time.perf_counter() - started
+
+        out["sizes"][str(size)] = {
+            "cached": len(device.state),
+            "cached_by_endpoint": len(device.state_by_endpoint),
+            "indexed_us_per_report": round(indexed_s * 1e6 / max(1, int(reports)), 2),
+            "scan_us_per_report": round(scan_s * 1e6 / max(1, int(reports)), 2),
+        }
+    return out
+
+
+class _HeapMeter:
+    """Heap delta in bytes: gc.mem_alloc() on MicroPython, tracemalloc on CPython."""
+
+    def __init__(self):
+        self._gc = importlib.import_module("gc")
+        self._tracemalloc = None
+        self.base = 0
+
+    def __enter__(self):
+        self._gc.collect()
+        if hasattr(self._gc, "mem_alloc"):
+            self._gc.disable()
+        else:
+            self._tracemalloc = importlib.import_module("tracemalloc")
+            self._tracemalloc.start()
+        self.base = self._read()
+        return self
+
+    def _read(self):
+        if self._tracemalloc is None:
+            return int(self._gc.mem_alloc())
+        return int(self._tracemalloc.get_traced_memory()[0])
+
+    def delta(self):
+        return self._read() - self.base
+
+    def peak(self):
+        # With gc disabled mem_alloc() never shrinks, so the delta is already the peak.
+        if self._tracemalloc is None:
+            return self.delta()
+        return int(self._tracemalloc.get_traced_memory()[1]) - self.base
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._tracemalloc is None:
+            self._gc.enable()
+        else:
+            self._tracemalloc.stop()
+        return False
+
+
+def _legacy_meta_write(state, state_meta, by_endpoint, meta_by_endpoint, key, value, now_ms):
+    # Pre-record layout: one meta dict per report, copied into both caches.
+    meta = {"updated_ms": now_ms, "source": "attribute", "authoritative": True, "attr_type": 0x21}
+    endpoint_meta = dict(meta)
+    endpoint_meta["endpoint_id"] = 1
+    by_endpoint[(1, key[0], key[1])] = value
+    meta_by_endpoint[(1, key[0], key[1])] = endpoint_meta
+    state[key] = value
+    state_meta[key] = dict(meta)
+
+
+def bench_state_memory(attrs=64, reports=1000):
+    """Heap bytes per cached attribute and heap delta per 1000 reports: meta dicts vs records.
+
+    On MicroPython the collector is paused, so the delta is gross allocation per
+    report; on CPython (tracemalloc) it is the net growth after warm-up.
+    """
+    network = importlib.import_module("uzigbee.network")
+    keys = [(0x0B04, 0x0500 + index) for index in range(int(attrs))]
+    out = {"attrs": len(keys), "reports": int(reports)}
+    for label in ("dict_meta", "record"):
+        device = network.DiscoveredDevice(
+            stack=None,
+            short_addr=0x1234,
+            endpoint_clusters={1: {"input": (0x0B04,), "output": ()}},
+            cluster_to_endpoint={0x0B04: 1},
+            features=(),
+            state_cache_max=max(int(attrs), 8),
+        )
+        maps = ({}, {}, {}, {})
+
+        def write(key, index):
+            if label == "record":
+                device._write_state(key, index, source="attribute", endpoint_id=1, now_ms=index, attr_type=0x21)
+            else:
+                _legacy_meta_write(maps[0], maps[1], maps[2], maps[3], key, index, index)
+
+        with _HeapMeter() as meter:
+            for index, key in enumerate(keys):
+                write(key, 1000 + index)
+            filled = meter.delta()
+            # Warm up so the write-order index reaches its steady-state size first.
+            for index in range(4 * len(keys)):
+                write(keys[index % len(keys)], 2000 + index)
+            warm = meter.delta()
+            for index in range(int(reports)):
+                write(keys[index % len(keys)], 4000 + index)
+            churn = meter.delta() - warm
+        out["heap_probe"] = "tracemalloc" if meter._tracemalloc is not None else "gc.mem_alloc"
+        out[label] = {
+            "bytes_per_attr": int(filled // max(1, len(keys))),
+            "delta_per_1000_reports": int(churn * 1000 // max(1, int(reports))),
+        }
+    return out
+
+
+def bench_registry_restore(devices=1500, max_devices=512):
+    """Restore a large snapshot into a smaller registry: linear oldest-scan vs lazy min-heap eviction."""
+    network = importlib.import_module("uzigbee.network")
+    rows = []
+    for index in range(int(devices)):
+        short_addr = 0x4000 + index
+        rows.append({
+            "short_addr": short_addr,
+            "features": ["on_off"],
+            "endpoint_clusters": {1: {"input": [0x0006], "output": []}},
+            "cluster_to_endpoint": {0x0006: 1},
+            "identity": {"short_addr": short_addr},
+            "last_seen_ms": 1000 + ((index * 7919) % int(devices)),
+        })
+    snapshot = {"schema": 1, "devices": rows}
+    out = {"devices": int(devices), "max_devices": int(max_devices)}
+    saved_heapq = network._heapq
+    for label, heapq_mod in (("scan", None), ("heap", saved_heapq)):
+        network._heapq = heapq_mod
+        try:
+            coordinator = network.Coordinator(stack=object(), auto_discovery=False, max_devices=int(max_devices))
+            started = time.perf_counter()
+            coordinator.restore_registry(snapshot, merge=False)
+            elapsed_s = time.perf_counter() - started
+        finally:
+            network._heapq = saved_heapq
+        out[label] = {
+            "ms": round(elapsed_s * 1000.0, 2),
+            "kept": tuple(sorted(int(device.short_addr) for device in coordinator.list_devices())),
+            "evicted": coordinator.registry_stats()["evicted"],
+        }
+    out["same_survivors"] = out["scan"]["kept"] == out["heap"]["kept"]
+    for label in ("scan", "heap"):
+        out[label]["kept"] = len(out[label]["kept"])
+    return out
+
+
+class BatchUZigbee:
+    """Fake _uzigbee that replays ATTR_SET events per-event or in firmware-sized batches."""
+
+    def __init__(self, native_batch=True):
+        self.callback = None
+        self.batch_callback = None
+        self.max_batch = 1
+        self.calls = 0
+        if native_batch:
+            self.set_attribute_batch_callback = self._set_batch
+
+    def set_attribute_callback(self, callback=None):
+        self.callback = callback
+
+    def _set_batch(self, callback=None, max_batch=8):
+        self.batch_callback = callback
+        self.max_batch = int(max_batch)
+
+    def replay(self, records):
+        # Like the firmware dispatcher, a per-event callback still fires when a batch one is set.
+        if self.batch_callback is not None:
+            step = self.max_batch
+            for index in range(0, len(records), step):
+                self.calls += 1
+                self.batch_callback(records[index:index + step])
+                if self.callback is not None:
+                    for record in records[index:index + step]:
+                        self.calls += 1
+                        self.callback(*record)
+            return
+        for record in records:
+            self.calls += 1
+            self.callback(*record)
+
+
+def bench_attribute_batch(devices=16, reports=4000, max_batch=8):
+    """Per-event cost of delivering attribute reports: one callback per event vs batched lists."""
+    core = importlib.import_module("uzigbee.core")
+    network = importlib.import_module("uzigbee.network")
+    records = []
+    for index in range(int(reports)):
+        short_addr = 0x3000 + (index % int(devices))
+        records.append((short_addr, 1, 0x0006, 0x0000, index & 1, 0x10, 0))
+    out = {"devices": int(devices), "reports": int(reports), "max_batch": int(max_batch)}
+    for label, native in (("per_event", False), ("batched", True)):
+        fake = BatchUZigbee(native_batch=native)
+        clock = VirtualClock()
+        with _CorePatch(core, fake, clock):
+            coordinator = network.Coordinator(stack=core.ZigbeeStack(), auto_discovery=False, max_devices=int(devices))
+            for index in range(int(devices)):
+                coordinator.registry.upsert(network.DiscoveredDevice(
+                    stack=None,
+                    short_addr=0x3000 + index,
+                    endpoint_clusters={1: {"input": (0x0006,), "output": ()}},
+                    cluster_to_endpoint={0x0006: 1},
+                    features=("on_off",),
+                ))
+            coordinator.stack.on_attribute_batch(coordinator._handle_attribute_batch, int(max_batch))
+            started = time.perf_counter()
+            fake.replay(records)
+            elapsed_s = time.perf_counter() - started
+        out[label] = {
+            "callbacks": fake.calls,
+            "routed": coordinator.attribute_route_stats()["routed"],
+            "us_per_event": round(elapsed_s * 1e6 / max(1, int(reports)), 3),
+        }
+    return out
+
+
+def bench_registry_snapshot(devices=256):
+    """Peak heap of saving/loading the registry: one json document vs streamed NDJSON rows."""
+    network = importlib.import_module("uzigbee.network")
+    persistence = importlib.import_module("uzigbee.persistence")
+    tempfile = importlib.import_module("tempfile")
+    coordinator = network.Coordinator(stack=object(), auto_discovery=False, max_devices=int(devices))
+    for index in range(int(devices)):
+        coordinator.registry.upsert(network.DiscoveredDevice(
+            stack=None,
+            short_addr=0x5000 + index,
+            endpoint_clusters={1: {"input": (0x0000, 0x0006, 0x0008), "output": (0x0019,)}},
+            cluster_to_endpoint={0x0006: 1, 0x0008: 1},
+            features=("on_off", "level"),
+            identity=network.DeviceIdentity(0x5000 + index, ieee_addr=bytes((index & 0xFF, (index >> 8) & 0xFF, 0, 0, 0, 0, 0x5A, 0x00)), manufacturer_code=0x1234),
+        ))
+    out = {"devices": int(devices)}
+    with tempfile.TemporaryDirectory() as tmp:
+        document_path = os.path.join(tmp, "document.json")
+        stream_path = os.path.join(tmp, "stream.json")
+        with _HeapMeter() as meter:
+            persistence.write_snapshot(document_path, json.dumps(coordinator.dump_registry()))
+            document_save = meter.peak()
+        with _HeapMeter() as meter:
+            coordinator._write_registry_snapshot(stream_path)
+            stream_save = meter.peak()
+        with _HeapMeter() as meter:
+            coordinator.restore_registry(persistence.load_snapshot(document_path)[0])
+            document_load = meter.peak()
+        with _HeapMeter() as meter:
+            coordinator.load_registry(stream_path)
+            stream_load = meter.peak()
+        out["document"] = {"save_peak_bytes": document_save, "load_peak_bytes": document_load}
+        out["stream"] = {"save_peak_bytes": stream_save, "load_peak_bytes": stream_load}
+        out["file_bytes"] = {
+            "document": persistence.file_size(document_path),
+            "stream": persistence.file_size(stream_path),
+        }
+    out["restored"] = len(coordinator.list_devices())
+    return out
+
+
+def bench_gateway_stream(frames=2000, max_chunk=48, max_frame=1024):
+    """Gateway frames/s and peak buffer when a recorded UART byte stream is fed in arbitrary chunks."""
+    gateway_mod = importlib.import_module("uzigbee.gateway")
+    gateway = gateway_mod.Gateway(coordinator=object())
+    gateway.register_op("echo", lambda command: command.get("value"))
+    lines = []
+    for index in range(int(frames)):
+        if index % 10 == 9:
+            command = {"op": "batch", "id": index, "commands": [{"op": "echo", "value": item} for item in range(4)]}
+        elif index % 2:
+            command = {"op": "echo", "id": index, "value": {"short_addr": 0x1000 + index, "level": index & 0xFF}}
+        else:
+            command = {"op": "ping", "id": index}
+        lines.append(json.dumps(command))
+    recorded = ("\n".join(lines) + "\n").encode()
+    chunks = []
+    offset = 0
+    size = 1
+    while offset < len(recorded):
+        # Deterministic ragged chunk sizes, like UART reads of whatever has arrived.
+        chunks.append(recorded[offset:offset + size])
+        offset += size
+        size = size * 7 % int(max_chunk) + 1
+
+    def _write(data):
+        pass
+
+    stream = gateway.open_stream(_write, max_frame=int(max_frame))
+    started = time.perf_counter()
+    for chunk in chunks:
+        stream.feed(chunk)
+    elapsed_s = time.perf_counter() - started
+    stats = stream.stats()
+    # Second pass for heap only; tracemalloc would skew the timing above.
+    replay = gateway.open_stream(_write, max_frame=int(max_frame))
+    with _HeapMeter() as meter:
+        for chunk in chunks:
+            replay.feed(chunk)
+        heap_peak = meter.peak()
+    return {
+        "frames": stats["frames"],
+        "chunks": len(chunks),
+        "bytes_in": stats["bytes_in"],
+        "bytes_out": stats["bytes_out"],
+        "responses": stats["responses"],
+        "frames_per_s": int(stats["frames"] / elapsed_s) if elapsed_s > 0 else 0,
+        "peak_buffer_bytes": stats["peak_buffer"],
+        "max_frame": stats["max_frame"],
+        "heap_peak_bytes": heap_peak,
+    }
+
+
+BENCHMARKS = {
+    "attribute_batch": bench_attribute_batch,
+    "descriptor_discovery": bench_descriptor_discovery,
+    "discovery_pipeline": bench_discovery_pipeline,
+    "gateway_stream": bench_gateway_stream,
+    "registry_restore": bench_registry_restore,
+    "registry_snapshot": bench_registry_snapshot,
+    "state_cache": bench_state_cache,
+    "state_memory": bench_state_memory,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    args = parser.parse_args(argv)
+    names = args.names or sorted(BENCHMARKS)
+    report = {}
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error("unknown benchmark: {}".format(name))
+        report[name] = BENCHMARKS[name]()
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())